@@ -8,21 +8,26 @@ from app.api.routes.configs import router as configs_router
 from app.api.routes.dashboard import router as dashboard_router
 from app.api.routes.favorites import router as favorites_router
 from app.api.routes.health import router as health_router
+from app.api.routes.live import router as live_router
 from app.api.routes.markets import router as markets_router
+from app.api.routes.metrics import router as metrics_router
 from app.api.routes.news import router as news_router
 from app.api.routes.orders import router as orders_router
 from app.api.routes.portfolio import router as portfolio_router
 from app.api.routes.positions import router as positions_router
+from app.api.routes.profiling import router as profiling_router
 from app.api.routes.slack import router as slack_router
 from app.api.routes.status import router as status_router
 from app.api.routes.upbit import router as upbit_router
 
 api_router = APIRouter()
 api_router.include_router(health_router)
+api_router.include_router(metrics_router)
 api_router.include_router(dashboard_router)
 api_router.include_router(status_router)
 api_router.include_router(config_router)
 api_router.include_router(configs_router, prefix="/system", tags=["system"])
+api_router.include_router(profiling_router, prefix="/system", tags=["system"])
 api_router.include_router(chat_router, prefix="/chat", tags=["chat"])
 api_router.include_router(positions_router)
 api_router.include_router(favorites_router, prefix="/favorites", tags=["favorites"])
@@ -30,6 +35,7 @@ api_router.include_router(markets_router, prefix="/markets", tags=["markets"])
 api_router.include_router(orders_router, prefix="/orders", tags=["orders"])
 api_router.include_router(portfolio_router, prefix="/portfolio", tags=["portfolio"])
 api_router.include_router(news_router, prefix="/news", tags=["news"])
+api_router.include_router(live_router, prefix="/live", tags=["live"])
 api_router.include_router(upbit_router)
 api_router.include_router(slack_router)
 api_router.include_router(ai_router, prefix="/ai", tags=["ai"])
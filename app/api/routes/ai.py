@@ -1,6 +1,10 @@
+import json
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
+from typing import Literal
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,6 +12,8 @@ from app.api.dependencies import require_admin_token
 from app.db.session import get_db
 from app.models.domain import AIAnalysisLog, Asset, OrderHistory, Position
 from app.models.schemas import AIAnalysisLogItem
+from app.models.schemas import AIBulkAnalysisRequest
+from app.models.schemas import AICalibrationReport
 from app.models.schemas import AIManualCycleRequest
 from app.models.schemas import AIManualCycleResponse
 from app.models.schemas import AIPerformanceSummary
@@ -17,7 +23,14 @@ from app.services.ai.provider_router import AIProviderRouter
 from app.services.ai.providers.base import AIProviderRateLimitError
 from app.services.portfolio.aggregator import PortfolioService
 from app.services.trading.ai_analyst import execute_ai_analysis
+from app.services.trading.ai_analyst import load_analysis_cycle_context
+from app.services.trading.bulk_analysis import BULK_ANALYSIS_MAX_SYMBOLS
+from app.services.trading.bulk_analysis import load_favorite_symbols
+from app.services.trading.bulk_analysis import normalize_symbols
+from app.services.trading.bulk_analysis import stream_bulk_analysis
 from app.services.trading.ai_executor import execute_ai_trade
+from app.services.trading.calibration import calibration_store
+from app.services.trading.order_reconciler import FILL_STATUS_CANCELLED
 
 router = APIRouter()
 
@@ -181,6 +194,37 @@ async def run_manual_ai_cycle(
     )
 
 
+@router.post("/bulk-analysis")
+async def run_bulk_ai_analysis(
+    request: AIBulkAnalysisRequest,
+    db: AsyncSession = Depends(get_db),
+    _admin: None = Depends(require_admin_token),
+) -> StreamingResponse:
+    symbols = normalize_symbols(request.symbols)
+    if request.all_favorites:
+        symbols = normalize_symbols([*symbols, *await load_favorite_symbols(db)])
+    if not symbols:
+        raise HTTPException(status_code=400, detail="symbols or all_favorites is required")
+    if len(symbols) > BULK_ANALYSIS_MAX_SYMBOLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"bulk analysis supports at most {BULK_ANALYSIS_MAX_SYMBOLS} symbols",
+        )
+
+    # 공용 스냅샷은 요청 세션이 살아 있을 때 읽고, 스트림에서는 심볼별 세션만 씁니다.
+    cycle = await load_analysis_cycle_context(db)
+
+    async def event_stream() -> AsyncIterator[str]:
+        async for event in stream_bulk_analysis(symbols, cycle, concurrency=request.concurrency):
+            yield f"data: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/latest-analysis-batch", response_model=dict[str, AIAnalysisLogItem | None])
 async def get_latest_analysis_batch(
     symbols: str,
@@ -321,7 +365,10 @@ async def get_ai_performance_summary(
         .join(Position, Position.id == OrderHistory.position_id)
         .join(Asset, Asset.id == Position.asset_id)
         .join(AIAnalysisLog, AIAnalysisLog.id == OrderHistory.ai_analysis_log_id)
-        .where(OrderHistory.ai_analysis_log_id.is_not(None))
+        .where(
+            OrderHistory.ai_analysis_log_id.is_not(None),
+            OrderHistory.fill_status != FILL_STATUS_CANCELLED,
+        )
         .order_by(desc(OrderHistory.executed_at), desc(OrderHistory.id))
         .limit(20)
     )
@@ -336,14 +383,10 @@ async def get_ai_performance_summary(
         if trade_record is not None:
             recent_trades.append(trade_record)
 
-    accuracy_stmt = select(AIAnalysisLog.accuracy_label).where(
-        AIAnalysisLog.decision.in_(("BUY", "SELL")),
-        AIAnalysisLog.accuracy_label.in_(("SUCCESS", "FAIL")),
-    )
-    accuracy_result = await db.execute(accuracy_stmt)
-    accuracy_labels = list(accuracy_result.scalars().all())
-    checked_count = len(accuracy_labels)
-    success_count = sum(1 for label in accuracy_labels if label == "SUCCESS")
+    await calibration_store.ensure_loaded(db)
+    accuracy = calibration_store.overall_win_rate()
+    checked_count = accuracy.checked_count
+    success_count = accuracy.success_count
 
     total_trades = winning_trades + losing_trades
     win_rate = (winning_trades / total_trades) * 100.0 if total_trades > 0 else 0.0
@@ -362,6 +405,16 @@ async def get_ai_performance_summary(
     )
 
 
+@router.get("/calibration", response_model=AICalibrationReport)
+async def get_ai_calibration_report(
+    symbol: str | None = None,
+    decision: Literal["BUY", "SELL"] | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> AICalibrationReport:
+    await calibration_store.ensure_loaded(db)
+    return AICalibrationReport.model_validate(calibration_store.report(symbol=symbol, decision=decision))
+
+
 @router.get("/test-analysis")
 async def trigger_ai_analysis_now(
     symbol: str,
@@ -1,20 +1,42 @@
+import asyncio
+import json
 import logging
+from collections.abc import AsyncIterator
 from datetime import datetime
-from typing import Any
+from pathlib import Path
+from typing import Any, Literal
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, model_validator
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db.session import AsyncSessionLocal
 from app.db.session import get_db
 from app.services.ai.provider_router import AIProviderRouter
 from app.services.backtesting.analyzer import analyze_backtest_result
+from app.services.backtesting.data_loader import fetch_historical_data
 from app.services.backtesting.engine import AIPolicyBacktestEngine
+from app.services.backtesting.jobs import MAX_TRADES_PAGE_SIZE
+from app.services.backtesting.jobs import BacktestJob
+from app.services.backtesting.jobs import JOB_STATUS_SUCCEEDED
+from app.services.backtesting.jobs import backtest_job_manager
+from app.services.backtesting.jobs import read_candles
+from app.services.backtesting.jobs import read_equity
+from app.services.backtesting.jobs import read_trades
+from app.services.backtesting.replay import AIDecisionReplayEngine
+from app.services.backtesting.replay import coerce_replay_policy
+from app.services.backtesting.robustness import run_robustness_analysis
+from app.services.trading.ai_executor import load_ai_executor_policy
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+BACKTEST_JOB_HEARTBEAT_SECONDS = 15.0
+DEFAULT_SERIES_POINTS = 1000
+MAX_SERIES_POINTS = 5000
+
 
 class BacktestStrategyRequest(BaseModel):
     ema_fast: int = Field(default=12, ge=2, le=250)
@@ -48,6 +70,42 @@ class BacktestRunRequest(BaseModel):
     policy: BacktestPolicyRequest = Field(default_factory=BacktestPolicyRequest)
 
 
+class BacktestReplayPolicyRequest(BaseModel):
+    """비워 둔 항목은 현재 시스템 설정의 실행기 정책 값을 그대로 씁니다."""
+
+    min_confidence: int | None = Field(default=None, ge=0, le=100)
+    max_age_minutes: int | None = Field(default=None, ge=1, le=24 * 60)
+    max_allocation_pct: float | None = Field(default=None, ge=0.0, le=100.0)
+    max_buy_weight_pct: float | None = Field(default=None, ge=0.0, le=30.0)
+    hard_take_profit_pct: float | None = Field(default=None, ge=0.0, le=1000.0)
+    hard_stop_loss_pct: float | None = Field(default=None, ge=-1000.0, le=0.0)
+
+
+class BacktestReplayRequest(BaseModel):
+    market: str = Field(..., examples=["KRW-BTC"])
+    start_date: datetime
+    end_date: datetime
+    timeframe: str = "60m"
+    initial_balance: float = 1_000_000.0
+    policy: BacktestReplayPolicyRequest = Field(default_factory=BacktestReplayPolicyRequest)
+
+
+class BacktestRobustnessRequest(BacktestRunRequest):
+    """``grid`` 의 키는 전략/정책 항목 이름이고, 값 목록의 모든 조합을 학습 창마다 평가합니다."""
+
+    grid: dict[str, list[float]] = Field(default_factory=dict, examples=[{"min_confidence": [70, 80, 90]}])
+    train_bars: int = Field(default=720, ge=50, le=200_000)
+    test_bars: int = Field(default=168, ge=10, le=200_000)
+    step_bars: int | None = Field(default=None, ge=1, le=200_000)
+    anchored: bool = False
+    objective: Literal["return", "calmar"] = "calmar"
+    monte_carlo_iterations: int = Field(default=2_000, ge=0, le=100_000)
+    bootstrap_block_bars: int = Field(default=24, ge=1, le=1_000)
+    confidence: float = Field(default=0.95, gt=0.5, lt=1.0)
+    budget_seconds: float = Field(default=60.0, gt=0.0, le=300.0)
+    seed: int | None = None
+
+
 class BacktestSummaryResponse(BaseModel):
     total_return_pct: float
     max_drawdown_pct: float
@@ -139,6 +197,101 @@ class BacktestRunResponse(BaseModel):
     ai_briefing: BacktestAiBriefingResponse
 
 
+class BacktestJobResultResponse(BaseModel):
+    summary: BacktestSummaryResponse
+    meta: BacktestMetaResponse
+    ai_briefing: BacktestAiBriefingResponse
+
+
+class BacktestJobResponse(BaseModel):
+    id: str
+    status: str
+    bars_done: int
+    bars_total: int
+    error: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    trade_count: int
+    result: BacktestJobResultResponse | None = None
+
+
+class BacktestTradesPageResponse(BaseModel):
+    total: int
+    offset: int
+    limit: int
+    items: list[BacktestTradeResponse]
+
+
+class BacktestJobEquityPointResponse(BacktestEquityPointResponse):
+    drawdown_pct: float
+
+
+class BacktestDistributionResponse(BaseModel):
+    mean: float
+    median: float
+    ci_low: float
+    ci_high: float
+
+
+class BacktestRobustnessFoldResponse(BaseModel):
+    train: list[str | None]
+    test: list[str | None]
+    strategy: dict[str, Any]
+    policy: dict[str, Any]
+    train_score: float
+    test_return_pct: float
+    test_max_drawdown_pct: float
+    test_trades: int
+
+
+class BacktestOutOfSampleResponse(BaseModel):
+    folds: int
+    return_pct: BacktestDistributionResponse | None = None
+    max_drawdown_pct: BacktestDistributionResponse | None = None
+    stitched_return_pct: float
+    stitched_max_drawdown_pct: float
+    round_trips: int
+
+
+class BacktestMonteCarloResponse(BaseModel):
+    iterations: int
+    trades: int | None = None
+    block_bars: int | None = None
+    final_return_pct: BacktestDistributionResponse
+    max_drawdown_pct: BacktestDistributionResponse
+    probability_of_loss: float
+
+
+class BacktestRobustnessMonteCarloResponse(BaseModel):
+    trade_resampling: BacktestMonteCarloResponse | None = None
+    bar_bootstrap: BacktestMonteCarloResponse | None = None
+
+
+class BacktestRobustnessResponse(BaseModel):
+    bars: int
+    candidates: int
+    folds: list[BacktestRobustnessFoldResponse]
+    out_of_sample: BacktestOutOfSampleResponse
+    monte_carlo: BacktestRobustnessMonteCarloResponse
+    confidence: float
+    simulations: int
+    workers: int
+    budget_seconds: float
+    budget_exhausted: bool
+    elapsed_seconds: float
+
+
+class BacktestReplayStatsResponse(BaseModel):
+    decisions_total: int
+    decisions_executed: int
+    outcomes: dict[str, int]
+
+
+class BacktestReplayResponse(BacktestRunResponse):
+    replay: BacktestReplayStatsResponse
+
+
 def _as_dict(value: Any) -> dict[str, Any]:
     return value if isinstance(value, dict) else {}
 
@@ -257,6 +410,24 @@ def _to_float(value: Any) -> float:
         return 0.0
 
 
+def _build_response_fields(analyzed: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "summary": BacktestSummaryResponse(**_as_dict(analyzed.get("summary"))),
+        "candles": [BacktestCandleResponse(**item) for item in _as_list(analyzed.get("candles"))],
+        "markers": [BacktestMarkerResponse(**item) for item in _as_list(analyzed.get("markers"))],
+        "trades": [BacktestTradeResponse(**item) for item in _as_list(analyzed.get("trades"))],
+        "equity_curve": [
+            BacktestEquityPointResponse(**item)
+            for item in _as_list(analyzed.get("equity_curve"))
+        ],
+        "drawdown_curve": [
+            BacktestDrawdownPointResponse(**item)
+            for item in _as_list(analyzed.get("drawdown_curve"))
+        ],
+        "meta": BacktestMetaResponse(**_as_dict(analyzed.get("meta"))),
+    }
+
+
 @router.post("/run", response_model=BacktestRunResponse)
 async def run_backtest(
     payload: BacktestRunRequest,
@@ -286,19 +457,202 @@ async def run_backtest(
     analyzed = analyze_backtest_result(result)
     ai_briefing = await _build_ai_briefing(db, analyzed)
 
-    return BacktestRunResponse(
-        summary=BacktestSummaryResponse(**_as_dict(analyzed.get("summary"))),
-        candles=[BacktestCandleResponse(**item) for item in _as_list(analyzed.get("candles"))],
-        markers=[BacktestMarkerResponse(**item) for item in _as_list(analyzed.get("markers"))],
-        trades=[BacktestTradeResponse(**item) for item in _as_list(analyzed.get("trades"))],
-        equity_curve=[
-            BacktestEquityPointResponse(**item)
-            for item in _as_list(analyzed.get("equity_curve"))
-        ],
-        drawdown_curve=[
-            BacktestDrawdownPointResponse(**item)
-            for item in _as_list(analyzed.get("drawdown_curve"))
-        ],
-        meta=BacktestMetaResponse(**_as_dict(analyzed.get("meta"))),
-        ai_briefing=ai_briefing,
+    return BacktestRunResponse(**_build_response_fields(analyzed), ai_briefing=ai_briefing)
+
+
+@router.post("/replay", response_model=BacktestReplayResponse)
+async def replay_ai_decisions(
+    payload: BacktestReplayRequest,
+    db: AsyncSession = Depends(get_db),
+) -> BacktestReplayResponse:
+    """기록된 AI 분석 로그를 현재(또는 override 한) 실행기 정책으로 다시 체결해 봅니다.
+
+    LLM 을 호출하지 않으므로 브리핑도 로컬 요약만 제공합니다.
+    """
+    policy = coerce_replay_policy(
+        await load_ai_executor_policy(db),
+        payload.policy.model_dump(exclude_none=True),
+    )
+    engine = AIDecisionReplayEngine(db)
+
+    try:
+        result = await engine.run(
+            market=payload.market,
+            start_date=payload.start_date,
+            end_date=payload.end_date,
+            timeframe=payload.timeframe,
+            initial_balance=payload.initial_balance,
+            policy=policy,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except httpx.HTTPError as exc:
+        logger.exception("AI decision replay upstream request failed.")
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
+    except Exception as exc:
+        logger.exception("AI decision replay failed.")
+        raise HTTPException(status_code=500, detail="의사결정 replay 실행 중 오류가 발생했습니다.") from exc
+
+    analyzed = analyze_backtest_result(result)
+    return BacktestReplayResponse(
+        **_build_response_fields(analyzed),
+        ai_briefing=BacktestAiBriefingResponse(content=_build_local_ai_briefing(analyzed), fallback=True),
+        replay=BacktestReplayStatsResponse(**_as_dict(result.get("replay"))),
     )
+
+
+@router.post("/robustness", response_model=BacktestRobustnessResponse)
+async def run_backtest_robustness(payload: BacktestRobustnessRequest) -> BacktestRobustnessResponse:
+    """walk-forward 최적화와 Monte Carlo 로 정책 임계값의 out-of-sample 성과 분포를 계산합니다.
+
+    시뮬레이션은 CPU 작업이므로 스레드에서 돌리고, worker 프로세스는 작업량이 클 때만 띄웁니다.
+    ``budget_seconds`` 를 넘기면 끝난 평가만으로 결과를 만들고 ``budget_exhausted`` 를 켭니다.
+    """
+    try:
+        candles = await fetch_historical_data(
+            market=payload.market,
+            timeframe=payload.timeframe,
+            start_date=payload.start_date,
+            end_date=payload.end_date,
+        )
+        report = await asyncio.to_thread(
+            run_robustness_analysis,
+            candles,
+            base_strategy=payload.strategy.model_dump(),
+            base_policy=payload.policy.model_dump(),
+            grid=payload.grid,
+            train_bars=payload.train_bars,
+            test_bars=payload.test_bars,
+            step_bars=payload.step_bars,
+            anchored=payload.anchored,
+            objective=payload.objective,
+            initial_balance=payload.initial_balance,
+            monte_carlo_iterations=payload.monte_carlo_iterations,
+            bootstrap_block_bars=payload.bootstrap_block_bars,
+            confidence=payload.confidence,
+            budget_seconds=payload.budget_seconds,
+            seed=payload.seed,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except httpx.HTTPError as exc:
+        logger.exception("Backtest robustness upstream request failed.")
+        raise HTTPException(status_code=502, detail=str(exc)) from exc
+    except Exception as exc:
+        logger.exception("Backtest robustness failed.")
+        raise HTTPException(status_code=500, detail="견고성 검증 중 오류가 발생했습니다.") from exc
+
+    return BacktestRobustnessResponse(**report)
+
+
+async def _finalize_backtest_job(analyzed: dict[str, Any]) -> dict[str, Any]:
+    # 작업은 요청이 끝난 뒤에도 돌므로 요청 세션 대신 새 세션으로 브리핑을 만듭니다.
+    async with AsyncSessionLocal() as db:
+        ai_briefing = await _build_ai_briefing(db, analyzed)
+    return {"ai_briefing": ai_briefing.model_dump()}
+
+
+def _get_job_or_404(job_id: str) -> BacktestJob:
+    job = backtest_job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="백테스트 작업을 찾을 수 없습니다.")
+    return job
+
+
+def _get_artifact_or_409(job_id: str) -> tuple[BacktestJob, Path]:
+    job = _get_job_or_404(job_id)
+    if job.status != JOB_STATUS_SUCCEEDED or job.artifact_path is None:
+        raise HTTPException(status_code=409, detail=f"백테스트 작업이 완료되지 않았습니다: {job.status}")
+    return job, job.artifact_path
+
+
+@router.post("/jobs", response_model=BacktestJobResponse, status_code=202)
+async def submit_backtest_job(payload: BacktestRunRequest) -> BacktestJobResponse:
+    """백테스트를 백그라운드 작업으로 실행합니다.
+
+    진행률은 ``/jobs/{id}/events`` 로, 결과는 요약/거래 페이지/다운샘플링 시계열로 나눠 조회합니다.
+    """
+    job = backtest_job_manager.submit(
+        {
+            "market": payload.market,
+            "start_date": payload.start_date,
+            "end_date": payload.end_date,
+            "timeframe": payload.timeframe,
+            "initial_balance": payload.initial_balance,
+            "strategy": payload.strategy.model_dump(),
+            "policy": payload.policy.model_dump(),
+        },
+        finalize=_finalize_backtest_job,
+    )
+    return BacktestJobResponse(**job.to_dict())
+
+
+@router.get("/jobs/{job_id}", response_model=BacktestJobResponse)
+async def get_backtest_job(job_id: str) -> BacktestJobResponse:
+    return BacktestJobResponse(**_get_job_or_404(job_id).to_dict())
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_backtest_job_events(job_id: str) -> StreamingResponse:
+    job = _get_job_or_404(job_id)
+
+    async def event_stream() -> AsyncIterator[str]:
+        while True:
+            changed = job.changed()
+            event_type = "done" if job.is_finished else "progress"
+            yield f"event: {event_type}\ndata: {json.dumps(job.progress(), ensure_ascii=False)}\n\n"
+            if job.is_finished:
+                return
+            try:
+                await asyncio.wait_for(changed.wait(), timeout=BACKTEST_JOB_HEARTBEAT_SECONDS)
+            except TimeoutError:
+                yield ": ping\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/jobs/{job_id}/trades", response_model=BacktestTradesPageResponse)
+async def get_backtest_job_trades(
+    job_id: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=MAX_TRADES_PAGE_SIZE),
+) -> BacktestTradesPageResponse:
+    job, path = _get_artifact_or_409(job_id)
+    items = await asyncio.to_thread(read_trades, path, offset, limit)
+    return BacktestTradesPageResponse(
+        total=job.trade_count,
+        offset=offset,
+        limit=limit,
+        items=[BacktestTradeResponse(**item) for item in items],
+    )
+
+
+@router.get("/jobs/{job_id}/equity", response_model=list[BacktestJobEquityPointResponse])
+async def get_backtest_job_equity(
+    job_id: str,
+    points: int = Query(default=DEFAULT_SERIES_POINTS, ge=3, le=MAX_SERIES_POINTS),
+) -> list[BacktestJobEquityPointResponse]:
+    _job, path = _get_artifact_or_409(job_id)
+    rows = await asyncio.to_thread(read_equity, path, points)
+    return [BacktestJobEquityPointResponse(**row) for row in rows]
+
+
+@router.get("/jobs/{job_id}/candles", response_model=list[BacktestCandleResponse])
+async def get_backtest_job_candles(
+    job_id: str,
+    points: int = Query(default=DEFAULT_SERIES_POINTS, ge=1, le=MAX_SERIES_POINTS),
+) -> list[BacktestCandleResponse]:
+    _job, path = _get_artifact_or_409(job_id)
+    rows = await asyncio.to_thread(read_candles, path, points)
+    return [BacktestCandleResponse(**row) for row in rows]
+
+
+@router.delete("/jobs/{job_id}", response_model=BacktestJobResponse)
+async def cancel_backtest_job(job_id: str) -> BacktestJobResponse:
+    _get_job_or_404(job_id)
+    job = await backtest_job_manager.cancel(job_id)
+    return BacktestJobResponse(**job.to_dict())
@@ -28,7 +28,6 @@ from app.models.schemas import ChatSessionCreateRequest
 from app.models.schemas import ChatSessionCreateResponse
 from app.models.schemas import ChatSessionItem
 from app.models.schemas import SystemConfigItem
-from app.services.chat.orchestrator import run_chat_stream
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -114,6 +113,9 @@ async def stream_chat_messages(
     if not normalized_content:
         raise HTTPException(status_code=400, detail="메시지 내용은 비어 있을 수 없습니다.")
 
+    # LangGraph 오케스트레이터는 import 비용이 커서 첫 채팅 요청(또는 기동 warm-up) 때 불러옵니다.
+    from app.services.chat.orchestrator import run_chat_stream
+
     async def event_stream() -> AsyncIterator[str]:
         try:
             async for event in run_chat_stream(normalized_session_id, normalized_content, db):
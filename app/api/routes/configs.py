@@ -6,12 +6,15 @@ from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import require_admin_token
+from app.core.profiling import profiler
 from app.core.scheduler import reload_scheduler_jobs
 from app.db.repository import AI_BRIEFING_TIME_KEY
 from app.db.repository import AUTONOMOUS_AI_INTERVAL_HOURS_KEY
 from app.db.repository import AUTONOMOUS_AI_INTERVAL_MINUTES_KEY
 from app.db.repository import NEWS_INTERVAL_HOURS_KEY
 from app.db.repository import PAPER_TRADING_KRW_BALANCE_KEY
+from app.db.repository import PROFILING_CPROFILE_SAMPLE_RATE_KEY
+from app.db.repository import PROFILING_ENABLED_KEY
 from app.db.repository import SENTIMENT_INTERVAL_MINUTES_KEY
 from app.db.repository import SLACK_PORTFOLIO_ALERT_SETTINGS_KEY
 from app.db.repository import bulk_upsert_system_configs
@@ -37,6 +40,7 @@ SCHEDULER_CONFIG_KEYS = {
     AUTONOMOUS_AI_INTERVAL_MINUTES_KEY,
     SLACK_PORTFOLIO_ALERT_SETTINGS_KEY,
 }
+PROFILING_CONFIG_KEYS = {PROFILING_ENABLED_KEY, PROFILING_CPROFILE_SAMPLE_RATE_KEY}
 
 
 @router.get("/configs", response_model=list[SystemConfigItem])
@@ -80,6 +84,12 @@ async def update_system_configs(
                 exc_info=True,
             )
 
+    if any(config_key in PROFILING_CONFIG_KEYS for config_key in config_keys):
+        try:
+            await profiler.refresh_from_db(db)
+        except Exception:
+            logger.error("SystemConfig 저장 후 프로파일링 설정 적용에 실패했습니다.", exc_info=True)
+
     return [
         SystemConfigItem(
             id=config.id,
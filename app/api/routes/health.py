@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.warmup import app_warmup
 from app.db.session import get_db
 
 router = APIRouter()
@@ -11,3 +12,15 @@ router = APIRouter()
 async def health(db: AsyncSession = Depends(get_db)) -> dict:
     await db.execute(text("SELECT 1"))
     return {"status": "ok", "db": "connected"}
+
+
+@router.get("/health/ready")
+async def readiness(
+    response: Response,
+    require_warm: bool = Query(False, description="true 면 warm-up 이 끝나기 전까지 503 을 반환합니다."),
+) -> dict:
+    """요청 처리 가능(serving)과 선택 서브시스템 warm-up 완료(warmed)를 구분해 알려줍니다."""
+    snapshot = app_warmup.snapshot()
+    if require_warm and not snapshot["warmed"]:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return snapshot
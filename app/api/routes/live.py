@@ -0,0 +1,40 @@
+import json
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from app.core.event_hub import LiveEvent
+from app.core.event_hub import live_event_hub
+
+router = APIRouter()
+
+LIVE_HEARTBEAT_SECONDS = 15.0
+# 연결이 끊기면 브라우저 EventSource 가 이 시간(ms) 뒤에 다시 연결합니다.
+LIVE_RETRY_MILLISECONDS = 3000
+
+
+def _to_sse_event(event: LiveEvent) -> str:
+    payload = json.dumps(event.data, ensure_ascii=False, default=str)
+    return f"id: {event.id}\nevent: {event.type}\ndata: {payload}\n\n"
+
+
+@router.get("/stream")
+async def stream_live_events() -> StreamingResponse:
+    async def event_stream() -> AsyncIterator[str]:
+        async with live_event_hub.subscribe() as subscription:
+            yield f"retry: {LIVE_RETRY_MILLISECONDS}\nevent: ready\ndata: {{}}\n\n"
+            while True:
+                event = await subscription.get(timeout=LIVE_HEARTBEAT_SECONDS)
+                # 프록시가 유휴 연결을 끊지 않도록 이벤트가 없을 때는 주석 줄을 보냅니다.
+                yield ": ping\n\n" if event is None else _to_sse_event(event)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
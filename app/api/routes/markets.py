@@ -11,13 +11,12 @@ from app.db.session import get_db
 from app.models.schemas import MarketSentimentSnapshot
 from app.services.brokers.factory import BrokerFactory
 from app.services.brokers.upbit import UpbitAPIError
-from app.services.indicators import IndicatorCalculator
+from app.services.indicators import indicator_cache
 from app.services.market.sentiment_fetcher import MarketSentimentFetchError
 from app.services.market.sentiment_fetcher import get_or_refresh_market_sentiment
 
 router = APIRouter()
 broker = BrokerFactory.get_broker("UPBIT")
-indicator_calculator = IndicatorCalculator()
 
 MARKETS_CACHE_TTL_SECONDS = 300
 MAX_TICKER_SYMBOLS = 100
@@ -238,5 +237,5 @@ async def get_candles(
             }
         )
 
-    enriched_candles = indicator_calculator.calculate_from_candles(normalized_candles)
+    enriched_candles = indicator_cache.enrich(market, timeframe, normalized_candles)
     return [CandleItem(**item) for item in enriched_candles if isinstance(item, dict)]
@@ -0,0 +1,13 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import Response
+
+from app.api.dependencies import require_admin_token
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE
+from app.core.metrics import registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(_admin: None = Depends(require_admin_token)) -> Response:
+    return Response(content=registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -9,7 +9,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
 from app.services.news_analyzer import analyze_market_sentiment
 from app.services.news_scraper import fetch_crypto_news
-from app.services.rag.ingestion import get_configured_market_news_sources
 from app.services.rag.opensearch_client import INGESTION_RUNS_INDEX_NAME
 from app.services.rag.opensearch_client import INDEX_NAME
 from app.services.rag.opensearch_client import get_opensearch_client
@@ -524,6 +523,8 @@ async def _fetch_latest_ingestion_status(client: Any) -> dict[str, Any] | None:
 
 
 async def _build_rag_status_response(client: Any | None = None) -> RagStatusResponse:
+    from app.services.rag.ingestion import get_configured_market_news_sources
+
     configured_sources = get_configured_market_news_sources()
     search_client = client or get_opensearch_client()
     index_exists = False
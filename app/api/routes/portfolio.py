@@ -4,7 +4,7 @@ import re
 from datetime import datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel, Field
 from sqlalchemy import desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,15 +14,24 @@ from app.db.repository import read_cached_market_sentiment
 from app.db.repository import save_portfolio_snapshot
 from app.db.session import get_db
 from app.models.domain import AIAnalysisLog
+from app.models.schemas import PortfolioSeriesPoint
+from app.models.schemas import PortfolioSeriesResponse
 from app.models.schemas import PortfolioSnapshotItem
 from app.models.schemas import PortfolioSnapshotListResponse
 from app.services.ai.provider_router import AIProviderRouter
 from app.services.ai.provider_router import AIProviderUnavailableError
 from app.services.portfolio.aggregator import PortfolioService
+from app.services.portfolio.timeseries import DEFAULT_TARGET_POINTS
+from app.services.portfolio.timeseries import MAX_TARGET_POINTS
+from app.services.portfolio.timeseries import MIN_TARGET_POINTS
+from app.services.portfolio.timeseries import DownsampleMethod
+from app.services.portfolio.timeseries import SeriesRange
+from app.services.portfolio.timeseries import load_portfolio_series
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 PORTFOLIO_BRIEFING_TIMEOUT_SECONDS = 35
+MAX_SNAPSHOT_LIST_LIMIT = 1000
 
 
 class PortfolioBriefingResponse(BaseModel):
@@ -279,7 +288,7 @@ def _normalize_briefing_report(raw_report: str) -> str:
 
 @router.get("/snapshots", response_model=PortfolioSnapshotListResponse)
 async def list_portfolio_snapshots(
-    limit: int = 168,
+    limit: int = Query(168, ge=1, le=MAX_SNAPSHOT_LIST_LIMIT),
     db: AsyncSession = Depends(get_db),
 ) -> PortfolioSnapshotListResponse:
     snapshots = await get_portfolio_snapshots(db, limit)
@@ -288,6 +297,40 @@ async def list_portfolio_snapshots(
     )
 
 
+@router.get("/snapshots/series", response_model=PortfolioSeriesResponse)
+async def get_portfolio_snapshot_series(
+    series_range: SeriesRange = Query("30d", alias="range"),
+    points: int = Query(DEFAULT_TARGET_POINTS, ge=MIN_TARGET_POINTS, le=MAX_TARGET_POINTS),
+    method: DownsampleMethod = Query("lttb"),
+    currency: str | None = Query(None, description="자산별 시계열을 볼 통화 코드, 예: BTC"),
+    db: AsyncSession = Depends(get_db),
+) -> PortfolioSeriesResponse:
+    source_points, series = await load_portfolio_series(
+        db,
+        series_range=series_range,
+        target_points=points,
+        method=method,
+        currency=currency,
+    )
+    return PortfolioSeriesResponse(
+        range=series_range,
+        method=method,
+        currency=str(currency).strip().upper() if currency else None,
+        source_points=source_points,
+        points=[
+            PortfolioSeriesPoint(
+                timestamp=point.timestamp,
+                value=point.value,
+                secondary=point.secondary,
+                open=point.open,
+                high=point.high,
+                low=point.low,
+            )
+            for point in series
+        ],
+    )
+
+
 @router.post("/snapshots/now", response_model=PortfolioSnapshotItem)
 async def create_portfolio_snapshot_now(
     db: AsyncSession = Depends(get_db),
@@ -0,0 +1,87 @@
+import json
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.dependencies import require_admin_token
+from app.core.profiling import profiler
+from app.db.repository import PROFILING_CPROFILE_SAMPLE_RATE_KEY
+from app.db.repository import PROFILING_ENABLED_KEY
+from app.db.repository import bulk_upsert_system_configs
+from app.db.session import get_db
+from app.models.schemas import ProfilingConfigUpdate
+from app.models.schemas import ProfilingStatusResponse
+
+router = APIRouter(dependencies=[Depends(require_admin_token)])
+
+ProfileDownloadFormat = Literal["json", "collapsed", "pstats"]
+
+
+def _build_status() -> ProfilingStatusResponse:
+    return ProfilingStatusResponse(
+        enabled=profiler.enabled,
+        cprofile_sample_rate=profiler.cprofile_sample_rate,
+        buffer_size=profiler.buffer_size,
+        runs=profiler.list_runs(),
+    )
+
+
+@router.get("/profiling", response_model=ProfilingStatusResponse)
+async def get_profiling_status() -> ProfilingStatusResponse:
+    return _build_status()
+
+
+@router.put("/profiling", response_model=ProfilingStatusResponse)
+async def update_profiling_config(
+    payload: ProfilingConfigUpdate,
+    db: AsyncSession = Depends(get_db),
+) -> ProfilingStatusResponse:
+    values = [(PROFILING_ENABLED_KEY, "true" if payload.enabled else "false")]
+    if payload.cprofile_sample_rate is not None:
+        values.append((PROFILING_CPROFILE_SAMPLE_RATE_KEY, f"{payload.cprofile_sample_rate:g}"))
+    await bulk_upsert_system_configs(db, values)
+    profiler.configure(
+        enabled=payload.enabled,
+        cprofile_sample_rate=payload.cprofile_sample_rate,
+    )
+    return _build_status()
+
+
+@router.delete("/profiling/runs", response_model=ProfilingStatusResponse)
+async def clear_profiling_runs() -> ProfilingStatusResponse:
+    profiler.clear()
+    return _build_status()
+
+
+@router.get("/profiling/runs/{run_id}")
+async def download_profiling_run(
+    run_id: str,
+    format: ProfileDownloadFormat = Query(default="json"),
+) -> Response:
+    run = profiler.get_run(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="프로파일링 실행 기록을 찾을 수 없습니다.")
+
+    filename = f"{run.name}-{run.run_id}"
+    if format == "collapsed":
+        return Response(
+            content=run.to_collapsed_stacks(),
+            media_type="text/plain; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.collapsed.txt"'},
+        )
+    if format == "pstats":
+        if run.cprofile_stats is None:
+            raise HTTPException(status_code=404, detail="이 실행에는 cProfile 샘플이 없습니다.")
+        return Response(
+            content=run.cprofile_stats,
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.prof"'},
+        )
+
+    return Response(
+        content=json.dumps(run.to_dict(), ensure_ascii=False, default=str),
+        media_type="application/json",
+        headers={"Content-Disposition": f'attachment; filename="{filename}.json"'},
+    )
@@ -1,15 +1,11 @@
-import logging
-
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import require_admin_token
 from app.db.session import get_db
-from app.models.schemas import BotStatus
+from app.models.schemas import BotStatus, LiquidationReportResponse
 from app.services.bot_service import get_bot_status, start_bot, stop_bot
-from app.services.brokers.factory import BrokerFactory
-
-logger = logging.getLogger(__name__)
+from app.services.trading.liquidation import liquidate_all_positions
 
 router = APIRouter()
 
@@ -37,41 +33,11 @@ async def stop_bot_endpoint(
     return await get_bot_status(db)
 
 
-@router.post("/bot/liquidate")
+@router.post("/bot/liquidate", response_model=LiquidationReportResponse)
 async def liquidate_all_endpoint(
     db: AsyncSession = Depends(get_db),
     _admin: None = Depends(require_admin_token),
-) -> dict[str, str]:
+) -> LiquidationReportResponse:
     await stop_bot(db)
-
-    broker = BrokerFactory.get_broker("UPBIT")
-    accounts = await broker.get_accounts()
-
-    for account in accounts:
-        currency = str(account.get("currency") or "").upper()
-        if not currency or currency == "KRW":
-            continue
-
-        try:
-            balance = float(account.get("balance") or 0)
-            locked = float(account.get("locked") or 0)
-        except (TypeError, ValueError):
-            logger.warning("잔고 파싱 실패로 스킵합니다: account=%s", account)
-            continue
-
-        available_qty = max(balance - locked, 0.0)
-        if available_qty <= 0:
-            continue
-
-        market = f"KRW-{currency}"
-        try:
-            await broker.create_order(
-                market=market,
-                side="ask",
-                ord_type="market",
-                volume=str(available_qty),
-            )
-        except Exception:
-            logger.exception("전량 매도 실패: market=%s", market)
-
-    return {"message": "Liquidate pipeline executed successfully."}
+    report = await liquidate_all_positions()
+    return LiquidationReportResponse(**report.to_dict())
@@ -18,6 +18,8 @@ class Settings(BaseSettings):
 
     telegram_bot_token: str | None = None
     telegram_chat_id: str | None = None
+    telegram_max_concurrent_handlers: int = 4
+    telegram_command_timeout: float = 30.0
 
     slack_webhook_url: str | None = None
     slack_timeout: float = 10.0
@@ -29,6 +31,8 @@ class Settings(BaseSettings):
     slack_signing_secret: str | None = None
     slack_allowed_user_ids: str | None = None
     slack_trade_channel_ids: str | None = None
+    slack_socket_worker_count: int = 4
+    slack_command_timeout: float = 30.0
     OPENAI_API_KEY: str | None = None
     GEMINI_API_KEY: str | None = None
     cryptopanic_api_key: str | None = None
@@ -38,6 +42,15 @@ class Settings(BaseSettings):
     admin_api_token: str | None = None
     admin_basic_auth_user: str | None = None
     admin_basic_auth_hash: str | None = None
+    profiling_ring_buffer_size: int = 50
+    chat_working_memory_token_budget: int = 3000
+    chat_working_memory_message_token_cap: int = 800
+    chat_memory_summary_max_tokens: int = 500
+    app_warmup_enabled: bool = True
+    response_cache_enabled: bool = True
+    backtest_artifact_dir: str | None = None
+    gemini_context_cache_enabled: bool = True
+    gemini_context_cache_ttl_seconds: int = 900
 
     postgres_user: str = "postgres"
     postgres_password: str = "postgres"
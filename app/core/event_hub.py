@@ -0,0 +1,149 @@
+"""대시보드 실시간 이벤트 허브(SSE fan-out).
+
+생산자(포트폴리오/시세 producer, 봇 상태 갱신, DB 커밋 훅)는 ``publish`` 로 이벤트를 한 번만
+올리고, 허브가 연결된 모든 구독자에게 나눠 줍니다. 구독자마다 크기가 정해진 큐를 두고,
+느린 클라이언트 때문에 큐가 가득 차면 밀린 이벤트를 버리고 ``resync`` 이벤트 하나만 남깁니다.
+``resync`` 를 받은 클라이언트는 REST 로 전체 상태를 다시 불러옵니다. 생산자는 구독자 수와
+무관하게 같은 양의 작업만 하므로 대시보드를 여러 개 열어도 백엔드 부하가 늘지 않습니다.
+
+``ai_analysis_logs``/``order_history`` 행은 ORM 세션 커밋 훅이 ``publish_committed_rows`` 로
+넘겨 주므로 새 AI 분석과 주문 체결은 저장 위치와 상관없이 한 곳에서 방송됩니다.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.metrics import LIVE_EVENTS_DROPPED_TOTAL
+from app.core.metrics import LIVE_SUBSCRIBERS
+
+logger = logging.getLogger(__name__)
+
+LIVE_SUBSCRIBER_QUEUE_SIZE = 100
+RESYNC_EVENT = "resync"
+
+# 커밋 훅이 방송할 테이블 → (이벤트 타입, 실어 보낼 컬럼, 수정된 행도 보낼지 여부)
+ROW_EVENT_TABLES: dict[str, tuple[str, tuple[str, ...], bool]] = {
+    "ai_analysis_logs": (
+        "analysis",
+        ("id", "symbol", "decision", "confidence", "recommended_weight", "created_at"),
+        False,
+    ),
+    "order_history": (
+        "order_fill",
+        (
+            "id",
+            "position_id",
+            "ai_analysis_log_id",
+            "side",
+            "is_paper",
+            "price",
+            "qty",
+            "broker_order_uuid",
+            "fill_status",
+            "executed_at",
+        ),
+        True,
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class LiveEvent:
+    id: int
+    type: str
+    data: Any
+
+
+class LiveSubscription:
+    def __init__(self, queue_size: int) -> None:
+        self.queue: asyncio.Queue[LiveEvent] = asyncio.Queue(maxsize=max(1, queue_size))
+        self.dropped = 0
+
+    def offer(self, event: LiveEvent, resync_id: int) -> bool:
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            pass
+        # 느린 구독자: 밀린 이벤트를 비우고 전체 재조회를 요청합니다.
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(LiveEvent(id=resync_id, type=RESYNC_EVENT, data={"reason": "backpressure"}))
+        return False
+
+    async def get(self, timeout: float | None = None) -> LiveEvent | None:
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except TimeoutError:
+            return None
+
+
+class LiveEventHub:
+    def __init__(self, *, queue_size: int = LIVE_SUBSCRIBER_QUEUE_SIZE) -> None:
+        self.queue_size = queue_size
+        self._subscribers: set[LiveSubscription] = set()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._has_subscribers = asyncio.Event()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self) -> AsyncIterator[LiveSubscription]:
+        subscription = LiveSubscription(self.queue_size)
+        self._loop = asyncio.get_running_loop()
+        self._subscribers.add(subscription)
+        self._has_subscribers.set()
+        LIVE_SUBSCRIBERS.set(len(self._subscribers))
+        try:
+            yield subscription
+        finally:
+            self._subscribers.discard(subscription)
+            if not self._subscribers:
+                self._has_subscribers.clear()
+            LIVE_SUBSCRIBERS.set(len(self._subscribers))
+
+    async def wait_for_subscribers(self) -> None:
+        await self._has_subscribers.wait()
+
+    def publish(self, event_type: str, data: Any) -> None:
+        """이벤트를 모든 구독자에게 보냅니다. 구독자가 없으면 아무 일도 하지 않습니다."""
+        if not self._subscribers:
+            return
+        with self._lock:
+            event = LiveEvent(id=next(self._ids), type=event_type, data=data)
+        loop = self._loop
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if loop is not None and running_loop is not loop:
+            loop.call_soon_threadsafe(self._deliver, event)
+            return
+        self._deliver(event)
+
+    def publish_committed_rows(self, rows: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        for table_name, row in rows:
+            event = ROW_EVENT_TABLES.get(table_name)
+            if event is not None:
+                self.publish(event[0], row)
+
+    def _deliver(self, event: LiveEvent) -> None:
+        for subscription in tuple(self._subscribers):
+            if subscription.offer(event, resync_id=event.id):
+                continue
+            LIVE_EVENTS_DROPPED_TOTAL.inc(event_type=event.type)
+            logger.info("실시간 이벤트 구독자가 밀려 resync 를 보냅니다: dropped=%s", subscription.dropped)
+
+
+live_event_hub = LiveEventHub()
@@ -0,0 +1,500 @@
+"""프로세스 내부 Prometheus 호환 지표 수집기.
+
+외부 의존성 없이 counter/gauge/histogram 을 라벨별로 누적하고, ``/api/metrics`` 에서
+Prometheus text exposition format(0.0.4)으로 내보냅니다. 핫패스에서는
+``observe_duration`` 컨텍스트 매니저나 ``timed`` 데코레이터로 구간 시간을 기록합니다.
+"""
+
+import asyncio
+import functools
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+LONG_RUNNING_BUCKETS = (0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# AIProviderRouter.execute 가 설정하고 provider 구현이 토큰 사용량 기록 시 읽습니다.
+current_llm_purpose: ContextVar[str] = ContextVar("current_llm_purpose", default="unknown")
+
+
+@dataclass(slots=True)
+class LLMCallUsage:
+    """LLM 호출 한 번의 토큰 사용량. ``cached_tokens`` 는 ``input_tokens`` 중 캐시에서 읽은 양입니다."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_tokens: int = 0
+
+    @property
+    def cached_ratio(self) -> float | None:
+        if not self.input_tokens:
+            return None
+        return self.cached_tokens / self.input_tokens
+
+
+# AIProviderRouter.execute 가 후보 호출마다 새로 설정하고 record_llm_usage 가 누적합니다.
+current_llm_usage: ContextVar[LLMCallUsage | None] = ContextVar("current_llm_usage", default=None)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: dict[str, str] | None = None) -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)]
+    for name, value in (extra or {}).items():
+        pairs.append(f'{name}="{_escape_label_value(value)}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _label_key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} 라벨이 올바르지 않습니다: expected={self.labelnames} got={tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> list[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> list[str]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("counter 는 감소할 수 없습니다.")
+        key = self._label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._label_key(labels), 0.0)
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}"
+            for key, value in items
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._label_key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._label_key(labels), 0.0)
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}"
+            for key, value in items
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class _HistogramSeries:
+    __slots__ = ("bucket_counts", "count", "total")
+
+    def __init__(self, bucket_count: int) -> None:
+        self.bucket_counts = [0] * bucket_count
+        self.count = 0
+        self.total = 0.0
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(bucket) for bucket in buckets))
+        self._series: dict[tuple[str, ...], _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = _HistogramSeries(len(self.buckets))
+                self._series[key] = series
+            series.count += 1
+            series.total += value
+            for index, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    series.bucket_counts[index] += 1
+                    break
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started_at, **labels)
+
+    def summary(self, **labels: Any) -> dict[str, float]:
+        with self._lock:
+            series = self._series.get(self._label_key(labels))
+            if series is None:
+                return {"count": 0, "sum": 0.0}
+            return {"count": series.count, "sum": series.total}
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            items = [
+                (key, list(series.bucket_counts), series.count, series.total)
+                for key, series in sorted(self._series.items())
+            ]
+
+        lines: list[str] = []
+        for key, bucket_counts, count, total in items:
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, {"le": _format_number(upper_bound)})
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key, {"le": "+Inf"})
+            lines.append(f"{self.name}_bucket{labels} {count}")
+            plain_labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{plain_labels} {_format_number(total)}")
+            lines.append(f"{self.name}_count{plain_labels} {count}")
+        return lines
+
+    def reset(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+                    raise ValueError(f"이미 다른 형태로 등록된 지표입니다: {metric.name}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], None]) -> None:
+        """scrape 직전에 gauge 값을 갱신할 콜백을 등록합니다."""
+        with self._lock:
+            if collector not in self._collectors:
+                self._collectors.append(collector)
+
+    def render(self) -> str:
+        with self._lock:
+            collectors = list(self._collectors)
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        for collector in collectors:
+            try:
+                collector()
+            except Exception:
+                continue
+
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+
+registry = MetricsRegistry()
+
+UPBIT_REQUEST_SECONDS = registry.histogram(
+    "upbit_request_duration_seconds",
+    "Upbit REST API 호출 시간(초)",
+    ("method", "endpoint", "status"),
+)
+LLM_REQUEST_SECONDS = registry.histogram(
+    "llm_request_duration_seconds",
+    "LLM provider 호출 시간(초)",
+    ("provider", "model", "purpose", "outcome"),
+    buckets=LONG_RUNNING_BUCKETS,
+)
+LLM_TOKENS_TOTAL = registry.counter(
+    "llm_tokens_total",
+    "LLM provider 토큰 사용량",
+    ("provider", "model", "purpose", "kind"),
+)
+LLM_PROMPT_CACHE_TOTAL = registry.counter(
+    "llm_prompt_cache_total",
+    "LLM provider 명시적 프롬프트 캐시 사용 결과(created/reused/unavailable/expired)",
+    ("provider", "model", "outcome"),
+)
+OPENSEARCH_REQUEST_SECONDS = registry.histogram(
+    "opensearch_request_duration_seconds",
+    "OpenSearch 요청 시간(초)",
+    ("method", "operation", "outcome"),
+)
+DB_QUERY_SECONDS = registry.histogram(
+    "db_query_duration_seconds",
+    "DB 쿼리 실행 시간(초)",
+    ("statement",),
+)
+DB_CONNECTION_HOLD_SECONDS = registry.histogram(
+    "db_connection_hold_seconds",
+    "DB 세션이 커넥션을 점유한 시간(초)",
+)
+SCHEDULER_JOB_SECONDS = registry.histogram(
+    "scheduler_job_duration_seconds",
+    "스케줄러 작업 실행 시간(초)",
+    ("job", "outcome"),
+    buckets=LONG_RUNNING_BUCKETS,
+)
+SCHEDULER_JOB_MISFIRES_TOTAL = registry.counter(
+    "scheduler_job_misfires_total",
+    "misfire_grace_time 을 넘겨 건너뛴 스케줄러 작업 수",
+    ("job",),
+)
+AUTONOMOUS_CYCLE_STAGE_SECONDS = registry.histogram(
+    "autonomous_cycle_stage_duration_seconds",
+    "자율주행 AI 사이클 단계별 실행 시간(초)",
+    ("stage",),
+    buckets=LONG_RUNNING_BUCKETS,
+)
+CHAT_MODEL_CACHE_TOTAL = registry.counter(
+    "chat_model_cache_total",
+    "채팅 모델 registry 조회 결과",
+    ("provider", "kind", "result"),
+)
+CHAT_MODEL_BUILD_SECONDS = registry.histogram(
+    "chat_model_build_duration_seconds",
+    "채팅 모델 생성 및 bind_tools/with_structured_output 시간(초)",
+    ("provider", "kind"),
+)
+CHAT_MODEL_BUILD_SECONDS_SAVED_TOTAL = registry.counter(
+    "chat_model_build_seconds_saved_total",
+    "registry 재사용으로 생략한 채팅 모델 생성 시간 누계(초)",
+    ("provider", "kind"),
+)
+COMMAND_DURATION_SECONDS = registry.histogram(
+    "command_dispatch_duration_seconds",
+    "메신저 명령 처리 시간(초)",
+    ("dispatcher", "command", "outcome"),
+)
+COMMAND_QUEUE_DEPTH = registry.gauge(
+    "command_dispatch_queue_depth",
+    "메신저 명령 대기열 길이",
+    ("dispatcher",),
+)
+APP_WARMUP_SECONDS = registry.histogram(
+    "app_warmup_duration_seconds",
+    "기동 후 백그라운드 warm-up 단계별 소요 시간(초)",
+    ("step", "outcome"),
+)
+INDICATOR_CACHE_TOTAL = registry.counter(
+    "indicator_cache_total",
+    "기술 지표 캐시 조회 결과(hit/append/miss/bypass)",
+    ("timeframe", "result"),
+)
+LIQUIDATION_SUBMIT_SECONDS = registry.histogram(
+    "liquidation_submit_duration_seconds",
+    "비상 청산 요청부터 마지막 매도 주문 제출까지 걸린 시간(초)",
+    (),
+)
+LIQUIDATION_ORDERS_TOTAL = registry.counter(
+    "liquidation_orders_total",
+    "비상 청산 마켓별 결과",
+    ("status",),
+)
+RESPONSE_CACHE_TOTAL = registry.counter(
+    "response_cache_total",
+    "조회 API 응답 캐시 결과(hit/coalesced/miss)",
+    ("route", "result"),
+)
+LIVE_SUBSCRIBERS = registry.gauge(
+    "live_event_subscribers",
+    "실시간 이벤트(SSE) 연결 수",
+    (),
+)
+LIVE_EVENTS_DROPPED_TOTAL = registry.counter(
+    "live_events_dropped_total",
+    "구독자 큐가 가득 차 resync 로 대체된 실시간 이벤트 수",
+    ("event_type",),
+)
+
+
+@contextmanager
+def observe_duration(histogram: Histogram, **labels: Any) -> Iterator[dict[str, Any]]:
+    """구간 시간을 기록합니다. 예외가 나면 ``outcome`` 라벨을 ``error`` 로 바꿉니다.
+
+    yield 된 dict 의 값을 바꾸면 기록 시점의 라벨을 덮어쓸 수 있습니다.
+    """
+    resolved_labels = dict(labels)
+    started_at = time.perf_counter()
+    try:
+        yield resolved_labels
+    except BaseException:
+        if "outcome" in histogram.labelnames and resolved_labels.get("outcome") in (None, "success"):
+            resolved_labels["outcome"] = "error"
+        raise
+    finally:
+        histogram.observe(time.perf_counter() - started_at, **resolved_labels)
+
+
+def timed(histogram: Histogram, **labels: Any) -> Callable[[F], F]:
+    """동기/비동기 함수 실행 시간을 기록하는 데코레이터입니다."""
+
+    def decorator(func: F) -> F:
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with observe_duration(histogram, **labels):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with observe_duration(histogram, **labels):
+                return func(*args, **kwargs)
+
+        return sync_wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def record_llm_usage(
+    provider: str,
+    model: str,
+    *,
+    input_tokens: int | None = None,
+    output_tokens: int | None = None,
+    cached_tokens: int | None = None,
+    purpose: str | None = None,
+) -> None:
+    resolved_purpose = purpose or current_llm_purpose.get()
+    call_usage = current_llm_usage.get()
+    if call_usage is not None:
+        call_usage.input_tokens += int(input_tokens or 0)
+        call_usage.output_tokens += int(output_tokens or 0)
+        call_usage.cached_tokens += int(cached_tokens or 0)
+    for kind, amount in (
+        ("input", input_tokens),
+        ("output", output_tokens),
+        ("cached", cached_tokens),
+    ):
+        if amount:
+            LLM_TOKENS_TOTAL.inc(
+                float(amount),
+                provider=provider,
+                model=model,
+                purpose=resolved_purpose,
+                kind=kind,
+            )
+
+
+def record_langchain_usage(provider: str, model: str, message: Any) -> None:
+    """LangChain AIMessage.usage_metadata 의 토큰 사용량을 기록합니다."""
+    usage = getattr(message, "usage_metadata", None)
+    if not isinstance(usage, dict):
+        return
+    input_details = usage.get("input_token_details")
+    cached_tokens = input_details.get("cache_read") if isinstance(input_details, dict) else None
+    record_llm_usage(
+        provider,
+        model,
+        input_tokens=usage.get("input_tokens"),
+        output_tokens=usage.get("output_tokens"),
+        cached_tokens=cached_tokens,
+    )
+
+
+def normalize_sql_statement(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    if keyword in {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}:
+        return keyword
+    return "OTHER"
@@ -0,0 +1,342 @@
+"""자율주행 사이클/주문 실행/뉴스 수집 실행의 구조화 프로파일링.
+
+프로파일링 모드가 켜져 있으면 ``profiled`` 로 감싼 진입점이 실행될 때마다 span 트리를
+만들고, 내부 구간은 ``profile_span`` 으로 자식 span 을 붙입니다. 완료된 실행은 최근
+N건만 링 버퍼에 보관하며 JSON, collapsed stack(flamegraph.pl/speedscope), pstats
+형식으로 내려받을 수 있습니다.
+
+cProfile 은 샘플링된 실행에서만 켜며, 이벤트 루프 스레드 전체를 측정하므로 같은
+시간대에 돌던 다른 작업의 함수도 함께 포함될 수 있습니다.
+"""
+
+import cProfile
+import functools
+import io
+import json
+import logging
+import marshal
+import pstats
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.repository import PROFILING_CPROFILE_SAMPLE_RATE_KEY
+from app.db.repository import PROFILING_ENABLED_KEY
+from app.db.repository import get_system_config_value
+
+logger = logging.getLogger(__name__)
+
+CPROFILE_SUMMARY_LIMIT = 40
+DEFAULT_CPROFILE_SAMPLE_RATE = 0.1
+TRUE_VALUES = {"1", "true", "yes", "on"}
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@dataclass(slots=True)
+class ProfileSpan:
+    name: str
+    started_at: float
+    attributes: dict[str, Any] = field(default_factory=dict)
+    children: list["ProfileSpan"] = field(default_factory=list)
+    duration_seconds: float | None = None
+    error: str | None = None
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def to_dict(self, origin: float) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "offset_ms": round((self.started_at - origin) * 1000, 3),
+            "duration_ms": (
+                round(self.duration_seconds * 1000, 3) if self.duration_seconds is not None else None
+            ),
+            "attributes": self.attributes,
+            "error": self.error,
+            "children": [child.to_dict(origin) for child in self.children],
+        }
+
+
+@dataclass(slots=True)
+class ProfileRun:
+    run_id: str
+    name: str
+    started_at: datetime
+    root: ProfileSpan
+    cprofile_stats: bytes | None = None
+    cprofile_summary: list[dict[str, Any]] | None = None
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "name": self.name,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": (
+                round(self.root.duration_seconds * 1000, 3)
+                if self.root.duration_seconds is not None
+                else None
+            ),
+            "error": self.root.error,
+            "span_count": _count_spans(self.root),
+            "has_cprofile": self.cprofile_stats is not None,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **self.summary(),
+            "root": self.root.to_dict(self.root.started_at),
+            "cprofile_top": self.cprofile_summary,
+        }
+
+    def to_collapsed_stacks(self) -> str:
+        """span 별 self time(µs)을 ``a;b;c 123`` 형태로 펼칩니다."""
+        lines: list[str] = []
+        _collect_collapsed(self.root, (), lines)
+        return "\n".join(lines) + ("\n" if lines else "")
+
+
+def _count_spans(span: ProfileSpan) -> int:
+    return 1 + sum(_count_spans(child) for child in span.children)
+
+
+def _collect_collapsed(span: ProfileSpan, prefix: tuple[str, ...], lines: list[str]) -> None:
+    path = (*prefix, span.name.replace(";", ":").replace(" ", "_"))
+    duration = span.duration_seconds or 0.0
+    children_duration = sum(child.duration_seconds or 0.0 for child in span.children)
+    self_micros = int(max(duration - children_duration, 0.0) * 1_000_000)
+    if self_micros > 0:
+        lines.append(f"{';'.join(path)} {self_micros}")
+    for child in span.children:
+        _collect_collapsed(child, path, lines)
+
+
+def payload_size(value: Any) -> int:
+    """span 속성에 기록할 대략적인 payload 크기(UTF-8 바이트)를 계산합니다."""
+    if value is None:
+        return 0
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    try:
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(str(value).encode("utf-8"))
+
+
+def _summarize_cprofile(profile: cProfile.Profile) -> list[dict[str, Any]]:
+    stats = pstats.Stats(profile, stream=io.StringIO())
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    rows: list[dict[str, Any]] = []
+    for function_key in stats.fcn_list[:CPROFILE_SUMMARY_LIMIT]:  # type: ignore[attr-defined]
+        primitive_calls, total_calls, total_time, cumulative_time, _callers = stats.stats[function_key]  # type: ignore[attr-defined]
+        filename, line_number, function_name = function_key
+        rows.append(
+            {
+                "function": f"{filename}:{line_number}({function_name})",
+                "calls": total_calls,
+                "primitive_calls": primitive_calls,
+                "total_ms": round(total_time * 1000, 3),
+                "cumulative_ms": round(cumulative_time * 1000, 3),
+            }
+        )
+    return rows
+
+
+_current_span: ContextVar[ProfileSpan | None] = ContextVar("profiling_current_span", default=None)
+
+
+class StructuredProfiler:
+    def __init__(
+        self,
+        *,
+        buffer_size: int = 50,
+        cprofile_sample_rate: float = DEFAULT_CPROFILE_SAMPLE_RATE,
+    ) -> None:
+        self.enabled = False
+        self.cprofile_sample_rate = cprofile_sample_rate
+        self._runs: deque[ProfileRun] = deque(maxlen=max(1, int(buffer_size)))
+        self._lock = threading.Lock()
+        self._cprofile_active = False
+
+    @property
+    def buffer_size(self) -> int:
+        return self._runs.maxlen or 0
+
+    def configure(
+        self,
+        *,
+        enabled: bool | None = None,
+        cprofile_sample_rate: float | None = None,
+    ) -> None:
+        if enabled is not None:
+            self.enabled = bool(enabled)
+        if cprofile_sample_rate is not None:
+            self.cprofile_sample_rate = min(max(float(cprofile_sample_rate), 0.0), 1.0)
+
+    async def refresh_from_db(self, db: AsyncSession) -> None:
+        enabled_value = await get_system_config_value(db, PROFILING_ENABLED_KEY, "false")
+        sample_rate_value = await get_system_config_value(
+            db,
+            PROFILING_CPROFILE_SAMPLE_RATE_KEY,
+            str(DEFAULT_CPROFILE_SAMPLE_RATE),
+        )
+        try:
+            sample_rate = float(str(sample_rate_value).strip())
+        except (TypeError, ValueError):
+            sample_rate = DEFAULT_CPROFILE_SAMPLE_RATE
+        self.configure(
+            enabled=str(enabled_value or "").strip().lower() in TRUE_VALUES,
+            cprofile_sample_rate=sample_rate,
+        )
+
+    def list_runs(self) -> list[dict[str, Any]]:
+        with self._lock:
+            runs = list(self._runs)
+        return [run.summary() for run in reversed(runs)]
+
+    def get_run(self, run_id: str) -> ProfileRun | None:
+        with self._lock:
+            for run in self._runs:
+                if run.run_id == run_id:
+                    return run
+        return None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._runs.clear()
+
+    @contextmanager
+    def trace(self, name: str, **attributes: Any) -> Iterator[ProfileSpan | None]:
+        """진행 중인 trace 가 있으면 자식 span 을, 없으면 새 실행(root span)을 시작합니다."""
+        parent = _current_span.get()
+        if parent is None and not self.enabled:
+            yield None
+            return
+
+        span = ProfileSpan(name=name, started_at=time.perf_counter(), attributes=dict(attributes))
+        if parent is not None:
+            parent.children.append(span)
+            yield from _run_span(span)
+            return
+
+        started_at = datetime.now(timezone.utc)
+        profile = self._start_cprofile()
+        try:
+            yield from _run_span(span)
+        finally:
+            cprofile_stats, cprofile_summary = self._stop_cprofile(profile)
+            run = ProfileRun(
+                run_id=uuid.uuid4().hex,
+                name=name,
+                started_at=started_at,
+                root=span,
+                cprofile_stats=cprofile_stats,
+                cprofile_summary=cprofile_summary,
+            )
+            with self._lock:
+                self._runs.append(run)
+            logger.info(
+                "프로파일링 실행 기록: name=%s run_id=%s duration_ms=%.1f cprofile=%s",
+                name,
+                run.run_id,
+                (span.duration_seconds or 0.0) * 1000,
+                cprofile_stats is not None,
+            )
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[ProfileSpan | None]:
+        """진행 중인 trace 안에서만 자식 span 을 기록합니다."""
+        parent = _current_span.get()
+        if parent is None:
+            yield None
+            return
+        span = ProfileSpan(name=name, started_at=time.perf_counter(), attributes=dict(attributes))
+        parent.children.append(span)
+        yield from _run_span(span)
+
+    def _start_cprofile(self) -> cProfile.Profile | None:
+        if self.cprofile_sample_rate <= 0 or random.random() >= self.cprofile_sample_rate:
+            return None
+        with self._lock:
+            if self._cprofile_active:
+                return None
+            self._cprofile_active = True
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # 다른 profiler 가 이미 sys.setprofile 을 점유한 경우입니다.
+            with self._lock:
+                self._cprofile_active = False
+            return None
+        return profile
+
+    def _stop_cprofile(
+        self,
+        profile: cProfile.Profile | None,
+    ) -> tuple[bytes | None, list[dict[str, Any]] | None]:
+        if profile is None:
+            return None, None
+        try:
+            profile.disable()
+            profile.create_stats()
+            return marshal.dumps(profile.stats), _summarize_cprofile(profile)  # type: ignore[attr-defined]
+        except Exception:
+            logger.warning("cProfile 결과 수집 실패", exc_info=True)
+            return None, None
+        finally:
+            with self._lock:
+                self._cprofile_active = False
+
+
+def _run_span(span: ProfileSpan) -> Iterator[ProfileSpan]:
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.error = f"{type(exc).__name__}: {exc}"[:300]
+        raise
+    finally:
+        span.duration_seconds = time.perf_counter() - span.started_at
+        _current_span.reset(token)
+
+
+profiler = StructuredProfiler(buffer_size=settings.profiling_ring_buffer_size)
+
+
+def profile_span(name: str, **attributes: Any):
+    return profiler.span(name, **attributes)
+
+
+def annotate_span(**attributes: Any) -> None:
+    """현재 span 에 payload 크기 같은 속성을 덧붙입니다. trace 밖에서는 아무것도 하지 않습니다."""
+    span = _current_span.get()
+    if span is not None:
+        span.set(**attributes)
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    """비동기 진입점을 프로파일링 실행(root span) 또는 상위 trace 의 자식 span 으로 감쌉니다."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with profiler.trace(name):
+                return await func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,30 @@
+import asyncio
+import time
+from collections.abc import Callable
+
+
+class TokenBucketLimiter:
+    """초당 ``rate`` 회, 최대 ``burst`` 회까지 한 번에 허용하는 token bucket."""
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = max(float(rate_per_second), 0.001)
+        self.capacity = float(burst if burst is not None else max(int(self.rate), 1))
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1.0
+            wait_seconds = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
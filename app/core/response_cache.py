@@ -0,0 +1,285 @@
+"""조회 전용 API 응답 캐시(ETag / 304 / single-flight).
+
+대시보드·브리핑·마켓 목록처럼 프론트엔드가 주기적으로 폴링하는 GET 응답을 라우트별 TTL 동안
+메모리에 보관합니다.
+
+- 캐시 항목은 TTL 이 지나거나, 응답이 의존하는 테이블의 데이터 버전이 바뀌면 무효가 됩니다.
+  데이터 버전은 ORM 세션이 커밋한 테이블마다 올라갑니다(``app.db.session`` 참고).
+- ETag 는 응답 본문의 해시(strong validator)이고 ``If-None-Match`` 가 일치하면 본문 없이
+  ``304 Not Modified`` 를 돌려줍니다. ``Cache-Control: no-cache`` 를 함께 보내므로 브라우저는
+  매 폴링마다 재검증만 하고 본문은 바뀐 경우에만 내려받습니다.
+- 같은 키의 캐시가 비어 있을 때 동시에 들어온 요청은 하나만 라우트를 실행하고 나머지는 그
+  결과를 기다려 함께 씁니다(single-flight). 여러 탭이 동시에 폴링해도 백엔드/Upbit 부하가
+  탭 수만큼 늘지 않습니다.
+
+200 응답만 캐시합니다. 오류나 폴백 응답(예: 대시보드 ``is_stale``)도 200 이면 TTL 동안
+재사용되므로 TTL 은 라우트 성격에 맞춰 짧게 둡니다.
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.metrics import RESPONSE_CACHE_TOTAL
+
+RESPONSE_CACHE_MAX_ENTRIES = 256
+CACHE_CONTROL_HEADER = b"private, no-cache"
+
+
+@dataclass(frozen=True, slots=True)
+class CachedRoute:
+    path: str
+    ttl_seconds: float
+    tables: tuple[str, ...] = ()
+
+
+# 경로는 /api prefix 를 포함한 실제 요청 경로입니다.
+# 브리핑은 성공할 때마다 provider 상태를 system_configs 에 저장하므로 이 테이블을 의존 목록에 넣으면
+# 자기 쓰기로 매번 무효가 됩니다. 시장 심리 스냅샷 변경은 TTL 안에서만 늦게 반영됩니다.
+DEFAULT_CACHED_ROUTES: tuple[CachedRoute, ...] = (
+    CachedRoute("/api/dashboard", 5.0, ("positions", "order_history")),
+    CachedRoute(
+        "/api/portfolio/briefing",
+        300.0,
+        ("positions", "order_history", "ai_analysis_logs", "portfolio_snapshots"),
+    ),
+    CachedRoute("/api/markets/", 300.0),
+    CachedRoute("/api/news/rag/status", 30.0),
+    CachedRoute("/api/ai/performance", 60.0, ("positions", "order_history", "ai_analysis_logs")),
+)
+
+
+class DataVersions:
+    """테이블별 데이터 버전 카운터. 커밋된 쓰기마다 해당 테이블 버전이 1씩 오릅니다."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._versions: dict[str, int] = {}
+
+    def bump(self, tables: Iterable[str]) -> None:
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def snapshot(self, tables: Iterable[str]) -> tuple[int, ...]:
+        with self._lock:
+            return tuple(self._versions.get(table, 0) for table in tables)
+
+
+data_versions = DataVersions()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    body: bytes
+    media_type: bytes
+    etag: bytes
+    versions: tuple[int, ...]
+    expires_at: float
+
+
+def compute_etag(body: bytes) -> bytes:
+    return b'"' + hashlib.blake2b(body, digest_size=16).hexdigest().encode("ascii") + b'"'
+
+
+def etag_matches(if_none_match: bytes | None, etag: bytes) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(b",")]
+    if b"*" in candidates:
+        return True
+    # If-None-Match 는 weak 비교를 씁니다(W/ 접두어 무시).
+    return any(candidate.removeprefix(b"W/") == etag for candidate in candidates)
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        routes: Iterable[CachedRoute] = DEFAULT_CACHED_ROUTES,
+        *,
+        versions: DataVersions = data_versions,
+        max_entries: int = RESPONSE_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.routes = {route.path: route for route in routes}
+        self.versions = versions
+        self.max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def get(self, key: str, route: CachedRoute) -> CachedResponse | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._clock() >= entry.expires_at or entry.versions != self.versions.snapshot(route.tables):
+                self._entries.pop(key, None)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def store(
+        self,
+        key: str,
+        route: CachedRoute,
+        *,
+        body: bytes,
+        media_type: bytes,
+        versions: tuple[int, ...],
+    ) -> CachedResponse:
+        entry = CachedResponse(
+            body=body,
+            media_type=media_type,
+            etag=compute_etag(body),
+            versions=versions,
+            expires_at=self._clock() + route.ttl_seconds,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def inflight(self, key: str) -> asyncio.Future | None:
+        return self._inflight.get(key)
+
+    def begin(self, key: str) -> asyncio.Future:
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        return future
+
+    def finish(self, key: str, future: asyncio.Future, entry: CachedResponse | None) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.done():
+            future.set_result(entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+response_cache = ResponseCache()
+
+
+def _cache_key(scope: dict[str, Any]) -> str:
+    query = scope.get("query_string") or b""
+    return f"{scope['path']}?{query.decode('latin-1')}" if query else scope["path"]
+
+
+def _header(scope: dict[str, Any], name: bytes) -> bytes | None:
+    for key, value in scope.get("headers") or []:
+        if key.lower() == name:
+            return value
+    return None
+
+
+class ResponseCacheMiddleware:
+    """``ResponseCache`` 에 등록된 GET 경로만 가로채는 ASGI middleware."""
+
+    def __init__(self, app: Any, cache: ResponseCache | None = None, *, enabled: bool = True) -> None:
+        self.app = app
+        self.cache = cache or response_cache
+        self.enabled = enabled
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+        route = self.cache.routes.get(scope.get("path", "")) if scope["type"] == "http" else None
+        if not self.enabled or route is None or scope.get("method") != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        key = _cache_key(scope)
+        if_none_match = _header(scope, b"if-none-match")
+        entry = self.cache.get(key, route)
+        if entry is not None:
+            RESPONSE_CACHE_TOTAL.inc(route=route.path, result="hit")
+            await self._send_entry(send, entry, if_none_match, cache_status=b"HIT")
+            return
+
+        inflight = self.cache.inflight(key)
+        if inflight is not None:
+            entry = await asyncio.shield(inflight)
+            if entry is not None:
+                RESPONSE_CACHE_TOTAL.inc(route=route.path, result="coalesced")
+                await self._send_entry(send, entry, if_none_match, cache_status=b"HIT")
+                return
+
+        RESPONSE_CACHE_TOTAL.inc(route=route.path, result="miss")
+        future = self.cache.begin(key)
+        entry = None
+        try:
+            entry = await self._generate(scope, receive, send, key, route, if_none_match)
+        finally:
+            # 생성이 실패하면 기다리던 요청은 None 을 받고 각자 라우트를 실행합니다.
+            self.cache.finish(key, future, entry)
+
+    async def _generate(
+        self,
+        scope: dict[str, Any],
+        receive: Callable,
+        send: Callable,
+        key: str,
+        route: CachedRoute,
+        if_none_match: bytes | None,
+    ) -> CachedResponse | None:
+        # 생성 도중 들어온 쓰기는 버전이 달라지므로 바로 다음 요청에서 다시 만듭니다.
+        versions = self.cache.versions.snapshot(route.tables)
+        start_message: dict[str, Any] | None = None
+        chunks: list[bytes] = []
+
+        async def capture(message: dict[str, Any]) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        if start_message is None:
+            return None
+
+        body = b"".join(chunks)
+        if start_message.get("status") != 200:
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+            return None
+
+        media_type = dict(start_message.get("headers") or []).get(b"content-type", b"application/json")
+        entry = self.cache.store(key, route, body=body, media_type=media_type, versions=versions)
+        await self._send_entry(send, entry, if_none_match, cache_status=b"MISS")
+        return entry
+
+    @staticmethod
+    async def _send_entry(
+        send: Callable,
+        entry: CachedResponse,
+        if_none_match: bytes | None,
+        *,
+        cache_status: bytes,
+    ) -> None:
+        headers = [
+            (b"etag", entry.etag),
+            (b"cache-control", CACHE_CONTROL_HEADER),
+            (b"x-cache", cache_status),
+        ]
+        if etag_matches(if_none_match, entry.etag):
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        headers.extend(
+            [
+                (b"content-type", entry.media_type),
+                (b"content-length", str(len(entry.body)).encode("ascii")),
+            ]
+        )
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": entry.body})
@@ -1,19 +1,31 @@
 import asyncio
+import functools
 import json
 import logging
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from zoneinfo import ZoneInfo
 
+from apscheduler.events import EVENT_JOB_MISSED
+from apscheduler.events import JobExecutionEvent
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.base import BaseTrigger
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
-from sqlalchemy import desc, select
+from sqlalchemy import desc, func, select
 
 from app.api.routes.ai import analyze_portfolio
 from app.api.routes.news import get_news_sentiment
+from app.core.metrics import AUTONOMOUS_CYCLE_STAGE_SECONDS
+from app.core.metrics import SCHEDULER_JOB_MISFIRES_TOTAL
+from app.core.metrics import SCHEDULER_JOB_SECONDS
+from app.core.metrics import observe_duration
+from app.core.profiling import profile_span
+from app.core.profiling import profiled
 from app.db.repository import AI_BRIEFING_TIME_KEY
 from app.db.repository import AUTONOMOUS_AI_INTERVAL_HOURS_KEY
 from app.db.repository import AUTONOMOUS_AI_INTERVAL_MINUTES_KEY
@@ -72,6 +84,7 @@ SLACK_ALERT_DEFAULT_DECISIONS = ["BUY", "SELL"]
 MARKET_IMPACT_NEWS_LIMIT = 3
 MARKET_IMPACT_NEWS_CANDIDATE_LIMIT = 40
 MARKET_IMPACT_RECENT_HOURS = 48
+ALERT_SECTION_CACHE_TTL_SECONDS = 90
 MARKET_IMPACT_KEYWORDS: tuple[dict[str, Any], ...] = (
     {"label": "ETF", "terms": ("etf", "현물 etf"), "direction": "상방", "weight": 18},
     {"label": "승인", "terms": ("approval", "approved", "승인", "인가"), "direction": "상방", "weight": 15},
@@ -118,6 +131,35 @@ SLACK_ALERT_PRESET_TIMES: dict[str, list[str]] = {
 
 scheduler = AsyncIOScheduler(timezone=SCHEDULER_TIMEZONE)
 _scheduler_loop: asyncio.AbstractEventLoop | None = None
+_alert_section_cache: dict[str, tuple[float, asyncio.Future]] = {}
+
+
+def _scheduler_job_metric_name(job_id: str) -> str:
+    # slack_portfolio_alert:<rule>:<index> 처럼 규칙별로 늘어나는 job 은 접두사로 묶습니다.
+    return job_id.split(":", 1)[0]
+
+
+def _instrument_scheduler_job(job_id: str, func: Callable[..., Awaitable[Any]]):
+    job_name = _scheduler_job_metric_name(job_id)
+
+    @functools.wraps(func)
+    async def _run(*args: Any, **kwargs: Any) -> Any:
+        with observe_duration(SCHEDULER_JOB_SECONDS, job=job_name, outcome="success"):
+            return await func(*args, **kwargs)
+
+    return _run
+
+
+def _on_scheduler_job_missed(event: JobExecutionEvent) -> None:
+    SCHEDULER_JOB_MISFIRES_TOTAL.inc(job=_scheduler_job_metric_name(event.job_id))
+    logger.warning(
+        "Scheduler job misfire: job_id=%s scheduled_run_time=%s",
+        event.job_id,
+        event.scheduled_run_time,
+    )
+
+
+scheduler.add_listener(_on_scheduler_job_missed, EVENT_JOB_MISSED)
 
 
 async def run_market_news_ingestion_job() -> dict[str, Any]:
@@ -458,7 +500,7 @@ def _upsert_scheduler_job(
     existing_job = scheduler.get_job(job_id)
     if existing_job is None:
         scheduler.add_job(
-            func,
+            _instrument_scheduler_job(job_id, func),
             trigger=trigger,
             kwargs=kwargs,
             id=job_id,
@@ -720,12 +762,20 @@ async def save_portfolio_snapshot_job() -> None:
         )
 
 
+@contextmanager
+def _autonomous_cycle_stage(stage: str, **attributes: Any) -> Iterator[None]:
+    with AUTONOMOUS_CYCLE_STAGE_SECONDS.time(stage=stage), profile_span(stage, **attributes):
+        yield
+
+
+@profiled("autonomous_ai_analyst_job")
 async def autonomous_ai_analyst_job() -> None:
     try:
         liquidated_symbols: set[str] = set()
         async with AsyncSessionLocal() as db:
             try:
-                liquidated_symbols = await execute_hard_tp_sl_check(db)
+                with _autonomous_cycle_stage("hard_tp_sl_check"):
+                    liquidated_symbols = await execute_hard_tp_sl_check(db)
                 if liquidated_symbols:
                     logger.info(
                         "하드 TP/SL 선제 청산 완료: liquidated_symbols=%s",
@@ -737,16 +787,17 @@ async def autonomous_ai_analyst_job() -> None:
                     exc_info=True,
                 )
 
-            result = await db.execute(
-                select(Favorite.symbol).order_by(desc(Favorite.created_at), desc(Favorite.id))
-            )
-            symbols = [
-                str(symbol).strip().upper()
-                for symbol in result.scalars().all()
-                if str(symbol).strip()
-            ]
-            entry_gate_config = await load_entry_gate_config(db)
-            symbols = filter_trade_symbols(symbols, entry_gate_config)
+            with _autonomous_cycle_stage("watchlist_load"):
+                result = await db.execute(
+                    select(Favorite.symbol).order_by(desc(Favorite.created_at), desc(Favorite.id))
+                )
+                symbols = [
+                    str(symbol).strip().upper()
+                    for symbol in result.scalars().all()
+                    if str(symbol).strip()
+                ]
+                entry_gate_config = await load_entry_gate_config(db)
+                symbols = filter_trade_symbols(symbols, entry_gate_config)
             if liquidated_symbols:
                 symbols = [
                     symbol
@@ -763,7 +814,8 @@ async def autonomous_ai_analyst_job() -> None:
         for index, symbol in enumerate(symbols):
             async with AsyncSessionLocal() as db:
                 try:
-                    analysis_log = await execute_ai_analysis(db, symbol)
+                    with _autonomous_cycle_stage("analysis", symbol=symbol):
+                        analysis_log = await execute_ai_analysis(db, symbol)
                     logger.info(
                         "Watchlist 자율주행 AI 분석 완료: symbol=%s analysis_id=%s",
                         symbol,
@@ -792,7 +844,8 @@ async def autonomous_ai_analyst_job() -> None:
                     continue
 
                 try:
-                    await execute_ai_trade(db, symbol, analysis_id=analysis_log.id)
+                    with _autonomous_cycle_stage("trade_execution", symbol=symbol):
+                        await execute_ai_trade(db, symbol, analysis_id=analysis_log.id)
                     logger.info(
                         "Watchlist 자율주행 AI 집행 완료: symbol=%s analysis_id=%s",
                         symbol,
@@ -1034,54 +1087,72 @@ def _rank_market_impact_news_candidates(
     return ranked[:limit]
 
 
-async def _load_favorite_ai_signals(
-    db,
-    decisions: list[str],
-    min_confidence: int,
-    limit: int = 8,
-) -> list[dict[str, Any]]:
+async def _load_favorite_latest_analyses(db) -> list[dict[str, Any]]:
     favorite_result = await db.execute(
         select(Favorite.symbol).order_by(desc(Favorite.created_at), desc(Favorite.id))
     )
-    symbols = [
-        str(symbol).strip().upper()
-        for symbol in favorite_result.scalars().all()
-        if str(symbol).strip()
-    ]
+    symbols = _dedupe_preserve_order(
+        [
+            str(symbol).strip().upper()
+            for symbol in favorite_result.scalars().all()
+            if str(symbol).strip()
+        ]
+    )
     if not symbols:
         return []
 
-    allowed_decisions = {decision.upper() for decision in decisions}
-    signal_items: list[dict[str, Any]] = []
-    for symbol in symbols:
-        analysis_result = await db.execute(
-            select(AIAnalysisLog)
-            .where(AIAnalysisLog.symbol == symbol)
-            .order_by(desc(AIAnalysisLog.created_at), desc(AIAnalysisLog.id))
-            .limit(1)
+    ranked_analyses = (
+        select(
+            AIAnalysisLog.symbol.label("symbol"),
+            AIAnalysisLog.decision.label("decision"),
+            AIAnalysisLog.confidence.label("confidence"),
+            AIAnalysisLog.recommended_weight.label("recommended_weight"),
+            AIAnalysisLog.created_at.label("created_at"),
+            func.row_number()
+            .over(
+                partition_by=AIAnalysisLog.symbol,
+                order_by=(desc(AIAnalysisLog.created_at), desc(AIAnalysisLog.id)),
+            )
+            .label("row_number"),
         )
-        analysis = analysis_result.scalar_one_or_none()
-        if analysis is None:
-            continue
+        .where(AIAnalysisLog.symbol.in_(symbols))
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            ranked_analyses.c.symbol,
+            ranked_analyses.c.decision,
+            ranked_analyses.c.confidence,
+            ranked_analyses.c.recommended_weight,
+            ranked_analyses.c.created_at,
+        ).where(ranked_analyses.c.row_number == 1)
+    )
+    latest_by_symbol = {
+        str(row.symbol or "").strip().upper(): {
+            "symbol": str(row.symbol or "").strip().upper(),
+            "decision": str(row.decision or "").upper(),
+            "confidence": int(row.confidence or 0),
+            "recommended_weight": int(row.recommended_weight or 0),
+            "created_at": row.created_at,
+        }
+        for row in result.all()
+    }
+    return [latest_by_symbol[symbol] for symbol in symbols if symbol in latest_by_symbol]
 
-        decision = str(analysis.decision or "").upper()
-        if decision not in allowed_decisions:
-            continue
-        if int(analysis.confidence or 0) < min_confidence:
-            continue
 
-        signal_items.append(
-            {
-                "symbol": symbol,
-                "decision": decision,
-                "confidence": int(analysis.confidence or 0),
-                "recommended_weight": int(analysis.recommended_weight or 0),
-                "created_at": analysis.created_at,
-            }
-        )
-        if len(signal_items) >= limit:
-            break
-    return signal_items
+def _filter_favorite_ai_signals(
+    latest_analyses: list[dict[str, Any]],
+    decisions: list[str],
+    min_confidence: int,
+    limit: int = 8,
+) -> list[dict[str, Any]]:
+    allowed_decisions = {decision.upper() for decision in decisions}
+    signal_items = [
+        dict(item)
+        for item in latest_analyses
+        if item["decision"] in allowed_decisions and item["confidence"] >= min_confidence
+    ]
+    return signal_items[:limit]
 
 
 async def _load_alert_reference_symbols(db, portfolio: Any | None) -> list[str]:
@@ -1333,6 +1404,94 @@ def _build_slack_portfolio_alert_blocks(
     return blocks
 
 
+async def _cached_alert_section(key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """같은 시간대에 실행되는 알림 규칙끼리 섹션 조회 결과를 짧게 공유합니다.
+
+    진행 중인 조회도 future로 공유하므로 동시에 시작한 규칙들은 업스트림을 한 번만
+    호출합니다. 실패한 조회는 캐시에 남기지 않습니다.
+    """
+    now = time.monotonic()
+    for cached_key, (expires_at, _) in list(_alert_section_cache.items()):
+        if expires_at <= now:
+            _alert_section_cache.pop(cached_key, None)
+
+    cached = _alert_section_cache.get(key)
+    if cached is not None:
+        return await asyncio.shield(cached[1])
+
+    future = asyncio.ensure_future(loader())
+    _alert_section_cache[key] = (now + ALERT_SECTION_CACHE_TTL_SECONDS, future)
+    try:
+        return await asyncio.shield(future)
+    except Exception:
+        if _alert_section_cache.get(key, (0.0, None))[1] is future:
+            _alert_section_cache.pop(key, None)
+        raise
+
+
+def _clear_alert_section_cache() -> None:
+    _alert_section_cache.clear()
+
+
+async def _load_alert_portfolio() -> Any:
+    async with AsyncSessionLocal() as db:
+        return await PortfolioService(db).get_aggregated_portfolio()
+
+
+async def _load_alert_sentiment() -> Any:
+    async with AsyncSessionLocal() as db:
+        return await get_news_sentiment(force_refresh=False, db=db)
+
+
+async def _load_alert_favorite_latest_analyses() -> list[dict[str, Any]]:
+    async with AsyncSessionLocal() as db:
+        return await _load_favorite_latest_analyses(db)
+
+
+async def _load_alert_market_impact_news(portfolio_future: Awaitable[Any]) -> list[dict[str, Any]]:
+    portfolio = await portfolio_future
+    async with AsyncSessionLocal() as db:
+        reference_symbols = await _load_alert_reference_symbols(db, portfolio)
+    return await _cached_alert_section(
+        f"market_impact_news:{','.join(reference_symbols)}",
+        lambda: _load_market_impact_news_items(reference_symbols),
+    )
+
+
+async def _load_slack_portfolio_alert_sections(rule: dict[str, Any]) -> dict[str, Any]:
+    """규칙에 포함된 섹션 로더를 각자의 DB 세션에서 동시에 실행합니다."""
+    sections = set(rule["sections"])
+    loaders: dict[str, Awaitable[Any]] = {}
+    portfolio_future: asyncio.Future | None = None
+    if "portfolio" in sections or "market_impact_news" in sections:
+        portfolio_future = asyncio.ensure_future(
+            _cached_alert_section("portfolio", _load_alert_portfolio)
+        )
+        loaders["portfolio"] = portfolio_future
+    if "fear_index" in sections:
+        loaders["sentiment"] = _cached_alert_section("sentiment", _load_alert_sentiment)
+    if "favorite_ai_signals" in sections:
+        loaders["favorite_latest_analyses"] = _cached_alert_section(
+            "favorite_latest_analyses",
+            _load_alert_favorite_latest_analyses,
+        )
+    if "market_impact_news" in sections and portfolio_future is not None:
+        loaders["market_impact_news_items"] = _load_alert_market_impact_news(portfolio_future)
+
+    values = await asyncio.gather(*loaders.values())
+    loaded = dict(zip(loaders.keys(), values))
+    return {
+        "portfolio": loaded.get("portfolio"),
+        "sentiment": loaded.get("sentiment"),
+        "signal_items": _filter_favorite_ai_signals(
+            loaded.get("favorite_latest_analyses") or [],
+            decisions=rule["signal_decisions"],
+            min_confidence=rule["min_confidence"],
+        ),
+        "market_impact_news_items": loaded.get("market_impact_news_items") or [],
+    }
+
+
 async def slack_portfolio_alert_job(rule: dict[str, Any]) -> None:
     from app.services.slack_bot import slack_bot
 
@@ -1341,36 +1500,19 @@ async def slack_portfolio_alert_job(rule: dict[str, Any]) -> None:
         logger.warning("Slack 포트폴리오 알림 실행 스킵: invalid_rule=%s", rule)
         return
 
-    sections = set(normalized_rule["sections"])
     try:
-        portfolio = None
-        sentiment = None
-        signal_items: list[dict[str, Any]] = []
-        market_impact_news_items: list[dict[str, Any]] = []
-        async with AsyncSessionLocal() as db:
-            if "portfolio" in sections or "market_impact_news" in sections:
-                portfolio = await PortfolioService(db).get_aggregated_portfolio()
-            if "fear_index" in sections:
-                sentiment = await get_news_sentiment(force_refresh=False, db=db)
-            if "favorite_ai_signals" in sections:
-                signal_items = await _load_favorite_ai_signals(
-                    db,
-                    decisions=normalized_rule["signal_decisions"],
-                    min_confidence=normalized_rule["min_confidence"],
-                )
-            if "market_impact_news" in sections:
-                reference_symbols = await _load_alert_reference_symbols(db, portfolio)
-                market_impact_news_items = await _load_market_impact_news_items(reference_symbols)
+        started_at = time.perf_counter()
+        loaded = await _load_slack_portfolio_alert_sections(normalized_rule)
+        logger.info(
+            "Slack 포트폴리오 알림 섹션 로딩 완료: rule_id=%s sections=%s elapsed=%.3fs",
+            normalized_rule["id"],
+            normalized_rule["sections"],
+            time.perf_counter() - started_at,
+        )
 
         slack_bot.send_message(
             text="Slack 포트폴리오 알림",
-            blocks=_build_slack_portfolio_alert_blocks(
-                normalized_rule,
-                portfolio=portfolio,
-                sentiment=sentiment,
-                signal_items=signal_items,
-                market_impact_news_items=market_impact_news_items,
-            ),
+            blocks=_build_slack_portfolio_alert_blocks(normalized_rule, **loaded),
         )
     except Exception:
         logger.exception("Slack 포트폴리오 알림 생성 중 오류가 발생했습니다.")
@@ -1380,10 +1522,20 @@ async def slack_portfolio_alert_job(rule: dict[str, Any]) -> None:
 async def daily_ai_briefing(force_refresh_news: bool = False, provider: str = DEFAULT_PROVIDER) -> None:
     from app.services.slack_bot import slack_bot
 
-    try:
+    async def _load_sentiment() -> Any:
         async with AsyncSessionLocal() as db:
-            sentiment = await get_news_sentiment(force_refresh=force_refresh_news, db=db)
-            portfolio_payload = await analyze_portfolio(provider=provider, db=db)
+            return await get_news_sentiment(force_refresh=force_refresh_news, db=db)
+
+    async def _load_portfolio_report() -> dict[str, str]:
+        async with AsyncSessionLocal() as db:
+            return await analyze_portfolio(provider=provider, db=db)
+
+    try:
+        # 시장 심리와 포트폴리오 리포트는 서로 독립적이므로 별도 세션에서 동시에 생성합니다.
+        sentiment, portfolio_payload = await asyncio.gather(
+            _load_sentiment(),
+            _load_portfolio_report(),
+        )
 
         report = str(portfolio_payload.get("report") or "").strip()
         resolved_provider = str(portfolio_payload.get("provider") or provider).strip().lower() or provider
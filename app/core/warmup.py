@@ -0,0 +1,134 @@
+"""기동 후 무거운 선택 서브시스템을 백그라운드에서 미리 불러오는 warm-up.
+
+앱은 warm-up 을 기다리지 않고 바로 요청을 받고(serving), 채팅 그래프/지표 스택/RAG/LLM SDK
+는 각 단계가 끝나는 대로 준비 상태가 됩니다(warmed). 단계가 끝나기 전에 해당 기능 요청이
+오면 그 요청이 첫 사용 시점에 직접 불러오므로 warm-up 은 지연을 앞당길 뿐 필수는 아닙니다.
+"""
+
+import asyncio
+import importlib
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from app.core.metrics import APP_WARMUP_SECONDS
+
+logger = logging.getLogger(__name__)
+
+WarmupStatus = Literal["pending", "running", "ready", "failed"]
+
+
+@dataclass(slots=True)
+class WarmupStep:
+    name: str
+    load: Callable[[], Any]
+    status: WarmupStatus = "pending"
+    seconds: float | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "status": self.status,
+            "seconds": round(self.seconds, 4) if self.seconds is not None else None,
+            "error": self.error,
+        }
+
+
+def _load_indicator_stack() -> None:
+    from app.services.indicators.calculator import load_indicator_stack
+
+    load_indicator_stack()
+
+
+def _load_chat_graph() -> None:
+    from app.services.chat.orchestrator import get_chat_orchestrator_graph
+
+    get_chat_orchestrator_graph()
+
+
+def _load_rag_stack() -> None:
+    from app.services.rag.opensearch_client import _instrumented_transport_class
+
+    _instrumented_transport_class()
+    importlib.import_module("app.services.rag.ingestion")
+
+
+def _load_ai_provider_sdks() -> None:
+    importlib.import_module("app.services.ai.providers.openai")
+    importlib.import_module("app.services.ai.providers.gemini")
+
+
+DEFAULT_WARMUP_STEPS: tuple[tuple[str, Callable[[], Any]], ...] = (
+    ("indicators", _load_indicator_stack),
+    ("rag", _load_rag_stack),
+    ("ai_providers", _load_ai_provider_sdks),
+    ("chat_graph", _load_chat_graph),
+)
+
+
+class AppWarmup:
+    def __init__(self, steps: Sequence[tuple[str, Callable[[], Any]]] = DEFAULT_WARMUP_STEPS) -> None:
+        self.steps = [WarmupStep(name=name, load=load) for name, load in steps]
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+
+    @property
+    def warmed(self) -> bool:
+        return all(step.status == "ready" for step in self.steps)
+
+    @property
+    def finished(self) -> bool:
+        return self.finished_at is not None
+
+    def status(self) -> str:
+        if self.warmed:
+            return "ready"
+        if self.finished:
+            return "degraded"
+        return "warming"
+
+    async def run(self) -> None:
+        """단계를 순서대로 워커 스레드에서 불러옵니다. 실패한 단계는 기록만 하고 계속 진행합니다."""
+        self.started_at = time.perf_counter()
+        for step in self.steps:
+            step.status = "running"
+            started_at = time.perf_counter()
+            try:
+                await asyncio.to_thread(step.load)
+            except Exception as exc:
+                step.status = "failed"
+                step.error = f"{type(exc).__name__}: {exc}"
+                logger.warning("warm-up 단계 실패: step=%s error=%s", step.name, step.error, exc_info=True)
+            else:
+                step.status = "ready"
+            finally:
+                step.seconds = time.perf_counter() - started_at
+                APP_WARMUP_SECONDS.observe(
+                    step.seconds,
+                    step=step.name,
+                    outcome="success" if step.status == "ready" else "error",
+                )
+        self.finished_at = time.perf_counter()
+        logger.info(
+            "warm-up 완료: status=%s seconds=%.3f steps=%s",
+            self.status(),
+            self.finished_at - self.started_at,
+            {step.name: step.status for step in self.steps},
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = (self.finished_at or time.perf_counter()) - self.started_at
+        return {
+            "status": self.status(),
+            "serving": True,
+            "warmed": self.warmed,
+            "warmup_seconds": round(elapsed, 4) if elapsed is not None else None,
+            "components": {step.name: step.to_dict() for step in self.steps},
+        }
+
+
+app_warmup = AppWarmup()
@@ -1,9 +1,10 @@
 import json
 from collections.abc import Sequence
+from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import delete, desc, func, select
+from sqlalchemy import case, delete, desc, func, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.domain import AIChatMessage as AIChatMessageORM
@@ -11,6 +12,7 @@ from app.models.domain import BotConfig as BotConfigORM
 from app.models.domain import ChatSession as ChatSessionORM
 from app.models.domain import ChatSessionSurface
 from app.models.domain import PortfolioSnapshot as PortfolioSnapshotORM
+from app.models.domain import PortfolioSnapshotPoint as PortfolioSnapshotPointORM
 from app.models.domain import SystemConfig as SystemConfigORM
 from app.models.schemas import BotConfig as BotConfigSchema
 from app.models.schemas import MarketSentimentSnapshot
@@ -48,6 +50,8 @@ AI_PROVIDER_PRIORITY_KEY = "ai_provider_priority"
 AI_PROVIDER_SETTINGS_KEY = "ai_provider_settings"
 AI_PROVIDER_STATUS_KEY = "ai_provider_status"
 SLACK_PORTFOLIO_ALERT_SETTINGS_KEY = "slack_portfolio_alert_settings"
+PROFILING_ENABLED_KEY = "profiling_enabled"
+PROFILING_CPROFILE_SAMPLE_RATE_KEY = "profiling_cprofile_sample_rate"
 
 DEFAULT_AI_PROVIDER_PRIORITY_VALUE = json.dumps(["gemini", "openai"], ensure_ascii=False)
 DEFAULT_AI_PROVIDER_SETTINGS_VALUE = json.dumps(
@@ -236,6 +240,16 @@ SYSTEM_CONFIG_SEEDS: tuple[dict[str, str], ...] = (
         "config_value": DEFAULT_SLACK_PORTFOLIO_ALERT_SETTINGS_VALUE,
         "description": "Slack 포트폴리오 알림 반복 규칙(JSON 객체)",
     },
+    {
+        "config_key": PROFILING_ENABLED_KEY,
+        "config_value": "false",
+        "description": "자율주행/주문/뉴스 수집 실행의 구조화 프로파일링 기록 여부 (true/false)",
+    },
+    {
+        "config_key": PROFILING_CPROFILE_SAMPLE_RATE_KEY,
+        "config_value": "0.1",
+        "description": "프로파일링 실행 중 cProfile 을 함께 수집할 비율 (0~1)",
+    },
 )
 
 
@@ -273,6 +287,20 @@ async def get_system_config_value(
     return config.config_value
 
 
+async def get_system_config_values(
+    db: AsyncSession,
+    config_keys: Sequence[str],
+) -> dict[str, str]:
+    if not config_keys:
+        return {}
+    result = await db.execute(
+        select(SystemConfigORM.config_key, SystemConfigORM.config_value).where(
+            SystemConfigORM.config_key.in_(list(config_keys))
+        )
+    )
+    return {config_key: config_value for config_key, config_value in result.all()}
+
+
 async def list_system_configs(db: AsyncSession) -> list[SystemConfigORM]:
     result = await db.execute(select(SystemConfigORM).order_by(SystemConfigORM.id))
     return list(result.scalars().all())
@@ -463,6 +491,7 @@ async def save_chat_message(
     content: str,
     agent_name: str | None = None,
     is_tool_call: bool = False,
+    token_count: int | None = None,
 ) -> AIChatMessageORM:
     message = AIChatMessageORM(
         session_id=session_id,
@@ -470,6 +499,7 @@ async def save_chat_message(
         content=content,
         agent_name=agent_name,
         is_tool_call=is_tool_call,
+        token_count=token_count,
     )
     db.add(message)
     await db.commit()
@@ -498,6 +528,26 @@ async def get_chat_session_record(
     return await db.get(ChatSessionORM, session_id)
 
 
+async def update_chat_session_memory_summary(
+    db: AsyncSession,
+    session_id: str,
+    *,
+    summary: str,
+    until_message_id: int,
+    token_count: int,
+) -> ChatSessionORM | None:
+    session = await db.get(ChatSessionORM, session_id)
+    if session is None:
+        return None
+    session.memory_summary = summary
+    session.memory_summary_until_id = until_message_id
+    session.memory_summary_token_count = token_count
+    session.memory_summary_updated_at = func.now()
+    await db.commit()
+    await db.refresh(session)
+    return session
+
+
 async def delete_chat_session_record(db: AsyncSession, session_id: str) -> None:
     await db.execute(
         delete(ChatSessionORM).where(ChatSessionORM.session_id == session_id)
@@ -505,6 +555,15 @@ async def delete_chat_session_record(db: AsyncSession, session_id: str) -> None:
     await db.commit()
 
 
+def _optional_float(value: Any) -> float | None:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
 async def save_portfolio_snapshot(
     db: AsyncSession,
     total_net_worth: float,
@@ -517,8 +576,26 @@ async def save_portfolio_snapshot(
         snapshot_data=snapshot_data,
     )
     db.add(snapshot)
-    await db.commit()
+    await db.flush()
     await db.refresh(snapshot)
+
+    # 차트 조회는 JSON 을 파싱하지 않도록 자산별 시계열 행도 함께 기록합니다.
+    for item in snapshot_data:
+        currency = str(item.get("currency") or "").strip().upper()
+        if not currency:
+            continue
+        db.add(
+            PortfolioSnapshotPointORM(
+                snapshot_id=snapshot.id,
+                currency=currency,
+                balance=_optional_float(item.get("balance")),
+                current_price=_optional_float(item.get("current_price")),
+                total_value=_optional_float(item.get("total_value")),
+                pnl_percentage=_optional_float(item.get("pnl_percentage")),
+                created_at=snapshot.created_at,
+            )
+        )
+    await db.commit()
     return snapshot
 
 
@@ -534,21 +611,57 @@ async def get_portfolio_snapshots(
     return list(result.scalars().all())
 
 
+async def get_portfolio_value_series(
+    db: AsyncSession,
+    since: datetime | None = None,
+) -> list[tuple[datetime, float, float]]:
+    """(created_at, total_net_worth, total_pnl) 를 시간순으로 반환합니다. JSON 컬럼은 읽지 않습니다."""
+    stmt = select(
+        PortfolioSnapshotORM.created_at,
+        PortfolioSnapshotORM.total_net_worth,
+        PortfolioSnapshotORM.total_pnl,
+    )
+    if since is not None:
+        stmt = stmt.where(PortfolioSnapshotORM.created_at >= since)
+    result = await db.execute(stmt.order_by(PortfolioSnapshotORM.created_at))
+    return [(row[0], float(row[1]), float(row[2])) for row in result.all()]
+
+
+async def get_portfolio_asset_series(
+    db: AsyncSession,
+    currency: str,
+    since: datetime | None = None,
+) -> list[tuple[datetime, float, float | None]]:
+    """(created_at, total_value, pnl_percentage) 를 시간순으로 반환합니다."""
+    stmt = select(
+        PortfolioSnapshotPointORM.created_at,
+        PortfolioSnapshotPointORM.total_value,
+        PortfolioSnapshotPointORM.pnl_percentage,
+    ).where(PortfolioSnapshotPointORM.currency == currency.strip().upper())
+    if since is not None:
+        stmt = stmt.where(PortfolioSnapshotPointORM.created_at >= since)
+    result = await db.execute(stmt.order_by(PortfolioSnapshotPointORM.created_at))
+    return [(row[0], float(row[1] or 0.0), row[2]) for row in result.all()]
+
+
 async def get_recent_chat_messages(
     db: AsyncSession,
     session_id: str,
     limit: int = 20,
+    *,
+    after_message_id: int | None = None,
 ) -> list[AIChatMessageORM]:
     if limit <= 0:
         return []
 
+    stmt = select(AIChatMessageORM).where(
+        AIChatMessageORM.session_id == session_id,
+        AIChatMessageORM.is_tool_call.is_(False),
+    )
+    if after_message_id is not None:
+        stmt = stmt.where(AIChatMessageORM.id > after_message_id)
     result = await db.execute(
-        select(AIChatMessageORM)
-        .where(
-            AIChatMessageORM.session_id == session_id,
-            AIChatMessageORM.is_tool_call.is_(False),
-        )
-        .order_by(desc(AIChatMessageORM.created_at), desc(AIChatMessageORM.id))
+        stmt.order_by(desc(AIChatMessageORM.created_at), desc(AIChatMessageORM.id))
         .limit(limit)
     )
     messages = list(result.scalars().all())
@@ -556,22 +669,79 @@ async def get_recent_chat_messages(
     return messages
 
 
+async def get_chat_messages_after(
+    db: AsyncSession,
+    session_id: str,
+    *,
+    after_message_id: int | None,
+    before_message_id: int | None = None,
+    limit: int = 200,
+) -> list[AIChatMessageORM]:
+    """``after_message_id`` 다음 메시지부터 오래된 순으로 최대 ``limit`` 개를 반환합니다."""
+    if limit <= 0:
+        return []
+
+    stmt = select(AIChatMessageORM).where(
+        AIChatMessageORM.session_id == session_id,
+        AIChatMessageORM.is_tool_call.is_(False),
+    )
+    if after_message_id is not None:
+        stmt = stmt.where(AIChatMessageORM.id > after_message_id)
+    if before_message_id is not None:
+        stmt = stmt.where(AIChatMessageORM.id < before_message_id)
+    result = await db.execute(stmt.order_by(AIChatMessageORM.id.asc()).limit(limit))
+    return list(result.scalars().all())
+
+
+CHAT_HISTORY_SEARCH_PAGE_SIZE = 20
+CHAT_HISTORY_SEARCH_MAX_TERMS = 5
+
+
+def _escape_like_pattern(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 async def search_chat_history(
     db: AsyncSession,
     session_id: str,
     keyword: str,
+    *,
+    limit: int = CHAT_HISTORY_SEARCH_PAGE_SIZE,
+    offset: int = 0,
 ) -> list[AIChatMessageORM]:
+    """세션 대화에서 키워드를 검색해 관련도 순으로 한 페이지를 반환합니다.
+
+    한국어 조사/어미가 붙은 단어도 부분 일치로 찾을 수 있도록 ``pg_trgm`` GIN 인덱스를
+    타는 ILIKE 조건을 쓰고, 일치한 검색어 수와 ``word_similarity`` 로 순위를 매깁니다.
+    """
     normalized_keyword = keyword.strip()
     if not normalized_keyword:
         return []
 
+    terms = list(dict.fromkeys(normalized_keyword.split()))[:CHAT_HISTORY_SEARCH_MAX_TERMS]
+    term_conditions = [
+        AIChatMessageORM.content.ilike(f"%{_escape_like_pattern(term)}%", escape="\\")
+        for term in terms
+    ]
+    matched_terms = sum(
+        (case((condition, 1), else_=0) for condition in term_conditions),
+        start=literal(0),
+    )
+
     result = await db.execute(
         select(AIChatMessageORM)
         .where(
             AIChatMessageORM.session_id == session_id,
-            AIChatMessageORM.content.ilike(f"%{normalized_keyword}%"),
+            or_(*term_conditions),
+        )
+        .order_by(
+            desc(matched_terms),
+            desc(func.word_similarity(normalized_keyword, AIChatMessageORM.content)),
+            desc(AIChatMessageORM.created_at),
+            desc(AIChatMessageORM.id),
         )
-        .order_by(desc(AIChatMessageORM.created_at), desc(AIChatMessageORM.id))
+        .limit(max(1, int(limit)))
+        .offset(max(0, int(offset)))
     )
     return list(result.scalars().all())
 
@@ -1,8 +1,18 @@
+import time
 from collections.abc import AsyncGenerator
 
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.event_hub import ROW_EVENT_TABLES
+from app.core.event_hub import live_event_hub
+from app.core.metrics import DB_CONNECTION_HOLD_SECONDS
+from app.core.metrics import DB_QUERY_SECONDS
+from app.core.metrics import normalize_sql_statement
+from app.core.response_cache import data_versions
 
 engine = create_async_engine(
     settings.async_database_url,
@@ -17,6 +27,99 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False,
 )
 
+_QUERY_STARTED_AT_KEY = "metrics_query_started_at"
+_CHECKOUT_AT_KEY = "metrics_checkout_at"
+_WRITTEN_TABLES_KEY = "response_cache_written_tables"
+_COMMITTED_ROWS_KEY = "live_event_rows"
+
+
+@event.listens_for(engine.sync_engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_QUERY_STARTED_AT_KEY, []).append(time.perf_counter())
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started_stack = conn.info.get(_QUERY_STARTED_AT_KEY)
+    if not started_stack:
+        return
+    DB_QUERY_SECONDS.observe(
+        time.perf_counter() - started_stack.pop(),
+        statement=normalize_sql_statement(statement),
+    )
+
+
+@event.listens_for(engine.sync_engine, "checkout")
+def _on_connection_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+    # 세션이 커넥션을 점유한 시간(체크아웃~반납)이 사실상 DB 세션 시간입니다.
+    connection_record.info[_CHECKOUT_AT_KEY] = time.perf_counter()
+
+
+@event.listens_for(engine.sync_engine, "checkin")
+def _on_connection_checkin(dbapi_connection, connection_record) -> None:
+    checkout_at = connection_record.info.pop(_CHECKOUT_AT_KEY, None)
+    if checkout_at is not None:
+        DB_CONNECTION_HOLD_SECONDS.observe(time.perf_counter() - checkout_at)
+
+
+def _written_tables(session: Session) -> set[str]:
+    return session.info.setdefault(_WRITTEN_TABLES_KEY, set())
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session: Session, flush_context) -> None:
+    # after_flush 시점에도 new/dirty/deleted 는 flush 이전 상태를 그대로 보여 줍니다.
+    tables = _written_tables(session)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        table_name = getattr(instance, "__tablename__", None)
+        if table_name:
+            tables.add(table_name)
+
+    if live_event_hub.subscriber_count:
+        for instance in session.new:
+            _collect_event_row(session, instance, is_new=True)
+        for instance in session.dirty:
+            _collect_event_row(session, instance, is_new=False)
+
+
+def _collect_event_row(session: Session, instance: object, *, is_new: bool) -> None:
+    table_name = getattr(instance, "__tablename__", "")
+    row_event = ROW_EVENT_TABLES.get(table_name)
+    if row_event is None or not (is_new or row_event[2]):
+        return
+    # 이미 로드된 값만 읽습니다. 만료된 속성에 접근하면 async 세션에서 추가 조회가 일어납니다.
+    loaded = sa_inspect(instance).dict
+    row = {field: loaded[field] for field in row_event[1] if field in loaded}
+    session.info.setdefault(_COMMITTED_ROWS_KEY, []).append((table_name, row))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_dml_tables(orm_execute_state) -> None:
+    if not (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    table_name = getattr(table, "name", None)
+    if table_name:
+        _written_tables(orm_execute_state.session).add(table_name)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_committed_changes(session: Session) -> None:
+    # 커밋된 테이블의 데이터 버전을 올려 해당 테이블에 의존하는 응답 캐시를 무효화하고,
+    # 새 AI 분석/주문 체결 행은 실시간 이벤트로 방송합니다.
+    tables = session.info.pop(_WRITTEN_TABLES_KEY, None)
+    if tables:
+        data_versions.bump(tables)
+    rows = session.info.pop(_COMMITTED_ROWS_KEY, None)
+    if rows:
+        live_event_hub.publish_committed_rows(rows)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_changes(session: Session) -> None:
+    session.info.pop(_WRITTEN_TABLES_KEY, None)
+    session.info.pop(_COMMITTED_ROWS_KEY, None)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
@@ -6,15 +6,22 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.router import api_router
+from app.core.config import settings
 from app.core.logging import configure_logging
+from app.core.profiling import profiler
+from app.core.response_cache import ResponseCacheMiddleware
 from app.core.scheduler import start_scheduler, stop_scheduler
+from app.core.warmup import app_warmup
 from app.db.repository import get_or_create_bot_config
 from app.db.repository import seed_system_configs_if_empty
 from app.db.session import AsyncSessionLocal
+from app.services.backtesting.jobs import backtest_job_manager
+from app.services.live_updates import live_update_producer
 from app.services.rag.opensearch_client import close_opensearch_client
 from app.services.slack_bot import slack_bot
 from app.services.telegram_bot import telegram_bot
 from app.services.trading.engine import TradingEngine
+from app.services.trading.order_reconciler import order_reconciler
 
 logger = logging.getLogger(__name__)
 trading_engine = TradingEngine(AsyncSessionLocal)
@@ -25,6 +32,10 @@ async def lifespan(_app: FastAPI):
     async with AsyncSessionLocal() as db:
         await get_or_create_bot_config(db)
         await seed_system_configs_if_empty(db)
+        try:
+            await profiler.refresh_from_db(db)
+        except Exception:
+            logger.exception("프로파일링 설정을 불러오지 못했습니다. 프로파일링 없이 시작합니다.")
 
     await telegram_bot.start()
     slack_bot.start()
@@ -32,13 +43,28 @@ async def lifespan(_app: FastAPI):
         logger.info("SlackBot 패스: SLACK_BOT_TOKEN/SLACK_APP_TOKEN/SLACK_ALLOWED_USER_ID 미설정")
 
     await start_scheduler()
+    await order_reconciler.start()
+    live_update_producer.start()
     trading_task = asyncio.create_task(trading_engine.run_loop(), name="trading-engine-loop")
+    # 무거운 선택 서브시스템은 요청 처리를 막지 않도록 기동 후 백그라운드에서 불러옵니다.
+    warmup_task = (
+        asyncio.create_task(app_warmup.run(), name="app-warmup")
+        if settings.app_warmup_enabled
+        else None
+    )
 
     try:
         yield
     finally:
         trading_engine._is_running = False
+        if warmup_task is not None and not warmup_task.done():
+            warmup_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await warmup_task
         stop_scheduler()
+        await order_reconciler.stop()
+        await live_update_producer.stop()
+        await backtest_job_manager.shutdown()
         try:
             await close_opensearch_client()
         except Exception:
@@ -57,6 +83,8 @@ async def lifespan(_app: FastAPI):
 def create_app() -> FastAPI:
     configure_logging()
     app = FastAPI(title="Trading Bot", lifespan=lifespan)
+    # CORS 가 바깥쪽에서 감싸도록 응답 캐시를 먼저 등록합니다.
+    app.add_middleware(ResponseCacheMiddleware, enabled=settings.response_cache_enabled)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
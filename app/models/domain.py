@@ -1,7 +1,7 @@
 from datetime import datetime
 from enum import StrEnum
 
-from sqlalchemy import JSON, Boolean, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import JSON, Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base
@@ -41,6 +41,13 @@ class Position(Base):
 
 class OrderHistory(Base):
     __tablename__ = "order_history"
+    __table_args__ = (
+        Index(
+            "ix_order_history_pending_fill",
+            "id",
+            postgresql_where=text("fill_status = 'pending'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     position_id: Mapped[int] = mapped_column(ForeignKey("positions.id"), nullable=False, index=True)
@@ -55,6 +62,15 @@ class OrderHistory(Base):
     price: Mapped[float] = mapped_column(Float, nullable=False)
     qty: Mapped[float] = mapped_column(Float, nullable=False)
     broker: Mapped[str] = mapped_column(String, nullable=False)
+    broker_order_uuid: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
+    # pending: 주문 직후 추정 체결가/수량으로 기록되어 체결 확정(order_reconciler)을 기다리는 상태
+    # cancelled: 한 건도 체결되지 않고 끝난 주문(qty=0, 감사용으로 보존)
+    fill_status: Mapped[str] = mapped_column(
+        String(16),
+        nullable=False,
+        default="filled",
+        server_default="filled",
+    )
     executed_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -103,6 +119,10 @@ class ChatSession(Base):
 
     session_id: Mapped[str] = mapped_column(String, primary_key=True)
     surface: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    memory_summary: Mapped[str | None] = mapped_column(Text, nullable=True)
+    memory_summary_until_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    memory_summary_token_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    memory_summary_updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -112,6 +132,15 @@ class ChatSession(Base):
 
 class AIChatMessage(Base):
     __tablename__ = "ai_chat_messages"
+    __table_args__ = (
+        Index(
+            "ix_ai_chat_messages_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+        Index("ix_ai_chat_messages_session_id_created_at", "session_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     session_id: Mapped[str] = mapped_column(
@@ -123,6 +152,7 @@ class AIChatMessage(Base):
     content: Mapped[str] = mapped_column(Text, nullable=False)
     agent_name: Mapped[str | None] = mapped_column(String, nullable=True)
     is_tool_call: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    token_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -157,4 +187,29 @@ class PortfolioSnapshot(Base):
         DateTime(timezone=True),
         nullable=False,
         server_default=func.now(),
+        index=True,
+    )
+
+
+class PortfolioSnapshotPoint(Base):
+    __tablename__ = "portfolio_snapshot_points"
+    __table_args__ = (
+        Index("ix_portfolio_snapshot_points_currency_created_at", "currency", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    snapshot_id: Mapped[int] = mapped_column(
+        ForeignKey("portfolio_snapshots.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    currency: Mapped[str] = mapped_column(String, nullable=False)
+    balance: Mapped[float | None] = mapped_column(Float, nullable=True)
+    current_price: Mapped[float | None] = mapped_column(Float, nullable=True)
+    total_value: Mapped[float | None] = mapped_column(Float, nullable=True)
+    pnl_percentage: Mapped[float | None] = mapped_column(Float, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        index=True,
     )
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -44,6 +44,28 @@ class BotStatus(BaseModel):
     latest_action: str | None = None
 
 
+class LiquidationOrderItem(BaseModel):
+    market: str
+    currency: str
+    volume: float
+    price: float | None = None
+    estimated_krw: float | None = None
+    status: str
+    order_uuid: str | None = None
+    executed_volume: float = 0.0
+    executed_krw: float | None = None
+    submitted_after_seconds: float | None = None
+    error: str | None = None
+
+
+class LiquidationReportResponse(BaseModel):
+    run_id: str
+    message: str
+    submit_seconds: float = Field(..., description="요청부터 마지막 매도 주문 제출까지 걸린 시간(초)")
+    total_seconds: float
+    results: list[LiquidationOrderItem]
+
+
 class AIAnalysisResponse(BaseModel):
     decision: Literal["BUY", "SELL", "HOLD"]
     confidence: int = Field(..., ge=0, le=100)
@@ -70,6 +92,14 @@ class AIManualCycleRequest(BaseModel):
     confirm_trade_execution: bool = False
 
 
+class AIBulkAnalysisRequest(BaseModel):
+    symbols: list[str] = Field(default_factory=list, max_length=50)
+    all_favorites: bool = False
+    concurrency: int = Field(default=4, ge=1, le=8)
+
+    model_config = ConfigDict(extra="forbid")
+
+
 class AIManualCycleResponse(BaseModel):
     symbol: str
     analysis: AIAnalysisLogItem
@@ -109,6 +139,41 @@ class AIPerformanceSummary(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
 
+class AICalibrationBucket(BaseModel):
+    bucket_start: int = Field(..., ge=0, le=100)
+    bucket_end: int = Field(..., ge=0, le=100)
+    checked_count: int = Field(..., ge=0)
+    mean_confidence_pct: float = Field(..., ge=0, le=100)
+    win_rate_pct: float | None = Field(default=None, ge=0, le=100)
+    brier_score: float | None = Field(default=None, ge=0, le=1)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class AICalibrationBreakdown(BaseModel):
+    key: str | int
+    checked_count: int = Field(..., ge=0)
+    win_rate_pct: float | None = Field(default=None, ge=0, le=100)
+    mean_confidence_pct: float | None = Field(default=None, ge=0, le=100)
+    brier_score: float | None = Field(default=None, ge=0, le=1)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class AICalibrationReport(BaseModel):
+    checked_count: int = Field(..., ge=0)
+    success_count: int = Field(..., ge=0)
+    win_rate_pct: float | None = Field(default=None, ge=0, le=100)
+    brier_score: float | None = Field(default=None, ge=0, le=1)
+    expected_calibration_error_pct: float | None = Field(default=None, ge=0, le=100)
+    reliability: list[AICalibrationBucket] = Field(default_factory=list)
+    by_symbol: list[AICalibrationBreakdown] = Field(default_factory=list)
+    by_decision: list[AICalibrationBreakdown] = Field(default_factory=list)
+    by_hour: list[AICalibrationBreakdown] = Field(default_factory=list)
+
+    model_config = ConfigDict(extra="forbid")
+
+
 class MarketSentimentSnapshot(BaseModel):
     score: int = Field(..., ge=0, le=100)
     classification: str = Field(...)
@@ -127,6 +192,18 @@ class SystemConfigUpdateItem(BaseModel):
     config_value: str = Field(...)
 
 
+class ProfilingConfigUpdate(BaseModel):
+    enabled: bool
+    cprofile_sample_rate: float | None = Field(default=None, ge=0, le=1)
+
+
+class ProfilingStatusResponse(BaseModel):
+    enabled: bool
+    cprofile_sample_rate: float
+    buffer_size: int
+    runs: list[dict[str, Any]] = Field(default_factory=list)
+
+
 class AIProviderRuntimeStatusItem(BaseModel):
     provider: Literal["gemini", "openai"]
     rank: int = Field(..., ge=1)
@@ -210,3 +287,20 @@ class PortfolioSnapshotItem(BaseModel):
 
 class PortfolioSnapshotListResponse(BaseModel):
     snapshots: list[PortfolioSnapshotItem]
+
+
+class PortfolioSeriesPoint(BaseModel):
+    timestamp: datetime
+    value: float
+    secondary: float | None = Field(default=None, description="전체 시계열은 총 손익, 자산 시계열은 수익률(%)")
+    open: float | None = None
+    high: float | None = None
+    low: float | None = None
+
+
+class PortfolioSeriesResponse(BaseModel):
+    range: str
+    method: str
+    currency: str | None = None
+    source_points: int
+    points: list[PortfolioSeriesPoint]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import copy
 import json
 import logging
+import time
 from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass
 from datetime import datetime
@@ -11,16 +13,22 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.metrics import LLM_REQUEST_SECONDS
+from app.core.metrics import LLMCallUsage
+from app.core.metrics import current_llm_purpose
+from app.core.metrics import current_llm_usage
+from app.core.profiling import profile_span
 from app.db.repository import AI_PROVIDER_PRIORITY_KEY
 from app.db.repository import AI_PROVIDER_SETTINGS_KEY
 from app.db.repository import AI_PROVIDER_STATUS_KEY
 from app.db.repository import DEFAULT_AI_PROVIDER_PRIORITY_VALUE
 from app.db.repository import DEFAULT_AI_PROVIDER_SETTINGS_VALUE
 from app.db.repository import DEFAULT_AI_PROVIDER_STATUS_VALUE
-from app.db.repository import get_system_config_value
+from app.db.repository import get_system_config_values
 from app.db.repository import upsert_system_config
 from app.services.ai.analyzer import AIAnalyzerFactory
 from app.services.ai.providers.base import AIProviderRateLimitError
+from app.services.ai.providers.base import build_prompt_cache_key
 from app.services.ai.providers.base import is_provider_rate_limit_error
 from app.services.ai.providers.base import normalize_utc
 from app.services.ai.providers.base import resolve_provider_block_until
@@ -58,6 +66,7 @@ class AIProviderExecutionResult(Generic[T]):
     value: T
     provider: str
     model: str
+    usage: LLMCallUsage | None = None
 
 
 class AIProviderUnavailableError(RuntimeError):
@@ -191,6 +200,21 @@ def _has_valid_api_key(provider: str) -> bool:
     return True
 
 
+def _observe_llm_call(
+    candidate: AIProviderCandidate,
+    purpose: str,
+    started_at: float,
+    outcome: str,
+) -> None:
+    LLM_REQUEST_SECONDS.observe(
+        time.perf_counter() - started_at,
+        provider=candidate.provider,
+        model=candidate.model,
+        purpose=purpose,
+        outcome=outcome,
+    )
+
+
 def resolve_provider_candidates(
     *,
     priority_value: Any,
@@ -331,30 +355,35 @@ def resolve_provider_runtime_status(
 
 
 class AIProviderRouter:
+    """AI provider 선택/폴백 라우터.
+
+    provider 설정은 인스턴스 생성 후 처음 한 번만 읽고, 상태 변경은 메모리 사본에도
+    반영합니다. 채팅 한 턴처럼 여러 LLM 호출을 묶어야 하면 인스턴스를 재사용하십시오.
+    """
+
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
+        self._config_values: tuple[Any, Any, dict[str, dict[str, Any]]] | None = None
 
     async def _load_config_values(self) -> tuple[Any, Any, Any]:
-        priority_raw = await get_system_config_value(
-            self.db,
-            AI_PROVIDER_PRIORITY_KEY,
-            DEFAULT_AI_PROVIDER_PRIORITY_VALUE,
-        )
-        settings_raw = await get_system_config_value(
-            self.db,
-            AI_PROVIDER_SETTINGS_KEY,
-            DEFAULT_AI_PROVIDER_SETTINGS_VALUE,
-        )
-        status_raw = await get_system_config_value(
+        if self._config_values is not None:
+            return self._config_values
+
+        values = await get_system_config_values(
             self.db,
-            AI_PROVIDER_STATUS_KEY,
-            DEFAULT_AI_PROVIDER_STATUS_VALUE,
+            (AI_PROVIDER_PRIORITY_KEY, AI_PROVIDER_SETTINGS_KEY, AI_PROVIDER_STATUS_KEY),
         )
-        return (
-            _loads_json(priority_raw, ["gemini", "openai"]),
-            _loads_json(settings_raw, {}),
-            _loads_json(status_raw, {}),
+        self._config_values = (
+            _loads_json(
+                values.get(AI_PROVIDER_PRIORITY_KEY, DEFAULT_AI_PROVIDER_PRIORITY_VALUE),
+                ["gemini", "openai"],
+            ),
+            _loads_json(values.get(AI_PROVIDER_SETTINGS_KEY, DEFAULT_AI_PROVIDER_SETTINGS_VALUE), {}),
+            _normalize_status(
+                _loads_json(values.get(AI_PROVIDER_STATUS_KEY, DEFAULT_AI_PROVIDER_STATUS_VALUE), {})
+            ),
         )
+        return self._config_values
 
     async def get_candidates(
         self,
@@ -383,12 +412,8 @@ class AIProviderRouter:
         )
 
     async def _load_status(self) -> dict[str, dict[str, Any]]:
-        status_raw = await get_system_config_value(
-            self.db,
-            AI_PROVIDER_STATUS_KEY,
-            DEFAULT_AI_PROVIDER_STATUS_VALUE,
-        )
-        return _normalize_status(_loads_json(status_raw, {}))
+        _priority_value, _settings_value, status_value = await self._load_config_values()
+        return copy.deepcopy(status_value)
 
     async def _save_status(self, status: dict[str, dict[str, Any]]) -> None:
         await upsert_system_config(
@@ -397,6 +422,9 @@ class AIProviderRouter:
             json.dumps(status, ensure_ascii=False, sort_keys=True),
             "AI provider별 쿼터 차단/성공 상태(JSON 객체)",
         )
+        if self._config_values is not None:
+            priority_value, settings_value, _status_value = self._config_values
+            self._config_values = (priority_value, settings_value, copy.deepcopy(status))
 
     async def mark_success(self, provider: str) -> None:
         provider_name = provider.strip().lower()
@@ -452,40 +480,75 @@ class AIProviderRouter:
             raise AIProviderUnavailableError("사용 가능한 AI provider가 없습니다.")
 
         last_error: Exception | None = None
-        for candidate in candidates:
-            try:
-                value = await operation(candidate)
-            except AIProviderRateLimitError as exc:
-                last_error = exc
-                await self.mark_rate_limited(candidate.provider, exc)
-                logger.warning(
-                    "AI provider 한도 도달로 다음 provider를 시도합니다: provider=%s model=%s error=%s",
-                    candidate.provider,
-                    candidate.model,
-                    exc,
-                )
-                continue
-            except Exception as exc:
-                last_error = exc
-                if is_provider_rate_limit_error(candidate.provider, exc):
+        purpose_label = purpose or "unknown"
+        purpose_token = current_llm_purpose.set(purpose_label)
+        try:
+            for candidate in candidates:
+                started_at = time.perf_counter()
+                usage = LLMCallUsage()
+                usage_token = current_llm_usage.set(usage)
+                try:
+                    with profile_span(
+                        "llm",
+                        provider=candidate.provider,
+                        model=candidate.model,
+                        purpose=purpose_label,
+                    ) as span:
+                        value = await operation(candidate)
+                        if span is not None:
+                            span.set(
+                                input_tokens=usage.input_tokens,
+                                cached_tokens=usage.cached_tokens,
+                                output_tokens=usage.output_tokens,
+                            )
+                except AIProviderRateLimitError as exc:
+                    _observe_llm_call(candidate, purpose_label, started_at, "rate_limited")
+                    last_error = exc
                     await self.mark_rate_limited(candidate.provider, exc)
-                else:
-                    await self.mark_error(candidate.provider, exc)
-                logger.warning(
-                    "AI provider 호출 실패로 다음 provider를 시도합니다: provider=%s model=%s error=%s",
+                    logger.warning(
+                        "AI provider 한도 도달로 다음 provider를 시도합니다: provider=%s model=%s error=%s",
+                        candidate.provider,
+                        candidate.model,
+                        exc,
+                    )
+                    continue
+                except Exception as exc:
+                    _observe_llm_call(candidate, purpose_label, started_at, "error")
+                    last_error = exc
+                    if is_provider_rate_limit_error(candidate.provider, exc):
+                        await self.mark_rate_limited(candidate.provider, exc)
+                    else:
+                        await self.mark_error(candidate.provider, exc)
+                    logger.warning(
+                        "AI provider 호출 실패로 다음 provider를 시도합니다: provider=%s model=%s error=%s",
+                        candidate.provider,
+                        candidate.model,
+                        exc,
+                        exc_info=True,
+                    )
+                    continue
+                finally:
+                    current_llm_usage.reset(usage_token)
+
+                _observe_llm_call(candidate, purpose_label, started_at, "success")
+                logger.debug(
+                    "LLM 호출 토큰: provider=%s model=%s purpose=%s input=%s cached=%s output=%s",
                     candidate.provider,
                     candidate.model,
-                    exc,
-                    exc_info=True,
+                    purpose_label,
+                    usage.input_tokens,
+                    usage.cached_tokens,
+                    usage.output_tokens,
                 )
-                continue
-
-            await self.mark_success(candidate.provider)
-            return AIProviderExecutionResult(
-                value=value,
-                provider=candidate.provider,
-                model=candidate.model,
-            )
+                await self.mark_success(candidate.provider)
+                return AIProviderExecutionResult(
+                    value=value,
+                    provider=candidate.provider,
+                    model=candidate.model,
+                    usage=usage,
+                )
+        finally:
+            current_llm_purpose.reset(purpose_token)
 
         detail = f"마지막 오류: {last_error}" if last_error is not None else "후보 없음"
         raise AIProviderUnavailableError(f"모든 AI provider 호출에 실패했습니다. {detail}")
@@ -519,12 +582,16 @@ class AIProviderRouter:
         purpose: str | None = None,
         allow_fallback: bool = True,
     ) -> AIProviderExecutionResult[StructuredResponseT]:
+        # 시스템 프롬프트를 고정 prefix 로 두고 변하는 내용은 user prompt 에만 넣어야 캐시가 맞습니다.
+        cache_key = build_prompt_cache_key(purpose or "structured", system_prompt)
+
         async def _operation(candidate: AIProviderCandidate) -> StructuredResponseT:
             analyzer = AIAnalyzerFactory.get_analyzer(candidate.provider, model=candidate.model)
             return await analyzer.generate_structured_analysis(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 response_model=response_model,
+                cache_key=cache_key,
             )
 
         return await self.execute(
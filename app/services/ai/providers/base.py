@@ -1,3 +1,4 @@
+import hashlib
 import math
 import re
 from datetime import UTC, datetime, timedelta
@@ -172,6 +173,15 @@ def resolve_provider_block_until(
     return current + timedelta(seconds=DEFAULT_RATE_LIMIT_COOLDOWN_SECONDS)
 
 
+def prompt_digest(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def build_prompt_cache_key(namespace: str, stable_prefix: str) -> str:
+    """고정 프롬프트 prefix 가 같은 호출끼리 같은 provider 캐시로 모이도록 하는 키입니다."""
+    return f"{namespace}-{prompt_digest(stable_prefix)[:16]}"
+
+
 class BaseAIAnalyzer(Protocol):
     async def generate_report(self, portfolio_str: str) -> str:
         ...
@@ -182,5 +192,6 @@ class BaseAIAnalyzer(Protocol):
         system_prompt: str,
         user_prompt: str,
         response_model: type[StructuredResponseT],
+        cache_key: str | None = None,
     ) -> StructuredResponseT:
         ...
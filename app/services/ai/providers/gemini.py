@@ -1,4 +1,11 @@
+import asyncio
 import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import TypeVar
 
 from google import genai
@@ -6,19 +13,127 @@ from google.genai import types
 from pydantic import BaseModel
 
 from app.core.config import settings
+from app.core.metrics import LLM_PROMPT_CACHE_TOTAL
+from app.core.metrics import record_llm_usage
 from app.services.ai.providers.base import (
     AIProviderRateLimitError,
     SYSTEM_PROMPT,
     BaseAIAnalyzer,
     is_provider_rate_limit_error,
+    prompt_digest,
     resolve_provider_block_until,
 )
 
+logger = logging.getLogger(__name__)
+
 StructuredResponseT = TypeVar("StructuredResponseT", bound=BaseModel)
 
 GEMINI_TEXT_MODEL = "gemini-3-flash-preview"
 GEMINI_EMBEDDING_MODEL = "gemini-embedding-001"
 GEMINI_EMBEDDING_DIMENSION = 1536
+GEMINI_CONTEXT_CACHE_MAX_ENTRIES = 32
+# 서버 쪽 TTL 이 끝나기 직전의 캐시를 참조하지 않도록 로컬 만료를 조금 앞당깁니다.
+GEMINI_CONTEXT_CACHE_EXPIRY_MARGIN_SECONDS = 60
+
+
+@dataclass(slots=True)
+class _ContextCacheEntry:
+    # name 이 None 이면 생성에 실패(최소 토큰 수 미달 등)한 prefix 라 만료까지 다시 만들지 않습니다.
+    name: str | None
+    expires_at: float
+
+
+class GeminiContextCacheRegistry:
+    """시스템 프롬프트별 Gemini cached content 이름을 프로세스 안에서 공유합니다.
+
+    같은 (모델, 시스템 프롬프트) 로 동시에 들어온 호출은 cached content 를 한 번만 만듭니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = GEMINI_CONTEXT_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], _ContextCacheEntry] = OrderedDict()
+        self._creating: dict[tuple[str, str], asyncio.Future[str | None]] = {}
+
+    def lookup(self, key: tuple[str, str]) -> _ContextCacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def store(self, key: tuple[str, str], name: str | None, ttl_seconds: int) -> None:
+        expires_at = self._clock() + max(ttl_seconds - GEMINI_CONTEXT_CACHE_EXPIRY_MARGIN_SECONDS, 1)
+        with self._lock:
+            self._entries[key] = _ContextCacheEntry(name=name, expires_at=expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: tuple[str, str]) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    async def resolve(
+        self,
+        key: tuple[str, str],
+        create: Callable[[], Awaitable[str]],
+        ttl_seconds: int,
+    ) -> tuple[str | None, str]:
+        """(cached content 이름 또는 None, created/reused/unavailable) 을 돌려줍니다."""
+        entry = self.lookup(key)
+        if entry is not None:
+            return entry.name, "reused" if entry.name else "unavailable"
+
+        pending = self._creating.get(key)
+        if pending is not None:
+            try:
+                name = await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+                name = None
+            return name, "reused" if name else "unavailable"
+
+        future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        self._creating[key] = future
+        try:
+            name: str | None = await create()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            logger.info("Gemini cached content 생성 실패로 일반 호출을 사용합니다: model=%s error=%s", key[0], exc)
+            name = None
+        finally:
+            self._creating.pop(key, None)
+
+        self.store(key, name, ttl_seconds)
+        future.set_result(name)
+        return name, "created" if name else "unavailable"
+
+
+gemini_context_cache = GeminiContextCacheRegistry()
+
+
+def _is_cached_content_missing(error: Exception) -> bool:
+    message = str(error).lower()
+    return ("cachedcontent" in message or "cached content" in message or "cached_content" in message) and (
+        "not found" in message or "404" in message or "expired" in message or "not_found" in message
+    )
 
 
 def _normalize_gemini_error(error: Exception) -> str:
@@ -65,6 +180,18 @@ class GeminiAnalyzer(BaseAIAnalyzer):
         if self.client is None:
             raise RuntimeError("Gemini API 키가 설정되지 않아 분석을 실행할 수 없습니다.")
 
+    def _record_usage(self, response: object) -> None:
+        usage = getattr(response, "usage_metadata", None)
+        if usage is None:
+            return
+        record_llm_usage(
+            "gemini",
+            self.model,
+            input_tokens=getattr(usage, "prompt_token_count", None),
+            output_tokens=getattr(usage, "candidates_token_count", None),
+            cached_tokens=getattr(usage, "cached_content_token_count", None),
+        )
+
     def _build_rate_limit_error(self, error: Exception) -> AIProviderRateLimitError:
         return AIProviderRateLimitError(
             _normalize_gemini_error(error),
@@ -84,6 +211,7 @@ class GeminiAnalyzer(BaseAIAnalyzer):
                     system_instruction=SYSTEM_PROMPT,
                 ),
             )
+            self._record_usage(response)
 
             response_text = getattr(response, "text", None)
             if isinstance(response_text, str) and response_text.strip():
@@ -137,30 +265,86 @@ class GeminiAnalyzer(BaseAIAnalyzer):
         embeddings = await self.generate_embeddings([text], task_type=task_type)
         return embeddings[0]
 
+    async def _resolve_cached_content(self, system_prompt: str, cache_key: str | None) -> str | None:
+        if not settings.gemini_context_cache_enabled or self.client is None or not system_prompt:
+            return None
+
+        ttl_seconds = max(int(settings.gemini_context_cache_ttl_seconds), 120)
+        client = self.client
+
+        async def _create() -> str:
+            cached = await client.aio.caches.create(
+                model=self.model,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_prompt,
+                    ttl=f"{ttl_seconds}s",
+                    display_name=(cache_key or "ai-trade-manager")[:128],
+                ),
+            )
+            return str(cached.name)
+
+        name, outcome = await gemini_context_cache.resolve(
+            (self.model, prompt_digest(system_prompt)),
+            _create,
+            ttl_seconds,
+        )
+        LLM_PROMPT_CACHE_TOTAL.inc(provider="gemini", model=self.model, outcome=outcome)
+        return name
+
+    def _build_structured_config(
+        self,
+        system_prompt: str,
+        response_model: type[StructuredResponseT],
+        cached_content: str | None,
+    ) -> types.GenerateContentConfig:
+        if cached_content is not None:
+            # 시스템 프롬프트는 cached content 에 들어 있으므로 변하는 user prompt 만 보냅니다.
+            return types.GenerateContentConfig(
+                cached_content=cached_content,
+                response_mime_type="application/json",
+                response_schema=response_model,
+            )
+        return types.GenerateContentConfig(
+            system_instruction=system_prompt,
+            response_mime_type="application/json",
+            response_schema=response_model,
+        )
+
     async def generate_structured_analysis(
         self,
         *,
         system_prompt: str,
         user_prompt: str,
         response_model: type[StructuredResponseT],
+        cache_key: str | None = None,
     ) -> StructuredResponseT:
         self._ensure_client_available()
+        cached_content = await self._resolve_cached_content(system_prompt, cache_key)
 
         try:
-            response = await self.client.aio.models.generate_content(
-                model=self.model,
-                contents=user_prompt,
-                config=types.GenerateContentConfig(
-                    system_instruction=system_prompt,
-                    response_mime_type="application/json",
-                    response_schema=response_model,
-                ),
-            )
+            try:
+                response = await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=user_prompt,
+                    config=self._build_structured_config(system_prompt, response_model, cached_content),
+                )
+            except Exception as error:
+                if cached_content is None or not _is_cached_content_missing(error):
+                    raise
+                # 서버에서 먼저 만료/삭제된 캐시면 비우고 시스템 프롬프트를 직접 보내 한 번 더 시도합니다.
+                gemini_context_cache.invalidate((self.model, prompt_digest(system_prompt)))
+                LLM_PROMPT_CACHE_TOTAL.inc(provider="gemini", model=self.model, outcome="expired")
+                response = await self.client.aio.models.generate_content(
+                    model=self.model,
+                    contents=user_prompt,
+                    config=self._build_structured_config(system_prompt, response_model, None),
+                )
         except Exception as error:
             if is_provider_rate_limit_error("gemini", error):
                 raise self._build_rate_limit_error(error) from error
             raise
 
+        self._record_usage(response)
         parsed = getattr(response, "parsed", None)
         if isinstance(parsed, response_model):
             return parsed
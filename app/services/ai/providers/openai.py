@@ -6,6 +6,8 @@ from openai import AsyncOpenAI
 from pydantic import BaseModel
 
 from app.core.config import settings
+from app.core.metrics import record_langchain_usage
+from app.core.metrics import record_llm_usage
 from app.services.ai.providers.base import (
     AIProviderRateLimitError,
     SYSTEM_PROMPT,
@@ -60,8 +62,15 @@ class OpenAIAnalyzer(BaseAIAnalyzer):
         if self.api_key is None:
             raise RuntimeError("OpenAI API 키가 설정되지 않아 분석을 실행할 수 없습니다.")
 
-    def _build_chat_model(self) -> ChatOpenAI:
+    def _build_chat_model(self, prompt_cache_key: str | None = None) -> ChatOpenAI:
         self._ensure_client_available()
+        if prompt_cache_key:
+            # 같은 고정 prefix 요청을 같은 캐시로 라우팅해 자동 prompt caching 적중률을 높입니다.
+            return ChatOpenAI(
+                model=self.model,
+                api_key=self.api_key,
+                model_kwargs={"prompt_cache_key": prompt_cache_key},
+            )
         return ChatOpenAI(model=self.model, api_key=self.api_key)
 
     def _build_async_client(self) -> AsyncOpenAI:
@@ -90,6 +99,7 @@ class OpenAIAnalyzer(BaseAIAnalyzer):
                 raise self._build_rate_limit_error(error) from error
             raise RuntimeError(_normalize_openai_error(error)) from error
 
+        record_langchain_usage("openai", self.model, response)
         content = response.content
         if isinstance(content, str) and content.strip():
             return content
@@ -123,6 +133,14 @@ class OpenAIAnalyzer(BaseAIAnalyzer):
         finally:
             await client.close()
 
+        usage = getattr(response, "usage", None)
+        record_llm_usage(
+            "openai",
+            OPENAI_EMBEDDING_MODEL,
+            input_tokens=getattr(usage, "prompt_tokens", None),
+            purpose="embedding",
+        )
+
         response_data = getattr(response, "data", None)
         if not isinstance(response_data, list) or len(response_data) != len(texts):
             raise RuntimeError("OpenAI embedding response count does not match request count.")
@@ -150,10 +168,14 @@ class OpenAIAnalyzer(BaseAIAnalyzer):
         system_prompt: str,
         user_prompt: str,
         response_model: type[StructuredResponseT],
+        cache_key: str | None = None,
     ) -> StructuredResponseT:
         try:
-            structured_model = self._build_chat_model().with_structured_output(response_model)
-            result = await structured_model.ainvoke(
+            structured_model = self._build_chat_model(cache_key).with_structured_output(
+                response_model,
+                include_raw=True,
+            )
+            raw_result = await structured_model.ainvoke(
                 [
                     SystemMessage(content=system_prompt),
                     HumanMessage(content=user_prompt),
@@ -164,6 +186,12 @@ class OpenAIAnalyzer(BaseAIAnalyzer):
                 raise self._build_rate_limit_error(error) from error
             raise
 
+        record_langchain_usage("openai", self.model, raw_result.get("raw"))
+        parsing_error = raw_result.get("parsing_error")
+        if parsing_error is not None:
+            raise parsing_error
+        result = raw_result.get("parsed")
+
         if isinstance(result, response_model):
             return result
         if isinstance(result, BaseModel):
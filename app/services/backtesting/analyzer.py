@@ -11,6 +11,45 @@ def analyze_backtest_result(backtest_result: dict[str, Any]) -> dict[str, Any]:
     trades = _normalize_trades(backtest_result.get("trades"))
     equity_curve = _normalize_equity_curve(backtest_result.get("equity_curve"))
     drawdown_curve = _normalize_drawdown_curve(backtest_result.get("drawdown_curve"))
+    initial_balance = _to_float(backtest_result.get("initial_balance"))
+    max_drawdown_pct = _calculate_max_drawdown_pct(initial_balance, trades, drawdown_curve)
+
+    return {
+        **_build_summary_and_meta(backtest_result, trades, max_drawdown_pct),
+        "candles": candles,
+        "markers": _build_markers(trades),
+        "trades": trades,
+        "equity_curve": equity_curve,
+        "drawdown_curve": drawdown_curve,
+    }
+
+
+def summarize_backtest_result(backtest_result: dict[str, Any]) -> dict[str, Any]:
+    """``columnar=True`` 로 실행한 결과의 요약/메타/거래만 계산합니다.
+
+    캔들과 자산 곡선은 열 배열 그대로 artifact 에 저장되므로 여기서 dict 로 펼치지 않습니다.
+    """
+    trades = _normalize_trades(backtest_result.get("trades"))
+    equity_columns = backtest_result.get("equity_columns")
+    drawdowns = equity_columns.get("drawdown_pct") if isinstance(equity_columns, dict) else None
+    if drawdowns is not None and len(drawdowns) > 0:
+        max_drawdown_pct = max(_to_float(value) for value in drawdowns)
+    else:
+        initial_balance = _to_float(backtest_result.get("initial_balance"))
+        max_drawdown_pct = _calculate_max_drawdown_pct(initial_balance, trades, [])
+
+    return {
+        **_build_summary_and_meta(backtest_result, trades, max_drawdown_pct),
+        "markers": _build_markers(trades),
+        "trades": trades,
+    }
+
+
+def _build_summary_and_meta(
+    backtest_result: dict[str, Any],
+    trades: list[dict[str, Any]],
+    max_drawdown_pct: float,
+) -> dict[str, Any]:
     initial_balance = _to_float(backtest_result.get("initial_balance"))
     final_balance = _to_float(backtest_result.get("final_balance"))
 
@@ -18,14 +57,10 @@ def analyze_backtest_result(backtest_result: dict[str, Any]) -> dict[str, Any]:
     if initial_balance > 0:
         total_return_pct = ((final_balance - initial_balance) / initial_balance) * 100.0
 
-    max_drawdown_pct = _calculate_max_drawdown_pct(initial_balance, trades, drawdown_curve)
-    win_rate = _calculate_win_rate(trades)
-    markers = _build_markers(trades)
-
     summary = {
         "total_return_pct": round(total_return_pct, 4),
         "max_drawdown_pct": round(max_drawdown_pct, 4),
-        "win_rate": round(win_rate, 4),
+        "win_rate": round(_calculate_win_rate(trades), 4),
         "number_of_trades": len(trades),
     }
 
@@ -43,11 +78,6 @@ def analyze_backtest_result(backtest_result: dict[str, Any]) -> dict[str, Any]:
 
     return {
         "summary": summary,
-        "candles": candles,
-        "markers": markers,
-        "trades": trades,
-        "equity_curve": equity_curve,
-        "drawdown_curve": drawdown_curve,
         "meta": meta,
         "strategy": backtest_result.get("strategy") if isinstance(backtest_result.get("strategy"), dict) else {},
         "policy": backtest_result.get("policy") if isinstance(backtest_result.get("policy"), dict) else {},
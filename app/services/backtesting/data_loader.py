@@ -1,7 +1,18 @@
+"""백테스트용 과거 캔들 다운로드와 CSV 캐시.
+
+조회 구간을 미리 알기 때문에 200봉 페이지의 ``to`` 커서를 응답을 기다리지 않고 모두 계산할 수
+있습니다. 페이지들은 공유 캔들 rate limiter(``upbit_candle_rate_limiter``) 안에서 동시에
+요청하고, 합친 뒤 페이지 경계에 빈 구간이 있으면 이어서 더 받아 메웁니다. 페이지 안의 빈 봉은
+업비트가 거래 없는 구간의 캔들을 만들지 않아서 생긴 것이므로 ``fill_gaps`` 일 때만 직전 종가로
+채웁니다.
+"""
+
 import asyncio
 import csv
 import logging
 import re
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
@@ -9,12 +20,44 @@ from typing import Any
 import httpx
 
 from app.core.config import settings
+from app.core.rate_limit import TokenBucketLimiter
 
 logger = logging.getLogger(__name__)
 
 UPBIT_MINUTE_UNITS = {1, 3, 5, 10, 15, 30, 60, 240}
 UPBIT_PAGE_SIZE = 200
-UPBIT_REQUEST_GAP_SECONDS = 0.12
+# 업비트 캔들 조회 API 는 IP 당 초당 10회까지 허용하므로 여유를 두고 8회로 제한합니다.
+UPBIT_CANDLE_RATE_PER_SECOND = 8.0
+UPBIT_CANDLE_MAX_IN_FLIGHT = 8
+UPBIT_CANDLE_MAX_ATTEMPTS = 3
+UPBIT_CANDLE_RETRY_BASE_SECONDS = 0.5
+CANDLE_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+
+# 여러 마켓을 동시에 받아도 합계가 한도를 넘지 않도록 프로세스 전체가 공유합니다.
+upbit_candle_rate_limiter = TokenBucketLimiter(UPBIT_CANDLE_RATE_PER_SECOND)
+
+
+@dataclass(slots=True)
+class CandleDownloadReport:
+    market: str
+    timeframe: str
+    pages: int = 0
+    followup_pages: int = 0
+    retries: int = 0
+    rows: int = 0
+    empty_slots: int = 0
+    filled_slots: int = 0
+    elapsed_seconds: float = 0.0
+    cache_hit: bool = False
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        total_pages = self.pages + self.followup_pages
+        return total_pages / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
 
 
 def _normalize_market(market: str) -> str:
@@ -48,6 +91,12 @@ def _resolve_candle_path(timeframe: str) -> tuple[str, str]:
     raise ValueError("timeframe must be days or supported minute format like 60m")
 
 
+def _timeframe_step(normalized_timeframe: str) -> timedelta:
+    if normalized_timeframe == "days":
+        return timedelta(days=1)
+    return timedelta(minutes=int(normalized_timeframe.removesuffix("m")))
+
+
 def _parse_upbit_utc(value: Any) -> datetime | None:
     text = str(value or "").strip()
     if not text:
@@ -121,12 +170,45 @@ def _read_cached_csv(path: Path) -> list[dict[str, Any]] | None:
         return None
 
 
+def _find_covering_cache(
+    market: str,
+    timeframe: str,
+    start_utc: datetime,
+    end_utc: datetime,
+) -> list[dict[str, Any]] | None:
+    """요청 구간을 포함하는 더 넓은 캐시 파일(예: 일괄 시딩 결과)이 있으면 잘라서 돌려줍니다."""
+    exact_path = _cache_file_path(market, timeframe, start_utc, end_utc)
+    cached = _read_cached_csv(exact_path)
+    if cached is not None:
+        return cached
+
+    prefix = f"{market.replace('-', '_')}_{timeframe}_"
+    for path in sorted(exact_path.parent.glob(f"{prefix}*.csv")):
+        tokens = path.stem.removeprefix(prefix).split("_")
+        if len(tokens) != 2:
+            continue
+        try:
+            cached_start, cached_end = (
+                datetime.strptime(token, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc) for token in tokens
+            )
+        except ValueError:
+            continue
+        if cached_start > start_utc or cached_end < end_utc:
+            continue
+        rows = _read_cached_csv(path)
+        if rows is None:
+            continue
+        start_text, end_text = _serialize_utc(start_utc), _serialize_utc(end_utc)
+        return [row for row in rows if start_text <= row["timestamp"] <= end_text]
+    return None
+
+
 def _write_cached_csv(path: Path, candles: list[dict[str, Any]]) -> None:
     try:
         with path.open("w", newline="", encoding="utf-8") as file:
             writer = csv.DictWriter(
                 file,
-                fieldnames=["timestamp", "open", "high", "low", "close", "volume"],
+                fieldnames=list(CANDLE_FIELDS),
             )
             writer.writeheader()
             writer.writerows(candles)
@@ -172,6 +254,160 @@ async def _fetch_page(
     return [row for row in payload if isinstance(row, dict)]
 
 
+async def _fetch_page_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    market: str,
+    to_cursor: datetime | None,
+    rate_limiter: TokenBucketLimiter,
+    report: CandleDownloadReport,
+) -> list[dict[str, Any]]:
+    for attempt in range(1, UPBIT_CANDLE_MAX_ATTEMPTS + 1):
+        await rate_limiter.acquire()
+        try:
+            return await _fetch_page(client, url, market, to_cursor)
+        except httpx.HTTPStatusError as exc:
+            retryable = exc.response.status_code == 429 or exc.response.status_code >= 500
+            if not retryable or attempt == UPBIT_CANDLE_MAX_ATTEMPTS:
+                raise
+        except httpx.TransportError:
+            if attempt == UPBIT_CANDLE_MAX_ATTEMPTS:
+                raise
+        report.retries += 1
+        await asyncio.sleep(UPBIT_CANDLE_RETRY_BASE_SECONDS * (2 ** (attempt - 1)))
+    return []
+
+
+def _normalize_page(page_rows: list[dict[str, Any]]) -> list[tuple[datetime, dict[str, Any]]]:
+    normalized = [item for row in page_rows if (item := _normalize_upbit_candle(row)) is not None]
+    normalized.sort(key=lambda item: item[0])
+    return normalized
+
+
+def _fill_empty_slots(
+    candles: list[tuple[datetime, dict[str, Any]]],
+    step: timedelta,
+) -> list[tuple[datetime, dict[str, Any]]]:
+    """거래가 없어 빠진 봉을 직전 종가의 거래량 0 캔들로 채웁니다."""
+    filled: list[tuple[datetime, dict[str, Any]]] = []
+    for timestamp, candle in candles:
+        if filled:
+            previous_time, previous = filled[-1]
+            slot = previous_time + step
+            while slot < timestamp:
+                close = previous["close"]
+                filled.append(
+                    (
+                        slot,
+                        {
+                            "timestamp": _serialize_utc(slot),
+                            "open": close,
+                            "high": close,
+                            "low": close,
+                            "close": close,
+                            "volume": 0.0,
+                        },
+                    )
+                )
+                slot += step
+        filled.append((timestamp, candle))
+    return filled
+
+
+async def download_candles(
+    market: str,
+    timeframe: str,
+    start_date: datetime,
+    end_date: datetime,
+    *,
+    client: httpx.AsyncClient | None = None,
+    rate_limiter: TokenBucketLimiter | None = None,
+    max_in_flight: int = UPBIT_CANDLE_MAX_IN_FLIGHT,
+    fill_gaps: bool = False,
+) -> tuple[list[dict[str, Any]], CandleDownloadReport]:
+    """구간의 캔들을 페이지 단위로 동시에 받아 시간순으로 돌려줍니다(캐시는 쓰지 않습니다)."""
+    market_symbol = _normalize_market(market)
+    normalized_timeframe, candle_path = _resolve_candle_path(timeframe)
+    start_utc = _normalize_datetime_utc(start_date)
+    end_utc = _normalize_datetime_utc(end_date)
+    if start_utc > end_utc:
+        raise ValueError("start_date must be earlier than or equal to end_date")
+
+    limiter = rate_limiter or upbit_candle_rate_limiter
+    step = _timeframe_step(normalized_timeframe)
+    page_span = step * UPBIT_PAGE_SIZE
+    # ``to`` 는 그 시각 이전 캔들을 돌려주므로 마지막 봉이 포함되도록 한 칸 뒤에서 시작합니다.
+    first_cursor = end_utc + step
+    page_count = max(1, -(-(first_cursor - start_utc) // page_span))
+    cursors = [first_cursor - page_span * index for index in range(page_count)]
+    report = CandleDownloadReport(market=market_symbol, timeframe=normalized_timeframe, pages=page_count)
+    request_url = f"{settings.upbit_base_url.rstrip('/')}{candle_path}"
+    in_flight = asyncio.Semaphore(max(1, max_in_flight))
+    started_at = time.perf_counter()
+
+    async def fetch(http: httpx.AsyncClient, cursor: datetime) -> list[tuple[datetime, dict[str, Any]]]:
+        async with in_flight:
+            rows = await _fetch_page_with_retry(http, request_url, market_symbol, cursor, limiter, report)
+        return _normalize_page(rows)
+
+    async def download(http: httpx.AsyncClient) -> dict[datetime, dict[str, Any]]:
+        pages = await asyncio.gather(*(fetch(http, cursor) for cursor in cursors))
+        merged = {timestamp: candle for page in pages for timestamp, candle in page}
+        # 페이지 내부는 연속 구간이지만 페이지 사이는 이어지는지 확인해야 합니다. 더 과거 페이지에
+        # 캔들이 있는데 경계가 비어 있으면(잘린 응답 등) 빈 구간이 메워질 때까지 이어서 받습니다.
+        non_empty_pages = [page for page in pages if page]
+        for newer, older in zip(non_empty_pages, non_empty_pages[1:]):
+            seam_end = older[-1][0]
+            oldest = newer[0][0]
+            while oldest - seam_end > step:
+                report.followup_pages += 1
+                followup = await fetch(http, oldest)
+                fresh = [item for item in followup if seam_end < item[0] < oldest]
+                merged.update(fresh)
+                if not fresh or len(followup) < UPBIT_PAGE_SIZE:
+                    break
+                oldest = fresh[0][0]
+        return merged
+
+    if client is None:
+        async with httpx.AsyncClient(timeout=settings.upbit_timeout) as http:
+            merged = await download(http)
+    else:
+        merged = await download(client)
+
+    in_range = sorted(
+        (item for item in merged.items() if start_utc <= item[0] <= end_utc),
+        key=lambda item: item[0],
+    )
+    if in_range:
+        expected_slots = (in_range[-1][0] - in_range[0][0]) // step + 1
+        report.empty_slots = max(expected_slots - len(in_range), 0)
+        if fill_gaps and report.empty_slots:
+            before = len(in_range)
+            in_range = _fill_empty_slots(in_range, step)
+            report.filled_slots = len(in_range) - before
+
+    candles = [candle for _timestamp, candle in in_range]
+    report.rows = len(candles)
+    report.elapsed_seconds = time.perf_counter() - started_at
+    logger.info(
+        "Backtest OHLCV download completed: market=%s timeframe=%s rows=%s pages=%s followup=%s "
+        "retries=%s empty_slots=%s filled=%s elapsed=%.2fs rows_per_sec=%.0f pages_per_sec=%.1f",
+        market_symbol,
+        normalized_timeframe,
+        report.rows,
+        report.pages,
+        report.followup_pages,
+        report.retries,
+        report.empty_slots,
+        report.filled_slots,
+        report.elapsed_seconds,
+        report.rows_per_second,
+        report.pages_per_second,
+    )
+    return candles, report
+
+
 async def fetch_historical_data(
     market: str,
     timeframe: str,
@@ -179,14 +415,13 @@ async def fetch_historical_data(
     end_date: datetime,
 ) -> list[dict[str, Any]]:
     market_symbol = _normalize_market(market)
-    normalized_timeframe, candle_path = _resolve_candle_path(timeframe)
+    normalized_timeframe, _candle_path = _resolve_candle_path(timeframe)
     start_utc = _normalize_datetime_utc(start_date)
     end_utc = _normalize_datetime_utc(end_date)
     if start_utc > end_utc:
         raise ValueError("start_date must be earlier than or equal to end_date")
 
-    cache_path = _cache_file_path(market_symbol, normalized_timeframe, start_utc, end_utc)
-    cached = _read_cached_csv(cache_path)
+    cached = _find_covering_cache(market_symbol, normalized_timeframe, start_utc, end_utc)
     if cached is not None:
         logger.info(
             "Backtest OHLCV cache hit: market=%s timeframe=%s rows=%s",
@@ -203,60 +438,48 @@ async def fetch_historical_data(
         start_utc.isoformat(),
         end_utc.isoformat(),
     )
+    candles, _report = await download_candles(market_symbol, normalized_timeframe, start_utc, end_utc)
+    _write_cached_csv(_cache_file_path(market_symbol, normalized_timeframe, start_utc, end_utc), candles)
+    return candles
 
-    request_url = f"{settings.upbit_base_url.rstrip('/')}{candle_path}"
-    to_cursor: datetime | None = end_utc
-    oldest_seen: datetime | None = None
-    raw_rows: list[dict[str, Any]] = []
-
-    async with httpx.AsyncClient(timeout=settings.upbit_timeout) as client:
-        while True:
-            page_rows = await _fetch_page(client, request_url, market_symbol, to_cursor)
-            if not page_rows:
-                break
-
-            raw_rows.extend(page_rows)
-            page_oldest: datetime | None = None
-            for row in page_rows:
-                parsed = _parse_upbit_utc(row.get("candle_date_time_utc"))
-                if parsed is None:
-                    continue
-                if page_oldest is None or parsed < page_oldest:
-                    page_oldest = parsed
-
-            if page_oldest is None:
-                break
-            if page_oldest <= start_utc:
-                break
-            if oldest_seen is not None and page_oldest >= oldest_seen:
-                logger.warning(
-                    "Backtest OHLCV pagination did not advance. stopping loop: market=%s timeframe=%s",
-                    market_symbol,
-                    normalized_timeframe,
-                )
-                break
-
-            oldest_seen = page_oldest
-            to_cursor = page_oldest - timedelta(seconds=1)
-            await asyncio.sleep(UPBIT_REQUEST_GAP_SECONDS)
 
-    normalized_rows: dict[str, dict[str, Any]] = {}
-    for row in raw_rows:
-        normalized = _normalize_upbit_candle(row)
-        if normalized is None:
-            continue
-        timestamp, candle = normalized
-        if timestamp < start_utc or timestamp > end_utc:
-            continue
-        normalized_rows[candle["timestamp"]] = candle
-
-    candles = sorted(normalized_rows.values(), key=lambda item: item["timestamp"])
-    _write_cached_csv(cache_path, candles)
+async def seed_candle_history(
+    markets: list[str],
+    timeframe: str,
+    start_date: datetime,
+    end_date: datetime,
+    *,
+    fill_gaps: bool = False,
+) -> list[CandleDownloadReport]:
+    """여러 마켓의 캔들을 한 번에 받아 CSV 캐시에 저장합니다.
+
+    모든 마켓이 ``upbit_candle_rate_limiter`` 를 공유하므로 동시에 받아도 한도를 넘지 않습니다.
+    이미 구간을 포함하는 캐시가 있는 마켓은 건너뜁니다.
+    """
+    normalized_timeframe, _candle_path = _resolve_candle_path(timeframe)
+    start_utc = _normalize_datetime_utc(start_date)
+    end_utc = _normalize_datetime_utc(end_date)
+    symbols = list(dict.fromkeys(_normalize_market(market) for market in markets))
+
+    async def seed(client: httpx.AsyncClient, symbol: str) -> CandleDownloadReport:
+        cached = _find_covering_cache(symbol, normalized_timeframe, start_utc, end_utc)
+        if cached is not None:
+            return CandleDownloadReport(
+                market=symbol,
+                timeframe=normalized_timeframe,
+                rows=len(cached),
+                cache_hit=True,
+            )
+        candles, report = await download_candles(
+            symbol,
+            normalized_timeframe,
+            start_utc,
+            end_utc,
+            client=client,
+            fill_gaps=fill_gaps,
+        )
+        _write_cached_csv(_cache_file_path(symbol, normalized_timeframe, start_utc, end_utc), candles)
+        return report
 
-    logger.info(
-        "Backtest OHLCV fetch completed: market=%s timeframe=%s rows=%s",
-        market_symbol,
-        normalized_timeframe,
-        len(candles),
-    )
-    return candles
+    async with httpx.AsyncClient(timeout=settings.upbit_timeout) as client:
+        return list(await asyncio.gather(*(seed(client, symbol) for symbol in symbols)))
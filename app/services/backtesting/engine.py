@@ -1,4 +1,6 @@
+import asyncio
 import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, Mapping
@@ -6,10 +8,15 @@ from typing import Any, Mapping
 from app.services.backtesting.data_loader import fetch_historical_data
 from app.services.backtesting.simulated_broker import SimulatedBroker
 from app.services.indicators import IndicatorCalculator
+from app.services.indicators.calculator import load_indicator_stack
 
 logger = logging.getLogger(__name__)
 
 MIN_ORDER_KRW = 5_000.0
+# 이 봉 수마다 진행률을 알리고 이벤트 루프에 제어를 넘깁니다.
+PROGRESS_INTERVAL_BARS = 1_000
+
+BacktestProgressCallback = Callable[[int, int], None]
 
 
 @dataclass(frozen=True, slots=True)
@@ -51,6 +58,10 @@ class AIPolicyBacktestEngine:
         self._fee_rate = max(float(fee_rate), 0.0)
         self._indicator_calculator = IndicatorCalculator()
 
+    @property
+    def is_running(self) -> bool:
+        return self._is_running
+
     def stop(self) -> None:
         self._is_running = False
 
@@ -63,7 +74,16 @@ class AIPolicyBacktestEngine:
         timeframe: str = "60m",
         strategy: Mapping[str, Any] | AIPolicyStrategyParams | None = None,
         policy: Mapping[str, Any] | AIPolicyConfig | None = None,
+        *,
+        progress: BacktestProgressCallback | None = None,
+        columnar: bool = False,
     ) -> dict[str, Any]:
+        """백테스트를 실행합니다.
+
+        ``columnar=True`` 면 봉별 캔들/자산 곡선을 dict 목록 대신 열 배열
+        (``candle_columns``/``equity_columns``)로 돌려줍니다. 백그라운드 작업이 이 배열을 그대로
+        압축 artifact 로 저장합니다.
+        """
         market_symbol = str(market or "").strip().upper()
         if not market_symbol:
             raise ValueError("market is required")
@@ -95,7 +115,6 @@ class AIPolicyBacktestEngine:
             start_date=start_utc,
             end_date=end_utc,
         )
-        enriched_candles = self._indicator_calculator.calculate_from_candles(candles)
 
         broker = SimulatedBroker(
             initial_krw_balance=initial_balance_value,
@@ -108,8 +127,11 @@ class AIPolicyBacktestEngine:
         rsi_values = _rsi_series(closes, strategy_params.rsi_period)
 
         trades: list[dict[str, Any]] = []
-        equity_curve: list[dict[str, Any]] = []
-        drawdown_curve: list[dict[str, Any]] = []
+        equity_times: list[int] = []
+        equity_values: list[float] = []
+        pnl_values: list[float] = []
+        drawdown_values: list[float] = []
+        total_bars = len(candles)
         processed_bars = 0
         last_timestamp: str | None = None
         last_close = 0.0
@@ -125,6 +147,10 @@ class AIPolicyBacktestEngine:
                 break
 
             processed_bars = index + 1
+            if processed_bars % PROGRESS_INTERVAL_BARS == 0:
+                if progress is not None:
+                    progress(processed_bars, total_bars)
+                await asyncio.sleep(0)
             last_timestamp = str(candle.get("timestamp") or "").strip()
             tick_time = _parse_timestamp(last_timestamp)
             close_price = _to_float(candle.get("close"))
@@ -192,19 +218,10 @@ class AIPolicyBacktestEngine:
             peak_equity = max(peak_equity, equity)
             pnl_pct = ((equity - initial_balance_value) / initial_balance_value) * 100.0
             drawdown_pct = ((peak_equity - equity) / peak_equity) * 100.0 if peak_equity > 0 else 0.0
-            equity_curve.append(
-                {
-                    "time": int(tick_time.timestamp()),
-                    "equity": equity,
-                    "pnl_pct": pnl_pct,
-                }
-            )
-            drawdown_curve.append(
-                {
-                    "time": int(tick_time.timestamp()),
-                    "drawdown_pct": drawdown_pct,
-                }
-            )
+            equity_times.append(int(tick_time.timestamp()))
+            equity_values.append(equity)
+            pnl_values.append(pnl_pct)
+            drawdown_values.append(drawdown_pct)
 
         final_position_qty = broker.get_coin_balance(target_coin)
         final_balance = broker.get_krw_balance()
@@ -217,6 +234,31 @@ class AIPolicyBacktestEngine:
             processed_bars,
             final_balance,
         )
+        if progress is not None:
+            progress(processed_bars, total_bars)
+
+        if columnar:
+            series: dict[str, Any] = {
+                "candle_columns": self._candle_columns(candles),
+                "equity_columns": {
+                    "time": equity_times,
+                    "equity": equity_values,
+                    "pnl_pct": pnl_values,
+                    "drawdown_pct": drawdown_values,
+                },
+            }
+        else:
+            series = {
+                "candles": self._indicator_calculator.calculate_from_candles(candles),
+                "equity_curve": [
+                    {"time": time_, "equity": equity, "pnl_pct": pnl_pct}
+                    for time_, equity, pnl_pct in zip(equity_times, equity_values, pnl_values)
+                ],
+                "drawdown_curve": [
+                    {"time": time_, "drawdown_pct": drawdown_pct}
+                    for time_, drawdown_pct in zip(equity_times, drawdown_values)
+                ],
+            }
 
         return {
             "market": market_symbol,
@@ -230,10 +272,28 @@ class AIPolicyBacktestEngine:
             "position_qty": final_position_qty,
             "strategy": _strategy_to_dict(strategy_params),
             "policy": _policy_to_dict(policy_config),
-            "candles": enriched_candles,
             "trades": trades,
-            "equity_curve": equity_curve,
-            "drawdown_curve": drawdown_curve,
+            **series,
+        }
+
+    def _candle_columns(self, candles: list[dict[str, Any]]) -> dict[str, Any]:
+        """OHLCV 와 지표를 시간순 float64 배열로 만듭니다. 시각을 해석할 수 없는 봉은 뺍니다."""
+        np, _pd, _ta = load_indicator_stack()
+        ohlcv = self._indicator_calculator.candles_to_columns(candles)
+        indicators = self._indicator_calculator.calculate_columns(ohlcv["close"])
+        times = np.array(
+            [
+                parsed.timestamp() if (parsed := _parse_timestamp(str(candle.get("timestamp") or "").strip())) else np.nan
+                for candle in candles
+            ],
+            dtype=np.float64,
+        )
+        order = np.argsort(times, kind="stable")
+        order = order[~np.isnan(times[order])]
+        return {
+            "time": times[order].astype(np.int64),
+            **{column: values[order] for column, values in ohlcv.items()},
+            **{column: values[order] for column, values in indicators.items()},
         }
 
     async def _try_buy(
@@ -0,0 +1,324 @@
+"""백그라운드 백테스트 작업과 열 기반 결과 artifact.
+
+긴 기간 백테스트는 캔들/자산 곡선/거래를 한 번에 JSON 으로 내려 보내면 응답이 수십 MB 가
+되므로, 작업으로 제출해 진행률만 스트리밍하고 결과는 열 배열 그대로 ``.npz`` 파일에
+저장합니다. 클라이언트는 요약을 먼저 받고 거래는 페이지 단위로, 캔들과 자산 곡선은 화면 폭에
+맞게 다운샘플링해서 필요한 만큼만 가져갑니다.
+
+artifact 의 열 이름은 ``candle_``/``equity_``/``trade_`` 접두사로 구분합니다. 문자열은 유니코드
+배열로 저장해 pickle 없이 읽고, 없는 값은 빈 문자열(문자열)이나 -1(정수)로 표시합니다.
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from app.core.config import settings
+from app.services.backtesting.analyzer import summarize_backtest_result
+from app.services.backtesting.engine import AIPolicyBacktestEngine
+from app.services.indicators.calculator import load_indicator_stack
+from app.services.indicators.calculator import nan_to_none
+from app.services.portfolio.timeseries import SeriesSample
+from app.services.portfolio.timeseries import downsample_lttb
+
+logger = logging.getLogger(__name__)
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_SUCCEEDED = "succeeded"
+JOB_STATUS_FAILED = "failed"
+JOB_STATUS_CANCELLED = "cancelled"
+FINAL_JOB_STATUSES = frozenset({JOB_STATUS_SUCCEEDED, JOB_STATUS_FAILED, JOB_STATUS_CANCELLED})
+
+MAX_CONCURRENT_BACKTEST_JOBS = 2
+MAX_RETAINED_BACKTEST_JOBS = 20
+MAX_TRADES_PAGE_SIZE = 500
+
+TRADE_FLOAT_COLUMNS = ("price", "qty", "fee", "krw_balance", "coin_balance")
+TRADE_INT_COLUMNS = ("index", "confidence", "recommended_weight")
+TRADE_TEXT_COLUMNS = ("timestamp", "side", "reason")
+EQUITY_COLUMNS = ("equity", "pnl_pct", "drawdown_pct")
+
+BacktestFinalizer = Callable[[dict[str, Any]], Awaitable[dict[str, Any]]]
+
+
+def resolve_artifact_dir() -> Path:
+    configured = str(settings.backtest_artifact_dir or "").strip()
+    return Path(configured) if configured else Path(tempfile.gettempdir()) / "ai-trade-manager-backtests"
+
+
+@dataclass(slots=True)
+class BacktestJob:
+    id: str
+    status: str = JOB_STATUS_QUEUED
+    bars_done: int = 0
+    bars_total: int = 0
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    error: str | None = None
+    result: dict[str, Any] | None = None
+    trade_count: int = 0
+    artifact_path: Path | None = None
+    engine: AIPolicyBacktestEngine | None = field(default=None, repr=False)
+    task: asyncio.Task | None = field(default=None, repr=False)
+    _changed: asyncio.Event = field(default_factory=asyncio.Event, init=False, repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in FINAL_JOB_STATUSES
+
+    def changed(self) -> asyncio.Event:
+        """다음 상태 변경 때 set 될 이벤트. 상태를 읽기 전에 받아 두어야 변경을 놓치지 않습니다."""
+        return self._changed
+
+    def notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def progress(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "bars_done": self.bars_done,
+            "bars_total": self.bars_total,
+            "error": self.error,
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **self.progress(),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "trade_count": self.trade_count,
+            "result": self.result,
+        }
+
+
+def write_backtest_artifact(path: Path, result: dict[str, Any], trades: list[dict[str, Any]]) -> None:
+    np, _pd, _ta = load_indicator_stack()
+    arrays: dict[str, Any] = {}
+    for column, values in (result.get("candle_columns") or {}).items():
+        dtype = np.int64 if column == "time" else np.float64
+        arrays[f"candle_{column}"] = np.asarray(values, dtype=dtype)
+    equity_columns = result.get("equity_columns") or {}
+    arrays["equity_time"] = np.asarray(equity_columns.get("time") or [], dtype=np.int64)
+    for column in EQUITY_COLUMNS:
+        arrays[f"equity_{column}"] = np.asarray(equity_columns.get(column) or [], dtype=np.float64)
+    for column in TRADE_FLOAT_COLUMNS:
+        arrays[f"trade_{column}"] = np.asarray([trade[column] for trade in trades], dtype=np.float64)
+    for column in TRADE_INT_COLUMNS:
+        arrays[f"trade_{column}"] = np.asarray(
+            [-1 if trade[column] is None else trade[column] for trade in trades], dtype=np.int64
+        )
+    for column in TRADE_TEXT_COLUMNS:
+        arrays[f"trade_{column}"] = np.asarray([trade[column] or "" for trade in trades], dtype=np.str_)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # 쓰는 도중의 파일을 읽지 않도록 임시 파일에 쓴 뒤 이름을 바꿉니다.
+    temporary = path.with_name(f".{path.name}.tmp")
+    with temporary.open("wb") as file:
+        np.savez_compressed(file, **arrays)
+    os.replace(temporary, path)
+
+
+def read_trades(path: Path, offset: int, limit: int) -> list[dict[str, Any]]:
+    np, _pd, _ta = load_indicator_stack()
+    with np.load(path, allow_pickle=False) as artifact:
+        window = slice(max(offset, 0), max(offset, 0) + max(limit, 0))
+        columns = {
+            column: artifact[f"trade_{column}"][window].tolist()
+            for column in (*TRADE_FLOAT_COLUMNS, *TRADE_INT_COLUMNS, *TRADE_TEXT_COLUMNS)
+        }
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    for row in rows:
+        row["reason"] = row["reason"] or None
+        for column in ("confidence", "recommended_weight"):
+            if row[column] < 0:
+                row[column] = None
+    return rows
+
+
+def read_equity(path: Path, points: int) -> list[dict[str, Any]]:
+    """자산 곡선을 LTTB 로 points 개까지 줄입니다. 극값이 보존되므로 낙폭 구간이 사라지지 않습니다."""
+    np, _pd, _ta = load_indicator_stack()
+    with np.load(path, allow_pickle=False) as artifact:
+        times = artifact["equity_time"].tolist()
+        columns = {column: artifact[f"equity_{column}"].tolist() for column in EQUITY_COLUMNS}
+    samples = [
+        SeriesSample(timestamp=datetime.fromtimestamp(time_, tz=timezone.utc), value=equity)
+        for time_, equity in zip(times, columns["equity"])
+    ]
+    index_by_time = {time_: index for index, time_ in enumerate(times)}
+    selected = [index_by_time[int(point.timestamp.timestamp())] for point in downsample_lttb(samples, points)]
+    return [
+        {"time": times[index], **{column: columns[column][index] for column in EQUITY_COLUMNS}}
+        for index in selected
+    ]
+
+
+def read_candles(path: Path, points: int) -> list[dict[str, Any]]:
+    """캔들을 points 개 이하의 버킷으로 합칩니다.
+
+    버킷마다 시가는 첫 봉, 고가/저가는 최대/최소, 종가와 지표는 마지막 봉, 거래량은 합계입니다.
+    """
+    np, _pd, _ta = load_indicator_stack()
+    with np.load(path, allow_pickle=False) as artifact:
+        columns = {
+            name.removeprefix("candle_"): artifact[name]
+            for name in artifact.files
+            if name.startswith("candle_")
+        }
+    times = columns.get("time")
+    if times is None or len(times) == 0:
+        return []
+
+    count = len(times)
+    bucket_count = min(count, max(points, 1))
+    starts = (np.arange(bucket_count) * count) // bucket_count
+    lasts = np.append(starts[1:], count) - 1
+    aggregated: dict[str, Any] = {
+        "time": times[starts],
+        "open": columns["open"][starts],
+        "high": np.maximum.reduceat(columns["high"], starts),
+        "low": np.minimum.reduceat(columns["low"], starts),
+        "close": columns["close"][lasts],
+        "volume": np.add.reduceat(columns["volume"], starts),
+    }
+    for column, values in columns.items():
+        if column not in aggregated:
+            aggregated[column] = nan_to_none(values[lasts])
+
+    names = list(aggregated)
+    values = [column if isinstance(column, list) else column.tolist() for column in aggregated.values()]
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+
+class BacktestJobManager:
+    def __init__(
+        self,
+        *,
+        artifact_dir: Path | None = None,
+        max_concurrent: int = MAX_CONCURRENT_BACKTEST_JOBS,
+        max_retained: int = MAX_RETAINED_BACKTEST_JOBS,
+        engine_factory: Callable[[], AIPolicyBacktestEngine] = AIPolicyBacktestEngine,
+    ) -> None:
+        self._artifact_dir = artifact_dir
+        self._max_concurrent = max(1, max_concurrent)
+        self._semaphore: asyncio.Semaphore | None = None
+        self.max_retained = max(1, max_retained)
+        self._engine_factory = engine_factory
+        self._jobs: OrderedDict[str, BacktestJob] = OrderedDict()
+
+    @property
+    def artifact_dir(self) -> Path:
+        if self._artifact_dir is None:
+            self._artifact_dir = resolve_artifact_dir()
+        return self._artifact_dir
+
+    def get(self, job_id: str) -> BacktestJob | None:
+        return self._jobs.get(job_id)
+
+    def submit(
+        self,
+        run_kwargs: dict[str, Any],
+        finalize: BacktestFinalizer | None = None,
+    ) -> BacktestJob:
+        """백테스트를 백그라운드 작업으로 등록하고 바로 반환합니다."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        job = BacktestJob(id=uuid.uuid4().hex)
+        self._jobs[job.id] = job
+        self._evict_finished()
+        job.task = asyncio.create_task(self._run(job, run_kwargs, finalize), name=f"backtest-job-{job.id}")
+        return job
+
+    async def cancel(self, job_id: str) -> BacktestJob | None:
+        job = self._jobs.get(job_id)
+        if job is None or job.is_finished:
+            return job
+        if job.engine is not None:
+            # 실행 중이면 엔진이 다음 봉에서 멈추고, 부분 결과는 저장하지 않습니다.
+            job.engine.stop()
+        elif job.task is not None:
+            job.task.cancel()
+        if job.task is not None:
+            with suppress(asyncio.CancelledError):
+                await job.task
+        return job
+
+    async def shutdown(self) -> None:
+        for job_id in list(self._jobs):
+            await self.cancel(job_id)
+
+    async def _run(
+        self,
+        job: BacktestJob,
+        run_kwargs: dict[str, Any],
+        finalize: BacktestFinalizer | None,
+    ) -> None:
+        assert self._semaphore is not None
+        try:
+            async with self._semaphore:
+                job.engine = self._engine_factory()
+                job.status = JOB_STATUS_RUNNING
+                job.started_at = datetime.now(timezone.utc)
+                job.notify()
+
+                def on_progress(done: int, total: int) -> None:
+                    job.bars_done, job.bars_total = done, total
+                    job.notify()
+
+                result = await job.engine.run(**run_kwargs, progress=on_progress, columnar=True)
+                if not job.engine.is_running:
+                    job.status = JOB_STATUS_CANCELLED
+                    return
+
+                summarized = summarize_backtest_result(result)
+                trades = summarized.pop("trades")
+                summarized.pop("markers")
+                path = self.artifact_dir / f"{job.id}.npz"
+                await asyncio.to_thread(write_backtest_artifact, path, result, trades)
+                if finalize is not None:
+                    summarized.update(await finalize({**summarized, "trades": trades}))
+                job.artifact_path = path
+                job.trade_count = len(trades)
+                job.result = summarized
+                job.status = JOB_STATUS_SUCCEEDED
+        except asyncio.CancelledError:
+            job.status = JOB_STATUS_CANCELLED
+        except Exception as exc:
+            logger.exception("백그라운드 백테스트 실패: job=%s", job.id)
+            job.status = JOB_STATUS_FAILED
+            job.error = str(exc) or exc.__class__.__name__
+        finally:
+            job.engine = None
+            job.finished_at = datetime.now(timezone.utc)
+            job.notify()
+
+    def _evict_finished(self) -> None:
+        # 오래된 완료 작업부터 지웁니다. 실행 중인 작업은 한도를 넘어도 남겨 둡니다.
+        overflow = len(self._jobs) - self.max_retained
+        for job_id, job in list(self._jobs.items()):
+            if overflow <= 0:
+                break
+            if not job.is_finished:
+                continue
+            del self._jobs[job_id]
+            overflow -= 1
+            if job.artifact_path is not None:
+                with suppress(OSError):
+                    job.artifact_path.unlink()
+
+
+backtest_job_manager = BacktestJobManager()
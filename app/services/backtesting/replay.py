@@ -0,0 +1,430 @@
+"""기록된 AI 분석(AIAnalysisLog)을 현재 실행기 정책으로 다시 돌려 보는 고속 replay.
+
+과거 의사결정을 시간순으로 스트리밍하면서 로컬 캔들 위에서 실행기의 주문 크기 계산
+(``plan_ai_buy_order``/``plan_ai_sell_volume``), 하드 TP/SL 판정, paper 정산 규칙
+(``settle_paper_fill``)을 그대로 적용합니다. LLM 매수 precheck, 진입 게이트, 알림 같은
+외부 I/O 는 건너뛰고 paper 원장은 메모리 장부로 대신합니다. 결과는
+``AIPolicyBacktestEngine.run`` 과 같은 형태라 ``analyze_backtest_result`` 에 그대로 넣을 수 있습니다.
+"""
+
+import logging
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Mapping
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.domain import AIAnalysisLog
+from app.services.backtesting.data_loader import fetch_historical_data
+from app.services.backtesting.engine import _normalize_datetime_utc, _parse_timestamp, _to_float
+from app.services.trading.ai_executor import MIN_ORDER_KRW
+from app.services.trading.ai_executor import PAPER_BUY_FEE_MULTIPLIER
+from app.services.trading.ai_executor import PAPER_SELL_FEE_MULTIPLIER
+from app.services.trading.ai_executor import AIExecutorPolicy
+from app.services.trading.ai_executor import plan_ai_buy_order
+from app.services.trading.ai_executor import plan_ai_sell_volume
+from app.services.trading.ai_executor import resolve_hard_tp_sl_reason
+from app.services.trading.paper import PaperFill
+from app.services.trading.paper import settle_paper_fill
+
+logger = logging.getLogger(__name__)
+
+REPLAY_STREAM_BATCH_SIZE = 500
+REPLAY_POLICY_FIELDS = tuple(AIExecutorPolicy.__dataclass_fields__)
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayDecision:
+    id: int
+    symbol: str
+    decision: str
+    confidence: int
+    recommended_weight: int
+    created_at: datetime
+
+
+async def stream_replay_decisions(
+    db: AsyncSession,
+    symbol: str,
+    start_date: datetime,
+    end_date: datetime,
+    *,
+    batch_size: int = REPLAY_STREAM_BATCH_SIZE,
+) -> AsyncIterator[ReplayDecision]:
+    """기간 내 분석 로그를 created_at 순으로 서버 측 커서에서 batch_size 씩 읽어 옵니다.
+
+    reasoning 같은 큰 컬럼은 읽지 않습니다.
+    """
+    stmt = (
+        select(
+            AIAnalysisLog.id,
+            AIAnalysisLog.symbol,
+            AIAnalysisLog.decision,
+            AIAnalysisLog.confidence,
+            AIAnalysisLog.recommended_weight,
+            AIAnalysisLog.created_at,
+        )
+        .where(
+            AIAnalysisLog.symbol == symbol,
+            AIAnalysisLog.created_at >= start_date,
+            AIAnalysisLog.created_at <= end_date,
+        )
+        .order_by(AIAnalysisLog.created_at.asc(), AIAnalysisLog.id.asc())
+        .execution_options(yield_per=batch_size)
+    )
+    result = await db.stream(stmt)
+    async for row in result:
+        yield ReplayDecision(
+            id=int(row.id),
+            symbol=str(row.symbol),
+            decision=str(row.decision or "").strip().upper(),
+            confidence=int(row.confidence or 0),
+            recommended_weight=int(row.recommended_weight or 0),
+            created_at=_normalize_datetime_utc(row.created_at),
+        )
+
+
+def coerce_replay_policy(
+    base: AIExecutorPolicy,
+    overrides: Mapping[str, Any] | None,
+) -> AIExecutorPolicy:
+    """현재 실행기 정책 위에 None 이 아닌 override 값만 덮어씁니다."""
+    if not overrides:
+        return base
+    changes = {
+        key: value
+        for key, value in overrides.items()
+        if key in REPLAY_POLICY_FIELDS and value is not None
+    }
+    return replace(base, **changes)
+
+
+@dataclass(slots=True)
+class _ReplayBook:
+    """paper 원장의 메모리 대체물입니다. 단일 종목 현금/수량/평단만 보관합니다."""
+
+    cash: float
+    position_qty: float = 0.0
+    avg_entry_price: float = 0.0
+
+    def apply(self, fill: PaperFill) -> None:
+        self.cash, self.position_qty, self.avg_entry_price = settle_paper_fill(
+            self.cash,
+            self.position_qty,
+            self.avg_entry_price,
+            fill,
+        )
+        if self.position_qty <= 0:
+            self.avg_entry_price = 0.0
+
+    def equity(self, price: float) -> float:
+        return self.cash + (self.position_qty * price)
+
+
+class AIDecisionReplayEngine:
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self._is_running = True
+
+    def stop(self) -> None:
+        self._is_running = False
+
+    async def run(
+        self,
+        market: str,
+        start_date: datetime,
+        end_date: datetime,
+        initial_balance: float,
+        policy: AIExecutorPolicy,
+        timeframe: str = "60m",
+    ) -> dict[str, Any]:
+        market_symbol = str(market or "").strip().upper()
+        if not market_symbol:
+            raise ValueError("market is required")
+
+        start_utc = _normalize_datetime_utc(start_date)
+        end_utc = _normalize_datetime_utc(end_date)
+        if start_utc > end_utc:
+            raise ValueError("start_date must be earlier than or equal to end_date")
+
+        initial_balance_value = float(initial_balance)
+        if initial_balance_value <= 0:
+            raise ValueError("initial_balance must be greater than zero")
+
+        candles = await fetch_historical_data(
+            market=market_symbol,
+            timeframe=timeframe,
+            start_date=start_utc,
+            end_date=end_utc,
+        )
+        decisions = stream_replay_decisions(self.db, market_symbol, start_utc, end_utc)
+        result = await self.replay(
+            market=market_symbol,
+            candles=candles,
+            decisions=decisions,
+            initial_balance=initial_balance_value,
+            policy=policy,
+        )
+        result.update(
+            {
+                "timeframe": timeframe,
+                "start_date": start_utc.isoformat(),
+                "end_date": end_utc.isoformat(),
+            }
+        )
+        return result
+
+    async def replay(
+        self,
+        *,
+        market: str,
+        candles: list[dict[str, Any]],
+        decisions: AsyncIterable[ReplayDecision],
+        initial_balance: float,
+        policy: AIExecutorPolicy,
+    ) -> dict[str, Any]:
+        """각 봉의 시가에 그 시점까지 나온 결정을 체결하고, 종가로 하드 TP/SL 과 평가금액을 계산합니다.
+
+        결정은 다음 봉 시가에 체결하므로 결정 시각 이후의 가격을 미리 보지 않습니다.
+        """
+        book = _ReplayBook(cash=initial_balance)
+        trades: list[dict[str, Any]] = []
+        equity_curve: list[dict[str, Any]] = []
+        drawdown_curve: list[dict[str, Any]] = []
+        outcomes: Counter[str] = Counter()
+        processed_bars = 0
+        last_timestamp: str | None = None
+        last_close = 0.0
+        peak_equity = initial_balance
+        max_age = timedelta(minutes=policy.max_age_minutes)
+
+        decision_iter = aiter(decisions)
+        pending = await anext(decision_iter, None)
+
+        for index, candle in enumerate(candles):
+            if not self._is_running:
+                logger.info("AI 의사결정 replay 중단 신호 수신.")
+                break
+
+            processed_bars = index + 1
+            last_timestamp = str(candle.get("timestamp") or "").strip()
+            tick_time = _parse_timestamp(last_timestamp)
+            close_price = _to_float(candle.get("close"))
+            if tick_time is None or close_price <= 0:
+                continue
+            open_price = _to_float(candle.get("open"))
+            fill_price = open_price if open_price > 0 else close_price
+            last_close = close_price
+
+            while pending is not None and pending.created_at <= tick_time:
+                if tick_time - pending.created_at > max_age:
+                    outcomes["stale"] += 1
+                else:
+                    outcome = self._execute_decision(
+                        book=book,
+                        decision=pending,
+                        market=market,
+                        index=index,
+                        tick_time=tick_time,
+                        price=fill_price,
+                        policy=policy,
+                        trades=trades,
+                    )
+                    outcomes[outcome] += 1
+                pending = await anext(decision_iter, None)
+
+            self._check_hard_tp_sl(
+                book=book,
+                market=market,
+                index=index,
+                tick_time=tick_time,
+                price=close_price,
+                policy=policy,
+                trades=trades,
+            )
+
+            equity = book.equity(close_price)
+            peak_equity = max(peak_equity, equity)
+            equity_curve.append(
+                {
+                    "time": int(tick_time.timestamp()),
+                    "equity": equity,
+                    "pnl_pct": ((equity - initial_balance) / initial_balance) * 100.0,
+                }
+            )
+            drawdown_curve.append(
+                {
+                    "time": int(tick_time.timestamp()),
+                    "drawdown_pct": ((peak_equity - equity) / peak_equity) * 100.0 if peak_equity > 0 else 0.0,
+                }
+            )
+
+        # 마지막 봉 이후의 결정은 체결할 가격이 없으므로 개수만 셉니다.
+        while pending is not None:
+            outcomes["after_last_candle"] += 1
+            pending = await anext(decision_iter, None)
+
+        final_balance = book.cash + (book.position_qty * last_close if last_close > 0 else 0.0)
+        decision_count = sum(outcomes.values())
+        logger.info(
+            "AI 의사결정 replay 완료: market=%s bars=%s decisions=%s trades=%s final_balance=%s",
+            market,
+            processed_bars,
+            decision_count,
+            len(trades),
+            final_balance,
+        )
+        return {
+            "market": market,
+            "bars_processed": processed_bars,
+            "last_timestamp": last_timestamp,
+            "initial_balance": initial_balance,
+            "final_balance": final_balance,
+            "position_qty": book.position_qty,
+            "strategy": {},
+            "policy": asdict(policy),
+            "candles": candles,
+            "trades": trades,
+            "equity_curve": equity_curve,
+            "drawdown_curve": drawdown_curve,
+            "replay": {
+                "decisions_total": decision_count,
+                "decisions_executed": outcomes["executed"],
+                "outcomes": dict(outcomes),
+            },
+        }
+
+    def _execute_decision(
+        self,
+        *,
+        book: _ReplayBook,
+        decision: ReplayDecision,
+        market: str,
+        index: int,
+        tick_time: datetime,
+        price: float,
+        policy: AIExecutorPolicy,
+        trades: list[dict[str, Any]],
+    ) -> str:
+        # execute_ai_trade 의 사전 필터와 같은 순서입니다.
+        if decision.decision == "HOLD":
+            return "hold"
+        if decision.confidence < policy.min_confidence:
+            return "low_confidence"
+        if decision.recommended_weight <= 0:
+            return "zero_weight"
+
+        if decision.decision == "BUY":
+            plan = plan_ai_buy_order(
+                total_krw=book.equity(price),
+                available_krw=book.cash,
+                current_position_value=book.position_qty * price,
+                recommended_weight=decision.recommended_weight,
+                max_allocation_pct=policy.max_allocation_pct,
+                max_buy_weight_pct=policy.max_buy_weight_pct,
+            )
+            if plan.skip_reason is not None:
+                return plan.skip_reason
+            fill = PaperFill(
+                symbol=market,
+                side="buy",
+                executed_price=price,
+                executed_qty=(plan.order_amount_krw / price) * PAPER_BUY_FEE_MULTIPLIER,
+                cash_amount=plan.order_amount_krw,
+                executed_at=tick_time,
+                ai_analysis_log_id=decision.id,
+            )
+        elif decision.decision == "SELL":
+            sell_volume = plan_ai_sell_volume(book.position_qty, decision.recommended_weight)
+            if sell_volume <= 0:
+                return "no_position"
+            if sell_volume * price < MIN_ORDER_KRW:
+                return "below_min_order"
+            fill = PaperFill(
+                symbol=market,
+                side="sell",
+                executed_price=price,
+                executed_qty=sell_volume,
+                cash_amount=sell_volume * price * PAPER_SELL_FEE_MULTIPLIER,
+                executed_at=tick_time,
+                ai_analysis_log_id=decision.id,
+            )
+        else:
+            return "unsupported_decision"
+
+        book.apply(fill)
+        trades.append(
+            _build_replay_trade_row(
+                index,
+                fill,
+                book,
+                reason=f"ai_{fill.side}",
+                confidence=decision.confidence,
+                recommended_weight=decision.recommended_weight,
+            )
+        )
+        return "executed"
+
+    def _check_hard_tp_sl(
+        self,
+        *,
+        book: _ReplayBook,
+        market: str,
+        index: int,
+        tick_time: datetime,
+        price: float,
+        policy: AIExecutorPolicy,
+        trades: list[dict[str, Any]],
+    ) -> None:
+        if book.position_qty <= 0 or book.avg_entry_price <= 0:
+            return
+        pnl_percentage = ((price - book.avg_entry_price) / book.avg_entry_price) * 100.0
+        trigger_reason = resolve_hard_tp_sl_reason(
+            pnl_percentage,
+            policy.hard_take_profit_pct,
+            policy.hard_stop_loss_pct,
+        )
+        if trigger_reason is None or book.position_qty * price < MIN_ORDER_KRW:
+            return
+
+        fill = PaperFill(
+            symbol=market,
+            side="sell",
+            executed_price=price,
+            executed_qty=book.position_qty,
+            cash_amount=book.position_qty * price * PAPER_SELL_FEE_MULTIPLIER,
+            executed_at=tick_time,
+            order_reason=trigger_reason,
+        )
+        book.apply(fill)
+        trades.append(_build_replay_trade_row(index, fill, book, reason=trigger_reason))
+
+
+def _build_replay_trade_row(
+    index: int,
+    fill: PaperFill,
+    book: _ReplayBook,
+    *,
+    reason: str,
+    confidence: int | None = None,
+    recommended_weight: int | None = None,
+) -> dict[str, Any]:
+    notional = fill.executed_price * fill.executed_qty
+    cash_amount = _to_float(fill.cash_amount)
+    fee = cash_amount - notional if fill.side == "buy" else notional - cash_amount
+    return {
+        "index": index,
+        "timestamp": fill.executed_at.isoformat() if fill.executed_at is not None else "",
+        "side": fill.side,
+        "price": fill.executed_price,
+        "qty": fill.executed_qty,
+        "fee": max(fee, 0.0),
+        "krw_balance": book.cash,
+        "coin_balance": book.position_qty,
+        "reason": reason,
+        "confidence": confidence,
+        "recommended_weight": recommended_weight,
+    }
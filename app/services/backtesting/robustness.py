@@ -0,0 +1,654 @@
+"""AI 정책 백테스트 견고성 검증(walk-forward + Monte Carlo).
+
+``AIPolicyBacktestEngine`` 한 번의 in-sample 결과만으로는 ``AIPolicyConfig`` 임계값을 믿기
+어렵습니다. 여기서는 같은 매매 규칙을 동기 함수(``simulate_policy``)로 다시 구현해 수천 번
+돌립니다.
+
+1. walk-forward: 봉 구간을 학습/검증 창으로 굴리며, 학습 창에서 파라미터 격자 중 최고 조합을
+   고르고 바로 다음 검증 창(out-of-sample)에서 성과를 잽니다. 격자 평가는 process pool 에 나눠
+   실행합니다.
+2. Monte Carlo: 검증 창에서 나온 왕복 거래 수익률을 복원 추출로 재배열하고, 봉 수익률은 블록
+   bootstrap 으로 재표집해 최종 수익률/최대 낙폭 분포와 신뢰구간을 냅니다.
+
+EMA/RSI 는 기간별로 ``PolicyBacktestSeries`` 에 한 번만 계산해 두고 모든 시뮬레이션과 worker 가
+재사용합니다. 전체 실행은 ``budget_seconds`` 안에서 끝나며, 시간이 모자라면 끝난 평가만으로
+결과를 만들고 ``budget_exhausted`` 로 알려 줍니다.
+"""
+
+import itertools
+import logging
+import math
+import multiprocessing
+import os
+import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timedelta
+from typing import Any, Literal
+
+from app.services.backtesting.engine import MIN_ORDER_KRW
+from app.services.backtesting.engine import AIPolicyConfig
+from app.services.backtesting.engine import AIPolicyStrategyParams
+from app.services.backtesting.engine import _coerce_policy_config
+from app.services.backtesting.engine import _coerce_strategy_params
+from app.services.backtesting.engine import _ema_series
+from app.services.backtesting.engine import _fmt_number
+from app.services.backtesting.engine import _parse_timestamp
+from app.services.backtesting.engine import _policy_to_dict
+from app.services.backtesting.engine import _resolve_signal
+from app.services.backtesting.engine import _rsi_series
+from app.services.backtesting.engine import _strategy_to_dict
+from app.services.backtesting.engine import _to_float
+from app.services.indicators.calculator import load_indicator_stack
+
+logger = logging.getLogger(__name__)
+
+RobustnessObjective = Literal["return", "calmar"]
+
+DEFAULT_FEE_RATE = 0.0005
+DEFAULT_BUDGET_SECONDS = 60.0
+DEFAULT_MONTE_CARLO_ITERATIONS = 2_000
+DEFAULT_BOOTSTRAP_BLOCK_BARS = 24
+MAX_GRID_COMBINATIONS = 256
+# worker 에 보내는 작업 하나에 담을 후보 수. 작을수록 예산 초과 시 버리는 양이 줄어듭니다.
+CANDIDATES_PER_TASK = 8
+MONTE_CARLO_BATCH = 500
+# 평가할 봉 수(창 × 후보 × 학습 봉)가 이보다 적으면 worker 기동 비용이 더 커서 현재 프로세스에서 돌립니다.
+POOL_MIN_SIMULATED_BARS = 2_000_000
+GRID_KEYS = frozenset(
+    item.name for dataclass_type in (AIPolicyStrategyParams, AIPolicyConfig) for item in fields(dataclass_type)
+)
+
+
+class PolicyBacktestSeries:
+    """시뮬레이션 입력(봉 시각/종가)과 기간별 EMA/RSI 캐시."""
+
+    def __init__(self, times: Sequence[datetime | None], closes: Sequence[float]) -> None:
+        if len(times) != len(closes):
+            raise ValueError("times and closes must have the same length")
+        self.times = list(times)
+        self.closes = list(closes)
+        self._indicators: dict[tuple[str, int], list[float | None]] = {}
+
+    @classmethod
+    def from_candles(cls, candles: Sequence[Mapping[str, Any]]) -> "PolicyBacktestSeries":
+        return cls(
+            [_parse_timestamp(str(candle.get("timestamp") or "").strip()) for candle in candles],
+            [_to_float(candle.get("close")) for candle in candles],
+        )
+
+    def __len__(self) -> int:
+        return len(self.closes)
+
+    def ema(self, period: int) -> list[float | None]:
+        key = ("ema", period)
+        if key not in self._indicators:
+            self._indicators[key] = _ema_series(self.closes, period)
+        return self._indicators[key]
+
+    def rsi(self, period: int) -> list[float | None]:
+        key = ("rsi", period)
+        if key not in self._indicators:
+            self._indicators[key] = _rsi_series(self.closes, period)
+        return self._indicators[key]
+
+    def warm(self, strategies: Sequence[AIPolicyStrategyParams]) -> None:
+        """worker 로 보내기 전에 필요한 지표를 모두 계산해 둡니다."""
+        for strategy in strategies:
+            self.ema(strategy.ema_fast)
+            self.ema(strategy.ema_slow)
+            self.rsi(strategy.rsi_period)
+
+
+@dataclass(slots=True)
+class SimulationResult:
+    return_pct: float
+    max_drawdown_pct: float
+    trade_count: int
+    final_equity: float
+    trade_returns: list[float] = field(default_factory=list)
+    equity: list[float] = field(default_factory=list)
+
+
+def simulate_policy(
+    series: PolicyBacktestSeries,
+    strategy: AIPolicyStrategyParams,
+    policy: AIPolicyConfig,
+    start: int = 0,
+    stop: int | None = None,
+    *,
+    initial_balance: float = 1_000_000.0,
+    fee_rate: float = DEFAULT_FEE_RATE,
+    keep_equity: bool = False,
+) -> SimulationResult:
+    """``AIPolicyBacktestEngine.run`` 과 같은 규칙으로 ``[start, stop)`` 봉을 시뮬레이션합니다.
+
+    지표는 전체 구간 기준이므로 창 앞부분에서도 워밍업 없이 바로 신호가 납니다(미래 값은 쓰지 않음).
+    주문 수량은 엔진과 같이 ``_fmt_number`` 로 반올림해 결과가 엔진과 일치합니다.
+    """
+    stop = len(series) if stop is None else min(stop, len(series))
+    ema_fast = series.ema(strategy.ema_fast)
+    ema_slow = series.ema(strategy.ema_slow)
+    rsi = series.rsi(strategy.rsi_period)
+    times, closes = series.times, series.closes
+    cooldown = timedelta(minutes=policy.cooldown_minutes)
+
+    krw = float(initial_balance)
+    position_qty = 0.0
+    avg_entry_price = 0.0
+    highest_price_since_entry = 0.0
+    next_trade_at: datetime | None = None
+    last_close = 0.0
+    peak_equity = krw
+    max_drawdown_pct = 0.0
+    entry_equity = 0.0
+    trade_count = 0
+    trade_returns: list[float] = []
+    equity_curve: list[float] = []
+
+    for index in range(start, stop):
+        tick_time = times[index]
+        close_price = closes[index]
+        if tick_time is None or close_price <= 0:
+            continue
+
+        last_close = close_price
+        if position_qty > 0:
+            highest_price_since_entry = max(highest_price_since_entry, close_price)
+
+        signal = _resolve_signal(
+            close_price=close_price,
+            ema_fast=ema_fast[index],
+            ema_slow=ema_slow[index],
+            rsi=rsi[index],
+            position_qty=position_qty,
+            avg_entry_price=avg_entry_price,
+            highest_price_since_entry=highest_price_since_entry,
+            strategy=strategy,
+            policy=policy,
+            next_trade_at=next_trade_at,
+            current_time=tick_time,
+        )
+
+        if signal.decision == "BUY":
+            current_equity = krw + position_qty * close_price
+            remaining_budget = max(
+                current_equity * (policy.max_allocation_pct / 100.0) - position_qty * close_price,
+                0.0,
+            )
+            order_krw = min(remaining_budget * (signal.recommended_weight / 100.0), krw / (1.0 + fee_rate))
+            order_krw = float(_fmt_number(order_krw)) if order_krw >= MIN_ORDER_KRW else 0.0
+            buy_fee = order_krw * fee_rate
+            if order_krw > 0 and krw >= order_krw + buy_fee:
+                if position_qty <= 0:
+                    entry_equity = current_equity
+                executed_qty = order_krw / close_price
+                previous_cost = position_qty * avg_entry_price
+                krw -= order_krw + buy_fee
+                position_qty += executed_qty
+                avg_entry_price = (previous_cost + executed_qty * close_price) / position_qty
+                highest_price_since_entry = max(highest_price_since_entry, close_price)
+                next_trade_at = tick_time + cooldown
+                trade_count += 1
+
+        elif signal.decision == "SELL":
+            sell_ratio = 1.0 if signal.is_risk_exit else signal.recommended_weight / 100.0
+            sell_qty = min(position_qty, position_qty * sell_ratio)
+            if sell_qty > 1e-12:
+                sell_qty = float(_fmt_number(sell_qty))
+                if sell_qty > 0 and sell_qty - position_qty <= 1e-8:
+                    sell_qty = min(sell_qty, position_qty)
+                    gross = sell_qty * close_price
+                    krw += gross - gross * fee_rate
+                    position_qty = max(position_qty - sell_qty, 0.0)
+                    if position_qty <= 1e-12:
+                        position_qty = 0.0
+                        avg_entry_price = 0.0
+                        highest_price_since_entry = 0.0
+                        if entry_equity > 0:
+                            trade_returns.append(krw / entry_equity - 1.0)
+                    next_trade_at = tick_time + cooldown
+                    trade_count += 1
+
+        equity = krw + position_qty * close_price
+        peak_equity = max(peak_equity, equity)
+        if peak_equity > 0:
+            max_drawdown_pct = max(max_drawdown_pct, (peak_equity - equity) / peak_equity * 100.0)
+        if keep_equity:
+            equity_curve.append(equity)
+
+    final_equity = krw + position_qty * last_close
+    return SimulationResult(
+        return_pct=(final_equity / initial_balance - 1.0) * 100.0,
+        max_drawdown_pct=max_drawdown_pct,
+        trade_count=trade_count,
+        final_equity=final_equity,
+        trade_returns=trade_returns,
+        equity=equity_curve,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class WalkForwardFold:
+    train_start: int
+    train_stop: int
+    test_start: int
+    test_stop: int
+
+
+def build_walk_forward_folds(
+    total_bars: int,
+    train_bars: int,
+    test_bars: int,
+    step_bars: int | None = None,
+    *,
+    anchored: bool = False,
+) -> list[WalkForwardFold]:
+    """학습 창 바로 뒤에 검증 창이 오도록 구간을 굴립니다. ``anchored`` 면 학습 시작을 0 에 고정합니다."""
+    if train_bars <= 0 or test_bars <= 0:
+        raise ValueError("train_bars and test_bars must be positive")
+    step = step_bars or test_bars
+    folds: list[WalkForwardFold] = []
+    train_start = 0
+    while train_start + train_bars + test_bars <= total_bars:
+        train_stop = train_start + train_bars
+        folds.append(
+            WalkForwardFold(
+                train_start=0 if anchored else train_start,
+                train_stop=train_stop,
+                test_start=train_stop,
+                test_stop=train_stop + test_bars,
+            )
+        )
+        train_start += step
+    return folds
+
+
+def build_candidates(
+    base_strategy: Mapping[str, Any] | None,
+    base_policy: Mapping[str, Any] | None,
+    grid: Mapping[str, Sequence[Any]] | None,
+) -> list[tuple[AIPolicyStrategyParams, AIPolicyConfig]]:
+    """기본 설정에 격자 값을 덮어쓴 (전략, 정책) 조합 목록. EMA 순서가 맞지 않는 조합은 뺍니다."""
+    grid = dict(grid or {})
+    unknown = sorted(set(grid) - GRID_KEYS)
+    if unknown:
+        raise ValueError(f"unsupported grid keys: {unknown}")
+    combinations = math.prod(len(values) for values in grid.values()) if grid else 1
+    if combinations > MAX_GRID_COMBINATIONS:
+        raise ValueError(f"grid has {combinations} combinations; limit is {MAX_GRID_COMBINATIONS}")
+
+    base = {**(base_strategy or {}), **(base_policy or {})}
+    keys = list(grid)
+    candidates: dict[tuple[AIPolicyStrategyParams, AIPolicyConfig], None] = {}
+    for values in itertools.product(*(grid[key] for key in keys)):
+        merged = {**base, **dict(zip(keys, values))}
+        strategy = _coerce_strategy_params(merged)
+        if strategy.ema_fast >= strategy.ema_slow:
+            continue
+        candidates[(strategy, _coerce_policy_config(merged))] = None
+    if not candidates:
+        raise ValueError("grid produced no valid parameter combinations")
+    return list(candidates)
+
+
+def score_simulation(result: SimulationResult, objective: RobustnessObjective) -> float:
+    if objective == "calmar":
+        # 낙폭이 1% 미만이면 1% 로 보고 나눠, 거래가 거의 없는 조합이 과대평가되지 않게 합니다.
+        return result.return_pct / max(result.max_drawdown_pct, 1.0)
+    return result.return_pct
+
+
+# spawn worker 프로세스 전용 상태입니다. 현재 프로세스 실행(_InlineExecutor)은 실행마다 자기 상태를 씁니다.
+_worker_state: dict[str, Any] = {}
+
+
+def _build_worker_state(
+    series: PolicyBacktestSeries,
+    candidates: list[tuple[AIPolicyStrategyParams, AIPolicyConfig]],
+    initial_balance: float,
+    fee_rate: float,
+    objective: RobustnessObjective,
+) -> dict[str, Any]:
+    return {
+        "series": series,
+        "candidates": candidates,
+        "initial_balance": initial_balance,
+        "fee_rate": fee_rate,
+        "objective": objective,
+    }
+
+
+def _init_worker(*initargs: Any) -> None:
+    _worker_state.update(_build_worker_state(*initargs))
+
+
+def _evaluate_candidates(
+    fold_index: int,
+    start: int,
+    stop: int,
+    candidate_indices: list[int],
+    state: dict[str, Any] | None = None,
+) -> tuple[int, list[tuple[int, float]]]:
+    state = _worker_state if state is None else state
+    scores: list[tuple[int, float]] = []
+    for candidate_index in candidate_indices:
+        strategy, policy = state["candidates"][candidate_index]
+        result = simulate_policy(
+            state["series"],
+            strategy,
+            policy,
+            start,
+            stop,
+            initial_balance=state["initial_balance"],
+            fee_rate=state["fee_rate"],
+        )
+        scores.append((candidate_index, score_simulation(result, state["objective"])))
+    return fold_index, scores
+
+
+class _InlineExecutor:
+    """worker 를 쓰지 않을 때(``max_workers`` 0/1) 같은 인터페이스로 현재 프로세스에서 실행합니다.
+
+    요청마다 스레드에서 동시에 돌 수 있으므로 상태는 모듈 전역이 아니라 인스턴스에 두고
+    ``submit`` 할 때 ``state`` 로 넘깁니다.
+    """
+
+    def __init__(self, initargs: tuple[Any, ...]) -> None:
+        self._state = _build_worker_state(*initargs)
+
+    def submit(self, func: Any, *args: Any) -> Future:
+        future: Future = Future()
+        future.set_result(func(*args, state=self._state))
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        return None
+
+
+def _create_executor(max_workers: int, initargs: tuple[Any, ...]) -> Any:
+    if max_workers <= 1:
+        return _InlineExecutor(initargs)
+    # 서버 프로세스는 이벤트 루프/스레드를 갖고 있으므로 fork 대신 spawn 으로 띄웁니다.
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=initargs,
+    )
+
+
+def _distribution(values: Sequence[float], confidence: float) -> dict[str, float] | None:
+    if len(values) == 0:
+        return None
+    np, _pd, _ta = load_indicator_stack()
+    array = np.asarray(values, dtype=np.float64)
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    low, median, high = np.percentile(array, [tail, 50.0, 100.0 - tail])
+    return {
+        "mean": round(float(array.mean()), 4),
+        "median": round(float(median), 4),
+        "ci_low": round(float(low), 4),
+        "ci_high": round(float(high), 4),
+    }
+
+
+def _paths_summary(paths: Any) -> dict[str, Any]:
+    """누적 자산 경로(시작 1.0 제외)에서 최종 수익률/최대 낙폭 분포를 냅니다."""
+    np, _pd, _ta = load_indicator_stack()
+    running_peak = np.maximum(np.maximum.accumulate(paths, axis=1), 1.0)
+    max_drawdowns = ((running_peak - paths) / running_peak).max(axis=1) * 100.0
+    final_returns = (paths[:, -1] - 1.0) * 100.0
+    return {
+        "final_return_pct": final_returns,
+        "max_drawdown_pct": max_drawdowns,
+    }
+
+
+def monte_carlo_trade_returns(
+    trade_returns: Sequence[float],
+    iterations: int,
+    *,
+    confidence: float = 0.95,
+    seed: int | None = None,
+    deadline: float | None = None,
+) -> dict[str, Any] | None:
+    """왕복 거래 수익률을 복원 추출로 재배열해 최종 수익률/최대 낙폭 분포를 냅니다."""
+    if len(trade_returns) < 2 or iterations <= 0:
+        return None
+    np, _pd, _ta = load_indicator_stack()
+    rng = np.random.default_rng(seed)
+    returns = np.asarray(trade_returns, dtype=np.float64)
+    finals: list[Any] = []
+    drawdowns: list[Any] = []
+    done = 0
+    while done < iterations and (deadline is None or time.monotonic() < deadline):
+        batch = min(MONTE_CARLO_BATCH, iterations - done)
+        sampled = returns[rng.integers(0, len(returns), size=(batch, len(returns)))]
+        summary = _paths_summary(np.cumprod(1.0 + sampled, axis=1))
+        finals.append(summary["final_return_pct"])
+        drawdowns.append(summary["max_drawdown_pct"])
+        done += batch
+    return _monte_carlo_report(np, finals, drawdowns, done, confidence, trades=len(returns))
+
+
+def bootstrap_bar_returns(
+    bar_returns: Sequence[float],
+    iterations: int,
+    *,
+    block_bars: int = DEFAULT_BOOTSTRAP_BLOCK_BARS,
+    confidence: float = 0.95,
+    seed: int | None = None,
+    deadline: float | None = None,
+) -> dict[str, Any] | None:
+    """봉 수익률을 연속 블록 단위로 재표집(moving block bootstrap)해 자기상관을 유지한 채 분포를 냅니다."""
+    count = len(bar_returns)
+    if count < 2 or iterations <= 0:
+        return None
+    np, _pd, _ta = load_indicator_stack()
+    rng = np.random.default_rng(seed)
+    returns = np.asarray(bar_returns, dtype=np.float64)
+    block = max(1, min(block_bars, count))
+    blocks_per_path = -(-count // block)
+    offsets = np.arange(block)
+    finals: list[Any] = []
+    drawdowns: list[Any] = []
+    done = 0
+    while done < iterations and (deadline is None or time.monotonic() < deadline):
+        batch = min(MONTE_CARLO_BATCH, iterations - done)
+        starts = rng.integers(0, count - block + 1, size=(batch, blocks_per_path))
+        indices = (starts[:, :, None] + offsets).reshape(batch, -1)[:, :count]
+        summary = _paths_summary(np.cumprod(1.0 + returns[indices], axis=1))
+        finals.append(summary["final_return_pct"])
+        drawdowns.append(summary["max_drawdown_pct"])
+        done += batch
+    return _monte_carlo_report(np, finals, drawdowns, done, confidence, block_bars=block)
+
+
+def _monte_carlo_report(
+    np: Any,
+    finals: list[Any],
+    drawdowns: list[Any],
+    iterations: int,
+    confidence: float,
+    **extra: Any,
+) -> dict[str, Any] | None:
+    if not finals:
+        return None
+    final_returns = np.concatenate(finals)
+    return {
+        "iterations": iterations,
+        **extra,
+        "final_return_pct": _distribution(final_returns, confidence),
+        "max_drawdown_pct": _distribution(np.concatenate(drawdowns), confidence),
+        "probability_of_loss": round(float((final_returns < 0).mean()), 4),
+    }
+
+
+def run_robustness_analysis(
+    candles: Sequence[Mapping[str, Any]],
+    *,
+    base_strategy: Mapping[str, Any] | None = None,
+    base_policy: Mapping[str, Any] | None = None,
+    grid: Mapping[str, Sequence[Any]] | None = None,
+    train_bars: int,
+    test_bars: int,
+    step_bars: int | None = None,
+    anchored: bool = False,
+    objective: RobustnessObjective = "calmar",
+    initial_balance: float = 1_000_000.0,
+    fee_rate: float = DEFAULT_FEE_RATE,
+    monte_carlo_iterations: int = DEFAULT_MONTE_CARLO_ITERATIONS,
+    bootstrap_block_bars: int = DEFAULT_BOOTSTRAP_BLOCK_BARS,
+    confidence: float = 0.95,
+    budget_seconds: float = DEFAULT_BUDGET_SECONDS,
+    max_workers: int | None = None,
+    seed: int | None = None,
+) -> dict[str, Any]:
+    """walk-forward 최적화 후 out-of-sample 결과로 Monte Carlo 분포를 계산합니다(CPU 작업, 동기 함수)."""
+    started_at = time.monotonic()
+    deadline = started_at + max(budget_seconds, 0.0)
+    series = PolicyBacktestSeries.from_candles(candles)
+    folds = build_walk_forward_folds(len(series), train_bars, test_bars, step_bars, anchored=anchored)
+    if not folds:
+        raise ValueError("not enough candles for one train/test window")
+    candidates = build_candidates(base_strategy, base_policy, grid)
+    series.warm([strategy for strategy, _policy in candidates])
+
+    workers = max_workers
+    if workers is None:
+        simulated_bars = sum(fold.train_stop - fold.train_start for fold in folds) * len(candidates)
+        workers = min(os.cpu_count() or 1, 4) if simulated_bars >= POOL_MIN_SIMULATED_BARS else 1
+    best: dict[int, tuple[float, int]] = {}
+    evaluated = 0
+    budget_exhausted = False
+    executor = _create_executor(workers, (series, candidates, initial_balance, fee_rate, objective))
+    try:
+        pending: set[Future] = set()
+        for fold_index, fold in enumerate(folds):
+            for offset in range(0, len(candidates), CANDIDATES_PER_TASK):
+                # 현재 프로세스에서 실행할 때는 submit 이 곧 실행이므로 여기서도 예산을 확인합니다.
+                if time.monotonic() >= deadline:
+                    budget_exhausted = True
+                    break
+                indices = list(range(offset, min(offset + CANDIDATES_PER_TASK, len(candidates))))
+                pending.add(
+                    executor.submit(_evaluate_candidates, fold_index, fold.train_start, fold.train_stop, indices)
+                )
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                budget_exhausted = True
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                fold_index, scores = future.result()
+                evaluated += len(scores)
+                for candidate_index, score in scores:
+                    if fold_index not in best or score > best[fold_index][0]:
+                        best[fold_index] = (score, candidate_index)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    # 검증 창 평가는 창마다 한 번뿐이라 예산을 넘겨도 끝까지 돌립니다.
+    fold_reports: list[dict[str, Any]] = []
+    oos_returns: list[float] = []
+    oos_drawdowns: list[float] = []
+    trade_returns: list[float] = []
+    bar_returns: list[float] = []
+    for fold_index, fold in enumerate(folds):
+        if fold_index not in best:
+            continue
+        train_score, candidate_index = best[fold_index]
+        strategy, policy = candidates[candidate_index]
+        result = simulate_policy(
+            series,
+            strategy,
+            policy,
+            fold.test_start,
+            fold.test_stop,
+            initial_balance=initial_balance,
+            fee_rate=fee_rate,
+            keep_equity=True,
+        )
+        oos_returns.append(result.return_pct)
+        oos_drawdowns.append(result.max_drawdown_pct)
+        trade_returns.extend(result.trade_returns)
+        previous = initial_balance
+        for equity in result.equity:
+            bar_returns.append(equity / previous - 1.0 if previous > 0 else 0.0)
+            previous = equity
+        fold_reports.append(
+            {
+                "train": [_bar_time(series, fold.train_start), _bar_time(series, fold.train_stop - 1)],
+                "test": [_bar_time(series, fold.test_start), _bar_time(series, fold.test_stop - 1)],
+                "strategy": _strategy_to_dict(strategy),
+                "policy": _policy_to_dict(policy),
+                "train_score": round(train_score, 4),
+                "test_return_pct": round(result.return_pct, 4),
+                "test_max_drawdown_pct": round(result.max_drawdown_pct, 4),
+                "test_trades": result.trade_count,
+            }
+        )
+
+    stitched = 1.0
+    stitched_peak = 1.0
+    stitched_drawdown = 0.0
+    for bar_return in bar_returns:
+        stitched *= 1.0 + bar_return
+        stitched_peak = max(stitched_peak, stitched)
+        stitched_drawdown = max(stitched_drawdown, (stitched_peak - stitched) / stitched_peak)
+
+    mc_deadline = max(deadline, time.monotonic() + 1.0)
+    report = {
+        "bars": len(series),
+        "candidates": len(candidates),
+        "folds": fold_reports,
+        "out_of_sample": {
+            "folds": len(fold_reports),
+            "return_pct": _distribution(oos_returns, confidence),
+            "max_drawdown_pct": _distribution(oos_drawdowns, confidence),
+            "stitched_return_pct": round((stitched - 1.0) * 100.0, 4),
+            "stitched_max_drawdown_pct": round(stitched_drawdown * 100.0, 4),
+            "round_trips": len(trade_returns),
+        },
+        "monte_carlo": {
+            "trade_resampling": monte_carlo_trade_returns(
+                trade_returns,
+                monte_carlo_iterations,
+                confidence=confidence,
+                seed=seed,
+                deadline=mc_deadline,
+            ),
+            "bar_bootstrap": bootstrap_bar_returns(
+                bar_returns,
+                monte_carlo_iterations,
+                block_bars=bootstrap_block_bars,
+                confidence=confidence,
+                seed=seed,
+                deadline=mc_deadline,
+            ),
+        },
+        "confidence": confidence,
+        "simulations": evaluated + len(fold_reports),
+        "workers": max(workers, 1),
+        "budget_seconds": budget_seconds,
+        "budget_exhausted": budget_exhausted,
+        "elapsed_seconds": round(time.monotonic() - started_at, 3),
+    }
+    logger.info(
+        "Backtest robustness finished: bars=%s folds=%s candidates=%s simulations=%s elapsed=%.2fs exhausted=%s",
+        report["bars"],
+        len(fold_reports),
+        len(candidates),
+        report["simulations"],
+        report["elapsed_seconds"],
+        budget_exhausted,
+    )
+    return report
+
+
+def _bar_time(series: PolicyBacktestSeries, index: int) -> str | None:
+    timestamp = series.times[index] if 0 <= index < len(series) else None
+    return timestamp.isoformat() if timestamp is not None else None
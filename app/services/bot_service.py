@@ -4,6 +4,7 @@ from typing import Any
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.event_hub import live_event_hub
 from app.db.repository import extract_bot_runtime_status
 from app.db.repository import get_or_create_bot_config
 from app.db.repository import merge_bot_runtime_status
@@ -59,6 +60,7 @@ async def update_bot_runtime_status(
     bot_config.config_json = merge_bot_runtime_status(bot_config.config_json, runtime_status)
     await db.commit()
     await db.refresh(bot_config)
+    live_event_hub.publish("bot_status", _to_bot_status(bot_config).model_dump(mode="json"))
     return bot_config
 
 
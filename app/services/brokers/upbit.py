@@ -1,6 +1,7 @@
 import hashlib
 import logging
 import re
+import time
 import uuid
 from typing import Any
 from urllib.parse import unquote, urlencode
@@ -10,6 +11,7 @@ import jwt
 from tenacity import RetryCallState, retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from app.core.config import settings
+from app.core.metrics import UPBIT_REQUEST_SECONDS
 from app.services.brokers.base import BaseBrokerClient
 
 logger = logging.getLogger(__name__)
@@ -285,13 +287,29 @@ class UpbitBroker(BaseBrokerClient):
             headers.update(self._auth_headers(query_string))
 
         url = f"{self._resolve_base_url()}{path}"
+        started_at = time.perf_counter()
         async with httpx.AsyncClient(timeout=self._resolve_timeout()) as client:
-            resp = await client.request(
-                method,
-                url,
-                params=normalized_params,
-                json=json_payload,
-                headers=headers,
+            try:
+                resp = await client.request(
+                    method,
+                    url,
+                    params=normalized_params,
+                    json=json_payload,
+                    headers=headers,
+                )
+            except httpx.RequestError as exc:
+                UPBIT_REQUEST_SECONDS.observe(
+                    time.perf_counter() - started_at,
+                    method=method,
+                    endpoint=path,
+                    status=type(exc).__name__,
+                )
+                raise
+            UPBIT_REQUEST_SECONDS.observe(
+                time.perf_counter() - started_at,
+                method=method,
+                endpoint=path,
+                status=str(resp.status_code),
             )
             self._update_remaining(resp.headers)
             try:
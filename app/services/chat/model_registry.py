@@ -0,0 +1,194 @@
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.tools import BaseTool
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.metrics import CHAT_MODEL_BUILD_SECONDS
+from app.core.metrics import CHAT_MODEL_BUILD_SECONDS_SAVED_TOTAL
+from app.core.metrics import CHAT_MODEL_CACHE_TOTAL
+from app.services.ai.provider_router import AIProviderCandidate
+
+MAX_CACHED_CHAT_MODELS = 32
+
+ModelKey = tuple[Any, ...]
+
+
+@dataclass(slots=True)
+class _CachedModel:
+    runnable: Any
+    build_seconds: float
+
+
+def _fingerprint(value: str | None) -> str:
+    return hashlib.sha256(str(value or "").encode("utf-8")).hexdigest()[:12]
+
+
+def _api_key_fingerprint(provider: str) -> str:
+    # 키가 교체되면 이전 키로 만든 클라이언트를 재사용하지 않도록 key 에 포함합니다.
+    if provider == "openai":
+        return _fingerprint(settings.OPENAI_API_KEY)
+    return _fingerprint(settings.GEMINI_API_KEY)
+
+
+def tool_set_signature(tools: Sequence[BaseTool]) -> str:
+    """bind_tools 결과는 Tool 이름/설명/인자 스키마에만 의존하므로 세션이 달라도 공유합니다."""
+    payload = []
+    for tool in sorted(tools, key=lambda item: item.name):
+        args_schema = tool.tool_call_schema
+        schema = args_schema.model_json_schema() if isinstance(args_schema, type) else args_schema
+        payload.append([tool.name, tool.description, schema])
+    return _fingerprint(json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str))
+
+
+def response_schema_signature(response_model: type[BaseModel]) -> str:
+    schema = json.dumps(response_model.model_json_schema(), ensure_ascii=False, sort_keys=True)
+    return f"{response_model.__module__}.{response_model.__qualname__}:{_fingerprint(schema)}"
+
+
+def build_chat_model(candidate: AIProviderCandidate) -> Any:
+    if candidate.provider == "openai":
+        if not settings.OPENAI_API_KEY:
+            raise RuntimeError("OPENAI_API_KEY가 설정되지 않아 Chat Orchestrator를 실행할 수 없습니다.")
+        from langchain_openai import ChatOpenAI
+
+        return ChatOpenAI(model=candidate.model, api_key=settings.OPENAI_API_KEY)
+
+    if not settings.GEMINI_API_KEY:
+        raise RuntimeError("GEMINI_API_KEY 가 설정되지 않아 Chat Orchestrator 를 실행할 수 없습니다.")
+
+    try:
+        from langchain_google_genai import ChatGoogleGenerativeAI
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(
+            "langchain-google-genai 패키지가 없어 Gemini 채팅 모델을 초기화할 수 없습니다."
+        ) from exc
+
+    return ChatGoogleGenerativeAI(
+        model=candidate.model,
+        temperature=0,
+        google_api_key=settings.GEMINI_API_KEY,
+    )
+
+
+class ChatModelRegistry:
+    """(provider, model, tool-set, 응답 스키마) 별로 바인딩된 채팅 모델을 재사용합니다.
+
+    기본 모델 인스턴스는 provider/model 별로 하나만 만들어 HTTP 커넥션 풀을 공유하고,
+    ``bind_tools``/``with_structured_output`` 결과도 같은 조합이면 다시 만들지 않습니다.
+    HTTP 클라이언트가 이벤트 루프에 묶이므로 루프가 바뀌면 캐시를 비웁니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        builder: Callable[[AIProviderCandidate], Any] = build_chat_model,
+        max_entries: int = MAX_CACHED_CHAT_MODELS,
+    ) -> None:
+        self._builder = builder
+        self.max_entries = max(1, int(max_entries))
+        self._entries: OrderedDict[ModelKey, _CachedModel] = OrderedDict()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+
+    def get_base_model(self, candidate: AIProviderCandidate) -> Any:
+        return self._get_or_build(
+            candidate,
+            "base",
+            (),
+            lambda: self._builder(candidate),
+        )
+
+    def get_tool_model(self, candidate: AIProviderCandidate, tools: Sequence[BaseTool]) -> Any:
+        tool_list = list(tools)
+        return self._get_or_build(
+            candidate,
+            "tools",
+            (tool_set_signature(tool_list),),
+            lambda: self.get_base_model(candidate).bind_tools(tool_list),
+        )
+
+    def get_structured_model(
+        self,
+        candidate: AIProviderCandidate,
+        response_model: type[BaseModel],
+        *,
+        include_raw: bool = False,
+    ) -> Any:
+        return self._get_or_build(
+            candidate,
+            "structured",
+            (response_schema_signature(response_model), include_raw),
+            lambda: self.get_base_model(candidate).with_structured_output(
+                response_model,
+                include_raw=include_raw,
+            ),
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _reset_if_loop_changed(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._loop is not loop:
+            self._entries.clear()
+            self._loop = loop
+
+    def _get_or_build(
+        self,
+        candidate: AIProviderCandidate,
+        kind: str,
+        extra_key: tuple[Any, ...],
+        factory: Callable[[], Any],
+    ) -> Any:
+        key = (
+            candidate.provider,
+            candidate.model,
+            _api_key_fingerprint(candidate.provider),
+            kind,
+            *extra_key,
+        )
+        with self._lock:
+            self._reset_if_loop_changed()
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+        if cached is not None:
+            CHAT_MODEL_CACHE_TOTAL.inc(provider=candidate.provider, kind=kind, result="hit")
+            CHAT_MODEL_BUILD_SECONDS_SAVED_TOTAL.inc(
+                cached.build_seconds,
+                provider=candidate.provider,
+                kind=kind,
+            )
+            return cached.runnable
+
+        started_at = time.perf_counter()
+        runnable = factory()
+        build_seconds = time.perf_counter() - started_at
+        CHAT_MODEL_CACHE_TOTAL.inc(provider=candidate.provider, kind=kind, result="miss")
+        CHAT_MODEL_BUILD_SECONDS.observe(build_seconds, provider=candidate.provider, kind=kind)
+
+        with self._lock:
+            self._entries[key] = _CachedModel(runnable=runnable, build_seconds=build_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return runnable
+
+
+chat_model_registry = ChatModelRegistry()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from collections.abc import AsyncGenerator
+from functools import cache
 from typing import Annotated, Any, Literal, TypedDict
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
@@ -11,13 +13,16 @@ from langgraph.graph.message import add_messages
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.config import settings
-from app.db.repository import get_recent_chat_messages
+from app.core.metrics import record_langchain_usage
 from app.db.repository import save_chat_message
 from app.models.schemas import ReviewerDecision
 from app.services.ai.provider_router import AIProviderCandidate
 from app.services.ai.provider_router import AIProviderRouter
+from app.services.chat.model_registry import chat_model_registry
 from app.services.chat.tools import build_chat_tools
+from app.services.chat.working_memory import estimate_tokens
+from app.services.chat.working_memory import load_working_memory
+from app.services.chat.working_memory import schedule_summary_refresh
 
 SupervisorRoute = Literal["rag_agent", "quant_agent", "ops_agent", "FINISH"]
 
@@ -78,6 +83,12 @@ OPS_TOOL_NAMES = {
 }
 MAX_RETRIES = 2
 MAX_TOOL_CALL_ROUNDS = 4
+MAX_PARALLEL_TOOL_CALLS = 4
+TOOL_CALL_TIMEOUT_SECONDS = 20.0
+TOOL_CALL_TIMEOUT_OVERRIDES = {
+    "get_technical_indicators": 30.0,
+    "search_past_conversations": 30.0,
+}
 GRAPH_AGENT_NAMES = {"supervisor", "rag_agent", "quant_agent", "ops_agent"}
 
 
@@ -87,6 +98,7 @@ class OrchestratorState(TypedDict, total=False):
     session_id: str
     retry_count: int
     db: AsyncSession
+    ai_router: AIProviderRouter
 
 
 class SupervisorDecision(BaseModel):
@@ -94,31 +106,6 @@ class SupervisorDecision(BaseModel):
     response: str = Field(..., min_length=1)
 
 
-def _build_chat_model(candidate: AIProviderCandidate) -> Any:
-    if candidate.provider == "openai":
-        if not settings.OPENAI_API_KEY:
-            raise RuntimeError("OPENAI_API_KEY가 설정되지 않아 Chat Orchestrator를 실행할 수 없습니다.")
-        from langchain_openai import ChatOpenAI
-
-        return ChatOpenAI(model=candidate.model, api_key=settings.OPENAI_API_KEY)
-
-    if not settings.GEMINI_API_KEY:
-        raise RuntimeError("GEMINI_API_KEY 가 설정되지 않아 Chat Orchestrator 를 실행할 수 없습니다.")
-
-    try:
-        from langchain_google_genai import ChatGoogleGenerativeAI
-    except ModuleNotFoundError as exc:
-        raise RuntimeError(
-            "langchain-google-genai 패키지가 없어 Gemini 채팅 모델을 초기화할 수 없습니다."
-        ) from exc
-
-    return ChatGoogleGenerativeAI(
-        model=candidate.model,
-        temperature=0,
-        google_api_key=settings.GEMINI_API_KEY,
-    )
-
-
 def _get_state_db(state: OrchestratorState) -> AsyncSession:
     db = state.get("db")
     if not isinstance(db, AsyncSession):
@@ -126,16 +113,28 @@ def _get_state_db(state: OrchestratorState) -> AsyncSession:
     return db
 
 
+def _get_state_router(state: OrchestratorState) -> AIProviderRouter:
+    # 한 턴 안의 supervisor/worker/reviewer 호출이 같은 라우터를 공유해 provider 설정을 한 번만 읽습니다.
+    router = state.get("ai_router")
+    if isinstance(router, AIProviderRouter):
+        return router
+    return AIProviderRouter(_get_state_db(state))
+
+
 async def _ainvoke_structured_model(
     state: OrchestratorState,
     response_model: type[BaseModel],
     messages: list[BaseMessage],
 ) -> BaseModel:
-    router = AIProviderRouter(_get_state_db(state))
+    router = _get_state_router(state)
 
     async def _operation(candidate: AIProviderCandidate) -> BaseModel:
-        model = _build_chat_model(candidate).with_structured_output(response_model)
-        result = await model.ainvoke(messages)
+        model = chat_model_registry.get_structured_model(candidate, response_model, include_raw=True)
+        raw_result = await model.ainvoke(messages)
+        record_langchain_usage(candidate.provider, candidate.model, raw_result.get("raw"))
+        if raw_result.get("parsing_error") is not None:
+            raise raw_result["parsing_error"]
+        result = raw_result.get("parsed")
         if isinstance(result, BaseModel):
             return result
         if isinstance(result, dict):
@@ -151,11 +150,12 @@ async def _ainvoke_tool_model(
     tools: list[BaseTool],
     conversation: list[BaseMessage],
 ) -> AIMessage:
-    router = AIProviderRouter(_get_state_db(state))
+    router = _get_state_router(state)
 
     async def _operation(candidate: AIProviderCandidate) -> AIMessage:
-        model = _build_chat_model(candidate).bind_tools(tools)
+        model = chat_model_registry.get_tool_model(candidate, tools)
         response = await model.ainvoke(conversation)
+        record_langchain_usage(candidate.provider, candidate.model, response)
         if isinstance(response, AIMessage):
             return response
         return AIMessage(content=str(getattr(response, "content", "") or ""))
@@ -204,23 +204,6 @@ def _collapse_messages_for_gemini(messages: list[BaseMessage]) -> list[BaseMessa
     return collapsed
 
 
-def _restore_working_memory_messages(history_rows: list[Any]) -> list[BaseMessage]:
-    restored: list[BaseMessage] = []
-    for row in history_rows:
-        role = str(getattr(row, "role", "") or "").strip().lower()
-        content = str(getattr(row, "content", "") or "")
-        agent_name = getattr(row, "agent_name", None)
-
-        if role == "user":
-            restored.append(HumanMessage(content=content))
-            continue
-
-        if role == "assistant":
-            restored.append(AIMessage(content=content, name=agent_name or None))
-
-    return restored
-
-
 def _extract_last_ai_message(messages: list[Any] | None) -> AIMessage | None:
     if not messages:
         return None
@@ -269,6 +252,66 @@ def _get_filtered_tools(session_id: str, allowed_tool_names: set[str]) -> dict[s
     return {tool.name: tool for tool in tools if tool.name in allowed_tool_names}
 
 
+async def _execute_tool_call(
+    tool_call: dict[str, Any],
+    tools_by_name: dict[str, BaseTool],
+    semaphore: asyncio.Semaphore,
+) -> ToolMessage:
+    tool_name = str(tool_call.get("name") or "").strip()
+    tool_call_id = str(tool_call.get("id") or tool_name or "tool_call")
+    tool_args = tool_call.get("args") or {}
+    tool = tools_by_name.get(tool_name)
+    if tool is None:
+        return ToolMessage(
+            tool_call_id=tool_call_id,
+            name=tool_name or None,
+            status="error",
+            content=f"허용되지 않은 Tool 호출입니다: {tool_name}",
+        )
+
+    timeout = TOOL_CALL_TIMEOUT_OVERRIDES.get(tool_name, TOOL_CALL_TIMEOUT_SECONDS)
+    try:
+        async with semaphore:
+            result = await asyncio.wait_for(tool.ainvoke(tool_args), timeout=timeout)
+        return ToolMessage(
+            tool_call_id=tool_call_id,
+            name=tool_name,
+            status="success",
+            content=_stringify_tool_result(result),
+        )
+    except asyncio.TimeoutError:
+        return ToolMessage(
+            tool_call_id=tool_call_id,
+            name=tool_name,
+            status="error",
+            content=f"Tool 실행 시간이 {timeout:g}초를 초과했습니다.",
+        )
+    except Exception as exc:
+        return ToolMessage(
+            tool_call_id=tool_call_id,
+            name=tool_name,
+            status="error",
+            content=f"Tool 실행 중 오류가 발생했습니다: {exc}",
+        )
+
+
+async def _execute_tool_calls(
+    tool_calls: list[dict[str, Any]],
+    tools_by_name: dict[str, BaseTool],
+) -> list[ToolMessage]:
+    """한 응답의 Tool 호출을 동시에 실행하고 결과는 tool_call 순서대로 돌려줍니다.
+
+    각 Tool 은 자체 DB 세션을 열기 때문에 서로 독립적으로 실행할 수 있으며,
+    on_tool_end 이벤트는 완료되는 순서대로 스트리밍됩니다.
+    """
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_TOOL_CALLS)
+    return list(
+        await asyncio.gather(
+            *(_execute_tool_call(tool_call, tools_by_name, semaphore) for tool_call in tool_calls)
+        )
+    )
+
+
 async def _run_worker_agent(
     state: OrchestratorState,
     *,
@@ -301,41 +344,7 @@ async def _run_worker_agent(
                 "next_agent": target_agent,
             }
 
-        for tool_call in tool_calls:
-            tool_name = str(tool_call.get("name") or "").strip()
-            tool_call_id = str(tool_call.get("id") or tool_name or "tool_call")
-            tool_args = tool_call.get("args") or {}
-            tool = tools_by_name.get(tool_name)
-            if tool is None:
-                conversation.append(
-                    ToolMessage(
-                        tool_call_id=tool_call_id,
-                        name=tool_name or None,
-                        status="error",
-                        content=f"허용되지 않은 Tool 호출입니다: {tool_name}",
-                    )
-                )
-                continue
-
-            try:
-                result = await tool.ainvoke(tool_args)
-                conversation.append(
-                    ToolMessage(
-                        tool_call_id=tool_call_id,
-                        name=tool_name,
-                        status="success",
-                        content=_stringify_tool_result(result),
-                    )
-                )
-            except Exception as exc:
-                conversation.append(
-                    ToolMessage(
-                        tool_call_id=tool_call_id,
-                        name=tool_name,
-                        status="error",
-                        content=f"Tool 실행 중 오류가 발생했습니다: {exc}",
-                    )
-                )
+        conversation.extend(await _execute_tool_calls(tool_calls, tools_by_name))
 
     return {
         "messages": [
@@ -541,7 +550,10 @@ def build_chat_graph():
     return graph.compile()
 
 
-chat_orchestrator_graph = build_chat_graph()
+@cache
+def get_chat_orchestrator_graph():
+    """컴파일된 그래프를 프로세스당 한 번만 만듭니다. 첫 채팅 요청이나 기동 warm-up 에서 호출됩니다."""
+    return build_chat_graph()
 
 
 async def run_chat_stream(
@@ -557,8 +569,7 @@ async def run_chat_stream(
     if not normalized_user_message:
         raise ValueError("user_message 는 비어 있을 수 없습니다.")
 
-    history_rows = await get_recent_chat_messages(db, normalized_session_id, limit=20)
-    working_memory_messages = _restore_working_memory_messages(history_rows)
+    working_memory = await load_working_memory(db, normalized_session_id)
 
     await save_chat_message(
         db=db,
@@ -567,21 +578,23 @@ async def run_chat_stream(
         content=normalized_user_message,
         agent_name=None,
         is_tool_call=False,
+        token_count=estimate_tokens(normalized_user_message),
     )
 
     input_messages = [
-        *working_memory_messages,
+        *working_memory.messages,
         HumanMessage(content=normalized_user_message),
     ]
 
     final_answer_saved = False
 
-    async for event in chat_orchestrator_graph.astream_events(
+    async for event in get_chat_orchestrator_graph().astream_events(
         {
             "session_id": normalized_session_id,
             "messages": input_messages,
             "next_agent": "",
             "db": db,
+            "ai_router": AIProviderRouter(db),
         },
         version="v2",
     ):
@@ -652,9 +665,12 @@ async def run_chat_stream(
                     content=final_content,
                     agent_name=final_agent_name,
                     is_tool_call=False,
+                    token_count=estimate_tokens(final_content),
                 )
 
                 final_answer_saved = True
+                if working_memory.needs_summary:
+                    schedule_summary_refresh(normalized_session_id)
                 yield {
                     "type": "final_answer",
                     "agent_name": final_agent_name,
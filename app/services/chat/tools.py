@@ -7,19 +7,17 @@ from typing import Any
 from langchain_core.tools import tool
 from sqlalchemy import desc, select
 
-from app.db.repository import list_system_configs, search_chat_history
+from app.db.repository import CHAT_HISTORY_SEARCH_PAGE_SIZE, list_system_configs, search_chat_history
 from app.db.session import AsyncSessionLocal
 from app.models.domain import AIAnalysisLog, Asset, OrderHistory, Position
 from app.services.brokers.factory import BrokerFactory
-from app.services.indicators import IndicatorCalculator
+from app.services.indicators import indicator_cache
 from app.services.market.sentiment_fetcher import (
     get_cached_market_sentiment,
     get_or_refresh_market_sentiment,
 )
 from app.services.portfolio.aggregator import PortfolioService
 
-indicator_calculator = IndicatorCalculator()
-
 
 def _normalize_symbol(symbol: str | None) -> str | None:
     value = str(symbol or "").strip().upper()
@@ -185,26 +183,39 @@ def build_chat_tools(session_id: str) -> list[Any]:
         return "\n".join(lines)
 
     @tool
-    async def search_past_conversations(keyword: str) -> str:
-        """현재 세션의 과거 대화 내역에서 키워드를 검색합니다."""
+    async def search_past_conversations(keyword: str, page: int = 1) -> str:
+        """현재 세션의 과거 대화 내역에서 키워드를 관련도 순으로 검색합니다. 결과가 많으면 page 를 늘려 다음 페이지를 조회합니다."""
         normalized_keyword = str(keyword or "").strip()
         if not normalized_keyword:
             return "검색할 키워드를 입력해 주세요."
+        normalized_page = max(1, int(page or 1))
+        page_size = CHAT_HISTORY_SEARCH_PAGE_SIZE
         try:
             async with AsyncSessionLocal() as db:
-                rows = await search_chat_history(db, normalized_session_id, normalized_keyword)
+                rows = await search_chat_history(
+                    db,
+                    normalized_session_id,
+                    normalized_keyword,
+                    limit=page_size + 1,
+                    offset=(normalized_page - 1) * page_size,
+                )
         except Exception as exc:
             return f"과거 대화 검색 중 오류가 발생했습니다: {exc}"
 
         if not rows:
+            if normalized_page > 1:
+                return f"'{normalized_keyword}' 검색 결과의 {normalized_page}페이지가 비어 있습니다."
             return f"현재 세션에서 '{normalized_keyword}' 키워드와 일치하는 과거 대화가 없습니다."
 
-        lines = [f"[과거 대화 검색 결과: {normalized_keyword}]"]
-        for row in rows:
+        has_more = len(rows) > page_size
+        lines = [f"[과거 대화 검색 결과: {normalized_keyword} | {normalized_page}페이지]"]
+        for row in rows[:page_size]:
             lines.append(
                 f"- {_format_datetime(row.created_at)} | role={row.role} | agent={row.agent_name or '-'} | "
                 f"is_tool_call={row.is_tool_call} | content={_truncate_text(row.content, 300)}"
             )
+        if has_more:
+            lines.append(f"(결과가 더 있습니다. page={normalized_page + 1} 로 다음 결과를 조회할 수 있습니다.)")
         return "\n".join(lines)
 
     @tool
@@ -244,7 +255,11 @@ def build_chat_tools(session_id: str) -> list[Any]:
                 timeframe=normalized_timeframe,
                 count=200,
             )
-            enriched = indicator_calculator.calculate_from_candles(_normalize_candles(raw_candles))
+            enriched = indicator_cache.enrich(
+                normalized_symbol,
+                normalized_timeframe,
+                _normalize_candles(raw_candles),
+            )
         except Exception as exc:
             return f"{normalized_symbol} 기술 지표 조회 중 오류가 발생했습니다: {exc}"
 
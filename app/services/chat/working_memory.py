@@ -0,0 +1,282 @@
+"""채팅 세션 working memory 조립과 누적 요약 관리.
+
+최근 대화는 토큰 예산 안에서만 원문으로 넣고, 예산 밖으로 밀려난 오래된 대화는
+세션별 누적 요약(``ChatSession.memory_summary``)으로 압축합니다. 요약 갱신은 응답
+경로를 막지 않도록 턴이 끝난 뒤 백그라운드에서 실행합니다.
+"""
+
+import asyncio
+import logging
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.repository import get_chat_messages_after
+from app.db.repository import get_chat_session_record
+from app.db.repository import get_recent_chat_messages
+from app.db.repository import update_chat_session_memory_summary
+from app.db.session import AsyncSessionLocal
+from app.services.ai.provider_router import AI_PURPOSE_CHAT
+from app.services.ai.provider_router import AIProviderRouter
+
+logger = logging.getLogger(__name__)
+
+WORKING_MEMORY_MAX_MESSAGES = 40
+SUMMARY_SOURCE_MAX_MESSAGES = 200
+# 요약 후에도 최근 대화는 예산의 절반 정도를 원문으로 남겨 둡니다.
+SUMMARY_KEEP_RATIO = 0.5
+SUMMARY_HEADER = "[이전 대화 요약]"
+TRUNCATED_SUFFIX = " …(중략)"
+
+_WIDE_CHAR_PATTERN = re.compile(r"[\u1100-\u11ff\u3040-\u30ff\u3130-\u318f\u3400-\u9fff\uac00-\ud7af]")
+_summary_tasks: dict[str, asyncio.Task[bool]] = {}
+
+SUMMARY_PROMPT_TEMPLATE = """
+당신은 AI 트레이딩 뱅커 채팅 세션의 대화 기록 관리자입니다.
+아래의 기존 요약과 새 대화를 합쳐 이후 대화에 필요한 맥락만 남긴 누적 요약을 한국어로 작성하십시오.
+
+규칙:
+1. 사용자의 관심 종목, 보유/주문 관련 사실, 확인된 수치, 사용자가 밝힌 선호와 제약, 진행 중인 요청을 우선 보존합니다.
+2. 인사말, 반복 설명, 면책 조항 같은 상투 문구는 생략합니다.
+3. 추측을 추가하지 말고 대화에 나온 사실만 씁니다.
+4. 글머리표 위주로 {max_tokens} 토큰 이내로 작성합니다.
+
+[기존 요약]
+{previous_summary}
+
+[새 대화]
+{transcript}
+""".strip()
+
+
+def estimate_tokens(text: str | None) -> int:
+    """토크나이저 없이 쓰는 보수적 토큰 수 추정치입니다.
+
+    한글/CJK 문자는 대체로 글자당 1토큰 안팎이고 영문/숫자는 약 4글자당 1토큰이므로
+    두 부분을 나눠 계산합니다.
+    """
+    if not text:
+        return 0
+    wide_chars = len(_WIDE_CHAR_PATTERN.findall(text))
+    other_chars = len(text) - wide_chars
+    return wide_chars + (other_chars + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    tokens = estimate_tokens(text)
+    if tokens <= max_tokens or max_tokens <= 0:
+        return text
+    keep_chars = max(1, int(len(text) * max_tokens / tokens))
+    return text[:keep_chars].rstrip() + TRUNCATED_SUFFIX
+
+
+def _row_tokens(row: Any) -> int:
+    stored = getattr(row, "token_count", None)
+    if isinstance(stored, int) and stored >= 0:
+        return stored
+    return estimate_tokens(str(getattr(row, "content", "") or ""))
+
+
+def _row_to_message(row: Any, content: str) -> BaseMessage | None:
+    role = str(getattr(row, "role", "") or "").strip().lower()
+    if role == "user":
+        return HumanMessage(content=content)
+    if role == "assistant":
+        return AIMessage(content=content, name=getattr(row, "agent_name", None) or None)
+    return None
+
+
+@dataclass(slots=True)
+class WorkingMemory:
+    messages: list[BaseMessage] = field(default_factory=list)
+    token_count: int = 0
+    summary_included: bool = False
+    dropped_message_count: int = 0
+
+    @property
+    def needs_summary(self) -> bool:
+        return self.dropped_message_count > 0
+
+
+def assemble_working_memory(
+    history_rows: Sequence[Any],
+    *,
+    summary: str | None = None,
+    summary_token_count: int | None = None,
+    token_budget: int | None = None,
+    message_token_cap: int | None = None,
+) -> WorkingMemory:
+    """최신 메시지부터 토큰 예산이 허락하는 만큼 채우고 앞에 누적 요약을 붙입니다."""
+    budget = settings.chat_working_memory_token_budget if token_budget is None else token_budget
+    cap = settings.chat_working_memory_message_token_cap if message_token_cap is None else message_token_cap
+
+    memory = WorkingMemory()
+    summary_text = str(summary or "").strip()
+    if summary_text:
+        memory.token_count = summary_token_count or estimate_tokens(summary_text)
+        memory.summary_included = True
+
+    selected: list[BaseMessage] = []
+    for index, row in enumerate(reversed(history_rows)):
+        content = str(getattr(row, "content", "") or "")
+        tokens = _row_tokens(row)
+        if tokens > cap:
+            content = truncate_to_tokens(content, cap)
+            tokens = estimate_tokens(content)
+        # 가장 최근 메시지는 예산을 넘더라도 잘라서라도 남깁니다.
+        if selected and memory.token_count + tokens > budget:
+            memory.dropped_message_count = len(history_rows) - index
+            break
+        message = _row_to_message(row, content)
+        if message is None:
+            continue
+        selected.append(message)
+        memory.token_count += tokens
+
+    selected.reverse()
+    if memory.summary_included:
+        selected.insert(0, HumanMessage(content=f"{SUMMARY_HEADER}\n{summary_text}"))
+    memory.messages = selected
+    return memory
+
+
+async def load_working_memory(db: AsyncSession, session_id: str) -> WorkingMemory:
+    session = await get_chat_session_record(db, session_id)
+    summary_until_id = getattr(session, "memory_summary_until_id", None)
+    history_rows = await get_recent_chat_messages(
+        db,
+        session_id,
+        limit=WORKING_MEMORY_MAX_MESSAGES,
+        after_message_id=summary_until_id,
+    )
+    memory = assemble_working_memory(
+        history_rows,
+        summary=getattr(session, "memory_summary", None),
+        summary_token_count=getattr(session, "memory_summary_token_count", None),
+    )
+    if session is not None and len(history_rows) >= WORKING_MEMORY_MAX_MESSAGES:
+        # 창 밖으로 밀려난 미요약 메시지가 있을 수 있으므로 요약 대상입니다.
+        memory.dropped_message_count = max(memory.dropped_message_count, 1)
+    return memory
+
+
+def _format_transcript(rows: Sequence[Any], message_token_cap: int) -> str:
+    lines = []
+    for row in rows:
+        role = str(getattr(row, "role", "") or "").strip().lower()
+        speaker = "사용자" if role == "user" else f"AI({getattr(row, 'agent_name', None) or 'assistant'})"
+        content = truncate_to_tokens(str(getattr(row, "content", "") or ""), message_token_cap)
+        lines.append(f"- {speaker}: {content}")
+    return "\n".join(lines)
+
+
+def split_rows_for_summary(rows: Sequence[Any], keep_token_budget: int) -> tuple[list[Any], list[Any]]:
+    """(요약할 오래된 메시지, 원문으로 남길 최근 메시지)로 나눕니다."""
+    kept_tokens = 0
+    split_index = len(rows)
+    for index in range(len(rows) - 1, -1, -1):
+        tokens = min(_row_tokens(rows[index]), settings.chat_working_memory_message_token_cap)
+        if kept_tokens + tokens > keep_token_budget:
+            break
+        kept_tokens += tokens
+        split_index = index
+    return list(rows[:split_index]), list(rows[split_index:])
+
+
+async def refresh_session_summary(session_id: str) -> bool:
+    """요약 지점 이후의 미요약 메시지를 오래된 순으로 페이지씩 누적 요약합니다.
+
+    원문으로 남길 최근 메시지 직전까지만 요약하고, 요약 지점은 실제로 요약한 마지막
+    메시지로만 옮깁니다. 한 번에 ``SUMMARY_SOURCE_MAX_MESSAGES`` 개보다 많이 밀려 있으면
+    페이지를 이어서 처리하므로 중간 메시지를 건너뛰지 않습니다.
+    """
+    async with AsyncSessionLocal() as db:
+        session = await get_chat_session_record(db, session_id)
+        if session is None:
+            return False
+
+        summary = str(session.memory_summary or "").strip()
+        until_id = session.memory_summary_until_id
+        summary_tokens = session.memory_summary_token_count or estimate_tokens(summary)
+        keep_budget = int(
+            max(settings.chat_working_memory_token_budget - summary_tokens, 0) * SUMMARY_KEEP_RATIO
+        )
+        recent_rows = await get_recent_chat_messages(
+            db,
+            session_id,
+            limit=WORKING_MEMORY_MAX_MESSAGES,
+            after_message_id=until_id,
+        )
+        _older, kept = split_rows_for_summary(recent_rows, keep_budget)
+        keep_from_id = int(kept[0].id) if kept else None
+
+        max_tokens = settings.chat_memory_summary_max_tokens
+        summarized_count = 0
+        while True:
+            to_summarize = await get_chat_messages_after(
+                db,
+                session_id,
+                after_message_id=until_id,
+                before_message_id=keep_from_id,
+                limit=SUMMARY_SOURCE_MAX_MESSAGES,
+            )
+            if not to_summarize:
+                break
+
+            prompt = SUMMARY_PROMPT_TEMPLATE.format(
+                max_tokens=max_tokens,
+                previous_summary=summary or "(없음)",
+                transcript=_format_transcript(to_summarize, settings.chat_working_memory_message_token_cap),
+            )
+            result = await AIProviderRouter(db).generate_report(prompt, purpose=AI_PURPOSE_CHAT)
+            next_summary = truncate_to_tokens(str(result.value or "").strip(), max_tokens)
+            if not next_summary:
+                break
+
+            summary = next_summary
+            until_id = int(to_summarize[-1].id)
+            summarized_count += len(to_summarize)
+            await update_chat_session_memory_summary(
+                db,
+                session_id,
+                summary=summary,
+                until_message_id=until_id,
+                token_count=estimate_tokens(summary),
+            )
+            if len(to_summarize) < SUMMARY_SOURCE_MAX_MESSAGES:
+                break
+
+        if not summarized_count:
+            return False
+        logger.info(
+            "채팅 working memory 요약 갱신: session_id=%s summarized=%s summary_tokens=%s",
+            session_id,
+            summarized_count,
+            estimate_tokens(summary),
+        )
+        return True
+
+
+async def _run_summary_refresh(session_id: str) -> bool:
+    try:
+        return await refresh_session_summary(session_id)
+    except Exception:
+        logger.warning("채팅 working memory 요약 갱신 실패: session_id=%s", session_id, exc_info=True)
+        return False
+    finally:
+        _summary_tasks.pop(session_id, None)
+
+
+def schedule_summary_refresh(session_id: str) -> asyncio.Task[bool] | None:
+    """세션별로 하나의 요약 갱신 작업만 백그라운드에서 실행합니다."""
+    running = _summary_tasks.get(session_id)
+    if running is not None and not running.done():
+        return running
+    task = asyncio.create_task(_run_summary_refresh(session_id), name=f"chat-memory-summary:{session_id}")
+    _summary_tasks[session_id] = task
+    return task
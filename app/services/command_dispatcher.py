@@ -0,0 +1,245 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.metrics import COMMAND_DURATION_SECONDS
+from app.core.metrics import COMMAND_QUEUE_DEPTH
+
+logger = logging.getLogger(__name__)
+
+CommandHandler = Callable[[], Awaitable[None]]
+TimeoutCallback = Callable[[str, str], Awaitable[None]]
+
+
+@dataclass(slots=True)
+class CommandLatencyStats:
+    count: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    total_wait_seconds: float = 0.0
+
+    def observe(self, elapsed_seconds: float, wait_seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed_seconds
+        self.total_wait_seconds += wait_seconds
+        self.max_seconds = max(self.max_seconds, elapsed_seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "avg_seconds": round(self.total_seconds / self.count, 4) if self.count else 0.0,
+            "max_seconds": round(self.max_seconds, 4),
+            "avg_wait_seconds": (
+                round(self.total_wait_seconds / self.count, 4) if self.count else 0.0
+            ),
+        }
+
+
+@dataclass(slots=True)
+class _QueuedCommand:
+    key: str
+    name: str
+    handler: CommandHandler
+    timeout: float | None
+    enqueued_at: float
+    on_timeout: TimeoutCallback | None = None
+
+
+class KeyedCommandDispatcher:
+    """메신저 명령을 키(채팅/사용자)별 순서는 지키면서 제한된 동시성으로 실행합니다.
+
+    같은 키의 명령은 도착 순서대로 하나씩 처리하고, 서로 다른 키는 ``max_concurrency``
+    범위에서 병렬로 처리합니다. ``priority=True``로 제출된 비상 명령은 키 대기열과
+    동시성 제한을 모두 건너뛰어 느린 조회 뒤에 밀리지 않습니다.
+
+    ``cancellable=False``로 제출된 명령(비상 정지, 주문 실행 등)은 시간 제한을 두지 않습니다.
+    주문이 일부만 나간 상태에서 취소되면 되돌릴 수 없기 때문입니다.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        max_concurrency: int = 4,
+        default_timeout: float | None = 30.0,
+        on_timeout: TimeoutCallback | None = None,
+    ) -> None:
+        self.name = name
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.default_timeout = default_timeout
+        self._on_timeout = on_timeout
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._lanes: dict[str, asyncio.Queue[_QueuedCommand]] = {}
+        self._lane_tasks: dict[str, asyncio.Task] = {}
+        self._priority_tasks: set[asyncio.Task] = set()
+        self._stats: dict[str, CommandLatencyStats] = {}
+        self._in_flight = 0
+        self._max_queue_depth = 0
+        self._closed = False
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(queue.qsize() for queue in self._lanes.values())
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def submit(
+        self,
+        key: str,
+        name: str,
+        handler: CommandHandler,
+        *,
+        timeout: float | None = None,
+        priority: bool = False,
+        cancellable: bool = True,
+        on_timeout: TimeoutCallback | None = None,
+    ) -> bool:
+        if self._closed:
+            logger.warning("%s dispatcher 종료 후 명령 제출 무시: key=%s command=%s", self.name, key, name)
+            return False
+
+        if not cancellable:
+            timeout = None
+        elif timeout is None:
+            timeout = self.default_timeout
+        command = _QueuedCommand(
+            key=key,
+            name=name,
+            handler=handler,
+            timeout=timeout,
+            enqueued_at=time.perf_counter(),
+            on_timeout=on_timeout or self._on_timeout,
+        )
+        if priority:
+            task = asyncio.create_task(
+                self._execute(command),
+                name=f"{self.name}-priority-{name}",
+            )
+            self._priority_tasks.add(task)
+            task.add_done_callback(self._priority_tasks.discard)
+            return True
+
+        queue = self._lanes.get(key)
+        if queue is None:
+            queue = asyncio.Queue()
+            self._lanes[key] = queue
+        queue.put_nowait(command)
+        self._max_queue_depth = max(self._max_queue_depth, self.queue_depth)
+        COMMAND_QUEUE_DEPTH.set(self.queue_depth, dispatcher=self.name)
+
+        lane_task = self._lane_tasks.get(key)
+        if lane_task is None or lane_task.done():
+            self._lane_tasks[key] = asyncio.create_task(
+                self._drain_lane(key, queue),
+                name=f"{self.name}-lane-{key}",
+            )
+        return True
+
+    async def close(self, timeout: float = 5.0) -> None:
+        self._closed = True
+        tasks = [*self._lane_tasks.values(), *self._priority_tasks]
+        if not tasks:
+            return
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._lane_tasks.clear()
+        self._lanes.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "max_concurrency": self.max_concurrency,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "active_lanes": sum(1 for task in self._lane_tasks.values() if not task.done()),
+            "in_flight": self._in_flight,
+            "commands": {name: stats.to_dict() for name, stats in sorted(self._stats.items())},
+        }
+
+    async def _drain_lane(self, key: str, queue: asyncio.Queue[_QueuedCommand]) -> None:
+        current_task = asyncio.current_task()
+        try:
+            while not queue.empty():
+                command = queue.get_nowait()
+                async with self._semaphore:
+                    await self._execute(command)
+        finally:
+            if self._lane_tasks.get(key) is current_task:
+                self._lane_tasks.pop(key, None)
+                if queue.empty():
+                    self._lanes.pop(key, None)
+
+    async def _execute(self, command: _QueuedCommand) -> None:
+        stats = self._stats.setdefault(command.name, CommandLatencyStats())
+        started_at = time.perf_counter()
+        wait_seconds = started_at - command.enqueued_at
+        self._in_flight += 1
+        COMMAND_QUEUE_DEPTH.set(self.queue_depth, dispatcher=self.name)
+        outcome = "success"
+        try:
+            if command.timeout is not None and command.timeout > 0:
+                await asyncio.wait_for(command.handler(), timeout=command.timeout)
+            else:
+                await command.handler()
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            stats.timeouts += 1
+            logger.warning(
+                "%s 명령 처리 시간 초과: key=%s command=%s timeout=%ss",
+                self.name,
+                command.key,
+                command.name,
+                command.timeout,
+            )
+            await self._notify_timeout(command)
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except Exception:
+            outcome = "error"
+            stats.failures += 1
+            logger.exception(
+                "%s 명령 처리 실패: key=%s command=%s",
+                self.name,
+                command.key,
+                command.name,
+            )
+        finally:
+            self._in_flight -= 1
+            elapsed = time.perf_counter() - started_at
+            stats.observe(elapsed, wait_seconds)
+            COMMAND_DURATION_SECONDS.observe(
+                elapsed,
+                dispatcher=self.name,
+                command=command.name,
+                outcome=outcome,
+            )
+            logger.debug(
+                "%s 명령 처리 완료: key=%s command=%s elapsed=%.3fs wait=%.3fs queue_depth=%s",
+                self.name,
+                command.key,
+                command.name,
+                elapsed,
+                wait_seconds,
+                self.queue_depth,
+            )
+
+    async def _notify_timeout(self, command: _QueuedCommand) -> None:
+        if command.on_timeout is None:
+            return
+        try:
+            await command.on_timeout(command.key, command.name)
+        except Exception:
+            logger.exception("%s 시간 초과 알림 전송 실패: key=%s", self.name, command.key)
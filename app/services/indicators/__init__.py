@@ -1,3 +1,4 @@
-from .calculator import IndicatorCalculator
+from .cache import IndicatorCache, indicator_cache
+from .calculator import IndicatorCalculator, indicator_records, nan_to_none
 
-__all__ = ["IndicatorCalculator"]
+__all__ = ["IndicatorCache", "IndicatorCalculator", "indicator_cache", "indicator_records", "nan_to_none"]
@@ -0,0 +1,307 @@
+"""(symbol, timeframe) 별 기술 지표 결과 캐시.
+
+캔들 조회 API, 채팅 `get_technical_indicators` Tool, AI 분석 컨텍스트가 같은 심볼의 200봉을
+매번 다시 계산하지 않도록 마감된 봉(closed bar)의 지표와 스트리밍 상태를 보관합니다.
+
+- 마지막 마감 봉 시각이 같으면 저장된 지표를 그대로 쓰고, 진행 중인 봉만 상태를 복사해 계산합니다.
+- 새 봉이 마감되면 전체를 다시 계산하지 않고 새로 마감된 봉만 상태에 이어 붙입니다.
+- 항목은 다음 봉 마감 시각(+유예 봉 수)에 만료되어 오래된 상태가 남지 않습니다.
+
+EMA/RSI 는 캐시가 처음 계산한 구간의 첫 봉에서 시드되므로, 창이 밀린 뒤에는 같은 200봉을
+``IndicatorCalculator`` 로 새로 계산한 값보다 더 긴 이력을 반영한 값이 됩니다.
+"""
+
+import math
+import re
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from app.core.metrics import INDICATOR_CACHE_TOTAL
+from app.services.indicators.calculator import IndicatorCalculator
+
+INDICATOR_CACHE_MAX_ENTRIES = 256
+INDICATOR_CACHE_MAX_BARS = 400
+INDICATOR_CACHE_GRACE_BARS = 1
+
+_MINUTE_TIMEFRAME_PATTERN = re.compile(r"(\d+)m")
+_FIXED_TIMEFRAME_INTERVALS = {
+    "day": timedelta(days=1),
+    "days": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "weeks": timedelta(weeks=1),
+    # 월봉은 길이가 달라 가장 긴 달 기준으로 만료를 잡습니다.
+    "month": timedelta(days=31),
+    "months": timedelta(days=31),
+}
+
+
+def timeframe_interval(timeframe: str) -> timedelta | None:
+    normalized = str(timeframe or "").strip().lower()
+    if normalized in _FIXED_TIMEFRAME_INTERVALS:
+        return _FIXED_TIMEFRAME_INTERVALS[normalized]
+    minute_match = _MINUTE_TIMEFRAME_PATTERN.fullmatch(normalized)
+    if minute_match and int(minute_match.group(1)) > 0:
+        return timedelta(minutes=int(minute_match.group(1)))
+    return None
+
+
+def _parse_bar_time(candle: dict[str, Any]) -> datetime | None:
+    # 소비처마다 시각 표현이 달라(ISO 문자열, epoch 초, 일봉 날짜) 같은 봉을 같은 key 로 맞춥니다.
+    raw_time = candle.get("timestamp", candle.get("time"))
+    if isinstance(raw_time, bool) or raw_time is None:
+        return None
+    if isinstance(raw_time, (int, float)):
+        return datetime.fromtimestamp(raw_time, tz=UTC)
+    try:
+        parsed = datetime.fromisoformat(str(raw_time).strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+def _to_close(candle: dict[str, Any]) -> float | None:
+    value = candle.get("close")
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        close = float(value)
+    except (TypeError, ValueError):
+        return None
+    return close if math.isfinite(close) else None
+
+
+class IndicatorState:
+    """``IndicatorCalculator`` 와 같은 정의(pandas_ta)로 지표를 한 봉씩 갱신하는 상태.
+
+    - SMA/볼린저밴드: 최근 종가 창의 단순 평균과 모표준편차(ddof=0)
+    - EMA: 첫 ``period`` 개 종가의 SMA 로 시드한 뒤 alpha=2/(period+1) 재귀
+    - RSI: 종가 차분의 상승/하락분을 첫 ``length`` 개 평균으로 시드한 Wilder 평균
+    """
+
+    SMA_PERIODS = IndicatorCalculator.SMA_PERIODS
+    EMA_PERIODS = IndicatorCalculator.EMA_PERIODS
+    BBANDS_LENGTH = IndicatorCalculator.BBANDS_LENGTH
+    BBANDS_STD = IndicatorCalculator.BBANDS_STD
+    RSI_LENGTH = IndicatorCalculator.RSI_LENGTH
+    WINDOW = max(*SMA_PERIODS, BBANDS_LENGTH)
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.closes: deque[float] = deque(maxlen=self.WINDOW)
+        self.ema_values: dict[int, float | None] = {period: None for period in self.EMA_PERIODS}
+        self.ema_seed_sums: dict[int, float] = {period: 0.0 for period in self.EMA_PERIODS}
+        self.previous_close: float | None = None
+        self.rsi_diff_count = 0
+        self.rsi_gain_sum = 0.0
+        self.rsi_loss_sum = 0.0
+        self.avg_gain: float | None = None
+        self.avg_loss: float | None = None
+
+    def copy(self) -> "IndicatorState":
+        cloned = IndicatorState.__new__(IndicatorState)
+        cloned.count = self.count
+        cloned.closes = deque(self.closes, maxlen=self.WINDOW)
+        cloned.ema_values = dict(self.ema_values)
+        cloned.ema_seed_sums = dict(self.ema_seed_sums)
+        cloned.previous_close = self.previous_close
+        cloned.rsi_diff_count = self.rsi_diff_count
+        cloned.rsi_gain_sum = self.rsi_gain_sum
+        cloned.rsi_loss_sum = self.rsi_loss_sum
+        cloned.avg_gain = self.avg_gain
+        cloned.avg_loss = self.avg_loss
+        return cloned
+
+    def update(self, close: float) -> dict[str, float | None]:
+        """종가 한 개를 반영하고 해당 봉의 지표 값을 반환합니다."""
+        self.count += 1
+        self.closes.append(close)
+        window = list(self.closes)
+        values: dict[str, float | None] = {}
+
+        for period in self.SMA_PERIODS:
+            values[f"sma_{period}"] = sum(window[-period:]) / period if len(window) >= period else None
+
+        for period in self.EMA_PERIODS:
+            if self.count < period:
+                self.ema_seed_sums[period] += close
+            elif self.count == period:
+                self.ema_values[period] = (self.ema_seed_sums[period] + close) / period
+            else:
+                alpha = 2.0 / (period + 1)
+                self.ema_values[period] = alpha * close + (1.0 - alpha) * float(self.ema_values[period])
+            values[f"ema_{period}"] = self.ema_values[period]
+
+        suffix = f"{self.BBANDS_LENGTH}_{self.BBANDS_STD}"
+        if len(window) >= self.BBANDS_LENGTH:
+            band = window[-self.BBANDS_LENGTH:]
+            middle = sum(band) / self.BBANDS_LENGTH
+            deviation = math.sqrt(sum((value - middle) ** 2 for value in band) / self.BBANDS_LENGTH)
+            values[f"bb_upper_{suffix}"] = middle + self.BBANDS_STD * deviation
+            values[f"bb_middle_{suffix}"] = middle
+            values[f"bb_lower_{suffix}"] = middle - self.BBANDS_STD * deviation
+        else:
+            values[f"bb_upper_{suffix}"] = None
+            values[f"bb_middle_{suffix}"] = None
+            values[f"bb_lower_{suffix}"] = None
+
+        values[f"rsi_{self.RSI_LENGTH}"] = self._update_rsi(close)
+        return values
+
+    def peek(self, close: float) -> dict[str, float | None]:
+        """상태를 바꾸지 않고 진행 중인 봉의 지표 값을 계산합니다."""
+        return self.copy().update(close)
+
+    def _update_rsi(self, close: float) -> float | None:
+        previous_close = self.previous_close
+        self.previous_close = close
+        if previous_close is None:
+            return None
+
+        diff = close - previous_close
+        gain = max(diff, 0.0)
+        loss = max(-diff, 0.0)
+        self.rsi_diff_count += 1
+        length = self.RSI_LENGTH
+        if self.rsi_diff_count < length:
+            self.rsi_gain_sum += gain
+            self.rsi_loss_sum += loss
+            return None
+        if self.rsi_diff_count == length:
+            self.avg_gain = (self.rsi_gain_sum + gain) / length
+            self.avg_loss = (self.rsi_loss_sum + loss) / length
+        else:
+            self.avg_gain = (float(self.avg_gain) * (length - 1) + gain) / length
+            self.avg_loss = (float(self.avg_loss) * (length - 1) + loss) / length
+
+        denominator = self.avg_gain + self.avg_loss
+        if denominator == 0:
+            return None
+        return 100.0 * self.avg_gain / denominator
+
+
+@dataclass(slots=True)
+class _CachedSeries:
+    state: IndicatorState
+    times: list[datetime] = field(default_factory=list)
+    closes: list[float] = field(default_factory=list)
+    rows: list[dict[str, float | None]] = field(default_factory=list)
+    expires_at: datetime | None = None
+
+    def append(self, bar_time: datetime, close: float) -> None:
+        self.times.append(bar_time)
+        self.closes.append(close)
+        self.rows.append(self.state.update(close))
+        excess = len(self.times) - INDICATOR_CACHE_MAX_BARS
+        if excess > 0:
+            del self.times[:excess]
+            del self.closes[:excess]
+            del self.rows[:excess]
+
+    def find(self, bar_time: datetime) -> int | None:
+        # 봉 시각은 오름차순이므로 최근 봉 쪽에서 찾는 편이 빠릅니다.
+        for index in range(len(self.times) - 1, -1, -1):
+            if self.times[index] == bar_time:
+                return index
+            if self.times[index] < bar_time:
+                return None
+        return None
+
+
+class IndicatorCache:
+    def __init__(
+        self,
+        *,
+        max_entries: int = INDICATOR_CACHE_MAX_ENTRIES,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self._clock = clock or (lambda: datetime.now(UTC))
+        self._calculator = IndicatorCalculator()
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], _CachedSeries] = OrderedDict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def enrich(self, symbol: str, timeframe: str, candles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """``IndicatorCalculator.calculate_from_candles`` 와 같은 형태로 지표를 붙여 반환합니다.
+
+        ``candles`` 는 오래된 봉부터 정렬된 목록이며 마지막 봉은 진행 중인 봉으로 보고 캐시에 넣지 않습니다.
+        """
+        normalized_timeframe = str(timeframe or "").strip().lower()
+        if not candles:
+            return []
+
+        interval = timeframe_interval(normalized_timeframe)
+        bar_times = [_parse_bar_time(candle) for candle in candles]
+        closes = [_to_close(candle) for candle in candles]
+        if interval is None or len(candles) < 2 or None in bar_times or None in closes:
+            INDICATOR_CACHE_TOTAL.inc(timeframe=normalized_timeframe, result="bypass")
+            return self._calculator.calculate_from_candles(candles)
+
+        key = (str(symbol or "").strip().upper(), normalized_timeframe)
+        closed_times: list[datetime] = bar_times[:-1]  # type: ignore[assignment]
+        closed_closes: list[float] = closes[:-1]  # type: ignore[assignment]
+        now = self._clock()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None and entry.expires_at <= now:
+                entry = None
+            start = self._resolve_overlap_start(entry, closed_times, closed_closes)
+            if entry is None or start is None:
+                entry = _CachedSeries(state=IndicatorState())
+                cached_count = 0
+                result = "miss"
+            else:
+                cached_count = len(entry.times) - start
+                result = "append" if cached_count < len(closed_times) else "hit"
+            for bar_time, close in zip(closed_times[cached_count:], closed_closes[cached_count:]):
+                entry.append(bar_time, close)
+
+            entry.expires_at = closed_times[-1] + interval * (2 + INDICATOR_CACHE_GRACE_BARS)
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+            # 요청한 마감 봉은 항상 캐시의 마지막 구간과 일치합니다.
+            closed_rows = entry.rows[len(entry.rows) - len(closed_times) :]
+            forming_row = entry.state.peek(closes[-1])  # type: ignore[arg-type]
+
+        INDICATOR_CACHE_TOTAL.inc(timeframe=normalized_timeframe, result=result)
+        return [
+            {**candle, **indicator_row}
+            for candle, indicator_row in zip(candles, [*closed_rows, forming_row])
+        ]
+
+    @staticmethod
+    def _resolve_overlap_start(
+        entry: _CachedSeries | None,
+        closed_times: list[datetime],
+        closed_closes: list[float],
+    ) -> int | None:
+        """요청 구간이 캐시된 봉과 이어지면 캐시 안에서의 시작 위치를, 아니면 None 을 반환합니다."""
+        if entry is None:
+            return None
+        start = entry.find(closed_times[0])
+        if start is None:
+            return None
+        cached_times = entry.times[start:]
+        if len(cached_times) > len(closed_times):
+            return None
+        if closed_times[: len(cached_times)] != cached_times:
+            return None
+        if closed_closes[: len(cached_times)] != entry.closes[start:]:
+            return None
+        return start
+
+
+indicator_cache = IndicatorCache()
@@ -1,8 +1,25 @@
-from typing import Any
+from __future__ import annotations
 
-import numpy as np
-import pandas as pd
-import pandas_ta_classic as ta
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+
+@cache
+def load_indicator_stack() -> tuple[Any, Any, Any]:
+    """(numpy, pandas, pandas_ta) 를 첫 계산 시점에 불러옵니다.
+
+    세 패키지 import 만으로 수백 ms 가 걸리므로 앱 기동 경로에서는 불러오지 않고,
+    첫 사용 또는 기동 후 백그라운드 warm-up(``app.core.warmup``)에서 불러옵니다.
+    """
+    import numpy as np
+    import pandas as pd
+    import pandas_ta_classic as ta
+
+    return np, pd, ta
 
 
 class IndicatorCalculator:
@@ -12,11 +29,17 @@ class IndicatorCalculator:
     BBANDS_LENGTH = 20
     BBANDS_STD = 2
     RSI_LENGTH = 14
-
-    def __init__(self) -> None:
-        self._ta = ta
+    INDICATOR_COLUMNS = (
+        *[f"sma_{period}" for period in SMA_PERIODS],
+        *[f"ema_{period}" for period in EMA_PERIODS],
+        f"bb_upper_{BBANDS_LENGTH}_{BBANDS_STD}",
+        f"bb_middle_{BBANDS_LENGTH}_{BBANDS_STD}",
+        f"bb_lower_{BBANDS_LENGTH}_{BBANDS_STD}",
+        f"rsi_{RSI_LENGTH}",
+    )
 
     def to_dataframe(self, candles: list[dict[str, Any]]) -> pd.DataFrame:
+        _np, pd, _ta = load_indicator_stack()
         if not candles:
             return pd.DataFrame(columns=["timestamp", *self.REQUIRED_COLUMNS])
 
@@ -32,76 +55,94 @@ class IndicatorCalculator:
         return df[ordered_columns]
 
     def calculate(self, df: pd.DataFrame) -> pd.DataFrame:
+        np, pd, _ta = load_indicator_stack()
         calculated = df.copy()
-        if calculated.empty:
-            for period in self.SMA_PERIODS:
-                calculated[f"sma_{period}"] = pd.Series(dtype="float64")
-            for period in self.EMA_PERIODS:
-                calculated[f"ema_{period}"] = pd.Series(dtype="float64")
-            calculated[f"bb_upper_{self.BBANDS_LENGTH}_{self.BBANDS_STD}"] = pd.Series(dtype="float64")
-            calculated[f"bb_middle_{self.BBANDS_LENGTH}_{self.BBANDS_STD}"] = pd.Series(dtype="float64")
-            calculated[f"bb_lower_{self.BBANDS_LENGTH}_{self.BBANDS_STD}"] = pd.Series(dtype="float64")
-            calculated[f"rsi_{self.RSI_LENGTH}"] = pd.Series(dtype="float64")
-            return calculated
-
-        close_series = pd.to_numeric(calculated["close"], errors="coerce")
-
+        close = pd.to_numeric(calculated["close"], errors="coerce") if "close" in calculated.columns else []
+        for column, values in self.calculate_columns(close).items():
+            calculated[column] = values
+        return calculated.replace({np.nan: None})
+
+    def candles_to_columns(self, candles: list[dict[str, Any]]) -> dict[str, np.ndarray]:
+        """캔들 dict 목록을 OHLCV 별 float64 배열로 한 번에 변환합니다. 숫자가 아닌 값은 NaN 입니다."""
+        return {
+            column: self._to_float_array([candle.get(column) for candle in candles])
+            for column in self.REQUIRED_COLUMNS
+        }
+
+    def calculate_columns(self, close: Any) -> dict[str, np.ndarray]:
+        """종가 배열로 지표 배열을 계산합니다.
+
+        DataFrame 을 만들지 않고 종가 Series 하나에서 지표별 float64 배열을 받아 그대로 반환합니다.
+        값이 없는 구간은 NaN 이며, JSON 응답으로 내보낼 때 ``indicator_records`` 가 한 번에 null 로 바꿉니다.
+        """
+        np, pd, ta = load_indicator_stack()
+        close_array = self._to_float_array(close)
+        size = close_array.shape[0]
+        close_series = pd.Series(close_array, copy=False)
+
+        def to_array(values: Any) -> np.ndarray:
+            if values is None:
+                return np.full(size, np.nan)
+            return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+        columns: dict[str, np.ndarray] = {}
         for period in self.SMA_PERIODS:
-            calculated[f"sma_{period}"] = self._ta.sma(close=close_series, length=period)
+            columns[f"sma_{period}"] = to_array(ta.sma(close=close_series, length=period) if size else None)
         for period in self.EMA_PERIODS:
-            calculated[f"ema_{period}"] = self._ta.ema(close=close_series, length=period)
+            columns[f"ema_{period}"] = to_array(ta.ema(close=close_series, length=period) if size else None)
 
-        bbands = self._ta.bbands(close=close_series, length=self.BBANDS_LENGTH, std=self.BBANDS_STD)
+        suffix = f"{self.BBANDS_LENGTH}_{self.BBANDS_STD}"
+        bbands = ta.bbands(close=close_series, length=self.BBANDS_LENGTH, std=self.BBANDS_STD) if size else None
         if isinstance(bbands, pd.DataFrame) and not bbands.empty:
-            calculated[f"bb_lower_{self.BBANDS_LENGTH}_{self.BBANDS_STD}"] = bbands.iloc[:, 0]
-            calculated[f"bb_middle_{self.BBANDS_LENGTH}_{self.BBANDS_STD}"] = bbands.iloc[:, 1]
-            calculated[f"bb_upper_{self.BBANDS_LENGTH}_{self.BBANDS_STD}"] = bbands.iloc[:, 2]
+            columns[f"bb_upper_{suffix}"] = to_array(bbands.iloc[:, 2])
+            columns[f"bb_middle_{suffix}"] = to_array(bbands.iloc[:, 1])
+            columns[f"bb_lower_{suffix}"] = to_array(bbands.iloc[:, 0])
         else:
-            calculated[f"bb_lower_{self.BBANDS_LENGTH}_{self.BBANDS_STD}"] = pd.Series(dtype="float64")
-            calculated[f"bb_middle_{self.BBANDS_LENGTH}_{self.BBANDS_STD}"] = pd.Series(dtype="float64")
-            calculated[f"bb_upper_{self.BBANDS_LENGTH}_{self.BBANDS_STD}"] = pd.Series(dtype="float64")
+            columns[f"bb_upper_{suffix}"] = to_array(None)
+            columns[f"bb_middle_{suffix}"] = to_array(None)
+            columns[f"bb_lower_{suffix}"] = to_array(None)
 
-        calculated[f"rsi_{self.RSI_LENGTH}"] = self._ta.rsi(close=close_series, length=self.RSI_LENGTH)
-        calculated = calculated.replace({np.nan: None})
-        return calculated
+        columns[f"rsi_{self.RSI_LENGTH}"] = to_array(
+            ta.rsi(close=close_series, length=self.RSI_LENGTH) if size else None
+        )
+        return columns
 
     def calculate_from_candles(self, candles: list[dict[str, Any]]) -> list[dict[str, Any]]:
         if not candles:
             return []
 
-        base_df = self.to_dataframe(candles)
-        calculated_df = self.calculate(base_df)
-        return self._merge_with_original_candles(candles, calculated_df)
-
-    def _merge_with_original_candles(
-        self,
-        candles: list[dict[str, Any]],
-        calculated_df: pd.DataFrame,
-    ) -> list[dict[str, Any]]:
-        merged_rows: list[dict[str, Any]] = []
-        indicator_columns = [
-            *[f"sma_{period}" for period in self.SMA_PERIODS],
-            *[f"ema_{period}" for period in self.EMA_PERIODS],
-            f"bb_upper_{self.BBANDS_LENGTH}_{self.BBANDS_STD}",
-            f"bb_middle_{self.BBANDS_LENGTH}_{self.BBANDS_STD}",
-            f"bb_lower_{self.BBANDS_LENGTH}_{self.BBANDS_STD}",
-            f"rsi_{self.RSI_LENGTH}",
-        ]
-
-        for index, candle in enumerate(candles):
-            row = dict(candle)
-            for column in indicator_columns:
-                value = calculated_df.at[index, column] if column in calculated_df.columns else None
-                row[column] = self._normalize_value(value)
-            merged_rows.append(row)
-
-        return merged_rows
+        columns = self.calculate_columns(self.candles_to_columns(candles)["close"])
+        return indicator_records(candles, columns)
 
     @staticmethod
-    def _normalize_value(value: Any) -> float | None:
-        if pd.isna(value):
-            return None
+    def _to_float_array(values: Any) -> np.ndarray:
+        np, pd, _ta = load_indicator_stack()
         try:
-            return float(value)
+            return np.asarray(values, dtype=np.float64)
         except (TypeError, ValueError):
-            return None
+            # 문자열 등 섞인 값은 pandas 와 같은 규칙(errors="coerce")으로 NaN 처리합니다.
+            return pd.to_numeric(pd.Series(list(values), dtype=object), errors="coerce").to_numpy(
+                dtype=np.float64,
+                na_value=np.nan,
+            )
+
+
+def nan_to_none(values: np.ndarray) -> list[float | None]:
+    """float 배열을 JSON 으로 내보낼 수 있는 list 로 바꿉니다(NaN/inf → None)."""
+    np, _pd, _ta = load_indicator_stack()
+    converted = values.astype(object)
+    converted[~np.isfinite(values)] = None
+    return converted.tolist()
+
+
+def indicator_records(candles: list[dict[str, Any]], columns: dict[str, np.ndarray]) -> list[dict[str, Any]]:
+    """원본 캔들 dict 에 지표 배열을 붙여 응답용 record 목록을 만듭니다.
+
+    열마다 NaN → None 변환을 한 번만 하고 행 단위로는 dict 병합만 수행합니다.
+    """
+    names = list(columns)
+    column_values = [nan_to_none(columns[name]) for name in names]
+    return [
+        {**candle, **dict(zip(names, row_values))}
+        for candle, row_values in zip(candles, zip(*column_values))
+    ]
@@ -0,0 +1,189 @@
+"""실시간 이벤트 단일 producer.
+
+SSE 구독자가 한 명 이상 있을 때만 포트폴리오와 관심 종목 시세를 주기적으로 한 번씩 조회하고,
+직전 값과 달라진 부분만 ``live_event_hub`` 로 방송합니다. 구독자가 없으면 조회를 멈춥니다.
+관심 종목 목록은 ``favorites`` 데이터 버전이 바뀌거나 일정 시간이 지나면 다시 읽습니다.
+봇 상태/AI 분석/주문 체결 이벤트는 각각 ``update_bot_runtime_status`` 와 DB 커밋 훅이
+직접 올리므로 여기서는 다루지 않습니다.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.event_hub import LiveEventHub
+from app.core.event_hub import live_event_hub
+from app.core.response_cache import data_versions
+from app.db.session import AsyncSessionLocal
+from app.models.domain import Favorite
+from app.services.brokers.factory import BrokerFactory
+from app.services.portfolio.aggregator import PortfolioService
+
+logger = logging.getLogger(__name__)
+
+LIVE_PORTFOLIO_INTERVAL_SECONDS = 15.0
+LIVE_TICKER_INTERVAL_SECONDS = 3.0
+LIVE_FAVORITES_REFRESH_SECONDS = 30.0
+LIVE_PORTFOLIO_TIMEOUT_SECONDS = 8.0
+MAX_LIVE_TICKER_SYMBOLS = 100
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def build_ticker_items(raw_tickers: list[Any]) -> dict[str, dict[str, Any]]:
+    """Upbit 시세 응답을 ``/markets/tickers`` 와 같은 모양으로 바꿉니다."""
+    items: dict[str, dict[str, Any]] = {}
+    for row in raw_tickers or []:
+        if not isinstance(row, dict):
+            continue
+        symbol = str(row.get("market") or "").strip().upper()
+        if not symbol:
+            continue
+        items[symbol] = {
+            "symbol": symbol,
+            "current_price": _to_float(row.get("trade_price")),
+            "signed_change_rate": _to_float(row.get("signed_change_rate")),
+            "acc_trade_price_24h": _to_float(row.get("acc_trade_price_24h")),
+        }
+    return items
+
+
+class LiveUpdateProducer:
+    def __init__(
+        self,
+        hub: LiveEventHub = live_event_hub,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        *,
+        broker: Any | None = None,
+        portfolio_interval: float = LIVE_PORTFOLIO_INTERVAL_SECONDS,
+        ticker_interval: float = LIVE_TICKER_INTERVAL_SECONDS,
+        favorites_refresh: float = LIVE_FAVORITES_REFRESH_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.hub = hub
+        self._session_factory = session_factory
+        self._broker = broker
+        self.portfolio_interval = portfolio_interval
+        self.ticker_interval = ticker_interval
+        self.favorites_refresh = favorites_refresh
+        self._clock = clock
+        self._task: asyncio.Task | None = None
+        self._last_portfolio: dict[str, Any] | None = None
+        self._last_tickers: dict[str, dict[str, Any]] = {}
+        self._symbols: list[str] = []
+        self._symbols_loaded_at: float | None = None
+        self._symbols_version: tuple[int, ...] = ()
+        self._next_portfolio_at = 0.0
+        self._next_tickers_at = 0.0
+
+    @property
+    def broker(self) -> Any:
+        if self._broker is None:
+            self._broker = BrokerFactory.get_broker("UPBIT")
+        return self._broker
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="live-update-producer")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def run_once(self) -> None:
+        """조회 시점이 된 항목만 갱신해 바뀐 부분을 방송합니다."""
+        now = self._clock()
+        if now >= self._next_tickers_at:
+            self._next_tickers_at = now + self.ticker_interval
+            await self._guard("시세", self.publish_tickers())
+        if now >= self._next_portfolio_at:
+            self._next_portfolio_at = now + self.portfolio_interval
+            await self._guard("포트폴리오", self.publish_portfolio())
+
+    async def publish_portfolio(self) -> bool:
+        async with self._session_factory() as db:
+            portfolio = await asyncio.wait_for(
+                PortfolioService(db).get_aggregated_portfolio(),
+                timeout=LIVE_PORTFOLIO_TIMEOUT_SECONDS,
+            )
+        if portfolio.error is not None:
+            # 오류 응답은 방송하지 않고, 클라이언트는 REST 폴백으로 상태를 확인합니다.
+            return False
+        payload = portfolio.model_dump(mode="json", exclude={"updated_at"})
+        if payload == self._last_portfolio:
+            return False
+        self._last_portfolio = payload
+        self.hub.publish(
+            "portfolio",
+            portfolio.model_copy(update={"source": "live", "is_stale": False}).model_dump(mode="json"),
+        )
+        return True
+
+    async def publish_tickers(self) -> int:
+        symbols = await self._load_symbols()
+        if not symbols:
+            return 0
+        items = build_ticker_items(await self.broker.get_ticker(symbols))
+        changed = [item for symbol, item in items.items() if self._last_tickers.get(symbol) != item]
+        if not changed:
+            return 0
+        self._last_tickers.update((item["symbol"], item) for item in changed)
+        self.hub.publish("tickers", changed)
+        return len(changed)
+
+    def reset(self) -> None:
+        # 구독자가 모두 떠나면 다음 연결에서 현재 값을 처음부터 다시 비교합니다.
+        self._last_portfolio = None
+        self._last_tickers = {}
+        self._next_portfolio_at = 0.0
+        self._next_tickers_at = 0.0
+
+    async def _load_symbols(self) -> list[str]:
+        now = self._clock()
+        version = data_versions.snapshot(("favorites",))
+        if (
+            self._symbols_loaded_at is not None
+            and now - self._symbols_loaded_at < self.favorites_refresh
+            and version == self._symbols_version
+        ):
+            return self._symbols
+        async with self._session_factory() as db:
+            result = await db.execute(select(Favorite.symbol).order_by(Favorite.id.asc()))
+            symbols = [str(symbol or "").strip().upper() for symbol in result.scalars().all()]
+        self._symbols = list(dict.fromkeys(symbol for symbol in symbols if symbol))[:MAX_LIVE_TICKER_SYMBOLS]
+        self._symbols_loaded_at = now
+        self._symbols_version = version
+        return self._symbols
+
+    async def _guard(self, label: str, coro: Any) -> None:
+        try:
+            await coro
+        except Exception as exc:
+            logger.warning("실시간 %s 갱신 실패: %s", label, exc)
+
+    async def _run(self) -> None:
+        while True:
+            if not self.hub.subscriber_count:
+                self.reset()
+                await self.hub.wait_for_subscribers()
+            await self.run_once()
+            delay = min(self._next_tickers_at, self._next_portfolio_at) - self._clock()
+            await asyncio.sleep(max(delay, 0.1))
+
+
+live_update_producer = LiveUpdateProducer()
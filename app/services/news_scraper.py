@@ -5,8 +5,6 @@ from datetime import datetime, timedelta, timezone
 from html import unescape
 from typing import Any
 
-import feedparser
-
 logger = logging.getLogger(__name__)
 
 RSS_FEED_URLS: list[str] = [
@@ -35,6 +33,8 @@ def _sanitize_text(raw: Any) -> str:
 
 
 def _parse_feed_entries(feed_url: str) -> list[dict[str, str]]:
+    import feedparser
+
     parsed = feedparser.parse(feed_url)
     if getattr(parsed, "bozo", False):
         logger.warning("RSS 파싱 경고가 발생했습니다: feed=%s", feed_url)
@@ -0,0 +1,178 @@
+"""포트폴리오 스냅샷 시계열의 구간 조회와 서버 측 다운샘플링.
+
+차트는 화면 폭 이상의 점을 그릴 수 없으므로 기간(1d/7d/30d/90d/1y/all)과 목표 점 개수를
+받아 버킷 OHLC 또는 LTTB(Largest-Triangle-Three-Buckets)로 줄여서 내려줍니다.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Literal
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repository import get_portfolio_asset_series
+from app.db.repository import get_portfolio_value_series
+
+SeriesRange = Literal["1d", "7d", "30d", "90d", "1y", "all"]
+DownsampleMethod = Literal["lttb", "ohlc"]
+
+SERIES_RANGE_DURATIONS: dict[str, timedelta | None] = {
+    "1d": timedelta(days=1),
+    "7d": timedelta(days=7),
+    "30d": timedelta(days=30),
+    "90d": timedelta(days=90),
+    "1y": timedelta(days=365),
+    "all": None,
+}
+DEFAULT_TARGET_POINTS = 200
+MIN_TARGET_POINTS = 3
+MAX_TARGET_POINTS = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesSample:
+    timestamp: datetime
+    value: float
+    secondary: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class SeriesPoint:
+    timestamp: datetime
+    value: float
+    secondary: float | None = None
+    open: float | None = None
+    high: float | None = None
+    low: float | None = None
+
+
+def resolve_range_start(series_range: str, now: datetime | None = None) -> datetime | None:
+    duration = SERIES_RANGE_DURATIONS[series_range]
+    if duration is None:
+        return None
+    return (now or datetime.now(timezone.utc)) - duration
+
+
+def _to_point(sample: SeriesSample) -> SeriesPoint:
+    return SeriesPoint(timestamp=sample.timestamp, value=sample.value, secondary=sample.secondary)
+
+
+def downsample_lttb(samples: Sequence[SeriesSample], target_points: int) -> list[SeriesPoint]:
+    """모양(극값)을 보존하면서 target_points 개로 줄입니다. 처음과 끝 점은 항상 유지합니다."""
+    count = len(samples)
+    if target_points >= count or target_points < MIN_TARGET_POINTS:
+        return [_to_point(sample) for sample in samples]
+
+    xs = [sample.timestamp.timestamp() for sample in samples]
+    selected = [samples[0]]
+    bucket_size = (count - 2) / (target_points - 2)
+    previous_index = 0
+
+    for bucket in range(target_points - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_start = end
+        next_end = min(int((bucket + 2) * bucket_size) + 1, count)
+        if next_start >= next_end:
+            next_start, next_end = count - 1, count
+
+        next_span = next_end - next_start
+        average_x = sum(xs[next_start:next_end]) / next_span
+        average_y = sum(sample.value for sample in samples[next_start:next_end]) / next_span
+
+        previous_x = xs[previous_index]
+        previous_y = samples[previous_index].value
+        best_index = start
+        best_area = -1.0
+        for index in range(start, min(end, count - 1)):
+            area = abs(
+                (previous_x - average_x) * (samples[index].value - previous_y)
+                - (previous_x - xs[index]) * (average_y - previous_y)
+            )
+            if area > best_area:
+                best_area = area
+                best_index = index
+
+        selected.append(samples[best_index])
+        previous_index = best_index
+
+    selected.append(samples[-1])
+    return [_to_point(sample) for sample in selected]
+
+
+def downsample_ohlc(samples: Sequence[SeriesSample], target_points: int) -> list[SeriesPoint]:
+    """시간 축을 균등 버킷으로 나눠 버킷별 시가/고가/저가/종가를 만듭니다. 빈 버킷은 건너뜁니다."""
+    if not samples:
+        return []
+    target_points = max(1, target_points)
+    first_ts = samples[0].timestamp.timestamp()
+    span = samples[-1].timestamp.timestamp() - first_ts
+    bucket_seconds = span / target_points if span > 0 else 1.0
+
+    points: list[SeriesPoint] = []
+    bucket_index: int | None = None
+    bucket_start: datetime | None = None
+    open_ = high = low = close = 0.0
+    secondary: float | None = None
+
+    def flush() -> None:
+        if bucket_start is not None:
+            points.append(
+                SeriesPoint(
+                    timestamp=bucket_start,
+                    value=close,
+                    secondary=secondary,
+                    open=open_,
+                    high=high,
+                    low=low,
+                )
+            )
+
+    for sample in samples:
+        index = min(int((sample.timestamp.timestamp() - first_ts) / bucket_seconds), target_points - 1)
+        if index != bucket_index:
+            flush()
+            bucket_index = index
+            bucket_start = sample.timestamp
+            open_ = high = low = sample.value
+        high = max(high, sample.value)
+        low = min(low, sample.value)
+        close = sample.value
+        secondary = sample.secondary
+    flush()
+    return points
+
+
+def downsample(
+    samples: Sequence[SeriesSample],
+    target_points: int,
+    method: DownsampleMethod = "lttb",
+) -> list[SeriesPoint]:
+    if method == "ohlc":
+        return downsample_ohlc(samples, target_points)
+    return downsample_lttb(samples, target_points)
+
+
+async def load_portfolio_series(
+    db: AsyncSession,
+    *,
+    series_range: SeriesRange = "30d",
+    target_points: int = DEFAULT_TARGET_POINTS,
+    method: DownsampleMethod = "lttb",
+    currency: str | None = None,
+) -> tuple[int, list[SeriesPoint]]:
+    """(원본 점 개수, 다운샘플된 점) 을 반환합니다.
+
+    currency 가 없으면 총 순자산/총 손익, 있으면 해당 자산의 평가금액/수익률 시계열입니다.
+    """
+    since = resolve_range_start(series_range)
+    normalized_currency = str(currency or "").strip().upper()
+    if normalized_currency:
+        rows = await get_portfolio_asset_series(db, normalized_currency, since)
+    else:
+        rows = await get_portfolio_value_series(db, since)
+
+    samples = [SeriesSample(timestamp=row[0], value=row[1], secondary=row[2]) for row in rows]
+    bounded_target = min(max(int(target_points), MIN_TARGET_POINTS), MAX_TARGET_POINTS)
+    return len(samples), downsample(samples, bounded_target, method)
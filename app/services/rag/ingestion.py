@@ -21,6 +21,9 @@ from opensearchpy.helpers import async_bulk
 from pydantic import BaseModel, Field
 
 from app.core.config import settings
+from app.core.profiling import payload_size
+from app.core.profiling import profile_span
+from app.core.profiling import profiled
 from app.db.repository import AI_PROVIDER_SETTINGS_KEY
 from app.db.repository import DEFAULT_AI_PROVIDER_SETTINGS_VALUE
 from app.db.repository import RAG_SCHEDULED_OPENAI_TRANSLATION_FALLBACK_ENABLED_KEY
@@ -2320,6 +2323,7 @@ async def refresh_market_news_for_buy_precheck_if_stale(
     }
 
 
+@profiled("run_market_news_ingestion_job")
 async def run_market_news_ingestion_job(
     *,
     context: str = INGESTION_CONTEXT_SCHEDULED,
@@ -2388,40 +2392,52 @@ async def run_market_news_ingestion_job(
             stats["errors"] += 1
             return stats
 
-        async with httpx.AsyncClient(
-            timeout=NEWS_HTTP_TIMEOUT,
-            follow_redirects=True,
-            headers={"User-Agent": "ai-trade-manager/0.1"},
-        ) as client:
-            cryptopanic_result, naver_result, rss_result = await asyncio.gather(
-                _fetch_cryptopanic_news(client),
-                _fetch_naver_news(client),
-                _fetch_rss_news(client),
-            )
-            cryptopanic_documents, cryptopanic_health = cryptopanic_result
-            naver_documents, naver_health = naver_result
-            rss_documents, rss_health = rss_result
-            rss_documents, crawl_stats = await _enrich_rss_documents_with_crawl(
-                client,
-                rss_documents,
-            )
-            _apply_crawl_health_to_sources(rss_health, rss_documents)
-            source_health = [cryptopanic_health, naver_health, *rss_health]
-            stats.update(crawl_stats)
+        with profile_span("fetch_sources") as fetch_span:
+            async with httpx.AsyncClient(
+                timeout=NEWS_HTTP_TIMEOUT,
+                follow_redirects=True,
+                headers={"User-Agent": "ai-trade-manager/0.1"},
+            ) as client:
+                cryptopanic_result, naver_result, rss_result = await asyncio.gather(
+                    _fetch_cryptopanic_news(client),
+                    _fetch_naver_news(client),
+                    _fetch_rss_news(client),
+                )
+                cryptopanic_documents, cryptopanic_health = cryptopanic_result
+                naver_documents, naver_health = naver_result
+                rss_documents, rss_health = rss_result
+                rss_documents, crawl_stats = await _enrich_rss_documents_with_crawl(
+                    client,
+                    rss_documents,
+                )
+                _apply_crawl_health_to_sources(rss_health, rss_documents)
+                source_health = [cryptopanic_health, naver_health, *rss_health]
+                stats.update(crawl_stats)
+                if fetch_span is not None:
+                    fetch_span.set(
+                        source_count=len(source_health),
+                        rss_document_count=len(rss_documents),
+                    )
 
         documents = _deduplicate_documents(
             _prefer_real_documents([*cryptopanic_documents, *naver_documents, *rss_documents])
         )
         stats["fetched"] = len(documents)
         translation_model_overrides = await _load_translation_model_overrides()
-        documents, translation_stats = await _translate_news_documents(
-            documents,
-            model_overrides=translation_model_overrides,
-            allow_openai_fallback=bool(allow_openai_translation_fallback),
-        )
+        with profile_span("translation", document_count=len(documents)):
+            documents, translation_stats = await _translate_news_documents(
+                documents,
+                model_overrides=translation_model_overrides,
+                allow_openai_fallback=bool(allow_openai_translation_fallback),
+            )
         stats.update(translation_stats)
         chunks = _build_news_chunks(documents)
-        embeddings = await _generate_embeddings(chunks)
+        with profile_span(
+            "embedding",
+            chunk_count=len(chunks),
+            payload_bytes=sum(payload_size(chunk.content) for chunk in chunks),
+        ):
+            embeddings = await _generate_embeddings(chunks)
         stats["embedding_requested"] = embeddings.requested
         stats["embedding_succeeded"] = embeddings.succeeded
         stats["embedding_missing"] = embeddings.missing
@@ -2434,7 +2450,8 @@ async def run_market_news_ingestion_job(
         stats["embedding_provider_stats"] = embeddings.provider_stats
         stats["embedding_cost_summary"] = embeddings.cost_summary
 
-        indexed_count, bulk_errors = await _bulk_upsert_chunks(chunks, embeddings)
+        with profile_span("indexing", chunk_count=len(chunks)):
+            indexed_count, bulk_errors = await _bulk_upsert_chunks(chunks, embeddings)
         stats["indexed"] = indexed_count
         if bulk_errors:
             stats["errors"] += len(bulk_errors)
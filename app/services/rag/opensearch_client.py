@@ -1,9 +1,15 @@
+from __future__ import annotations
+
 import logging
-from typing import Any
+import time
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
-from opensearchpy import AsyncOpenSearch
+if TYPE_CHECKING:
+    from opensearchpy import AsyncOpenSearch
 
 from app.core.config import settings
+from app.core.metrics import OPENSEARCH_REQUEST_SECONDS
 
 INDEX_NAME = "market_news"
 INGESTION_RUNS_INDEX_NAME = "market_news_ingestion_runs"
@@ -147,14 +153,50 @@ EXPECTED_CHUNK_FIELD_TYPES = {
 }
 
 
+def _resolve_opensearch_operation(url: str) -> str:
+    # /market_news/_search -> _search, /market_news/_doc/<id> -> _doc 처럼 인덱스/문서 ID 를 라벨에서 제외합니다.
+    segments = [segment for segment in url.split("?", 1)[0].split("/") if segment]
+    for segment in segments:
+        if segment.startswith("_"):
+            return segment
+    return "index" if segments else "root"
+
+
+@cache
+def _instrumented_transport_class() -> type:
+    # opensearch-py 는 aiohttp 까지 끌고 와 import 비용이 크므로 클라이언트를 처음 만들 때 불러옵니다.
+    from opensearchpy import AsyncTransport
+
+    class _InstrumentedAsyncTransport(AsyncTransport):
+        async def perform_request(self, method: str, url: str, *args: Any, **kwargs: Any) -> Any:
+            started_at = time.perf_counter()
+            outcome = "error"
+            try:
+                response = await super().perform_request(method, url, *args, **kwargs)
+                outcome = "success"
+                return response
+            finally:
+                OPENSEARCH_REQUEST_SECONDS.observe(
+                    time.perf_counter() - started_at,
+                    method=method,
+                    operation=_resolve_opensearch_operation(url),
+                    outcome=outcome,
+                )
+
+    return _InstrumentedAsyncTransport
+
+
 def get_opensearch_client() -> AsyncOpenSearch:
     global _opensearch_client
 
     if _opensearch_client is None:
+        from opensearchpy import AsyncOpenSearch
+
         _opensearch_client = AsyncOpenSearch(
             hosts=[settings.opensearch_url],
             use_ssl=settings.opensearch_url.startswith("https://"),
             verify_certs=False,
+            transport_class=_instrumented_transport_class(),
         )
 
     return _opensearch_client
@@ -2,6 +2,7 @@ import asyncio
 import logging
 import re
 import uuid
+from contextvars import ContextVar
 from decimal import Decimal, ROUND_DOWN
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -13,8 +14,10 @@ from app.db.session import AsyncSessionLocal
 from app.services.bot_service import get_bot_status, start_bot, stop_bot
 from app.services.brokers.factory import BrokerFactory
 from app.services.brokers.upbit import UpbitAPIError
+from app.services.command_dispatcher import KeyedCommandDispatcher
 from app.services.portfolio.aggregator import PortfolioService
 from app.services.slack_blocks import build_portfolio_blocks, build_error_blocks
+from app.services.trading.liquidation import liquidate_all_positions
 
 logger = logging.getLogger(__name__)
 broker = BrokerFactory.get_broker("UPBIT")
@@ -27,6 +30,12 @@ MIN_ORDER_BY_BASE = {
     "BTC": 0.00005,
     "USDT": 0.5,
 }
+ORDER_DETAIL_CONCURRENCY = 4
+WORKING_PLACEHOLDER_TEXT = "⏳ 처리 중입니다…"
+EMERGENCY_COMMANDS = frozenset({"stop", "/stop", "정지", "/정지"})
+EMERGENCY_ACTION_IDS = frozenset({"emergency_stop", "emergency_liquidate"})
+HEAVY_COMMAND_PREFIXES = ("매수", "buy", "매도", "sell", "미체결", "체결", "취소내역")
+ORDER_CONFIRM_PREFIXES = ("확인", "confirm")
 
 
 @dataclass
@@ -54,6 +63,19 @@ class PendingCancel:
     created_at: datetime
 
 
+@dataclass
+class WorkingPlaceholder:
+    channel: str
+    ts: str
+    consumed: bool = False
+
+
+_active_placeholder: ContextVar[WorkingPlaceholder | None] = ContextVar(
+    "slack_working_placeholder",
+    default=None,
+)
+
+
 class SlackSocketService:
     def __init__(self) -> None:
         self._task: asyncio.Task | None = None
@@ -64,6 +86,7 @@ class SlackSocketService:
         self._pending_orders: dict[str, PendingOrder] = {}
         self._pending_cancels: dict[str, PendingCancel] = {}
         self._pending_by_user: dict[str, str] = {}
+        self._dispatcher: KeyedCommandDispatcher | None = None
 
     @property
     def enabled(self) -> bool:
@@ -84,6 +107,14 @@ class SlackSocketService:
         self._stop_event.set()
         await self._task
         self._task = None
+        if self._dispatcher is not None:
+            await self._dispatcher.close()
+            self._dispatcher = None
+
+    def dispatch_stats(self) -> dict[str, Any]:
+        if self._dispatcher is None:
+            return {}
+        return self._dispatcher.snapshot()
 
     async def _run(self) -> None:
         try:
@@ -100,24 +131,22 @@ class SlackSocketService:
             web_client=self._web_client,
         )
 
-        async def _process(client: Any, req: Any) -> None:
-            if req.type == "interactive":
-                await client.send_socket_mode_response(
-                    SocketModeResponse(envelope_id=req.envelope_id)
-                )
-                await self._handle_interactive(req.payload or {})
-                return
+        self._dispatcher = KeyedCommandDispatcher(
+            name="slack",
+            max_concurrency=settings.slack_socket_worker_count,
+            default_timeout=settings.slack_command_timeout,
+        )
 
+        async def _process(client: Any, req: Any) -> None:
+            # 리스너 경로에서는 ack 후 작업 대기열에 넣기만 하고 실제 처리는 워커가 맡습니다.
             if req.type in ("events_api", "slash_commands", "interactive"):
                 await client.send_socket_mode_response(
                     SocketModeResponse(envelope_id=req.envelope_id)
                 )
-            if req.type != "events_api":
-                return
             try:
-                await self._handle_event(req.payload.get("event") or {})
+                self._enqueue_request(req.type, req.payload or {})
             except Exception as exc:
-                logger.exception("Slack event handling error: %s", exc)
+                logger.exception("Slack event enqueue error: %s", exc)
 
         self._client.socket_mode_request_listeners.append(_process)
 
@@ -163,30 +192,145 @@ class SlackSocketService:
         except Exception as exc:
             logger.warning("Slack auth_test failed: %s", exc)
 
+    def _enqueue_request(self, request_type: str, payload: dict[str, Any]) -> None:
+        if self._dispatcher is None:
+            logger.warning("Slack dispatcher not ready; drop request type=%s", request_type)
+            return
+
+        if request_type == "interactive":
+            user_id = str((payload.get("user") or {}).get("id") or "unknown")
+            action_ids = {
+                str(action.get("action_id") or "").strip()
+                for action in payload.get("actions") or []
+                if isinstance(action, dict)
+            }
+            is_emergency = bool(action_ids & EMERGENCY_ACTION_IDS)
+            self._dispatcher.submit(
+                user_id,
+                "interactive",
+                lambda: self._handle_interactive(payload),
+                priority=is_emergency,
+                cancellable=not is_emergency,
+            )
+            return
+
+        if request_type != "events_api":
+            return
+
+        event = payload.get("event") or {}
+        text = self._extract_command_text(event)
+        if text is None:
+            return
+
+        user_id = str(event.get("user") or "unknown")
+        channel = event.get("channel")
+        command_name = self._command_label(text)
+        placeholder_task: asyncio.Task | None = None
+        if (
+            channel
+            and self._is_heavy_command(text)
+            and self._is_authorized(user_id, channel, event.get("channel_type"))
+        ):
+            placeholder_task = asyncio.create_task(self._post_working_placeholder(channel))
+
+        async def _notify_timeout(_key: str, name: str) -> None:
+            await self._post_message(
+                channel,
+                self._err("시간초과", f"{name} 명령 처리 시간이 초과되어 중단되었습니다."),
+            )
+
+        self._dispatcher.submit(
+            user_id,
+            command_name,
+            lambda: self._handle_event_with_placeholder(event, placeholder_task),
+            priority=text.strip().lower() in EMERGENCY_COMMANDS,
+            # 비상 정지와 주문 확인은 주문이 나가는 도중 취소되지 않도록 시간 제한 없이 실행합니다.
+            cancellable=not self._is_uncancellable_command(text),
+            on_timeout=_notify_timeout if channel else None,
+        )
+
+    async def _handle_event_with_placeholder(
+        self,
+        event: dict[str, Any],
+        placeholder_task: asyncio.Task | None,
+    ) -> None:
+        placeholder = await placeholder_task if placeholder_task is not None else None
+        token = _active_placeholder.set(placeholder)
+        try:
+            await self._handle_event(event)
+        finally:
+            _active_placeholder.reset(token)
+            if placeholder is not None and not placeholder.consumed:
+                await self._delete_working_placeholder(placeholder)
+
     async def _handle_event(self, event: dict[str, Any]) -> None:
-        event_type = event.get("type")
         logger.debug(
             "Slack event received: type=%s channel=%s channel_type=%s",
-            event_type,
+            event.get("type"),
             event.get("channel"),
             event.get("channel_type"),
         )
-        if event_type == "app_mention":
-            text = self._strip_mention(event.get("text", ""))
-            await self._handle_command(text, event)
+        text = self._extract_command_text(event)
+        if text is None:
             return
+        await self._handle_command(text, event)
+
+    def _extract_command_text(self, event: dict[str, Any]) -> str | None:
+        event_type = event.get("type")
+        if event_type == "app_mention":
+            return self._strip_mention(event.get("text", ""))
 
         if event_type == "message":
             if event.get("bot_id") or event.get("subtype") == "bot_message":
-                return
+                return None
             channel = event.get("channel")
             channel_type = event.get("channel_type")
             if channel_type not in ("im", "mpim"):
                 if not (isinstance(channel, str) and channel.startswith(("D", "G"))):
-                    return
-            text = event.get("text", "")
-            await self._handle_command(text, event)
+                    return None
+            return event.get("text", "")
+        return None
+
+    @staticmethod
+    def _command_label(text: str) -> str:
+        words = (text or "").strip().lower().split()
+        return words[0] if words else "help"
+
+    @staticmethod
+    def _is_uncancellable_command(text: str) -> bool:
+        normalized = (text or "").strip().lower()
+        return normalized in EMERGENCY_COMMANDS or normalized.startswith(ORDER_CONFIRM_PREFIXES)
+
+    @staticmethod
+    def _is_heavy_command(text: str) -> bool:
+        compact = re.sub(r"\s+", "", (text or "").lower())
+        if compact in ("balance", "/balance") or "잔고" in compact:
+            return True
+        return compact.startswith(HEAVY_COMMAND_PREFIXES)
+
+    async def _post_working_placeholder(self, channel: str) -> WorkingPlaceholder | None:
+        if not self._web_client:
+            return None
+        try:
+            response = await self._web_client.chat_postMessage(
+                channel=channel,
+                text=WORKING_PLACEHOLDER_TEXT,
+            )
+        except Exception:
+            logger.exception("Slack working placeholder 전송 실패: channel=%s", channel)
+            return None
+        ts = response.get("ts") if response is not None else None
+        if not ts:
+            return None
+        return WorkingPlaceholder(channel=response.get("channel") or channel, ts=str(ts))
+
+    async def _delete_working_placeholder(self, placeholder: WorkingPlaceholder) -> None:
+        if not self._web_client:
             return
+        try:
+            await self._web_client.chat_delete(channel=placeholder.channel, ts=placeholder.ts)
+        except Exception:
+            logger.warning("Slack working placeholder 삭제 실패: channel=%s", placeholder.channel)
 
     def _strip_mention(self, text: str) -> str:
         if not self._bot_user_id:
@@ -1182,6 +1326,12 @@ class SlackSocketService:
         if blocks is not None:
             payload["blocks"] = blocks
 
+        placeholder = _active_placeholder.get()
+        if placeholder is not None and not placeholder.consumed and placeholder.channel == channel:
+            placeholder.consumed = True
+            await self._web_client.chat_update(ts=placeholder.ts, **payload)
+            return
+
         await self._web_client.chat_postMessage(**payload)
 
     @staticmethod
@@ -1280,6 +1430,10 @@ class SlackSocketService:
         computed_value = self._to_float(item.get("computed_value"))
         if computed_value > 0:
             return computed_value
+        # 체결 금액이 목록 응답에 있으면 주문별 상세 조회 없이 그대로 씁니다.
+        executed_funds = self._to_float(item.get("executed_funds"))
+        if executed_funds > 0:
+            return executed_funds
 
         avg_price = self._to_float(item.get("avg_price"))
         executed = self._to_float(item.get("executed_volume"))
@@ -1298,45 +1452,46 @@ class SlackSocketService:
         return 0.0
 
     async def _enrich_order_values(self, orders: list[dict[str, Any]]) -> list[dict[str, Any]]:
-        enriched: list[dict[str, Any]] = []
-        for item in orders:
-            if item.get("state") != "done":
-                enriched.append(item)
-                continue
-            if self._calc_order_value_candidate(item) > 0:
-                enriched.append(item)
-                continue
-            uuid_ = item.get("uuid")
-            if not uuid_:
-                enriched.append(item)
-                continue
-            try:
-                detail = await broker.get_order(uuid_=uuid_)
-            except UpbitAPIError:
-                enriched.append(item)
-                continue
+        semaphore = asyncio.Semaphore(ORDER_DETAIL_CONCURRENCY)
 
-            trades = detail.get("trades") if isinstance(detail, dict) else None
-            total_value = 0.0
-            if isinstance(trades, list):
-                for trade in trades:
-                    if not isinstance(trade, dict):
-                        continue
-                    price = self._to_float(trade.get("price"))
-                    volume = self._to_float(trade.get("volume"))
-                    if price > 0 and volume > 0:
-                        total_value += price * volume
-
-            if total_value > 0:
-                updated = dict(item)
-                updated["computed_value"] = total_value
-                for key in ("avg_price", "executed_volume", "paid_fee"):
-                    if not updated.get(key) and isinstance(detail, dict) and detail.get(key) is not None:
-                        updated[key] = detail.get(key)
-                enriched.append(updated)
-            else:
-                enriched.append(item)
-        return enriched
+        async def _bounded(item: dict[str, Any]) -> dict[str, Any]:
+            async with semaphore:
+                return await self._enrich_order_value(item)
+
+        return list(await asyncio.gather(*(_bounded(item) for item in orders)))
+
+    async def _enrich_order_value(self, item: dict[str, Any]) -> dict[str, Any]:
+        if item.get("state") != "done":
+            return item
+        if self._calc_order_value_candidate(item) > 0:
+            return item
+        uuid_ = item.get("uuid")
+        if not uuid_:
+            return item
+        try:
+            detail = await broker.get_order(uuid_=uuid_)
+        except UpbitAPIError:
+            return item
+
+        trades = detail.get("trades") if isinstance(detail, dict) else None
+        total_value = 0.0
+        if isinstance(trades, list):
+            for trade in trades:
+                if not isinstance(trade, dict):
+                    continue
+                price = self._to_float(trade.get("price"))
+                volume = self._to_float(trade.get("volume"))
+                if price > 0 and volume > 0:
+                    total_value += price * volume
+
+        if total_value <= 0:
+            return item
+        updated = dict(item)
+        updated["computed_value"] = total_value
+        for key in ("avg_price", "executed_volume", "paid_fee"):
+            if not updated.get(key) and isinstance(detail, dict) and detail.get(key) is not None:
+                updated[key] = detail.get(key)
+        return updated
 
     @staticmethod
     def _format_time(value: Any) -> str | None:
@@ -1489,39 +1644,15 @@ class SlackSocketService:
                     logger.exception("Liquidate 처리 중 stop_bot 실행에 실패했습니다.")
 
                 try:
-                    accounts = await broker.get_accounts()
-                    for account in accounts:
-                        currency = str(account.get("currency") or "").upper()
-                        if not currency or currency == "KRW":
-                            continue
-
-                        balance = self._to_float(account.get("balance"))
-                        locked = self._to_float(account.get("locked"))
-                        available_qty = max(balance - locked, 0.0)
-                        if available_qty <= 0:
-                            continue
-
-                        market = f"KRW-{currency}"
-                        try:
-                            await broker.create_order(
-                                market=market,
-                                side="ask",
-                                ord_type="market",
-                                volume=self._fmt_number(available_qty),
-                            )
-                        except Exception:
-                            logger.exception(
-                                "Liquidate 시장가 매도 실패: market=%s qty=%s",
-                                market,
-                                available_qty,
-                            )
+                    report = await liquidate_all_positions(broker)
                 except Exception:
                     logger.exception("Liquidate 잔고 조회/매도 파이프라인 처리 중 오류가 발생했습니다.")
-
-                await self._post_message(
-                    channel,
-                    "🔥 전량 시장가 매도(Liquidate) 파이프라인 가동 및 봇 정지 완료.",
-                )
+                    await self._post_message(
+                        channel,
+                        "🔥 봇은 정지했지만 전량 시장가 매도(Liquidate) 중 오류가 발생했습니다. 잔고를 확인해 주세요.",
+                    )
+                else:
+                    await self._post_message(channel, f"🔥 봇 정지 완료.\n{report.to_text()}")
                 continue
 
             logger.info("Unsupported interactive action_id: %s", action_id)
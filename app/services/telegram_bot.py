@@ -9,13 +9,17 @@ from app.db.repository import merge_bot_config_metadata
 from app.db.session import AsyncSessionLocal
 from app.models.schemas import BotConfig as BotConfigSchema
 from app.services.bot_service import get_bot_status, start_bot, stop_bot
+from app.services.command_dispatcher import KeyedCommandDispatcher
 from app.services.telegram import TelegramClient, telegram
 from app.services.brokers.factory import BrokerFactory
 from app.services.brokers.upbit import UpbitAPIError
+from app.services.trading.liquidation import liquidate_all_positions
 
 logger = logging.getLogger(__name__)
 broker = BrokerFactory.get_broker("UPBIT")
 
+EMERGENCY_COMMANDS = frozenset({"/stop", "/halt", "/liquidate"})
+
 
 class TelegramBotService:
     def __init__(
@@ -23,13 +27,18 @@ class TelegramBotService:
         client: TelegramClient,
         poll_timeout: int = 20,
         poll_interval: int = 2,
+        max_concurrent_handlers: int = 4,
+        command_timeout: float = 30.0,
     ) -> None:
         self.client = client
         self.poll_timeout = poll_timeout
         self.poll_interval = poll_interval
+        self.max_concurrent_handlers = max_concurrent_handlers
+        self.command_timeout = command_timeout
         self._offset: int | None = None
         self._task: asyncio.Task | None = None
         self._stop_event = asyncio.Event()
+        self._dispatcher: KeyedCommandDispatcher | None = None
 
     async def start(self) -> None:
         if not self.client.enabled:
@@ -38,6 +47,7 @@ class TelegramBotService:
         if self._task:
             return
         self._stop_event.clear()
+        self._dispatcher = self._build_dispatcher()
         self._task = asyncio.create_task(self._run(), name="telegram-bot")
 
     async def stop(self) -> None:
@@ -48,6 +58,22 @@ class TelegramBotService:
         with suppress(asyncio.CancelledError):
             await self._task
         self._task = None
+        if self._dispatcher is not None:
+            await self._dispatcher.close()
+            self._dispatcher = None
+
+    def dispatch_stats(self) -> dict[str, Any]:
+        if self._dispatcher is None:
+            return {}
+        return self._dispatcher.snapshot()
+
+    def _build_dispatcher(self) -> KeyedCommandDispatcher:
+        return KeyedCommandDispatcher(
+            name="telegram",
+            max_concurrency=self.max_concurrent_handlers,
+            default_timeout=self.command_timeout,
+            on_timeout=self._notify_command_timeout,
+        )
 
     async def _run(self) -> None:
         logger.info("Telegram bot polling started")
@@ -61,11 +87,45 @@ class TelegramBotService:
                     update_id = update.get("update_id")
                     if isinstance(update_id, int):
                         self._offset = update_id + 1
-                    await self._handle_update(update)
+                    self._dispatch_update(update)
             except Exception as exc:
                 logger.exception("Telegram polling error: %s", exc)
                 await asyncio.sleep(self.poll_interval)
 
+    def _dispatch_update(self, update: dict[str, Any]) -> None:
+        """update를 채팅별 작업 대기열에 넘기고 즉시 반환해 long-polling을 막지 않습니다."""
+        if self._dispatcher is None:
+            self._dispatcher = self._build_dispatcher()
+
+        message = update.get("message") or update.get("edited_message")
+        if not isinstance(message, dict):
+            message = {}
+        chat_id = (message.get("chat") or {}).get("id")
+        command = self._extract_command(message)
+        self._dispatcher.submit(
+            str(chat_id if chat_id is not None else "unknown"),
+            command or "message",
+            lambda: self._handle_update(update),
+            priority=command in EMERGENCY_COMMANDS,
+            # /liquidate 는 여러 종목에 시장가 주문을 내므로 도중에 취소되면 안 됩니다.
+            cancellable=command not in EMERGENCY_COMMANDS,
+        )
+
+    async def _notify_command_timeout(self, chat_key: str, command: str) -> None:
+        if chat_key == "unknown":
+            return
+        await self.client.send_message(
+            f"{command} 명령 처리 시간이 {self.command_timeout:g}초를 초과해 중단되었습니다.",
+            chat_id=chat_key,
+        )
+
+    @staticmethod
+    def _extract_command(message: dict[str, Any]) -> str | None:
+        text = (message.get("text") or "").strip()
+        if not text.startswith("/"):
+            return None
+        return text.split()[0].split("@", 1)[0].lower()
+
     async def _handle_update(self, update: dict[str, Any]) -> None:
         message = update.get("message") or update.get("edited_message")
         if not isinstance(message, dict):
@@ -79,12 +139,10 @@ class TelegramBotService:
             logger.warning("Telegram message from unauthorized chat_id=%s", chat_id)
             return
 
-        text = (message.get("text") or "").strip()
-        if not text or not text.startswith("/"):
+        cmd = self._extract_command(message)
+        if cmd is None:
             return
-
-        command, *args = text.split()
-        cmd = command.split("@", 1)[0].lower()
+        _, *args = (message.get("text") or "").split()
 
         if cmd in ("/start", "/run"):
             async with AsyncSessionLocal() as db:
@@ -98,6 +156,10 @@ class TelegramBotService:
             await self.client.send_message(self._format_status(status), chat_id=chat_id)
             return
 
+        if cmd == "/liquidate":
+            await self._handle_liquidate(chat_id, args)
+            return
+
         if cmd in ("/status", "/health"):
             async with AsyncSessionLocal() as db:
                 status = await get_bot_status(db)
@@ -126,6 +188,27 @@ class TelegramBotService:
 
         await self.client.send_message("지원하지 않는 명령입니다. /help를 입력하세요.", chat_id=chat_id)
 
+    async def _handle_liquidate(self, chat_id: int, args: list[str]) -> None:
+        if [arg.lower() for arg in args] != ["confirm"]:
+            await self.client.send_message(
+                "보유 코인을 모두 시장가로 매도하고 봇을 정지합니다. 실행하려면 /liquidate confirm 을 입력하세요.",
+                chat_id=chat_id,
+            )
+            return
+
+        async with AsyncSessionLocal() as db:
+            await stop_bot(db)
+        try:
+            report = await liquidate_all_positions(broker)
+        except Exception as exc:
+            logger.exception("Telegram 비상 청산 처리 중 오류가 발생했습니다.")
+            await self.client.send_message(
+                f"봇은 정지했지만 전량 매도 중 오류가 발생했습니다: {exc}",
+                chat_id=chat_id,
+            )
+            return
+        await self.client.send_message(report.to_text(), chat_id=chat_id)
+
     async def _handle_balance(self, chat_id: int) -> None:
         if not settings.upbit_access_key or not settings.upbit_secret_key:
             await self.client.send_message(
@@ -237,6 +320,7 @@ class TelegramBotService:
         return (
             "명령 목록:\n"
             "/start, /stop, /status\n"
+            "/liquidate confirm (전량 시장가 매도 + 봇 정지)\n"
             "/balance, /pnl, /positions\n"
             "/setrisk daily_loss=5 max_capital=10 position=20 max_positions=3 cooldown=60\n"
         )
@@ -255,4 +339,8 @@ class TelegramBotService:
             return False
 
 
-telegram_bot = TelegramBotService(telegram)
+telegram_bot = TelegramBotService(
+    telegram,
+    max_concurrent_handlers=settings.telegram_max_concurrent_handlers,
+    command_timeout=settings.telegram_command_timeout,
+)
@@ -7,6 +7,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.domain import AIAnalysisLog
 from app.services.brokers.factory import BrokerFactory
+from app.services.trading.calibration import CalibrationOutcome
+from app.services.trading.calibration import calibration_store
 
 logger = logging.getLogger(__name__)
 
@@ -153,7 +155,7 @@ async def update_ai_analysis_accuracy(db: AsyncSession) -> int:
             return 0
 
         broker = BrokerFactory.get_broker("UPBIT")
-        updated_count = 0
+        outcomes: list[CalibrationOutcome] = []
 
         for analysis in analysis_logs:
             analysis_time = _normalize_datetime(analysis.created_at)
@@ -189,11 +191,15 @@ async def update_ai_analysis_accuracy(db: AsyncSession) -> int:
             analysis.accuracy_label = accuracy_label
             analysis.actual_price_diff_pct = actual_price_diff_pct
             analysis.accuracy_checked_at = datetime.now(UTC)
-            updated_count += 1
+            outcome = CalibrationOutcome.from_log(analysis)
+            if outcome is not None:
+                outcomes.append(outcome)
 
-        if updated_count > 0:
+        if outcomes:
             await db.commit()
-        return updated_count
+            for outcome in outcomes:
+                calibration_store.record(outcome)
+        return len(outcomes)
     except Exception:
         await db.rollback()
         logger.error("AI 분석 정확도 워커 실행 중 예외가 발생했습니다.", exc_info=True)
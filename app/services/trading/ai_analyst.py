@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.profiling import annotate_span
+from app.core.profiling import payload_size
+from app.core.profiling import profile_span
 from app.db.repository import AI_CUSTOM_PERSONA_PROMPT_KEY
 from app.db.repository import AUTONOMOUS_AI_INTERVAL_HOURS_KEY
 from app.db.repository import AUTONOMOUS_AI_INTERVAL_MINUTES_KEY
@@ -21,7 +25,7 @@ from app.services.ai.providers.base import AIProviderRateLimitError
 from app.services.ai.provider_router import AIProviderRouter
 from app.services.ai.provider_router import AIProviderUnavailableError
 from app.services.brokers.factory import BrokerFactory
-from app.services.indicators import IndicatorCalculator
+from app.services.indicators import indicator_cache
 from app.services.market.sentiment_fetcher import get_cached_market_sentiment
 from app.services.market.sentiment_fetcher import get_or_refresh_market_sentiment
 from app.services.portfolio.aggregator import PortfolioService
@@ -126,21 +130,23 @@ def _build_self_correction_feedback_section(feedback_text: str) -> str:
     )
 
 
-def build_analysis_system_prompt(custom_persona: str, self_correction_feedback: str = "") -> str:
+def build_analysis_system_prompt(custom_persona: str) -> str:
+    """사이클 안의 모든 심볼이 공유하는 고정 prefix 입니다.
+
+    심볼마다 달라지는 내용(실패 사례 피드백, 시장 컨텍스트)은 user prompt 에 넣어야 provider
+    프롬프트 캐시가 심볼 간에 재사용됩니다.
+    """
     persona_prefix = _build_persona_prefix(custom_persona)
-    feedback_section = _build_self_correction_feedback_section(self_correction_feedback)
     prompt_sections = [
         persona_prefix.rstrip() if persona_prefix else "",
         ANALYSIS_CORE_IDENTITY_PROMPT,
         ANALYSIS_CORE_RULES_PROMPT,
         ANALYSIS_SAFETY_RULES_PROMPT,
-        feedback_section.rstrip() if feedback_section else "",
     ]
     return "\n\n".join(section for section in prompt_sections if section).strip()
 
 
 broker = BrokerFactory.get_broker("UPBIT")
-indicator_calculator = IndicatorCalculator()
 
 
 def _normalize_symbol(symbol: str) -> str:
@@ -719,6 +725,57 @@ async def _build_sentiment_context(db: AsyncSession) -> dict[str, Any]:
     }
 
 
+async def _load_sentiment_context(db: AsyncSession) -> dict[str, Any]:
+    try:
+        with profile_span("sentiment_context"):
+            return await _build_sentiment_context(db)
+    except Exception as exc:
+        logger.warning("AI 심리 지표 컨텍스트 생성 실패: %s", exc, exc_info=True)
+        return {
+            "score": None,
+            "classification": None,
+            "updated_at": None,
+            "error": "SENTIMENT_CONTEXT_FAILED",
+        }
+
+
+async def _load_portfolio_summary(db: AsyncSession) -> PortfolioSummary | None:
+    try:
+        with profile_span("portfolio_context"):
+            return await PortfolioService(db).get_aggregated_portfolio()
+    except Exception as exc:
+        logger.warning("AI 포트폴리오 컨텍스트 생성 실패: %s", exc, exc_info=True)
+        return None
+
+
+@dataclass(frozen=True, slots=True)
+class AnalysisCycleContext:
+    """한 사이클에서 여러 심볼을 분석할 때 심볼마다 다시 읽지 않는 공용 스냅샷.
+
+    매매를 집행하지 않는 일괄 분석처럼 사이클 도중 포트폴리오가 바뀌지 않는 경우에만 씁니다.
+    """
+
+    technical_timeframe: str
+    portfolio: PortfolioSummary | None
+    sentiment: dict[str, Any]
+    custom_persona_prompt: str
+
+
+async def load_analysis_cycle_context(db: AsyncSession) -> AnalysisCycleContext:
+    custom_persona_prompt = ""
+    try:
+        custom_persona_prompt = (await get_system_config_value(db, AI_CUSTOM_PERSONA_PROMPT_KEY, "")) or ""
+    except Exception as exc:
+        logger.warning("AI 커스텀 페르소나 프롬프트 조회 실패: error=%s", exc, exc_info=True)
+
+    return AnalysisCycleContext(
+        technical_timeframe=await _resolve_technical_timeframe(db),
+        portfolio=await _load_portfolio_summary(db),
+        sentiment=await _load_sentiment_context(db),
+        custom_persona_prompt=custom_persona_prompt,
+    )
+
+
 def _build_empty_context(symbol: str, timeframe: str) -> dict[str, Any]:
     normalized_symbol = _normalize_symbol(symbol)
     return {
@@ -751,17 +808,23 @@ def _build_empty_context(symbol: str, timeframe: str) -> dict[str, Any]:
     }
 
 
-async def gather_market_context(db: AsyncSession, symbol: str) -> dict[str, Any]:
+async def gather_market_context(
+    db: AsyncSession,
+    symbol: str,
+    *,
+    cycle: AnalysisCycleContext | None = None,
+) -> dict[str, Any]:
     normalized_symbol = _normalize_symbol(symbol)
-    technical_timeframe = await _resolve_technical_timeframe(db)
+    technical_timeframe = (
+        cycle.technical_timeframe if cycle is not None else await _resolve_technical_timeframe(db)
+    )
     context = _build_empty_context(normalized_symbol, technical_timeframe)
     market_row: dict[str, Any] | None = None
 
-    try:
-        portfolio = await PortfolioService(db).get_aggregated_portfolio()
+    portfolio = cycle.portfolio if cycle is not None else await _load_portfolio_summary(db)
+    if portfolio is not None:
         context["portfolio"] = _build_portfolio_context(portfolio, normalized_symbol)
-    except Exception as exc:
-        logger.warning("AI 포트폴리오 컨텍스트 생성 실패: %s", exc, exc_info=True)
+    else:
         context["portfolio"]["portfolio_error"] = "PORTFOLIO_CONTEXT_FAILED"
 
     try:
@@ -770,13 +833,20 @@ async def gather_market_context(db: AsyncSession, symbol: str) -> dict[str, Any]
         logger.warning("AI 시장 메타데이터 조회 실패: %s", exc, exc_info=True)
 
     try:
-        raw_candles = await broker.get_candles(
-            market=normalized_symbol,
-            timeframe=technical_timeframe,
-            count=TECHNICAL_CANDLE_COUNT,
-        )
-        normalized_candles = _normalize_candles(raw_candles)
-        enriched_candles = indicator_calculator.calculate_from_candles(normalized_candles)
+        with profile_span("candles_and_indicators", timeframe=technical_timeframe) as span:
+            raw_candles = await broker.get_candles(
+                market=normalized_symbol,
+                timeframe=technical_timeframe,
+                count=TECHNICAL_CANDLE_COUNT,
+            )
+            normalized_candles = _normalize_candles(raw_candles)
+            enriched_candles = indicator_cache.enrich(
+                normalized_symbol,
+                technical_timeframe,
+                normalized_candles,
+            )
+            if span is not None:
+                span.set(candle_count=len(normalized_candles))
         context["technical"] = {
             **_compress_technical_snapshot(enriched_candles, technical_timeframe),
             "error": None,
@@ -788,18 +858,14 @@ async def gather_market_context(db: AsyncSession, symbol: str) -> dict[str, Any]
             "error": "TECHNICAL_CONTEXT_FAILED",
         }
 
-    context["news"] = await _search_news_documents(normalized_symbol, market_row)
+    with profile_span("news_retrieval") as span:
+        context["news"] = await _search_news_documents(normalized_symbol, market_row)
+        if span is not None:
+            span.set(payload_bytes=payload_size(context["news"]))
 
-    try:
-        context["sentiment"] = await _build_sentiment_context(db)
-    except Exception as exc:
-        logger.warning("AI 심리 지표 컨텍스트 생성 실패: %s", exc, exc_info=True)
-        context["sentiment"] = {
-            "score": None,
-            "classification": None,
-            "updated_at": None,
-            "error": "SENTIMENT_CONTEXT_FAILED",
-        }
+    context["sentiment"] = (
+        dict(cycle.sentiment) if cycle is not None else await _load_sentiment_context(db)
+    )
 
     return context
 
@@ -867,13 +933,15 @@ def format_market_context_for_llm(context: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-def _build_analysis_user_prompt(symbol: str, context_text: str) -> str:
-    return (
-        f"대상 종목: {symbol}\n\n"
+def _build_analysis_user_prompt(symbol: str, context_text: str, self_correction_feedback: str = "") -> str:
+    sections = [
         "아래 시장 컨텍스트를 보고 포지션을 결정하십시오.\n"
-        "반드시 BUY, SELL, HOLD 중 하나만 선택하고, 확신도와 추천 비중을 정수로 제시하십시오.\n\n"
-        f"{context_text}"
-    )
+        "반드시 BUY, SELL, HOLD 중 하나만 선택하고, 확신도와 추천 비중을 정수로 제시하십시오.",
+        f"대상 종목: {symbol}",
+        context_text,
+        _build_self_correction_feedback_section(self_correction_feedback),
+    ]
+    return "\n\n".join(section.strip() for section in sections if section and section.strip())
 
 
 def _build_fallback_analysis(reason: str | None = None) -> AIAnalysisResponse:
@@ -1014,24 +1082,38 @@ async def _load_recent_failure_feedback(db: AsyncSession, symbol: str) -> str:
     return "\n".join(feedback_lines)
 
 
-async def execute_ai_analysis(db: AsyncSession, symbol: str) -> AIAnalysisLog:
+async def execute_ai_analysis(
+    db: AsyncSession,
+    symbol: str,
+    *,
+    cycle: AnalysisCycleContext | None = None,
+    fallback_on_unavailable: bool = True,
+) -> AIAnalysisLog:
+    """심볼 하나를 분석해 ``AIAnalysisLog`` 로 저장합니다.
+
+    provider 를 하나도 쓸 수 없으면 기본적으로 HOLD fallback 을 저장합니다.
+    ``fallback_on_unavailable=False`` 이면 저장하지 않고 ``AIProviderUnavailableError`` 를 그대로 올립니다.
+    """
     normalized_symbol = _normalize_symbol(symbol)
-    context = await gather_market_context(db, normalized_symbol)
+    with profile_span("context_gathering", symbol=normalized_symbol):
+        context = await gather_market_context(db, normalized_symbol, cycle=cycle)
     context_text = format_market_context_for_llm(context)
-    custom_persona_prompt = ""
+    annotate_span(context_bytes=payload_size(context_text))
+    custom_persona_prompt = cycle.custom_persona_prompt if cycle is not None else ""
     self_correction_feedback = ""
 
-    try:
-        custom_persona_prompt = (
-            await get_system_config_value(db, AI_CUSTOM_PERSONA_PROMPT_KEY, "")
-        ) or ""
-    except Exception as exc:
-        logger.warning(
-            "AI 커스텀 페르소나 프롬프트 조회 실패: symbol=%s error=%s",
-            normalized_symbol,
-            exc,
-            exc_info=True,
-        )
+    if cycle is None:
+        try:
+            custom_persona_prompt = (
+                await get_system_config_value(db, AI_CUSTOM_PERSONA_PROMPT_KEY, "")
+            ) or ""
+        except Exception as exc:
+            logger.warning(
+                "AI 커스텀 페르소나 프롬프트 조회 실패: symbol=%s error=%s",
+                normalized_symbol,
+                exc,
+                exc_info=True,
+            )
 
     try:
         self_correction_feedback = await _load_recent_failure_feedback(db, normalized_symbol)
@@ -1043,12 +1125,12 @@ async def execute_ai_analysis(db: AsyncSession, symbol: str) -> AIAnalysisLog:
             exc_info=True,
         )
 
-    system_prompt = build_analysis_system_prompt(custom_persona_prompt, self_correction_feedback)
+    system_prompt = build_analysis_system_prompt(custom_persona_prompt)
 
     try:
         routed_result = await AIProviderRouter(db).generate_structured_analysis(
             system_prompt=system_prompt,
-            user_prompt=_build_analysis_user_prompt(normalized_symbol, context_text),
+            user_prompt=_build_analysis_user_prompt(normalized_symbol, context_text, self_correction_feedback),
             response_model=AIAnalysisResponse,
             purpose="trade_analysis",
         )
@@ -1057,6 +1139,9 @@ async def execute_ai_analysis(db: AsyncSession, symbol: str) -> AIAnalysisLog:
         logger.warning("AI 구조화 분석 quota 초과: symbol=%s error=%s", normalized_symbol, exc)
         raise
     except AIProviderUnavailableError as exc:
+        if not fallback_on_unavailable:
+            logger.warning("AI provider 전체 사용 불가: symbol=%s error=%s", normalized_symbol, exc)
+            raise
         logger.warning("AI provider 전체 사용 불가로 HOLD fallback을 사용합니다: symbol=%s error=%s", normalized_symbol, exc)
         analysis = _build_fallback_analysis(str(exc))
     except Exception as exc:
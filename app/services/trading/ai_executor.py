@@ -1,11 +1,15 @@
 import json
 import logging
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.profiling import annotate_span
+from app.core.profiling import profile_span
+from app.core.profiling import profiled
 from app.db.repository import AI_ANALYSIS_MAX_AGE_MINUTES_KEY
 from app.db.repository import AI_MAX_BUY_WEIGHT_PCT_KEY
 from app.db.repository import AI_MIN_CONFIDENCE_TRADE_KEY
@@ -13,11 +17,10 @@ from app.db.repository import HARD_STOP_LOSS_PCT_KEY
 from app.db.repository import HARD_TAKE_PROFIT_PCT_KEY
 from app.db.repository import LIVE_BUY_ENABLED_KEY
 from app.db.repository import MAX_ALLOCATION_PCT_KEY
-from app.db.repository import PAPER_TRADING_KRW_BALANCE_KEY
 from app.db.repository import RAG_BUY_PRECHECK_NEWS_MAX_AGE_MINUTES_KEY
 from app.db.repository import RAG_BUY_PRECHECK_NEWS_REFRESH_ENABLED_KEY
 from app.db.repository import get_system_config_value
-from app.models.domain import AIAnalysisLog, Asset, OrderHistory, Position, SystemConfig
+from app.models.domain import AIAnalysisLog, Asset, OrderHistory, Position
 from app.models.schemas import AIAnalysisResponse
 from app.schemas.portfolio import AssetItem, PortfolioSummary
 from app.services.ai.provider_router import AIProviderRouter
@@ -27,14 +30,16 @@ from app.services.brokers.factory import BrokerFactory
 from app.services.brokers.upbit import UpbitAPIError
 from app.services.portfolio.aggregator import PortfolioService
 from app.services.slack_bot import slack_bot
-from app.services.trading.paper import DEFAULT_PAPER_KRW_BALANCE
-from app.services.trading.paper import PAPER_BALANCE_DESCRIPTION
-from app.services.trading.paper import PAPER_BALANCE_EPSILON
-from app.services.trading.paper import PAPER_BROKER_NAME
+from app.services.trading.paper import PaperFill
+from app.services.trading.paper import PaperLedger
 from app.services.trading.paper import build_paper_order_result
 from app.services.trading.paper import get_trading_mode
 from app.services.trading.entry_policy import EntryGateResult
 from app.services.trading.entry_policy import evaluate_ai_buy_entry_gate
+from app.services.trading.order_reconciler import FILL_STATUS_FILLED
+from app.services.trading.order_reconciler import FILL_STATUS_PENDING
+from app.services.trading.order_reconciler import FINAL_ORDER_STATES
+from app.services.trading.order_reconciler import order_reconciler
 
 logger = logging.getLogger(__name__)
 
@@ -48,9 +53,23 @@ DEFAULT_BUY_PRECHECK_NEWS_MAX_AGE_MINUTES = 60
 DEFAULT_HARD_TAKE_PROFIT_PCT = 0.0
 DEFAULT_HARD_STOP_LOSS_PCT = 0.0
 MIN_ORDER_KRW = 5000.0
+PAPER_BUY_FEE_MULTIPLIER = 0.9995
+PAPER_SELL_FEE_MULTIPLIER = 0.9995
+# 0.5% 여유분 (업비트 수수료 0.05% 대비 충분한 버퍼)
+BUY_ORDER_FEE_BUFFER = 0.995
 ORDER_REASON_TP_SELL = "TP_SELL"
 ORDER_REASON_SL_SELL = "SL_SELL"
 
+BUY_SKIP_MESSAGES = {
+    "no_cash": "사용 가능한 KRW 잔고가 없습니다.",
+    "allocation_cap_reached": "종목당 최대 비중 한도에 도달했습니다.",
+    "target_budget_non_positive": "계산된 목표 예산이 0 이하입니다.",
+    "remaining_budget_below_min": "남은 종목 비중 예산이 최소 주문 금액보다 작습니다.",
+    "cash_below_min": "가용 KRW가 최소 주문 금액보다 작습니다.",
+    "exceeds_remaining_budget": "주문 금액이 남은 종목 비중 예산을 초과합니다.",
+    "exceeds_available_cash": "가용 KRW보다 주문 금액이 큽니다.",
+}
+
 
 def _normalize_symbol(symbol: str) -> str:
     return str(symbol or "").strip().upper()
@@ -149,6 +168,80 @@ def _resolve_weighted_amount(total_amount: float, recommended_weight: int | floa
     return total_amount * weight_ratio
 
 
+@dataclass(frozen=True, slots=True)
+class AIBuyOrderPlan:
+    order_amount_krw: float
+    max_budget: float
+    remaining_budget: float
+    target_budget: float
+    effective_recommended_weight: float
+    skip_reason: str | None = None
+
+
+def plan_ai_buy_order(
+    *,
+    total_krw: float,
+    available_krw: float,
+    current_position_value: float,
+    recommended_weight: int | float,
+    max_allocation_pct: float,
+    max_buy_weight_pct: float,
+) -> AIBuyOrderPlan:
+    """AI 매수 주문 금액을 종목 비중 한도/추천 비중 상한/최소 주문 금액 규칙으로 계산합니다.
+
+    I/O 가 없는 순수 함수라 실거래 경로와 의사결정 replay 가 같은 규칙을 씁니다.
+    skip_reason 이 있으면 주문하지 않습니다(``BUY_SKIP_MESSAGES`` 참고).
+    """
+    max_budget = total_krw * (max_allocation_pct / 100.0)
+    remaining_budget = max(max_budget - max(current_position_value, 0.0), 0.0)
+    effective_recommended_weight = min(float(recommended_weight), max_buy_weight_pct)
+    target_budget = min(remaining_budget, _resolve_weighted_amount(total_krw, effective_recommended_weight))
+
+    def _plan(order_amount_krw: float, skip_reason: str | None = None) -> AIBuyOrderPlan:
+        return AIBuyOrderPlan(
+            order_amount_krw=order_amount_krw,
+            max_budget=max_budget,
+            remaining_budget=remaining_budget,
+            target_budget=target_budget,
+            effective_recommended_weight=effective_recommended_weight,
+            skip_reason=skip_reason,
+        )
+
+    if available_krw <= 0:
+        return _plan(0.0, "no_cash")
+    if remaining_budget <= 0:
+        return _plan(0.0, "allocation_cap_reached")
+    if target_budget <= 0:
+        return _plan(0.0, "target_budget_non_positive")
+    if remaining_budget < MIN_ORDER_KRW:
+        return _plan(0.0, "remaining_budget_below_min")
+    if available_krw < MIN_ORDER_KRW:
+        return _plan(0.0, "cash_below_min")
+
+    order_amount_krw = max(target_budget * BUY_ORDER_FEE_BUFFER, MIN_ORDER_KRW)
+    if order_amount_krw > remaining_budget:
+        return _plan(order_amount_krw, "exceeds_remaining_budget")
+    if order_amount_krw > available_krw:
+        return _plan(order_amount_krw, "exceeds_available_cash")
+    return _plan(order_amount_krw)
+
+
+def plan_ai_sell_volume(available_qty: float, recommended_weight: int | float) -> float:
+    return min(_resolve_weighted_amount(available_qty, recommended_weight), available_qty)
+
+
+def resolve_hard_tp_sl_reason(
+    pnl_percentage: float,
+    hard_take_profit_pct: float,
+    hard_stop_loss_pct: float,
+) -> str | None:
+    if hard_take_profit_pct > 0 and pnl_percentage >= hard_take_profit_pct:
+        return ORDER_REASON_TP_SELL
+    if hard_stop_loss_pct < 0 and pnl_percentage <= hard_stop_loss_pct:
+        return ORDER_REASON_SL_SELL
+    return None
+
+
 async def _load_executor_thresholds(db: AsyncSession) -> tuple[int, int]:
     min_confidence_raw = await get_system_config_value(
         db,
@@ -265,6 +358,30 @@ async def _load_hard_tp_sl_thresholds(db: AsyncSession) -> tuple[float, float]:
     return hard_take_profit_pct, hard_stop_loss_pct
 
 
+@dataclass(frozen=True, slots=True)
+class AIExecutorPolicy:
+    min_confidence: int = DEFAULT_AI_MIN_CONFIDENCE_TRADE
+    max_age_minutes: int = DEFAULT_AI_ANALYSIS_MAX_AGE_MINUTES
+    max_allocation_pct: float = DEFAULT_MAX_ALLOCATION_PCT
+    max_buy_weight_pct: float = DEFAULT_AI_MAX_BUY_WEIGHT_PCT
+    hard_take_profit_pct: float = DEFAULT_HARD_TAKE_PROFIT_PCT
+    hard_stop_loss_pct: float = DEFAULT_HARD_STOP_LOSS_PCT
+
+
+async def load_ai_executor_policy(db: AsyncSession) -> AIExecutorPolicy:
+    """현재 시스템 설정 기준의 실행기 정책(확신도/만료/비중/TP·SL)을 한 번에 읽습니다."""
+    min_confidence, max_age_minutes = await _load_executor_thresholds(db)
+    hard_take_profit_pct, hard_stop_loss_pct = await _load_hard_tp_sl_thresholds(db)
+    return AIExecutorPolicy(
+        min_confidence=min_confidence,
+        max_age_minutes=max_age_minutes,
+        max_allocation_pct=await _load_max_allocation_pct(db),
+        max_buy_weight_pct=await _load_ai_max_buy_weight_pct(db),
+        hard_take_profit_pct=hard_take_profit_pct,
+        hard_stop_loss_pct=hard_stop_loss_pct,
+    )
+
+
 async def _load_analysis_by_id(db: AsyncSession, analysis_id: int) -> AIAnalysisLog | None:
     result = await db.execute(
         select(AIAnalysisLog)
@@ -372,26 +489,6 @@ def _resolve_order_qty(order_result: dict[str, Any], fallback_qty: float) -> flo
     return fallback_qty
 
 
-async def _resolve_order_detail(
-    broker: Any,
-    order_result: dict[str, Any],
-) -> dict[str, Any]:
-    order_uuid = str(order_result.get("uuid") or "").strip()
-    get_order = getattr(broker, "get_order", None)
-    if not order_uuid or not callable(get_order):
-        return order_result
-
-    try:
-        detail = await get_order(uuid_=order_uuid)
-    except Exception as exc:
-        logger.warning("Upbit 주문 상세 조회 실패: uuid=%s error=%s", order_uuid, exc, exc_info=True)
-        return order_result
-
-    if not isinstance(detail, dict):
-        return order_result
-    return {**order_result, **detail}
-
-
 async def _get_or_create_asset(db: AsyncSession, market: str) -> Asset:
     result = await db.execute(select(Asset).where(Asset.symbol == market))
     asset = result.scalar_one_or_none()
@@ -478,24 +575,6 @@ def _apply_live_position_fill(
     position.status = "closed" if position.quantity <= 1e-12 else "open"
 
 
-async def _get_or_create_paper_cash_config(db: AsyncSession) -> SystemConfig:
-    result = await db.execute(
-        select(SystemConfig).where(SystemConfig.config_key == PAPER_TRADING_KRW_BALANCE_KEY)
-    )
-    config = result.scalar_one_or_none()
-    if config is not None:
-        return config
-
-    config = SystemConfig(
-        config_key=PAPER_TRADING_KRW_BALANCE_KEY,
-        config_value=_fmt_number(DEFAULT_PAPER_KRW_BALANCE),
-        description=PAPER_BALANCE_DESCRIPTION,
-    )
-    db.add(config)
-    await db.flush()
-    return config
-
-
 async def _record_order_history(
     *,
     db: AsyncSession,
@@ -509,6 +588,11 @@ async def _record_order_history(
     is_paper: bool = False,
     broker_name: str = "UPBIT",
 ) -> bool:
+    """주문 응답만으로 체결 이력을 먼저 기록합니다.
+
+    체결 상세 조회는 주문 체결 확정 서비스(order_reconciler)가 묶음으로 처리하므로 여기서는
+    기다리지 않습니다.
+    """
     resolved_price = _resolve_order_price(order_result, fallback_price, side=side)
     resolved_qty = _resolve_order_qty(order_result, fallback_qty)
     if resolved_price <= 0 or resolved_qty <= 0:
@@ -522,6 +606,10 @@ async def _record_order_history(
         return False
 
     executed_at = _parse_datetime(order_result.get("created_at")) or datetime.now(UTC)
+    broker_order_uuid = str(order_result.get("uuid") or "").strip() or None
+    order_state = str(order_result.get("state") or "").strip().lower()
+    # 시장가 주문 응답은 보통 체결 전(wait) 상태이므로 추정치로 기록하고 체결 확정을 맡깁니다.
+    fill_pending = not is_paper and broker_order_uuid is not None and order_state not in FINAL_ORDER_STATES
 
     try:
         asset = await _get_or_create_asset(db, symbol)
@@ -533,26 +621,30 @@ async def _record_order_history(
                 price=resolved_price,
                 qty=resolved_qty,
             )
-        db.add(
-            OrderHistory(
-                position_id=position.id,
-                ai_analysis_log_id=analysis.id if analysis is not None else None,
-                side=side,
-                order_reason=order_reason,
-                is_paper=is_paper,
-                price=resolved_price,
-                qty=resolved_qty,
-                broker=broker_name,
-                executed_at=executed_at,
-            )
+        history = OrderHistory(
+            position_id=position.id,
+            ai_analysis_log_id=analysis.id if analysis is not None else None,
+            side=side,
+            order_reason=order_reason,
+            is_paper=is_paper,
+            price=resolved_price,
+            qty=resolved_qty,
+            broker=broker_name,
+            broker_order_uuid=broker_order_uuid,
+            fill_status=FILL_STATUS_PENDING if fill_pending else FILL_STATUS_FILLED,
+            executed_at=executed_at,
         )
+        db.add(history)
         await db.commit()
-        return True
     except Exception as exc:
         await db.rollback()
         logger.warning("AI 주문 이력 기록 실패: symbol=%s side=%s error=%s", symbol, side, exc, exc_info=True)
         return False
 
+    if fill_pending and broker_order_uuid is not None:
+        order_reconciler.track(broker_order_uuid, history.id)
+    return True
+
 
 async def _send_trade_notification(
     *,
@@ -596,6 +688,7 @@ async def execute_hard_tp_sl_check(db: AsyncSession) -> set[str]:
     trading_mode = await get_trading_mode(db)
     broker = BrokerFactory.get_broker("UPBIT") if trading_mode == "live" else None
     liquidated_symbols: set[str] = set()
+    paper_candidates: list[tuple[str, str, float, float]] = []
 
     for item in portfolio.items:
         currency = str(item.currency or "").strip().upper()
@@ -607,12 +700,7 @@ async def execute_hard_tp_sl_check(db: AsyncSession) -> set[str]:
             continue
 
         pnl_percentage = _to_float(item.pnl_percentage)
-        trigger_reason: str | None = None
-        if tp_enabled and pnl_percentage >= hard_take_profit_pct:
-            trigger_reason = ORDER_REASON_TP_SELL
-        elif sl_enabled and pnl_percentage <= hard_stop_loss_pct:
-            trigger_reason = ORDER_REASON_SL_SELL
-
+        trigger_reason = resolve_hard_tp_sl_reason(pnl_percentage, hard_take_profit_pct, hard_stop_loss_pct)
         if trigger_reason is None:
             continue
 
@@ -647,115 +735,50 @@ async def execute_hard_tp_sl_check(db: AsyncSession) -> set[str]:
             continue
 
         if trading_mode == "paper":
-            try:
-                cash_config = await _get_or_create_paper_cash_config(db)
-                current_paper_balance = _to_float(cash_config.config_value)
-                if current_paper_balance < 0:
-                    current_paper_balance = DEFAULT_PAPER_KRW_BALANCE
-
-                asset = await _get_or_create_asset(db, symbol)
-                position = await _get_existing_position(db, asset.id, is_paper=True)
-                position_qty = max(_to_float(position.quantity) if position is not None else 0.0, 0.0)
-                if position is None or position_qty <= 0:
-                    logger.info(
-                        "하드 TP/SL paper 매도 스킵: paper 포지션이 없습니다. symbol=%s reason=%s",
-                        symbol,
-                        trigger_reason,
-                    )
-                    continue
-
-                realized_sell_qty = position_qty
-                if realized_sell_qty <= 0:
-                    logger.info(
-                        "하드 TP/SL paper 매도 스킵: 청산 수량이 0 이하입니다. symbol=%s reason=%s",
-                        symbol,
-                        trigger_reason,
-                    )
-                    continue
-
-                recovered_krw = realized_sell_qty * current_price * 0.9995
-                remaining_qty = max(position_qty - realized_sell_qty, 0.0)
-                position.quantity = 0.0 if remaining_qty <= PAPER_BALANCE_EPSILON else remaining_qty
-                position.status = "closed"
-                cash_config.config_value = _fmt_number(current_paper_balance + recovered_krw)
-                executed_at = datetime.now(UTC)
-                order_result = build_paper_order_result(
-                    market=symbol,
-                    side="ask",
-                    ord_type="market",
-                    executed_price=current_price,
-                    executed_qty=realized_sell_qty,
-                    executed_at=executed_at,
-                )
-
-                history_recorded = await _record_order_history(
-                    db=db,
-                    symbol=symbol,
-                    analysis=None,
-                    side="sell",
-                    order_result=order_result,
-                    fallback_price=current_price,
-                    fallback_qty=realized_sell_qty,
-                    order_reason=trigger_reason,
-                    is_paper=True,
-                    broker_name=PAPER_BROKER_NAME,
-                )
-                if not history_recorded:
-                    continue
-            except Exception as exc:
-                await db.rollback()
-                logger.error(
-                    "하드 TP/SL paper 매도 중 예기치 못한 오류: symbol=%s reason=%s error=%s",
-                    symbol,
-                    trigger_reason,
-                    exc,
-                    exc_info=True,
-                )
-                continue
-        else:
-            try:
-                raw_order = await broker.create_order(
-                    market=symbol,
-                    side="ask",
-                    ord_type="market",
-                    volume=_fmt_number(available_qty),
-                )
-            except (ValueError, UpbitAPIError) as exc:
-                logger.warning(
-                    "하드 TP/SL 시장가 매도 실패: symbol=%s reason=%s error=%s",
-                    symbol,
-                    trigger_reason,
-                    exc,
-                    exc_info=True,
-                )
-                continue
-            except Exception as exc:
-                logger.error(
-                    "하드 TP/SL 시장가 매도 중 예기치 못한 오류: symbol=%s reason=%s error=%s",
-                    symbol,
-                    trigger_reason,
-                    exc,
-                    exc_info=True,
-                )
-                continue
+            # paper 청산은 루프가 끝난 뒤 한 트랜잭션으로 일괄 반영합니다.
+            paper_candidates.append((symbol, trigger_reason, pnl_percentage, current_price))
+            continue
 
-            order_result = await _resolve_order_detail(
-                broker,
-                raw_order if isinstance(raw_order, dict) else {},
+        try:
+            raw_order = await broker.create_order(
+                market=symbol,
+                side="ask",
+                ord_type="market",
+                volume=_fmt_number(available_qty),
             )
-            history_recorded = await _record_order_history(
-                db=db,
-                symbol=symbol,
-                analysis=None,
-                side="sell",
-                order_result=order_result,
-                fallback_price=current_price,
-                fallback_qty=available_qty,
-                order_reason=trigger_reason,
-                is_paper=False,
+        except (ValueError, UpbitAPIError) as exc:
+            logger.warning(
+                "하드 TP/SL 시장가 매도 실패: symbol=%s reason=%s error=%s",
+                symbol,
+                trigger_reason,
+                exc,
+                exc_info=True,
+            )
+            continue
+        except Exception as exc:
+            logger.error(
+                "하드 TP/SL 시장가 매도 중 예기치 못한 오류: symbol=%s reason=%s error=%s",
+                symbol,
+                trigger_reason,
+                exc,
+                exc_info=True,
             )
-            if not history_recorded:
-                continue
+            continue
+
+        order_result = raw_order if isinstance(raw_order, dict) else {}
+        history_recorded = await _record_order_history(
+            db=db,
+            symbol=symbol,
+            analysis=None,
+            side="sell",
+            order_result=order_result,
+            fallback_price=current_price,
+            fallback_qty=available_qty,
+            order_reason=trigger_reason,
+            is_paper=False,
+        )
+        if not history_recorded:
+            continue
 
         liquidated_symbols.add(symbol)
         logger.info(
@@ -768,6 +791,79 @@ async def execute_hard_tp_sl_check(db: AsyncSession) -> set[str]:
             trading_mode,
         )
 
+    if paper_candidates:
+        liquidated_symbols.update(await _apply_paper_hard_tp_sl_sells(db, paper_candidates))
+    return liquidated_symbols
+
+
+async def _apply_paper_hard_tp_sl_sells(
+    db: AsyncSession,
+    candidates: list[tuple[str, str, float, float]],
+) -> set[str]:
+    executed_at = datetime.now(UTC)
+    fills: list[tuple[PaperFill, float]] = []
+    try:
+        position_quantities = await PaperLedger(db).position_quantities([candidate[0] for candidate in candidates])
+    except Exception as exc:
+        await db.rollback()
+        logger.error(
+            "하드 TP/SL paper 포지션 조회 중 예기치 못한 오류: symbols=%s error=%s",
+            [candidate[0] for candidate in candidates],
+            exc,
+            exc_info=True,
+        )
+        return set()
+
+    for symbol, trigger_reason, pnl_percentage, current_price in candidates:
+        position_qty = position_quantities.get(symbol, 0.0)
+        if position_qty <= 0:
+            logger.info(
+                "하드 TP/SL paper 매도 스킵: paper 포지션이 없습니다. symbol=%s reason=%s",
+                symbol,
+                trigger_reason,
+            )
+            continue
+        fill = PaperFill(
+            symbol=symbol,
+            side="sell",
+            executed_price=current_price,
+            executed_qty=position_qty,
+            cash_amount=position_qty * current_price * PAPER_SELL_FEE_MULTIPLIER,
+            executed_at=executed_at,
+            order_reason=trigger_reason,
+        )
+        fills.append((fill, pnl_percentage))
+
+    if not fills:
+        await db.rollback()
+        return set()
+
+    # 한 종목 체결 실패가 다른 종목의 손절/익절까지 되돌리지 않도록 체결마다 커밋합니다.
+    # rollback 뒤에는 원장의 메모리 잔고가 DB 와 어긋나므로 체결마다 새 원장을 씁니다.
+    liquidated_symbols: set[str] = set()
+    for fill, pnl_percentage in fills:
+        try:
+            await PaperLedger(db).apply(fill)
+            await db.commit()
+        except Exception as exc:
+            await db.rollback()
+            logger.error(
+                "하드 TP/SL paper 매도 중 예기치 못한 오류: symbol=%s reason=%s error=%s",
+                fill.symbol,
+                fill.order_reason,
+                exc,
+                exc_info=True,
+            )
+            continue
+
+        liquidated_symbols.add(fill.symbol)
+        logger.info(
+            "하드 TP/SL paper 매도 성공: symbol=%s reason=%s pnl_percentage=%s qty=%s",
+            fill.symbol,
+            fill.order_reason,
+            pnl_percentage,
+            fill.executed_qty,
+        )
     return liquidated_symbols
 
 
@@ -784,7 +880,12 @@ def _build_buy_precheck_system_prompt() -> str:
         "이미 1차 AI 분석, Entry Gate, shadow/live 안전락을 통과한 BUY 후보만 검토합니다. "
         "제공된 데이터만 근거로 삼고, 정보가 부족하거나 안전 정책상 애매하면 HOLD를 선택하세요. "
         "BUY는 기술/심리/뉴스/RAG/포트폴리오 위험이 모두 납득될 때만 유지합니다. "
-        "반드시 JSON 스키마에 맞춰 decision, confidence, recommended_weight, reasoning을 반환하세요."
+        "반드시 JSON 스키마에 맞춰 decision, confidence, recommended_weight, reasoning을 반환하세요.\n\n"
+        "판정 규칙:\n"
+        "- BUY 유지 시 confidence는 최소 체결 확신도 이상이어야 합니다.\n"
+        "- recommended_weight는 1 이상이어야 하며 과도한 비중은 낮춰도 됩니다.\n"
+        "- 근거가 부족하거나 provider/fallback/데이터 지연 위험이 크면 HOLD를 반환하세요.\n"
+        "- SELL은 신규 BUY 후보를 명확히 거절해야 할 때만 사용하고, 일반 보류는 HOLD를 사용하세요."
     )
 
 
@@ -825,12 +926,6 @@ def _build_buy_precheck_user_prompt(
             "cash": cash_item.model_dump() if cash_item is not None else None,
             "target_position": target_item.model_dump() if target_item is not None else None,
         },
-        "판정_규칙": [
-            "BUY 유지 시 confidence는 최소 체결 확신도 이상이어야 합니다.",
-            "recommended_weight는 1 이상이어야 하며 과도한 비중은 낮춰도 됩니다.",
-            "근거가 부족하거나 provider/fallback/데이터 지연 위험이 크면 HOLD를 반환하세요.",
-            "SELL은 신규 BUY 후보를 명확히 거절해야 할 때만 사용하고, 일반 보류는 HOLD를 사용하세요.",
-        ],
     }
     return json.dumps(payload, ensure_ascii=False, default=str, indent=2)
 
@@ -1017,82 +1112,41 @@ async def _execute_buy_trade(
     total_krw = max(_to_float(portfolio.total_net_worth), 0.0)
     max_allocation_pct = await _load_max_allocation_pct(db)
     max_buy_weight_pct = await _load_ai_max_buy_weight_pct(db)
-    max_budget = total_krw * (max_allocation_pct / 100.0)
     current_position_value = max(_to_float(target_item.total_value) if target_item is not None else 0.0, 0.0)
-    remaining_budget = max(max_budget - current_position_value, 0.0)
-
-    if remaining_budget <= 0:
-        logger.info(
-            "AI 매수 스킵: 종목당 최대 비중 한도에 도달했습니다. symbol=%s total_krw=%s max_budget=%s current_position_value=%s",
-            symbol,
-            total_krw,
-            max_budget,
-            current_position_value,
-        )
-        return
-
-    effective_recommended_weight = min(float(analysis.recommended_weight), max_buy_weight_pct)
-    ai_recommended_budget = _resolve_weighted_amount(total_krw, effective_recommended_weight)
-    target_budget = min(remaining_budget, ai_recommended_budget)
-    if effective_recommended_weight < float(analysis.recommended_weight):
+    plan = plan_ai_buy_order(
+        total_krw=total_krw,
+        available_krw=available_krw,
+        current_position_value=current_position_value,
+        recommended_weight=analysis.recommended_weight,
+        max_allocation_pct=max_allocation_pct,
+        max_buy_weight_pct=max_buy_weight_pct,
+    )
+    if plan.effective_recommended_weight < float(analysis.recommended_weight):
         logger.info(
             "AI 매수 비중 상한 적용: symbol=%s recommended_weight=%s max_buy_weight_pct=%s",
             symbol,
             analysis.recommended_weight,
             max_buy_weight_pct,
         )
-    if target_budget <= 0:
-        logger.info(
-            "AI 매수 스킵: 계산된 목표 예산이 0 이하입니다. symbol=%s target_budget=%s remaining_budget=%s",
-            symbol,
-            target_budget,
-            remaining_budget,
-        )
-        return
-
-    fee_buffer = 0.995  # 0.5% 여유분 (업비트 수수료 0.05% 대비 충분한 버퍼)
-    if remaining_budget < MIN_ORDER_KRW:
-        logger.info(
-            "AI 매수 스킵: 남은 종목 비중 예산이 최소 주문 금액보다 작습니다. symbol=%s remaining_budget=%s min_order=%s",
-            symbol,
-            remaining_budget,
-            MIN_ORDER_KRW,
-        )
-        return
-
-    if available_krw < MIN_ORDER_KRW:
+    if plan.skip_reason is not None:
         logger.info(
-            "AI 매수 스킵: 가용 KRW가 최소 주문 금액보다 작습니다. symbol=%s available_krw=%s min_order=%s",
-            symbol,
-            available_krw,
-            MIN_ORDER_KRW,
-        )
-        return
-
-    order_amount_krw = target_budget * fee_buffer
-    if order_amount_krw < MIN_ORDER_KRW:
-        order_amount_krw = MIN_ORDER_KRW
-
-    if order_amount_krw > remaining_budget:
-        logger.info(
-            "AI 매수 스킵: 주문 금액이 남은 종목 비중 예산을 초과합니다. symbol=%s remaining_budget=%s order_amount=%s target_budget=%s",
-            symbol,
-            remaining_budget,
-            order_amount_krw,
-            target_budget,
-        )
-        return
-
-    if order_amount_krw > available_krw:
-        logger.info(
-            "AI 매수 스킵: 가용 KRW보다 주문 금액이 큽니다. symbol=%s available_krw=%s order_amount=%s target_budget=%s",
+            "AI 매수 스킵: %s symbol=%s total_krw=%s available_krw=%s max_budget=%s current_position_value=%s remaining_budget=%s target_budget=%s order_amount=%s",
+            BUY_SKIP_MESSAGES[plan.skip_reason],
             symbol,
+            total_krw,
             available_krw,
-            order_amount_krw,
-            target_budget,
+            plan.max_budget,
+            current_position_value,
+            plan.remaining_budget,
+            plan.target_budget,
+            plan.order_amount_krw,
         )
         return
 
+    order_amount_krw = plan.order_amount_krw
+    max_budget = plan.max_budget
+    remaining_budget = plan.remaining_budget
+    target_budget = plan.target_budget
     logger.info(
         "AI 매수 시도: symbol=%s total_krw=%s max_allocation_pct=%s max_budget=%s current_position_value=%s remaining_budget=%s target_budget=%s total_avail=%s order_amount=%s mode=%s",
         symbol,
@@ -1122,7 +1176,7 @@ async def _execute_buy_trade(
             logger.info("AI paper 매수 스킵: 현재가가 유효하지 않습니다. symbol=%s", symbol)
             return
 
-        executed_qty = (order_amount_krw / executed_price) * 0.9995
+        executed_qty = (order_amount_krw / executed_price) * PAPER_BUY_FEE_MULTIPLIER
         if executed_qty <= 0:
             logger.info("AI paper 매수 스킵: 계산된 체결 수량이 0 이하입니다. symbol=%s", symbol)
             return
@@ -1136,13 +1190,11 @@ async def _execute_buy_trade(
             executed_qty=executed_qty,
             executed_at=executed_at,
         )
+        ledger = PaperLedger(db)
         try:
-            cash_config = await _get_or_create_paper_cash_config(db)
-            current_paper_balance = _to_float(cash_config.config_value)
-            if current_paper_balance < 0:
-                current_paper_balance = DEFAULT_PAPER_KRW_BALANCE
-
+            current_paper_balance = await ledger.cash_balance()
             if order_amount_krw > current_paper_balance:
+                await db.rollback()
                 logger.info(
                     "AI paper 매수 스킵: 가상 KRW 잔고보다 주문 금액이 큽니다. symbol=%s paper_balance=%s order_amount=%s",
                     symbol,
@@ -1151,36 +1203,18 @@ async def _execute_buy_trade(
                 )
                 return
 
-            asset = await _get_or_create_asset(db, symbol)
-            position = await _get_or_create_position(
-                db,
-                asset.id,
-                executed_price,
-                is_paper=True,
-            )
-            previous_qty = max(_to_float(position.quantity), 0.0)
-            previous_cost = previous_qty * max(_to_float(position.avg_entry_price), 0.0)
-            new_qty = previous_qty + executed_qty
-            total_cost = previous_cost + order_amount_krw
-
-            position.avg_entry_price = total_cost / new_qty if new_qty > 0 else executed_price
-            position.quantity = new_qty
-            position.status = "open"
-            cash_config.config_value = _fmt_number(max(current_paper_balance - order_amount_krw, 0.0))
-
-            history_recorded = await _record_order_history(
-                db=db,
-                symbol=symbol,
-                analysis=analysis,
-                side="buy",
-                order_result=order_result,
-                fallback_price=executed_price,
-                fallback_qty=executed_qty,
-                is_paper=True,
-                broker_name=PAPER_BROKER_NAME,
+            await ledger.apply(
+                PaperFill(
+                    symbol=symbol,
+                    side="buy",
+                    executed_price=executed_price,
+                    executed_qty=executed_qty,
+                    cash_amount=order_amount_krw,
+                    executed_at=executed_at,
+                    ai_analysis_log_id=analysis.id if analysis is not None else None,
+                )
             )
-            if not history_recorded:
-                return
+            await db.commit()
         except Exception as exc:
             await db.rollback()
             logger.error("AI paper 매수 적용 중 예기치 못한 오류: symbol=%s error=%s", symbol, exc, exc_info=True)
@@ -1201,10 +1235,7 @@ async def _execute_buy_trade(
             logger.error("AI 시장가 매수 중 예기치 못한 오류: symbol=%s error=%s", symbol, exc, exc_info=True)
             return
 
-        order_result = await _resolve_order_detail(
-            broker,
-            raw_order if isinstance(raw_order, dict) else {},
-        )
+        order_result = raw_order if isinstance(raw_order, dict) else {}
         fallback_price = _resolve_order_price(order_result, 0.0, side="buy")
         if fallback_price <= 0:
             try:
@@ -1212,7 +1243,7 @@ async def _execute_buy_trade(
             except Exception as exc:
                 logger.warning("AI 매수 체결가 보정 실패: symbol=%s error=%s", symbol, exc, exc_info=True)
                 fallback_price = 0.0
-        fallback_qty = (order_amount_krw * 0.9995) / fallback_price if fallback_price > 0 else 0.0
+        fallback_qty = (order_amount_krw * PAPER_BUY_FEE_MULTIPLIER) / fallback_price if fallback_price > 0 else 0.0
         history_recorded = await _record_order_history(
             db=db,
             symbol=symbol,
@@ -1260,10 +1291,7 @@ async def _execute_sell_trade(
         logger.info("AI 매도 스킵: 매도 가능한 코인 잔고가 없습니다. symbol=%s", symbol)
         return
 
-    sell_volume = min(
-        _resolve_weighted_amount(available_qty, analysis.recommended_weight),
-        available_qty,
-    )
+    sell_volume = plan_ai_sell_volume(available_qty, analysis.recommended_weight)
     if sell_volume <= 0:
         logger.info("AI 매도 스킵: 계산된 매도 수량이 0 이하입니다. symbol=%s", symbol)
         return
@@ -1287,29 +1315,20 @@ async def _execute_sell_trade(
         return
 
     if trading_mode == "paper":
+        ledger = PaperLedger(db)
         try:
-            cash_config = await _get_or_create_paper_cash_config(db)
-            current_paper_balance = _to_float(cash_config.config_value)
-            if current_paper_balance < 0:
-                current_paper_balance = DEFAULT_PAPER_KRW_BALANCE
-
-            asset = await _get_or_create_asset(db, symbol)
-            position = await _get_existing_position(db, asset.id, is_paper=True)
-            position_qty = max(_to_float(position.quantity) if position is not None else 0.0, 0.0)
-            if position is None or position_qty <= 0:
+            position_qty = (await ledger.position_quantities([symbol]))[symbol]
+            if position_qty <= 0:
+                await db.rollback()
                 logger.info("AI paper 매도 스킵: paper 포지션이 없습니다. symbol=%s", symbol)
                 return
 
             realized_sell_qty = min(sell_volume, position_qty)
             if realized_sell_qty <= 0:
+                await db.rollback()
                 logger.info("AI paper 매도 스킵: 계산된 실매도 수량이 0 이하입니다. symbol=%s", symbol)
                 return
 
-            recovered_krw = realized_sell_qty * current_price * 0.9995
-            remaining_qty = max(position_qty - realized_sell_qty, 0.0)
-            position.quantity = 0.0 if remaining_qty <= PAPER_BALANCE_EPSILON else remaining_qty
-            position.status = "closed" if position.quantity <= PAPER_BALANCE_EPSILON else "open"
-            cash_config.config_value = _fmt_number(current_paper_balance + recovered_krw)
             executed_at = datetime.now(UTC)
             order_result = build_paper_order_result(
                 market=symbol,
@@ -1319,20 +1338,18 @@ async def _execute_sell_trade(
                 executed_qty=realized_sell_qty,
                 executed_at=executed_at,
             )
-
-            history_recorded = await _record_order_history(
-                db=db,
-                symbol=symbol,
-                analysis=analysis,
-                side="sell",
-                order_result=order_result,
-                fallback_price=current_price,
-                fallback_qty=realized_sell_qty,
-                is_paper=True,
-                broker_name=PAPER_BROKER_NAME,
+            await ledger.apply(
+                PaperFill(
+                    symbol=symbol,
+                    side="sell",
+                    executed_price=current_price,
+                    executed_qty=realized_sell_qty,
+                    cash_amount=realized_sell_qty * current_price * PAPER_SELL_FEE_MULTIPLIER,
+                    executed_at=executed_at,
+                    ai_analysis_log_id=analysis.id if analysis is not None else None,
+                )
             )
-            if not history_recorded:
-                return
+            await db.commit()
         except Exception as exc:
             await db.rollback()
             logger.error("AI paper 매도 적용 중 예기치 못한 오류: symbol=%s error=%s", symbol, exc, exc_info=True)
@@ -1353,10 +1370,7 @@ async def _execute_sell_trade(
             logger.error("AI 시장가 매도 중 예기치 못한 오류: symbol=%s error=%s", symbol, exc, exc_info=True)
             return
 
-        order_result = await _resolve_order_detail(
-            broker,
-            raw_order if isinstance(raw_order, dict) else {},
-        )
+        order_result = raw_order if isinstance(raw_order, dict) else {}
         history_recorded = await _record_order_history(
             db=db,
             symbol=symbol,
@@ -1388,6 +1402,7 @@ async def _execute_sell_trade(
     )
 
 
+@profiled("execute_ai_trade")
 async def execute_ai_trade(
     db: AsyncSession,
     symbol: str,
@@ -1473,7 +1488,9 @@ async def execute_ai_trade(
         )
         return
 
-    portfolio = await PortfolioService(db).get_aggregated_portfolio()
+    annotate_span(symbol=normalized_symbol, analysis_id=analysis.id, decision=analysis.decision)
+    with profile_span("portfolio_load"):
+        portfolio = await PortfolioService(db).get_aggregated_portfolio()
     if portfolio.error is not None:
         logger.warning(
             "AI 실행 스킵: 포트폴리오 조회 실패. symbol=%s error=%s",
@@ -1484,13 +1501,14 @@ async def execute_ai_trade(
 
     trading_mode = await get_trading_mode(db)
     if analysis.decision == "BUY":
-        entry_gate = await evaluate_ai_buy_entry_gate(
-            db,
-            symbol=normalized_symbol,
-            analysis=analysis,
-            portfolio=portfolio,
-            min_calibrated_confidence=min_confidence,
-        )
+        with profile_span("entry_gate"):
+            entry_gate = await evaluate_ai_buy_entry_gate(
+                db,
+                symbol=normalized_symbol,
+                analysis=analysis,
+                portfolio=portfolio,
+                min_calibrated_confidence=min_confidence,
+            )
         if not entry_gate.allowed:
             logger.info(
                 "AI BUY 진입 게이트 스킵: symbol=%s gate=%s",
@@ -1518,36 +1536,39 @@ async def execute_ai_trade(
 
         execution_analysis = analysis
         if trading_mode == "live":
-            precheck_analysis = await _run_buy_precheck(
+            with profile_span("buy_precheck"):
+                precheck_analysis = await _run_buy_precheck(
+                    db=db,
+                    symbol=normalized_symbol,
+                    analysis=analysis,
+                    entry_gate=entry_gate,
+                    portfolio=portfolio,
+                    trading_mode=trading_mode,
+                    min_confidence=min_confidence,
+                )
+            if precheck_analysis is None:
+                return
+            execution_analysis = precheck_analysis
+
+        with profile_span("order_execution", side="BUY", trading_mode=trading_mode):
+            await _execute_buy_trade(
                 db=db,
                 symbol=normalized_symbol,
-                analysis=analysis,
-                entry_gate=entry_gate,
+                analysis=execution_analysis,
                 portfolio=portfolio,
                 trading_mode=trading_mode,
-                min_confidence=min_confidence,
             )
-            if precheck_analysis is None:
-                return
-            execution_analysis = precheck_analysis
-
-        await _execute_buy_trade(
-            db=db,
-            symbol=normalized_symbol,
-            analysis=execution_analysis,
-            portfolio=portfolio,
-            trading_mode=trading_mode,
-        )
         return
 
     if analysis.decision == "SELL":
-        await _execute_sell_trade(
-            db=db,
-            symbol=normalized_symbol,
-            analysis=analysis,
-            portfolio=portfolio,
-            trading_mode=trading_mode,
-        )
+        with profile_span("order_execution", side="SELL", trading_mode=trading_mode):
+            await _execute_sell_trade(
+                db=db,
+                symbol=normalized_symbol,
+                analysis=analysis,
+                portfolio=portfolio,
+                trading_mode=trading_mode,
+            )
         return
 
     logger.info(
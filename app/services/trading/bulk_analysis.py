@@ -0,0 +1,186 @@
+"""여러 심볼 AI 분석 일괄 실행(fan-out).
+
+UI 에서 관심 종목 전체를 다시 분석할 때 심볼마다 요청을 보내지 않도록 한 요청 안에서 최대
+``concurrency`` 개씩 동시에 분석하고, 끝나는 순서대로 결과 이벤트를 흘려보냅니다.
+
+- 포트폴리오/시장심리/기술 지표 타임프레임/커스텀 페르소나는 사이클 시작 시 한 번만 읽어
+  모든 심볼이 공유합니다(``AnalysisCycleContext``).
+- 같은 심볼 분석이 이미 진행 중이면(다른 일괄 요청 포함) 새로 돌리지 않고 그 결과를 함께 받습니다.
+- 심볼마다 분석 전에 provider 후보를 확인합니다. 쓸 수 있는 provider 가 없으면(모두 한도 차단/비활성)
+  그 심볼과 아직 시작하지 않은 심볼은 컨텍스트 수집·LLM 호출 없이 건너뜁니다.
+- provider 전체 실패는 HOLD fallback 을 저장하지 않고 오류 이벤트로 돌려줍니다. 가짜 HOLD 가
+  정확도 라벨링과 신뢰도 보정 통계에 섞이지 않게 하기 위함입니다.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from sqlalchemy import desc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import AsyncSessionLocal
+from app.models.domain import Favorite
+from app.models.schemas import AIAnalysisLogItem
+from app.services.ai.provider_router import AIProviderRouter
+from app.services.ai.provider_router import AIProviderUnavailableError
+from app.services.trading.ai_analyst import AnalysisCycleContext
+from app.services.trading.ai_analyst import execute_ai_analysis
+
+logger = logging.getLogger(__name__)
+
+BULK_ANALYSIS_MAX_SYMBOLS = 50
+DEFAULT_BULK_ANALYSIS_CONCURRENCY = 4
+MAX_BULK_ANALYSIS_CONCURRENCY = 8
+
+_in_flight: dict[str, asyncio.Task[AIAnalysisLogItem]] = {}
+# 진행 중 분석 태스크마다 결과를 기다리는 스트림 수. 마지막 스트림이 떠날 때만 취소합니다.
+_waiters: dict[asyncio.Task[AIAnalysisLogItem], int] = {}
+
+
+class BulkAnalysisSkippedError(RuntimeError):
+    """쓸 수 있는 AI provider 가 없어 분석을 시작하지 않은 경우."""
+
+
+async def load_favorite_symbols(db: AsyncSession) -> list[str]:
+    result = await db.execute(select(Favorite.symbol).order_by(desc(Favorite.created_at), desc(Favorite.id)))
+    return normalize_symbols(result.scalars().all())
+
+
+def normalize_symbols(symbols: Any) -> list[str]:
+    normalized: list[str] = []
+    for symbol in symbols or ():
+        candidate = str(symbol or "").strip().upper()
+        if candidate and candidate not in normalized:
+            normalized.append(candidate)
+    return normalized
+
+
+async def _analyze_symbol(
+    symbol: str,
+    cycle: AnalysisCycleContext,
+    semaphore: asyncio.Semaphore,
+    budget_exhausted: asyncio.Event,
+) -> AIAnalysisLogItem:
+    async with semaphore:
+        if budget_exhausted.is_set():
+            raise BulkAnalysisSkippedError("AI provider 한도 소진으로 분석을 건너뜁니다.")
+        async with AsyncSessionLocal() as db:
+            # 한도 차단 상태는 다른 세션이 커밋한 것도 보이도록 심볼마다 새로 읽습니다.
+            if not await AIProviderRouter(db).get_candidates(purpose="trade_analysis"):
+                budget_exhausted.set()
+                raise BulkAnalysisSkippedError("AI provider 한도 소진으로 분석을 건너뜁니다.")
+            analysis_log = await execute_ai_analysis(db, symbol, cycle=cycle, fallback_on_unavailable=False)
+            return AIAnalysisLogItem.model_validate(analysis_log)
+
+
+def _release_in_flight(symbol: str, task: asyncio.Task[AIAnalysisLogItem]) -> None:
+    if _in_flight.get(symbol) is task:
+        del _in_flight[symbol]
+    # 요청이 끊겨 아무도 기다리지 않는 태스크의 예외가 "never retrieved" 로 남지 않게 합니다.
+    if not task.cancelled():
+        task.exception()
+
+
+def _result_event(symbol: str, task: asyncio.Task[AIAnalysisLogItem], shared: bool) -> dict[str, Any]:
+    if task.cancelled():
+        return {"type": "error", "symbol": symbol, "error": "분석이 취소되었습니다.", "shared": shared}
+    exc = task.exception()
+    if exc is None:
+        return {
+            "type": "result",
+            "symbol": symbol,
+            "shared": shared,
+            "analysis": task.result().model_dump(mode="json"),
+        }
+    if isinstance(exc, BulkAnalysisSkippedError):
+        return {"type": "skipped", "symbol": symbol, "reason": "provider_unavailable", "shared": shared}
+    if isinstance(exc, AIProviderUnavailableError):
+        return {
+            "type": "error",
+            "symbol": symbol,
+            "error": str(exc),
+            "reason": "provider_unavailable",
+            "shared": shared,
+        }
+    logger.error("일괄 AI 분석 실패: symbol=%s error=%s", symbol, exc, exc_info=exc)
+    return {"type": "error", "symbol": symbol, "error": str(exc), "shared": shared}
+
+
+async def stream_bulk_analysis(
+    symbols: list[str],
+    cycle: AnalysisCycleContext,
+    *,
+    concurrency: int = DEFAULT_BULK_ANALYSIS_CONCURRENCY,
+) -> AsyncIterator[dict[str, Any]]:
+    """심볼별 분석 결과를 끝나는 순서대로 ``result``/``error``/``skipped`` 이벤트로 내보냅니다.
+
+    ``cycle`` 은 요청 세션으로 미리 읽어 둔 공용 스냅샷입니다. 심볼별 분석은 각자 세션을 엽니다.
+    """
+    started_at = time.perf_counter()
+    concurrency = max(min(concurrency, MAX_BULK_ANALYSIS_CONCURRENCY), 1)
+    semaphore = asyncio.Semaphore(concurrency)
+    budget_exhausted = asyncio.Event()
+
+    symbol_by_task: dict[asyncio.Task[AIAnalysisLogItem], str] = {}
+    shared_symbols: set[str] = set()
+    for symbol in symbols:
+        task = _in_flight.get(symbol)
+        if task is None:
+            task = asyncio.create_task(
+                _analyze_symbol(symbol, cycle, semaphore, budget_exhausted),
+                name=f"bulk-ai-analysis-{symbol}",
+            )
+            _in_flight[symbol] = task
+            task.add_done_callback(lambda done, symbol=symbol: _release_in_flight(symbol, done))
+        else:
+            shared_symbols.add(symbol)
+        symbol_by_task[task] = symbol
+        _waiters[task] = _waiters.get(task, 0) + 1
+
+    counts = {"result": 0, "error": 0, "skipped": 0}
+    pending = set(symbol_by_task)
+    try:
+        yield {
+            "type": "start",
+            "symbols": symbols,
+            "shared_symbols": sorted(shared_symbols),
+            "concurrency": concurrency,
+        }
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # 같은 틈에 끝난 결과는 요청한 심볼 순서대로 내보냅니다.
+            for task in sorted(done, key=lambda item: symbols.index(symbol_by_task[item])):
+                symbol = symbol_by_task[task]
+                event = _result_event(symbol, task, symbol in shared_symbols)
+                counts[event["type"]] += 1
+                yield event
+    finally:
+        # 클라이언트가 스트림을 끊으면, 다른 요청도 기다리지 않는 미완료 분석만 정리합니다.
+        for task in symbol_by_task:
+            remaining_waiters = _waiters.get(task, 1) - 1
+            if remaining_waiters > 0:
+                _waiters[task] = remaining_waiters
+                continue
+            _waiters.pop(task, None)
+            if not task.done():
+                task.cancel()
+
+    elapsed_seconds = time.perf_counter() - started_at
+    logger.info(
+        "일괄 AI 분석 완료: symbols=%s completed=%s failed=%s skipped=%s seconds=%.2f",
+        len(symbols),
+        counts["result"],
+        counts["error"],
+        counts["skipped"],
+        elapsed_seconds,
+    )
+    yield {
+        "type": "done",
+        "completed": counts["result"],
+        "failed": counts["error"],
+        "skipped": counts["skipped"],
+        "elapsed_seconds": round(elapsed_seconds, 3),
+    }
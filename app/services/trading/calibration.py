@@ -0,0 +1,342 @@
+"""AI 확신도 보정(calibration) 집계 저장소.
+
+정확도 워커가 ``accuracy_label`` 을 붙일 때마다 결과 한 건을 셀(심볼 x 판단 x 확신도 구간 x
+시간대)에 누적합니다. 셀마다 건수/적중 수와 Brier 계산에 필요한 합(p, p^2, p*y)만 들고 있으므로
+로그를 다시 훑지 않고도 적중률, 신뢰도 곡선(reliability curve), Brier 점수를 구할 수 있습니다.
+DB 는 프로세스당 처음 한 번만 읽습니다(부트스트랩).
+
+진입 게이트는 심볼/판단별 최근 ``RECENT_WINDOW_SIZE`` 건의 적중 수를 O(1) 로 조회합니다.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import asc, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.domain import AIAnalysisLog
+from app.services.indicators.calculator import load_indicator_stack
+
+logger = logging.getLogger(__name__)
+
+CALIBRATION_DECISIONS = ("BUY", "SELL")
+CALIBRATION_LABELS = ("SUCCESS", "FAIL")
+CONFIDENCE_BUCKET_WIDTH = 10
+CONFIDENCE_BUCKET_COUNT = 100 // CONFIDENCE_BUCKET_WIDTH
+RECENT_WINDOW_SIZE = 200
+CALIBRATION_TIMEZONE = ZoneInfo("Asia/Seoul")
+
+# 셀 누적값 위치: 건수, 적중 수, sum(p), sum(p^2), sum(p*y)
+_COUNT, _SUCCESS, _SUM_P, _SUM_P2, _SUM_PY = range(5)
+
+
+@dataclass(frozen=True, slots=True)
+class CalibrationOutcome:
+    analysis_id: int
+    symbol: str
+    decision: str
+    confidence: int
+    success: bool
+    created_at: datetime
+
+    @classmethod
+    def from_log(cls, analysis: AIAnalysisLog) -> "CalibrationOutcome | None":
+        decision = str(analysis.decision or "").strip().upper()
+        label = str(analysis.accuracy_label or "").strip().upper()
+        if decision not in CALIBRATION_DECISIONS or label not in CALIBRATION_LABELS:
+            return None
+        return cls(
+            analysis_id=int(analysis.id),
+            symbol=str(analysis.symbol or "").strip().upper(),
+            decision=decision,
+            confidence=int(analysis.confidence),
+            success=label == "SUCCESS",
+            created_at=analysis.created_at,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class WinRate:
+    checked_count: int
+    success_count: int
+
+    @property
+    def success_rate_pct(self) -> float | None:
+        if not self.checked_count:
+            return None
+        return (self.success_count / self.checked_count) * 100.0
+
+
+def confidence_bucket(confidence: int) -> int:
+    clamped = max(min(int(confidence), 100), 0)
+    return min(clamped // CONFIDENCE_BUCKET_WIDTH, CONFIDENCE_BUCKET_COUNT - 1)
+
+
+def local_hour(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(CALIBRATION_TIMEZONE).hour
+
+
+def _rate_pct(numerator: Any, denominator: Any) -> float | None:
+    if not denominator:
+        return None
+    return round(float(numerator) / float(denominator) * 100.0, 4)
+
+
+def _brier(stats: Any) -> float | None:
+    # (p - y)^2 = p^2 - 2py + y 이므로 합만으로 평균 제곱오차를 구합니다(y^2 == y).
+    if not stats[_COUNT]:
+        return None
+    return round(float((stats[_SUM_P2] - 2 * stats[_SUM_PY] + stats[_SUCCESS]) / stats[_COUNT]), 6)
+
+
+class CalibrationStore:
+    def __init__(self, recent_window: int = RECENT_WINDOW_SIZE) -> None:
+        self.recent_window = recent_window
+        self._lock = threading.Lock()
+        self._cells: dict[tuple[str, str, int, int], list[float]] = {}
+        self._recent: dict[tuple[str, str], deque[bool]] = {}
+        self._recent_success: dict[tuple[str, str], int] = {}
+        self._checked_total = 0
+        self._success_total = 0
+        # 워커의 record 와 부트스트랩 조회가 같은 커밋된 라벨을 둘 다 볼 수 있어 분석 ID 로 중복을 막습니다.
+        self._recorded_ids: set[int] = set()
+        self._loaded = False
+        self._pending: list[CalibrationOutcome] | None = None
+        self._loading: asyncio.Event | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def reset(self) -> None:
+        with self._lock:
+            self._clear()
+            self._loaded = False
+            self._pending = None
+            self._loading = None
+
+    def record(self, outcome: CalibrationOutcome) -> None:
+        """라벨이 확정된 결과 한 건을 누적합니다.
+
+        부트스트랩 전이면 버립니다. 이미 커밋된 라벨이므로 부트스트랩이 DB 에서 함께 읽습니다.
+        이미 누적된 분석 ID 는 다시 더하지 않습니다.
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append(outcome)
+            elif self._loaded:
+                self._apply(outcome)
+
+    def load_outcomes(self, outcomes: Iterable[CalibrationOutcome]) -> int:
+        """집계를 비우고 ``outcomes`` 를 라벨 확정 순서대로 다시 쌓습니다."""
+        with self._lock:
+            self._clear()
+            for outcome in outcomes:
+                self._apply(outcome)
+            # 부트스트랩 조회 중에 기록된 라벨은 조회 결과에 없던 것만 더해집니다.
+            for outcome in self._pending or ():
+                self._apply(outcome)
+            self._pending = None
+            self._loaded = True
+            return len(self._recorded_ids)
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        if self._loaded:
+            return
+        if self._loading is not None:
+            await self._loading.wait()
+            if self._loaded:
+                return
+
+        loading = asyncio.Event()
+        self._loading = loading
+        with self._lock:
+            self._pending = []
+        started_at = time.perf_counter()
+        try:
+            result = await db.execute(
+                select(
+                    AIAnalysisLog.id,
+                    AIAnalysisLog.symbol,
+                    AIAnalysisLog.decision,
+                    AIAnalysisLog.confidence,
+                    AIAnalysisLog.accuracy_label,
+                    AIAnalysisLog.created_at,
+                )
+                .where(AIAnalysisLog.decision.in_(CALIBRATION_DECISIONS))
+                .where(AIAnalysisLog.accuracy_label.in_(CALIBRATION_LABELS))
+                .order_by(
+                    asc(AIAnalysisLog.accuracy_checked_at),
+                    asc(AIAnalysisLog.created_at),
+                    asc(AIAnalysisLog.id),
+                )
+            )
+            loaded_count = self.load_outcomes(
+                CalibrationOutcome(
+                    analysis_id=int(row.id),
+                    symbol=str(row.symbol or "").strip().upper(),
+                    decision=str(row.decision or "").strip().upper(),
+                    confidence=int(row.confidence),
+                    success=str(row.accuracy_label or "").upper() == "SUCCESS",
+                    created_at=row.created_at,
+                )
+                for row in result.all()
+            )
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+        finally:
+            self._loading = None
+            loading.set()
+
+        logger.info(
+            "AI 확신도 보정 집계 부트스트랩 완료: outcomes=%s cells=%s seconds=%.3f",
+            loaded_count,
+            len(self._cells),
+            time.perf_counter() - started_at,
+        )
+
+    def recent_win_rate(self, symbol: str, decision: str = "BUY") -> WinRate:
+        key = (str(symbol or "").strip().upper(), str(decision or "").strip().upper())
+        with self._lock:
+            window = self._recent.get(key)
+            if not window:
+                return WinRate(checked_count=0, success_count=0)
+            return WinRate(checked_count=len(window), success_count=self._recent_success[key])
+
+    def overall_win_rate(self) -> WinRate:
+        with self._lock:
+            return WinRate(checked_count=self._checked_total, success_count=self._success_total)
+
+    def report(self, *, symbol: str | None = None, decision: str | None = None) -> dict[str, Any]:
+        """누적 셀로 적중률/신뢰도 곡선/Brier 점수를 한 번에 계산합니다."""
+        np, _pd, _ta = load_indicator_stack()
+
+        normalized_symbol = str(symbol or "").strip().upper() or None
+        normalized_decision = str(decision or "").strip().upper() or None
+        with self._lock:
+            selected = [
+                (key, list(stats))
+                for key, stats in self._cells.items()
+                if (normalized_symbol is None or key[0] == normalized_symbol)
+                and (normalized_decision is None or key[1] == normalized_decision)
+            ]
+
+        symbols = sorted({key[0] for key, _stats in selected})
+        symbol_index = {name: index for index, name in enumerate(symbols)}
+        stats = np.array([cell for _key, cell in selected], dtype=np.float64).reshape(-1, 5)
+        keys = {
+            "symbol": np.array([symbol_index[key[0]] for key, _stats in selected], dtype=np.intp),
+            "decision": np.array([CALIBRATION_DECISIONS.index(key[1]) for key, _stats in selected], dtype=np.intp),
+            "bucket": np.array([key[2] for key, _stats in selected], dtype=np.intp),
+            "hour": np.array([key[3] for key, _stats in selected], dtype=np.intp),
+        }
+
+        def group(dimension: str, size: int) -> Any:
+            index = keys[dimension]
+            if not len(index):
+                return np.zeros((size, 5), dtype=np.float64)
+            return np.stack(
+                [np.bincount(index, weights=stats[:, column], minlength=size) for column in range(5)],
+                axis=1,
+            )
+
+        totals = stats.sum(axis=0)
+        buckets = group("bucket", CONFIDENCE_BUCKET_COUNT)
+        reliability: list[dict[str, Any]] = []
+        calibration_error = 0.0
+        for bucket, row in enumerate(buckets):
+            if not row[_COUNT]:
+                continue
+            mean_confidence = row[_SUM_P] / row[_COUNT]
+            win_rate = row[_SUCCESS] / row[_COUNT]
+            calibration_error += row[_COUNT] * abs(win_rate - mean_confidence)
+            reliability.append(
+                {
+                    "bucket_start": bucket * CONFIDENCE_BUCKET_WIDTH,
+                    "bucket_end": min((bucket + 1) * CONFIDENCE_BUCKET_WIDTH, 100),
+                    "checked_count": int(row[_COUNT]),
+                    "mean_confidence_pct": round(float(mean_confidence) * 100.0, 4),
+                    "win_rate_pct": _rate_pct(row[_SUCCESS], row[_COUNT]),
+                    "brier_score": _brier(row),
+                }
+            )
+
+        def breakdown(dimension: str, labels: list[Any]) -> list[dict[str, Any]]:
+            rows = group(dimension, len(labels))
+            return [
+                {
+                    "key": label,
+                    "checked_count": int(row[_COUNT]),
+                    "win_rate_pct": _rate_pct(row[_SUCCESS], row[_COUNT]),
+                    "mean_confidence_pct": _rate_pct(row[_SUM_P], row[_COUNT]),
+                    "brier_score": _brier(row),
+                }
+                for label, row in zip(labels, rows, strict=True)
+                if row[_COUNT]
+            ]
+
+        return {
+            "checked_count": int(totals[_COUNT]),
+            "success_count": int(totals[_SUCCESS]),
+            "win_rate_pct": _rate_pct(totals[_SUCCESS], totals[_COUNT]),
+            "brier_score": _brier(totals),
+            "expected_calibration_error_pct": (
+                round(calibration_error / float(totals[_COUNT]) * 100.0, 4) if totals[_COUNT] else None
+            ),
+            "reliability": reliability,
+            "by_symbol": breakdown("symbol", symbols),
+            "by_decision": breakdown("decision", list(CALIBRATION_DECISIONS)),
+            "by_hour": breakdown("hour", list(range(24))),
+        }
+
+    def _clear(self) -> None:
+        self._cells.clear()
+        self._recent.clear()
+        self._recent_success.clear()
+        self._checked_total = 0
+        self._success_total = 0
+        self._recorded_ids.clear()
+
+    def _apply(self, outcome: CalibrationOutcome) -> None:
+        if outcome.analysis_id in self._recorded_ids:
+            return
+        self._recorded_ids.add(outcome.analysis_id)
+        probability = max(min(outcome.confidence, 100), 0) / 100.0
+        hit = 1.0 if outcome.success else 0.0
+        cell_key = (outcome.symbol, outcome.decision, confidence_bucket(outcome.confidence), local_hour(outcome.created_at))
+        cell = self._cells.get(cell_key)
+        if cell is None:
+            cell = self._cells[cell_key] = [0.0, 0.0, 0.0, 0.0, 0.0]
+        cell[_COUNT] += 1.0
+        cell[_SUCCESS] += hit
+        cell[_SUM_P] += probability
+        cell[_SUM_P2] += probability * probability
+        cell[_SUM_PY] += probability * hit
+        self._checked_total += 1
+        self._success_total += int(outcome.success)
+
+        recent_key = (outcome.symbol, outcome.decision)
+        window = self._recent.get(recent_key)
+        if window is None:
+            window = self._recent[recent_key] = deque(maxlen=self.recent_window)
+            self._recent_success[recent_key] = 0
+        if len(window) == self.recent_window and window[0]:
+            self._recent_success[recent_key] -= 1
+        window.append(outcome.success)
+        if outcome.success:
+            self._recent_success[recent_key] += 1
+
+
+calibration_store = CalibrationStore()
@@ -3,7 +3,6 @@ import logging
 from dataclasses import dataclass
 from typing import Any
 
-from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.repository import AI_CALIBRATION_MIN_SUCCESS_RATE_KEY
@@ -17,6 +16,7 @@ from app.models.domain import AIAnalysisLog
 from app.schemas.portfolio import AssetItem, PortfolioSummary
 from app.services.trading.ai_analyst import gather_market_context
 from app.services.trading.ai_analyst import is_fallback_news_item
+from app.services.trading.calibration import calibration_store
 
 logger = logging.getLogger(__name__)
 
@@ -230,24 +230,16 @@ async def load_buy_confidence_calibration(
     symbol: str,
     raw_confidence: int,
 ) -> AIConfidenceCalibration:
-    result = await db.execute(
-        select(AIAnalysisLog.accuracy_label)
-        .where(AIAnalysisLog.symbol == normalize_symbol(symbol))
-        .where(AIAnalysisLog.decision == "BUY")
-        .where(AIAnalysisLog.accuracy_label.in_(("SUCCESS", "FAIL")))
-        .order_by(desc(AIAnalysisLog.accuracy_checked_at), desc(AIAnalysisLog.created_at))
-        .limit(200)
-    )
-    labels = [str(label or "").upper() for label in result.scalars().all()]
-    checked_count = len(labels)
-    success_count = sum(1 for label in labels if label == "SUCCESS")
-    success_rate_pct = (success_count / checked_count) * 100.0 if checked_count else None
+    # 최근 BUY 적중 수는 정확도 워커가 라벨을 붙일 때마다 누적되므로 여기서는 조회하지 않습니다.
+    await calibration_store.ensure_loaded(db)
+    recent = calibration_store.recent_win_rate(normalize_symbol(symbol), "BUY")
+    success_rate_pct = recent.success_rate_pct
     effective_rate = success_rate_pct if success_rate_pct is not None else 50.0
     calibrated_confidence = _clamp_int(raw_confidence * (effective_rate / 50.0))
 
     return AIConfidenceCalibration(
-        checked_count=checked_count,
-        success_count=success_count,
+        checked_count=recent.checked_count,
+        success_count=recent.success_count,
         success_rate_pct=success_rate_pct,
         calibrated_confidence=calibrated_confidence,
     )
@@ -0,0 +1,354 @@
+"""보유 코인 전량 시장가 매도(비상 청산) 실행기.
+
+API(`POST /bot/liquidate`), Slack 비상 버튼, Telegram `/liquidate` 가 같은 실행기를 사용합니다.
+
+1. 잔고를 한 번 조회하고 대상 마켓의 현재가를 한 번의 ticker 호출로 미리 가져옵니다.
+2. 최소 주문 금액 미만/거래 불가 마켓을 걸러낸 뒤 업비트 주문 rate limit 안에서 모든 매도를 동시에 제출합니다.
+3. 제출된 주문은 uuid 묶음 조회로 체결 상태를 추적하고 마켓별 결과 리포트를 반환합니다.
+
+요청 시각부터 마지막 주문 제출까지의 시간은 ``liquidation_submit_duration_seconds`` 로 기록합니다.
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+import httpx
+
+from app.core.metrics import LIQUIDATION_ORDERS_TOTAL
+from app.core.metrics import LIQUIDATION_SUBMIT_SECONDS
+from app.core.rate_limit import TokenBucketLimiter
+from app.services.brokers.factory import BrokerFactory
+from app.services.brokers.upbit import UpbitAPIError
+
+logger = logging.getLogger(__name__)
+
+# 업비트 주문 API 는 초당 8회까지 허용합니다.
+UPBIT_ORDER_RATE_PER_SECOND = 8.0
+MIN_LIQUIDATION_ORDER_KRW = 5_000.0
+LIQUIDATION_PRICE_TIMEOUT_SECONDS = 2.0
+LIQUIDATION_SUBMIT_TIMEOUT_SECONDS = 10.0
+LIQUIDATION_FILL_TIMEOUT_SECONDS = 5.0
+LIQUIDATION_FILL_POLL_SECONDS = 0.5
+
+LiquidationStatus = Literal[
+    "filled",
+    "partially_filled",
+    "submitted",
+    "cancelled",
+    "below_min_order",
+    "no_market",
+    "submit_failed",
+    "submit_timeout",
+]
+FINAL_ORDER_STATES = frozenset({"done", "cancel"})
+
+
+class OrderRateLimiter(TokenBucketLimiter):
+    def __init__(
+        self,
+        rate_per_second: float = UPBIT_ORDER_RATE_PER_SECOND,
+        burst: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(rate_per_second, burst, clock)
+
+
+@dataclass(slots=True)
+class LiquidationOrderResult:
+    market: str
+    currency: str
+    volume: float
+    price: float | None = None
+    estimated_krw: float | None = None
+    status: LiquidationStatus = "submitted"
+    order_uuid: str | None = None
+    identifier: str | None = None
+    order_state: str | None = None
+    executed_volume: float = 0.0
+    executed_krw: float | None = None
+    submitted_after_seconds: float | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "market": self.market,
+            "currency": self.currency,
+            "volume": self.volume,
+            "price": self.price,
+            "estimated_krw": _round_krw(self.estimated_krw),
+            "status": self.status,
+            "order_uuid": self.order_uuid,
+            "executed_volume": self.executed_volume,
+            "executed_krw": _round_krw(self.executed_krw),
+            "submitted_after_seconds": (
+                round(self.submitted_after_seconds, 4) if self.submitted_after_seconds is not None else None
+            ),
+            "error": self.error,
+        }
+
+
+@dataclass(slots=True)
+class LiquidationReport:
+    run_id: str
+    results: list[LiquidationOrderResult] = field(default_factory=list)
+    submit_seconds: float = 0.0
+    total_seconds: float = 0.0
+
+    def count(self, *statuses: str) -> int:
+        return sum(1 for result in self.results if result.status in statuses)
+
+    def message(self) -> str:
+        if not self.results:
+            return "청산할 보유 코인이 없습니다."
+        submitted = self.count("filled", "partially_filled", "submitted", "cancelled")
+        return (
+            f"전량 매도 {submitted}건 제출(체결 {self.count('filled')}건), "
+            f"실패 {self.count('submit_failed', 'submit_timeout')}건, "
+            f"제외 {self.count('below_min_order', 'no_market')}건. "
+            f"마지막 주문 제출까지 {self.submit_seconds:.2f}초"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "run_id": self.run_id,
+            "message": self.message(),
+            "submit_seconds": round(self.submit_seconds, 4),
+            "total_seconds": round(self.total_seconds, 4),
+            "results": [result.to_dict() for result in self.results],
+        }
+
+    def to_text(self) -> str:
+        lines = [f"[비상 청산 결과] {self.message()}"]
+        for result in self.results:
+            amount = result.executed_krw if result.executed_krw is not None else result.estimated_krw
+            amount_text = f"{amount:,.0f}원" if amount is not None else "-"
+            suffix = f" ({result.error})" if result.error else ""
+            lines.append(f"- {result.market}: {result.status} {amount_text}{suffix}")
+        return "\n".join(lines)
+
+
+def _round_krw(value: float | None) -> float | None:
+    return round(value, 2) if value is not None else None
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _fmt_volume(value: float) -> str:
+    return f"{value:.8f}".rstrip("0").rstrip(".") or "0"
+
+
+def build_liquidation_orders(
+    accounts: list[dict[str, Any]],
+    prices: dict[str, float] | None,
+) -> list[LiquidationOrderResult]:
+    """잔고와 미리 조회한 현재가로 매도 대상을 만들고, 주문할 수 없는 마켓은 사유를 채워 둡니다.
+
+    ``prices`` 가 None 이면(현재가 조회 실패) 거르지 않고 모두 제출해 판단을 업비트에 맡깁니다.
+    """
+    orders: list[LiquidationOrderResult] = []
+    for account in accounts:
+        if not isinstance(account, dict):
+            continue
+        currency = str(account.get("currency") or "").strip().upper()
+        if not currency or currency == "KRW":
+            continue
+        available_qty = max(_to_float(account.get("balance")) - _to_float(account.get("locked")), 0.0)
+        if available_qty <= 0:
+            continue
+
+        market = f"KRW-{currency}"
+        order = LiquidationOrderResult(market=market, currency=currency, volume=available_qty)
+        if prices is not None:
+            price = prices.get(market)
+            if price is None:
+                order.status = "no_market"
+            else:
+                order.price = price
+                order.estimated_krw = available_qty * price
+                if order.estimated_krw < MIN_LIQUIDATION_ORDER_KRW:
+                    order.status = "below_min_order"
+        orders.append(order)
+    return orders
+
+
+def _may_have_been_accepted(exc: Exception) -> bool:
+    """주문 제출 오류가 업비트 접수 뒤에 났을 수 있는지 판단합니다.
+
+    브로커는 응답 시간 초과 시 같은 identifier 로 주문을 다시 보내므로, 첫 요청이 접수됐다면
+    마지막 시도는 시간 초과나 identifier 중복 거부로 끝납니다.
+    """
+    if isinstance(exc, httpx.TimeoutException):
+        return True
+    if isinstance(exc, UpbitAPIError):
+        reason = f"{exc.error_name or ''} {exc.message or ''} {exc.detail}".lower()
+        return "identifier" in reason
+    return False
+
+
+class LiquidationExecutor:
+    def __init__(
+        self,
+        broker: Any | None = None,
+        *,
+        rate_limiter: OrderRateLimiter | None = None,
+        submit_timeout: float = LIQUIDATION_SUBMIT_TIMEOUT_SECONDS,
+        fill_timeout: float = LIQUIDATION_FILL_TIMEOUT_SECONDS,
+        poll_interval: float = LIQUIDATION_FILL_POLL_SECONDS,
+    ) -> None:
+        self.broker = broker or BrokerFactory.get_broker("UPBIT")
+        self.rate_limiter = rate_limiter or OrderRateLimiter()
+        self.submit_timeout = submit_timeout
+        self.fill_timeout = fill_timeout
+        self.poll_interval = poll_interval
+
+    async def liquidate_all(self) -> LiquidationReport:
+        started_at = time.perf_counter()
+        report = LiquidationReport(run_id=uuid.uuid4().hex[:12])
+
+        accounts = await self.broker.get_accounts()
+        report.results = build_liquidation_orders(accounts, await self._prefetch_prices(accounts))
+        pending = [order for order in report.results if order.status == "submitted"]
+
+        await asyncio.gather(*(self._submit(order, report.run_id, started_at) for order in pending))
+        report.submit_seconds = time.perf_counter() - started_at
+        LIQUIDATION_SUBMIT_SECONDS.observe(report.submit_seconds)
+
+        await self._track_fills(pending)
+        report.total_seconds = time.perf_counter() - started_at
+        for order in report.results:
+            LIQUIDATION_ORDERS_TOTAL.inc(status=order.status)
+        logger.warning(
+            "비상 청산 완료: run_id=%s submit_seconds=%.3f total_seconds=%.3f %s",
+            report.run_id,
+            report.submit_seconds,
+            report.total_seconds,
+            {order.market: order.status for order in report.results},
+        )
+        return report
+
+    async def _prefetch_prices(self, accounts: list[dict[str, Any]]) -> dict[str, float] | None:
+        markets = sorted(
+            {
+                f"KRW-{str(account.get('currency') or '').strip().upper()}"
+                for account in accounts
+                if isinstance(account, dict)
+                and str(account.get("currency") or "").strip().upper() not in {"", "KRW"}
+            }
+        )
+        if not markets:
+            return {}
+        try:
+            async with asyncio.timeout(LIQUIDATION_PRICE_TIMEOUT_SECONDS):
+                rows = await self.broker.get_ticker(markets)
+        except Exception as exc:
+            # 가격을 못 가져와도 청산은 멈추지 않습니다. 최소 주문 금액 판단만 업비트에 맡깁니다.
+            logger.warning("비상 청산 현재가 일괄 조회 실패: %s", exc, exc_info=True)
+            return None
+        prices: dict[str, float] = {}
+        for row in rows or []:
+            if isinstance(row, dict) and row.get("market"):
+                prices[str(row["market"]).upper()] = _to_float(row.get("trade_price"))
+        return prices
+
+    async def _submit(self, order: LiquidationOrderResult, run_id: str, started_at: float) -> None:
+        # identifier 가 같은 주문은 업비트가 거부하므로 재시도로 이중 매도가 나지는 않지만,
+        # 그 거부가 실패로 보고되지 않도록 접수 여부는 identifier 로 다시 확인합니다.
+        order.identifier = f"liq-{run_id}-{order.currency}"
+        try:
+            await self.rate_limiter.acquire()
+            async with asyncio.timeout(self.submit_timeout):
+                response = await self.broker.create_order(
+                    market=order.market,
+                    side="ask",
+                    ord_type="market",
+                    volume=_fmt_volume(order.volume),
+                    identifier=order.identifier,
+                )
+        except TimeoutError:
+            order.status = "submit_timeout"
+            order.error = f"{self.submit_timeout:.0f}초 안에 주문 응답을 받지 못했습니다."
+            logger.error("비상 청산 주문 제출 시간 초과: market=%s", order.market)
+        except Exception as exc:
+            order.status = "submit_failed"
+            order.error = str(exc) or type(exc).__name__
+            logger.exception("비상 청산 시장가 매도 실패: market=%s qty=%s", order.market, order.volume)
+            if _may_have_been_accepted(exc):
+                await self._resolve_by_identifier(order)
+        else:
+            if isinstance(response, dict):
+                order.order_uuid = str(response.get("uuid") or "").strip() or None
+                self._apply_order_state(order, response)
+        finally:
+            order.submitted_after_seconds = time.perf_counter() - started_at
+
+    async def _track_fills(self, orders: list[LiquidationOrderResult]) -> None:
+        deadline = time.perf_counter() + self.fill_timeout
+        await asyncio.gather(
+            *(self._resolve_by_identifier(order) for order in orders if order.status == "submit_timeout")
+        )
+        while True:
+            waiting = [
+                order
+                for order in orders
+                if order.order_uuid and order.order_state not in FINAL_ORDER_STATES
+            ]
+            if not waiting or time.perf_counter() >= deadline:
+                return
+            await asyncio.sleep(self.poll_interval)
+            try:
+                rows = await self.broker.get_orders_by_uuids([order.order_uuid for order in waiting])
+            except Exception as exc:
+                logger.warning("비상 청산 체결 조회 실패: %s", exc, exc_info=True)
+                continue
+            by_uuid = {str(row.get("uuid")): row for row in rows or [] if isinstance(row, dict)}
+            for order in waiting:
+                row = by_uuid.get(str(order.order_uuid))
+                if row is not None:
+                    self._apply_order_state(order, row)
+
+    async def _resolve_by_identifier(self, order: LiquidationOrderResult) -> None:
+        """응답을 확정하지 못한 주문이 실제로 접수됐는지 identifier 로 확인합니다."""
+        try:
+            row = await self.broker.get_order(identifier=order.identifier)
+        except Exception as exc:
+            logger.warning("비상 청산 주문 접수 확인 실패: market=%s error=%s", order.market, exc)
+            return
+        if isinstance(row, dict) and row.get("uuid"):
+            order.order_uuid = str(row["uuid"])
+            order.status = "submitted"
+            order.error = None
+            self._apply_order_state(order, row)
+
+    @staticmethod
+    def _apply_order_state(order: LiquidationOrderResult, row: dict[str, Any]) -> None:
+        executed_volume = _to_float(row.get("executed_volume"))
+        order.executed_volume = executed_volume
+        executed_funds = _to_float(row.get("executed_funds"))
+        if executed_funds > 0:
+            order.executed_krw = executed_funds
+        elif executed_volume > 0 and order.price:
+            order.executed_krw = executed_volume * order.price
+
+        state = str(row.get("state") or "").strip().lower()
+        order.order_state = state or order.order_state
+        if state == "done":
+            order.status = "filled"
+        elif state == "cancel":
+            # 시장가 매도는 호가가 부족하면 일부만 체결되고 잔량이 취소된 채 끝납니다.
+            order.status = "partially_filled" if executed_volume > 0 else "cancelled"
+        elif executed_volume > 0:
+            order.status = "partially_filled"
+
+
+async def liquidate_all_positions(broker: Any | None = None) -> LiquidationReport:
+    return await LiquidationExecutor(broker).liquidate_all()
@@ -0,0 +1,415 @@
+"""실거래 주문의 체결 확정(reconciliation) 백그라운드 서비스.
+
+AI 매수/매도와 하드 TP/SL 은 주문 직후 상세 조회를 기다리지 않고 추정 체결가/수량으로
+``OrderHistory``(``fill_status="pending"``)와 포지션을 먼저 기록합니다. 이 서비스가 주문 uuid 를
+모아 ``get_orders_by_uuids`` 로 한 번에 조회하고, 체결이 끝난 주문만 실제 체결가/수량으로
+이력과 포지션을 보정합니다. 아직 끝나지 않은 주문은 지수 backoff 로 다시 조회합니다.
+한 건도 체결되지 않고 취소된 주문도 감사용으로 이력을 남기고 ``fill_status="cancelled"`` 로 표시합니다.
+
+서버가 재시작되면 DB 의 pending 이력을 다시 불러와 이어서 추적합니다.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.session import AsyncSessionLocal
+from app.models.domain import OrderHistory, Position
+from app.services.brokers.factory import BrokerFactory
+
+logger = logging.getLogger(__name__)
+
+# 업비트 uuids 조회는 한 번에 최대 100개까지 받습니다.
+ORDER_RECONCILE_BATCH_SIZE = 100
+ORDER_RECONCILE_MIN_BACKOFF_SECONDS = 1.0
+ORDER_RECONCILE_MAX_BACKOFF_SECONDS = 60.0
+# 이 시간이 지나도 체결이 확정되지 않으면 추정치를 그대로 두고 추적을 멈춥니다.
+ORDER_RECONCILE_MAX_AGE_SECONDS = 6 * 60 * 60.0
+FINAL_ORDER_STATES = frozenset({"done", "cancel"})
+# 업비트 시장가 매수는 주문 금액을 다 쓰고도 단위 미만 잔액 때문에 cancel 로 끝날 수 있어
+# 요청량 대비 이 비율 이내의 미체결은 전량 체결로 봅니다.
+ORDER_FULL_FILL_TOLERANCE = 1e-3
+
+FILL_STATUS_PENDING = "pending"
+FILL_STATUS_FILLED = "filled"
+FILL_STATUS_PARTIAL = "partial"
+FILL_STATUS_EXPIRED = "expired"
+FILL_STATUS_CANCELLED = "cancelled"
+
+
+@dataclass(slots=True)
+class TrackedOrder:
+    order_uuid: str
+    order_history_id: int
+    tracked_at: float
+    next_poll_at: float
+    attempts: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class OrderFill:
+    state: str
+    price: float
+    qty: float
+    executed_at: datetime | None = None
+    fully_filled: bool = False
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _parse_datetime(value: Any) -> datetime | None:
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+
+
+def _is_fully_filled(row: dict[str, Any], state: str, qty: float, funds: float) -> bool:
+    if state == "done":
+        return True
+    if qty <= 0:
+        return False
+    requested_volume = _to_float(row.get("volume"))
+    if requested_volume > 0:
+        return qty >= requested_volume * (1 - ORDER_FULL_FILL_TOLERANCE)
+    # 시장가 매수(ord_type=price)는 수량 없이 주문 금액(price)만 있습니다.
+    if str(row.get("ord_type") or "").strip().lower() == "price":
+        requested_funds = _to_float(row.get("price"))
+        return requested_funds > 0 and funds >= requested_funds * (1 - ORDER_FULL_FILL_TOLERANCE)
+    return False
+
+
+def _order_fill(
+    row: dict[str, Any],
+    state: str,
+    *,
+    qty: float,
+    funds: float,
+    executed_at: datetime | None,
+) -> OrderFill:
+    return OrderFill(
+        state=state,
+        price=funds / qty,
+        qty=qty,
+        executed_at=executed_at,
+        fully_filled=_is_fully_filled(row, state, qty, funds),
+    )
+
+
+def resolve_order_fill(row: dict[str, Any]) -> OrderFill | None:
+    """끝난 주문(done/cancel)의 평균 체결가와 체결 수량을 구합니다.
+
+    아직 진행 중이거나 체결 금액을 알 수 없으면 None 을 반환합니다(이 경우 상세 조회가 필요합니다).
+    ``fully_filled`` 는 상태가 아니라 요청량 대비 체결량으로 판단합니다.
+    """
+    state = str(row.get("state") or "").strip().lower()
+    if state not in FINAL_ORDER_STATES:
+        return None
+
+    executed_at = _parse_datetime(row.get("created_at"))
+    trades = row.get("trades")
+    if isinstance(trades, list) and trades:
+        total_qty = 0.0
+        total_funds = 0.0
+        for trade in trades:
+            if not isinstance(trade, dict):
+                continue
+            qty = _to_float(trade.get("volume"))
+            funds = _to_float(trade.get("funds")) or qty * _to_float(trade.get("price"))
+            if qty > 0 and funds > 0:
+                total_qty += qty
+                total_funds += funds
+        if total_qty > 0:
+            return _order_fill(row, state, qty=total_qty, funds=total_funds, executed_at=executed_at)
+
+    executed_qty = _to_float(row.get("executed_volume"))
+    if executed_qty <= 0:
+        return OrderFill(state=state, price=0.0, qty=0.0, executed_at=executed_at)
+    executed_funds = _to_float(row.get("executed_funds"))
+    if executed_funds > 0:
+        return _order_fill(row, state, qty=executed_qty, funds=executed_funds, executed_at=executed_at)
+    avg_price = _to_float(row.get("avg_price"))
+    if avg_price > 0:
+        return _order_fill(row, state, qty=executed_qty, funds=avg_price * executed_qty, executed_at=executed_at)
+    return None
+
+
+def reconcile_live_position(
+    position: Position,
+    *,
+    side: str,
+    provisional_price: float,
+    provisional_qty: float,
+    price: float,
+    qty: float,
+) -> None:
+    """추정치로 반영했던 체결을 되돌리고 실제 체결로 다시 반영합니다."""
+    current_qty = max(_to_float(position.quantity), 0.0)
+    if side == "buy":
+        current_cost = current_qty * max(_to_float(position.avg_entry_price), 0.0)
+        base_qty = max(current_qty - provisional_qty, 0.0)
+        base_cost = max(current_cost - provisional_qty * provisional_price, 0.0) if base_qty > 1e-12 else 0.0
+        new_qty = base_qty + qty
+        if new_qty > 1e-12:
+            position.avg_entry_price = (base_cost + qty * price) / new_qty
+        position.quantity = new_qty if new_qty > 1e-12 else 0.0
+    elif side == "sell":
+        new_qty = current_qty + provisional_qty - qty
+        position.quantity = new_qty if new_qty > 1e-12 else 0.0
+    else:
+        return
+    position.status = "open" if position.quantity > 1e-12 else "closed"
+
+
+class OrderFillReconciler:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        *,
+        broker: Any | None = None,
+        batch_size: int = ORDER_RECONCILE_BATCH_SIZE,
+        min_backoff: float = ORDER_RECONCILE_MIN_BACKOFF_SECONDS,
+        max_backoff: float = ORDER_RECONCILE_MAX_BACKOFF_SECONDS,
+        max_age: float = ORDER_RECONCILE_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._session_factory = session_factory
+        self._broker = broker
+        self.batch_size = max(1, min(int(batch_size), ORDER_RECONCILE_BATCH_SIZE))
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.max_age = max_age
+        self._clock = clock
+        self._tracked: dict[str, TrackedOrder] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def broker(self) -> Any:
+        if self._broker is None:
+            self._broker = BrokerFactory.get_broker("UPBIT")
+        return self._broker
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._tracked)
+
+    def track(self, order_uuid: str, order_history_id: int) -> None:
+        normalized_uuid = str(order_uuid or "").strip()
+        if not normalized_uuid:
+            return
+        now = self._clock()
+        self._tracked[normalized_uuid] = TrackedOrder(
+            order_uuid=normalized_uuid,
+            order_history_id=order_history_id,
+            tracked_at=now,
+            next_poll_at=now + self.min_backoff,
+        )
+        self._wakeup.set()
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        try:
+            await self._load_pending()
+        except Exception:
+            logger.exception("체결 확정 대기 주문을 불러오지 못했습니다. 새 주문부터 추적합니다.")
+        self._task = asyncio.create_task(self._run(), name="order-fill-reconciler")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def run_once(self) -> int:
+        """조회 시점이 된 주문을 묶음 조회해 확정하고, 확정한 주문 수를 반환합니다."""
+        now = self._clock()
+        due = sorted(
+            (order for order in self._tracked.values() if order.next_poll_at <= now),
+            key=lambda order: order.next_poll_at,
+        )
+        reconciled = 0
+        for start in range(0, len(due), self.batch_size):
+            reconciled += await self._reconcile_batch(due[start : start + self.batch_size])
+        return reconciled
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception:
+                logger.exception("주문 체결 확정 루프에서 오류가 발생했습니다.")
+            self._wakeup.clear()
+            timeout = None
+            if self._tracked:
+                next_poll_at = min(order.next_poll_at for order in self._tracked.values())
+                timeout = max(next_poll_at - self._clock(), 0.05)
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+
+    async def _load_pending(self) -> None:
+        async with self._session_factory() as db:
+            result = await db.execute(
+                select(OrderHistory.id, OrderHistory.broker_order_uuid).where(
+                    OrderHistory.fill_status == FILL_STATUS_PENDING,
+                    OrderHistory.broker_order_uuid.is_not(None),
+                )
+            )
+            rows = result.all()
+        for order_history_id, order_uuid in rows:
+            self.track(order_uuid, order_history_id)
+        if rows:
+            logger.info("체결 확정 대기 주문 %s건을 이어서 추적합니다.", len(rows))
+
+    async def _reconcile_batch(self, batch: list[TrackedOrder]) -> int:
+        try:
+            rows = await self.broker.get_orders_by_uuids([order.order_uuid for order in batch])
+        except Exception as exc:
+            logger.warning("주문 체결 묶음 조회 실패: count=%s error=%s", len(batch), exc)
+            await self._schedule_retries(batch)
+            return 0
+
+        by_uuid = {str(row.get("uuid")): row for row in rows or [] if isinstance(row, dict)}
+        fills: list[tuple[TrackedOrder, OrderFill]] = []
+        unresolved: list[TrackedOrder] = []
+        for order in batch:
+            row = by_uuid.get(order.order_uuid)
+            fill = resolve_order_fill(row) if row is not None else None
+            if fill is None and row is not None and str(row.get("state") or "") in FINAL_ORDER_STATES:
+                # 체결 금액이 목록 응답에 없을 때만 개별 상세 조회로 trades 를 확인합니다.
+                fill = await self._fetch_fill_detail(order.order_uuid)
+            if fill is None:
+                unresolved.append(order)
+            else:
+                fills.append((order, fill))
+
+        applied = 0
+        if fills:
+            try:
+                applied = await self._apply_fills(fills)
+            except Exception:
+                logger.exception("주문 체결 확정 반영 실패: count=%s", len(fills))
+                unresolved.extend(order for order, _fill in fills)
+            else:
+                for order, _fill in fills:
+                    self._tracked.pop(order.order_uuid, None)
+        await self._schedule_retries(unresolved)
+        return applied
+
+    async def _fetch_fill_detail(self, order_uuid: str) -> OrderFill | None:
+        try:
+            detail = await self.broker.get_order(uuid_=order_uuid)
+        except Exception as exc:
+            logger.warning("주문 상세 조회 실패: uuid=%s error=%s", order_uuid, exc)
+            return None
+        return resolve_order_fill(detail) if isinstance(detail, dict) else None
+
+    async def _schedule_retries(self, orders: list[TrackedOrder]) -> None:
+        now = self._clock()
+        expired_ids: list[int] = []
+        for order in orders:
+            if now - order.tracked_at >= self.max_age:
+                self._tracked.pop(order.order_uuid, None)
+                expired_ids.append(order.order_history_id)
+                logger.warning(
+                    "주문 체결 확정 포기: uuid=%s order_history_id=%s 추정 체결값을 유지합니다.",
+                    order.order_uuid,
+                    order.order_history_id,
+                )
+                continue
+            order.attempts += 1
+            order.next_poll_at = now + min(self.min_backoff * (2**order.attempts), self.max_backoff)
+        if expired_ids:
+            await self._mark_expired(expired_ids)
+
+    async def _mark_expired(self, order_history_ids: list[int]) -> None:
+        try:
+            async with self._session_factory() as db:
+                result = await db.execute(
+                    select(OrderHistory).where(
+                        OrderHistory.id.in_(order_history_ids),
+                        OrderHistory.fill_status == FILL_STATUS_PENDING,
+                    )
+                )
+                for history in result.scalars().all():
+                    history.fill_status = FILL_STATUS_EXPIRED
+                await db.commit()
+        except Exception:
+            logger.exception("주문 체결 확정 만료 기록 실패: order_history_ids=%s", order_history_ids)
+
+    async def _apply_fills(self, fills: list[tuple[TrackedOrder, OrderFill]]) -> int:
+        history_ids = [order.order_history_id for order, _fill in fills]
+        async with self._session_factory() as db:
+            try:
+                result = await db.execute(select(OrderHistory).where(OrderHistory.id.in_(history_ids)))
+                histories = {history.id: history for history in result.scalars().all()}
+                position_ids = {history.position_id for history in histories.values()}
+                position_result = await db.execute(
+                    select(Position).where(Position.id.in_(position_ids)).with_for_update()
+                )
+                positions = {position.id: position for position in position_result.scalars().all()}
+
+                applied = 0
+                for order, fill in fills:
+                    history = histories.get(order.order_history_id)
+                    if history is None or history.fill_status != FILL_STATUS_PENDING:
+                        continue
+                    provisional_price, provisional_qty = history.price, history.qty
+                    position = positions.get(history.position_id)
+                    if position is not None and not history.is_paper:
+                        reconcile_live_position(
+                            position,
+                            side=history.side,
+                            provisional_price=provisional_price,
+                            provisional_qty=provisional_qty,
+                            price=fill.price,
+                            qty=fill.qty,
+                        )
+                    if fill.qty <= 0:
+                        # 한 건도 체결되지 않은 주문도 제출 기록은 남기고 수량만 0 으로 둡니다.
+                        history.qty = 0.0
+                        history.fill_status = FILL_STATUS_CANCELLED
+                    else:
+                        history.price = fill.price
+                        history.qty = fill.qty
+                        history.fill_status = FILL_STATUS_FILLED if fill.fully_filled else FILL_STATUS_PARTIAL
+                        if fill.executed_at is not None:
+                            history.executed_at = fill.executed_at
+                    applied += 1
+                    logger.info(
+                        "주문 체결 확정: uuid=%s side=%s state=%s price=%s qty=%s 추정 price=%s qty=%s",
+                        order.order_uuid,
+                        history.side,
+                        fill.state,
+                        fill.price,
+                        fill.qty,
+                        provisional_price,
+                        provisional_qty,
+                    )
+                await db.commit()
+                return applied
+            except Exception:
+                await db.rollback()
+                raise
+
+
+order_reconciler = OrderFillReconciler()
@@ -1,4 +1,6 @@
 import uuid
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
 
@@ -54,14 +56,18 @@ async def get_trading_mode(db: AsyncSession) -> str:
     return _normalize_trading_mode(raw_value)
 
 
+def _parse_paper_cash_balance(raw_value: str | None) -> float:
+    parsed = _to_float(raw_value)
+    return parsed if parsed >= 0 else DEFAULT_PAPER_KRW_BALANCE
+
+
 async def load_paper_cash_balance(db: AsyncSession) -> float:
     raw_value = await get_system_config_value(
         db,
         PAPER_TRADING_KRW_BALANCE_KEY,
         str(DEFAULT_PAPER_KRW_BALANCE),
     )
-    parsed = _to_float(raw_value)
-    return parsed if parsed >= 0 else DEFAULT_PAPER_KRW_BALANCE
+    return _parse_paper_cash_balance(raw_value)
 
 
 def build_paper_order_result(
@@ -94,72 +100,6 @@ def build_paper_order_result(
     }
 
 
-async def _get_or_create_paper_cash_config(db: AsyncSession) -> SystemConfig:
-    result = await db.execute(
-        select(SystemConfig).where(SystemConfig.config_key == PAPER_TRADING_KRW_BALANCE_KEY)
-    )
-    config = result.scalar_one_or_none()
-    if config is not None:
-        return config
-
-    config = SystemConfig(
-        config_key=PAPER_TRADING_KRW_BALANCE_KEY,
-        config_value=_fmt_number(DEFAULT_PAPER_KRW_BALANCE),
-        description=PAPER_BALANCE_DESCRIPTION,
-    )
-    db.add(config)
-    await db.flush()
-    return config
-
-
-async def _get_or_create_asset(db: AsyncSession, market: str) -> Asset:
-    normalized_market = _normalize_symbol(market)
-    result = await db.execute(select(Asset).where(Asset.symbol == normalized_market))
-    asset = result.scalar_one_or_none()
-    if asset is not None:
-        return asset
-
-    asset = Asset(
-        symbol=normalized_market,
-        asset_type="crypto",
-        base_currency="KRW",
-        is_active=True,
-    )
-    db.add(asset)
-    await db.flush()
-    return asset
-
-
-async def _get_existing_paper_position(db: AsyncSession, asset_id: int) -> Position | None:
-    result = await db.execute(
-        select(Position)
-        .where(Position.asset_id == asset_id, Position.is_paper.is_(True))
-        .order_by(Position.id.asc())
-    )
-    return result.scalars().first()
-
-
-async def _get_or_create_paper_position(
-    db: AsyncSession,
-    asset_id: int,
-    fallback_price: float,
-) -> Position:
-    position = await _get_existing_paper_position(db, asset_id)
-    if position is not None:
-        return position
-
-    position = Position(
-        asset_id=asset_id,
-        avg_entry_price=max(fallback_price, 0.0),
-        quantity=0.0,
-        status="open",
-        is_paper=True,
-    )
-    db.add(position)
-    await db.flush()
-    return position
-
-
 async def list_paper_accounts(db: AsyncSession) -> list[dict[str, Any]]:
     cash_balance = await load_paper_cash_balance(db)
     result = await db.execute(
@@ -193,84 +133,300 @@ async def list_paper_accounts(db: AsyncSession) -> list[dict[str, Any]]:
     return accounts
 
 
-async def apply_paper_fill(
-    *,
-    db: AsyncSession,
-    symbol: str,
-    side: str,
-    executed_price: float,
-    executed_qty: float,
-    executed_at: datetime | None = None,
-    ai_analysis_log_id: int | None = None,
-    order_reason: str | None = None,
-    broker_name: str = PAPER_BROKER_NAME,
-) -> dict[str, Any]:
-    normalized_symbol = _normalize_symbol(symbol)
-    normalized_side = str(side or "").strip().lower()
-    resolved_price = max(_to_float(executed_price), 0.0)
-    resolved_qty = max(_to_float(executed_qty), 0.0)
-    resolved_executed_at = executed_at or datetime.now(UTC)
+@dataclass(frozen=True, slots=True)
+class PaperFill:
+    symbol: str
+    side: str
+    executed_price: float
+    executed_qty: float
+    # 매수는 차감할 KRW, 매도는 회수할 KRW 입니다. 없으면 가격 x 수량을 씁니다.
+    cash_amount: float | None = None
+    executed_at: datetime | None = None
+    ai_analysis_log_id: int | None = None
+    order_reason: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PaperFillResult:
+    symbol: str
+    side: str
+    cash_after: float
+    position_id: int
+    position_qty: float
+    position_status: str
+
+
+def _normalize_paper_fill(fill: PaperFill) -> PaperFill:
+    normalized_side = str(fill.side or "").strip().lower()
+    resolved_price = max(_to_float(fill.executed_price), 0.0)
+    resolved_qty = max(_to_float(fill.executed_qty), 0.0)
+    resolved_executed_at = fill.executed_at or datetime.now(UTC)
     if resolved_executed_at.tzinfo is None:
         resolved_executed_at = resolved_executed_at.replace(tzinfo=UTC)
     else:
         resolved_executed_at = resolved_executed_at.astimezone(UTC)
 
     if normalized_side not in {"buy", "sell"}:
-        raise ValueError(f"unsupported_paper_side:{side}")
+        raise ValueError(f"unsupported_paper_side:{fill.side}")
     if resolved_price <= 0:
         raise ValueError("paper_execution_price_invalid")
     if resolved_qty <= 0:
         raise ValueError("paper_execution_qty_invalid")
 
-    cash_config = await _get_or_create_paper_cash_config(db)
-    current_cash = await load_paper_cash_balance(db)
-    cash_config.config_value = _fmt_number(current_cash)
-    asset = await _get_or_create_asset(db, normalized_symbol)
+    cash_amount = (
+        resolved_price * resolved_qty
+        if fill.cash_amount is None
+        else max(_to_float(fill.cash_amount), 0.0)
+    )
+    return PaperFill(
+        symbol=_normalize_symbol(fill.symbol),
+        side=normalized_side,
+        executed_price=resolved_price,
+        executed_qty=resolved_qty,
+        cash_amount=cash_amount,
+        executed_at=resolved_executed_at,
+        ai_analysis_log_id=fill.ai_analysis_log_id,
+        order_reason=fill.order_reason,
+    )
 
-    if normalized_side == "buy":
-        order_value = resolved_price * resolved_qty
-        if order_value > current_cash + PAPER_BALANCE_EPSILON:
+
+def settle_paper_fill(
+    cash_balance: float,
+    position_qty: float,
+    avg_entry_price: float,
+    fill: PaperFill,
+) -> tuple[float, float, float]:
+    """정규화된 체결 하나를 (현금, 보유 수량, 평단)에 반영한 값을 돌려줍니다.
+
+    DB 원장(``PaperLedger``)과 의사결정 replay 가 같은 정산 규칙을 쓰도록 순수 함수로 둡니다.
+    """
+    cash_amount = _to_float(fill.cash_amount)
+    if fill.side == "buy":
+        if cash_amount > cash_balance + PAPER_BALANCE_EPSILON:
             raise ValueError("paper_krw_balance_insufficient")
+        new_qty = position_qty + fill.executed_qty
+        weighted_cost = (position_qty * avg_entry_price) + cash_amount
+        next_avg_entry_price = weighted_cost / new_qty if new_qty > 0 else fill.executed_price
+        return max(cash_balance - cash_amount, 0.0), new_qty, next_avg_entry_price
 
-        position = await _get_or_create_paper_position(db, asset.id, resolved_price)
-        previous_qty = max(_to_float(position.quantity), 0.0)
-        new_qty = previous_qty + resolved_qty
-        weighted_cost = (previous_qty * max(_to_float(position.avg_entry_price), 0.0)) + order_value
+    if fill.executed_qty > position_qty + PAPER_BALANCE_EPSILON:
+        raise ValueError("paper_coin_balance_insufficient")
+    remaining_qty = max(position_qty - fill.executed_qty, 0.0)
+    if remaining_qty <= PAPER_BALANCE_EPSILON:
+        remaining_qty = 0.0
+    return cash_balance + cash_amount, remaining_qty, avg_entry_price
 
-        position.avg_entry_price = weighted_cost / new_qty if new_qty > 0 else resolved_price
-        position.quantity = new_qty
-        position.status = "open"
-        cash_after = max(current_cash - order_value, 0.0)
-    else:
-        position = await _get_existing_paper_position(db, asset.id)
-        available_qty = max(_to_float(position.quantity) if position is not None else 0.0, 0.0)
-        if position is None or resolved_qty > available_qty + PAPER_BALANCE_EPSILON:
+
+# Asset 행은 삭제되지 않으므로 커밋된 것으로 확인된 id 만 프로세스 단위로 캐시합니다.
+_paper_asset_ids: dict[str, int] = {}
+
+
+def clear_paper_asset_cache() -> None:
+    _paper_asset_ids.clear()
+
+
+class PaperLedger:
+    """paper 현금/포지션을 한 트랜잭션 안에서 갱신하는 원장.
+
+    현금 계정(``paper_trading_krw_balance`` 설정 행)과 대상 포지션을 ``SELECT … FOR UPDATE``
+    로 잠근 뒤 메모리에서 체결을 반영하고 마지막에 한 번만 flush 합니다. 커밋은 호출자가
+    하며, 체결 도중 ValueError 가 나면 호출자가 rollback 해야 합니다.
+    """
+
+    def __init__(self, db: AsyncSession, *, broker_name: str = PAPER_BROKER_NAME) -> None:
+        self.db = db
+        self.broker_name = broker_name
+        self._cash_config: SystemConfig | None = None
+        self._cash_balance = 0.0
+        self._positions: dict[int, Position | None] = {}
+
+    async def cash_balance(self) -> float:
+        await self._lock_cash_account()
+        return self._cash_balance
+
+    async def position_quantities(self, symbols: Sequence[str]) -> dict[str, float]:
+        normalized_symbols = list(dict.fromkeys(_normalize_symbol(symbol) for symbol in symbols))
+        asset_ids = await self._resolve_asset_ids(normalized_symbols, create=False)
+        await self._load_positions(asset_ids.values())
+        quantities: dict[str, float] = {}
+        for symbol in normalized_symbols:
+            position = self._positions.get(asset_ids[symbol]) if symbol in asset_ids else None
+            quantities[symbol] = max(_to_float(position.quantity), 0.0) if position is not None else 0.0
+        return quantities
+
+    async def apply(self, fill: PaperFill) -> PaperFillResult:
+        return (await self.apply_many([fill]))[0]
+
+    async def apply_many(self, fills: Sequence[PaperFill]) -> list[PaperFillResult]:
+        normalized_fills = [_normalize_paper_fill(fill) for fill in fills]
+        if not normalized_fills:
+            return []
+
+        cash_config = await self._lock_cash_account()
+        asset_ids = await self._resolve_asset_ids(
+            list(dict.fromkeys(fill.symbol for fill in normalized_fills)),
+            create=True,
+        )
+        await self._load_positions(asset_ids.values())
+
+        results = [
+            await self._apply_one(fill, asset_ids[fill.symbol])
+            for fill in normalized_fills
+        ]
+        cash_config.config_value = _fmt_number(self._cash_balance)
+        await self.db.flush()
+        return results
+
+    async def _lock_cash_account(self) -> SystemConfig:
+        if self._cash_config is not None:
+            return self._cash_config
+
+        result = await self.db.execute(
+            select(SystemConfig)
+            .where(SystemConfig.config_key == PAPER_TRADING_KRW_BALANCE_KEY)
+            .with_for_update()
+        )
+        config = result.scalar_one_or_none()
+        if config is None:
+            config = SystemConfig(
+                config_key=PAPER_TRADING_KRW_BALANCE_KEY,
+                config_value=_fmt_number(DEFAULT_PAPER_KRW_BALANCE),
+                description=PAPER_BALANCE_DESCRIPTION,
+            )
+            self.db.add(config)
+            await self.db.flush()
+
+        self._cash_config = config
+        self._cash_balance = _parse_paper_cash_balance(config.config_value)
+        return config
+
+    async def _resolve_asset_ids(self, symbols: Sequence[str], *, create: bool) -> dict[str, int]:
+        missing = [symbol for symbol in symbols if symbol not in _paper_asset_ids]
+        if missing:
+            result = await self.db.execute(select(Asset.symbol, Asset.id).where(Asset.symbol.in_(missing)))
+            for symbol, asset_id in result.all():
+                _paper_asset_ids[symbol] = asset_id
+
+        resolved = {symbol: _paper_asset_ids[symbol] for symbol in symbols if symbol in _paper_asset_ids}
+        if not create:
+            return resolved
+
+        for symbol in symbols:
+            if symbol in resolved:
+                continue
+            asset = Asset(
+                symbol=symbol,
+                asset_type="crypto",
+                base_currency="KRW",
+                is_active=True,
+            )
+            self.db.add(asset)
+            await self.db.flush()
+            # 아직 커밋 전이므로 캐시에는 넣지 않습니다.
+            resolved[symbol] = asset.id
+        return resolved
+
+    async def _load_positions(self, asset_ids: Iterable[int]) -> None:
+        missing = [asset_id for asset_id in dict.fromkeys(asset_ids) if asset_id not in self._positions]
+        if not missing:
+            return
+        result = await self.db.execute(
+            select(Position)
+            .where(Position.asset_id.in_(missing), Position.is_paper.is_(True))
+            .order_by(Position.id.asc())
+            .with_for_update()
+        )
+        for position in result.scalars().all():
+            self._positions.setdefault(position.asset_id, position)
+        for asset_id in missing:
+            self._positions.setdefault(asset_id, None)
+
+    async def _apply_one(self, fill: PaperFill, asset_id: int) -> PaperFillResult:
+        position = self._positions.get(asset_id)
+        if fill.side == "sell" and position is None:
             raise ValueError("paper_coin_balance_insufficient")
 
-        remaining_qty = max(available_qty - resolved_qty, 0.0)
-        position.quantity = 0.0 if remaining_qty <= PAPER_BALANCE_EPSILON else remaining_qty
+        if fill.side == "buy" and position is None:
+            if _to_float(fill.cash_amount) > self._cash_balance + PAPER_BALANCE_EPSILON:
+                raise ValueError("paper_krw_balance_insufficient")
+            position = Position(
+                asset_id=asset_id,
+                avg_entry_price=fill.executed_price,
+                quantity=0.0,
+                status="open",
+                is_paper=True,
+            )
+            self.db.add(position)
+            await self.db.flush()
+            self._positions[asset_id] = position
+
+        self._cash_balance, position.quantity, position.avg_entry_price = settle_paper_fill(
+            self._cash_balance,
+            max(_to_float(position.quantity), 0.0),
+            max(_to_float(position.avg_entry_price), 0.0),
+            fill,
+        )
         position.status = "closed" if position.quantity <= PAPER_BALANCE_EPSILON else "open"
-        cash_after = current_cash + (resolved_price * resolved_qty)
 
-    cash_config.config_value = _fmt_number(cash_after)
-    db.add(
-        OrderHistory(
+        self.db.add(
+            OrderHistory(
+                position_id=position.id,
+                ai_analysis_log_id=fill.ai_analysis_log_id,
+                side=fill.side,
+                order_reason=fill.order_reason,
+                is_paper=True,
+                price=fill.executed_price,
+                qty=fill.executed_qty,
+                broker=self.broker_name,
+                executed_at=fill.executed_at,
+            )
+        )
+        return PaperFillResult(
+            symbol=fill.symbol,
+            side=fill.side,
+            cash_after=self._cash_balance,
             position_id=position.id,
+            position_qty=max(_to_float(position.quantity), 0.0),
+            position_status=position.status,
+        )
+
+
+async def apply_paper_fills(
+    db: AsyncSession,
+    fills: Sequence[PaperFill],
+    *,
+    broker_name: str = PAPER_BROKER_NAME,
+) -> list[PaperFillResult]:
+    return await PaperLedger(db, broker_name=broker_name).apply_many(fills)
+
+
+async def apply_paper_fill(
+    *,
+    db: AsyncSession,
+    symbol: str,
+    side: str,
+    executed_price: float,
+    executed_qty: float,
+    executed_at: datetime | None = None,
+    ai_analysis_log_id: int | None = None,
+    order_reason: str | None = None,
+    broker_name: str = PAPER_BROKER_NAME,
+) -> dict[str, Any]:
+    result = await PaperLedger(db, broker_name=broker_name).apply(
+        PaperFill(
+            symbol=symbol,
+            side=side,
+            executed_price=executed_price,
+            executed_qty=executed_qty,
+            executed_at=executed_at,
             ai_analysis_log_id=ai_analysis_log_id,
-            side=normalized_side,
             order_reason=order_reason,
-            is_paper=True,
-            price=resolved_price,
-            qty=resolved_qty,
-            broker=broker_name,
-            executed_at=resolved_executed_at,
         )
     )
-    await db.flush()
     return {
-        "cash_after": cash_after,
-        "position_qty": max(_to_float(position.quantity), 0.0),
-        "position_status": position.status,
+        "cash_after": result.cash_after,
+        "position_qty": result.position_qty,
+        "position_status": result.position_status,
     }
 
 
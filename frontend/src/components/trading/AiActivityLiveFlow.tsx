@@ -1,5 +1,6 @@
 import { useQuery } from '@tanstack/react-query'
 
+import { resolveLiveRefetchInterval, useLiveConnected } from '../../hooks/useLiveUpdates'
 import { getBotStatus, type BotStatus } from '../../services/api'
 
 interface FlowItem {
@@ -83,10 +84,12 @@ function resolveToneClassName(tone: FlowItem['tone']): string {
 }
 
 function AiActivityLiveFlow() {
+  const isLiveConnected = useLiveConnected()
   const botStatusQuery = useQuery({
     queryKey: ['bot-status'],
     queryFn: getBotStatus,
-    refetchInterval: (query) => (query.state.status === 'error' ? 30000 : 15000),
+    refetchInterval: (query) =>
+      query.state.status === 'error' ? 30000 : resolveLiveRefetchInterval(isLiveConnected, 15000),
     refetchIntervalInBackground: true,
     placeholderData: (previousData) => previousData,
     retry: 1,
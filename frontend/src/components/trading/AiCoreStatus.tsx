@@ -1,6 +1,7 @@
 import { useQuery } from '@tanstack/react-query'
 import { useEffect, useState } from 'react'
 
+import { resolveLiveRefetchInterval, useLiveConnected } from '../../hooks/useLiveUpdates'
 import { getBotStatus } from '../../services/api'
 
 function resolveTickerText(
@@ -66,10 +67,12 @@ function AnimatedTicker({ text }: { text: string }) {
 }
 
 function AiCoreStatus() {
+  const isLiveConnected = useLiveConnected()
   const botStatusQuery = useQuery({
     queryKey: ['bot-status'],
     queryFn: getBotStatus,
-    refetchInterval: (query) => (query.state.status === 'error' ? 30000 : 15000),
+    refetchInterval: (query) =>
+      query.state.status === 'error' ? 30000 : resolveLiveRefetchInterval(isLiveConnected, 15000),
     refetchIntervalInBackground: true,
     placeholderData: (previousData) => previousData,
     retry: 1,
@@ -3,6 +3,7 @@ import { isAxiosError } from 'axios'
 import { Loader2 } from 'lucide-react'
 import { useEffect, useState } from 'react'
 
+import { resolveLiveRefetchInterval, useLiveConnected } from '../../hooks/useLiveUpdates'
 import { useSystemConfigs } from '../../hooks/useSystemConfigs'
 import { getBotStatus, startBot, stopBot } from '../../services/api'
 
@@ -77,11 +78,12 @@ function BotControlPanel({ portfolioError = null }: BotControlPanelProps) {
   const [activeAction, setActiveAction] = useState<ActionType>(null)
   const [notice, setNotice] = useState<NoticeState | null>(null)
   const systemConfigsQuery = useSystemConfigs()
+  const isLiveConnected = useLiveConnected()
 
   const botStatusQuery = useQuery({
     queryKey: ['bot-status'],
     queryFn: getBotStatus,
-    refetchInterval: 5000,
+    refetchInterval: resolveLiveRefetchInterval(isLiveConnected, 5000),
     refetchIntervalInBackground: true,
     placeholderData: (previousData) => previousData,
   })
@@ -39,7 +39,7 @@ function ControlPanel() {
     setSuccessMessage(null)
 
     try {
-      await liquidateAll()
+      const report = await liquidateAll()
       queryClient.setQueryData<BotStatus>(['bot-status'], (previous) => ({
         running: false,
         last_heartbeat: previous?.last_heartbeat ?? null,
@@ -47,7 +47,7 @@ function ControlPanel() {
         latest_action: 'AI 엔진 대기 중...',
       }))
       void queryClient.invalidateQueries({ queryKey: ['bot-status'] })
-      setSuccessMessage('전량 롤백 요청을 전송했습니다.')
+      setSuccessMessage(report.message)
     } catch (error) {
       setErrorMessage(resolveErrorMessage(error, '전량 롤백 요청에 실패했습니다.'))
     } finally {
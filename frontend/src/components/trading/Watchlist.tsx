@@ -4,6 +4,7 @@ import { Loader2, X } from 'lucide-react'
 import { useMemo, useState } from 'react'
 
 import { fetchFavorites, fetchTickers, removeFavorite, type TickerItem } from '../../api/markets'
+import { resolveLiveRefetchInterval, useLiveConnected } from '../../hooks/useLiveUpdates'
 
 interface WatchlistProps {
   selectedSymbol?: string | null
@@ -37,6 +38,7 @@ function formatSignedPercent(rate: number): string {
 
 function Watchlist({ selectedSymbol = null, onSelectSymbol }: WatchlistProps) {
   const queryClient = useQueryClient()
+  const isLiveConnected = useLiveConnected()
   const [actionError, setActionError] = useState<string | null>(null)
   const [pendingSymbol, setPendingSymbol] = useState<string | null>(null)
 
@@ -55,7 +57,7 @@ function Watchlist({ selectedSymbol = null, onSelectSymbol }: WatchlistProps) {
     queryKey: tickerQueryKey,
     queryFn: () => fetchTickers(symbols),
     enabled: symbols.length > 0,
-    refetchInterval: 3000,
+    refetchInterval: resolveLiveRefetchInterval(isLiveConnected, 3000),
     refetchIntervalInBackground: true,
     placeholderData: (previousData) => previousData,
   })
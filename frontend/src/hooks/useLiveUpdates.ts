@@ -0,0 +1,116 @@
+import { useQueryClient } from '@tanstack/react-query'
+import { useEffect, useSyncExternalStore } from 'react'
+
+import type { TickerItem } from '../api/markets'
+import { API_BASE_URL } from '../services/api'
+import type { BotStatus } from '../services/api'
+import type { PortfolioSummary } from '../services/portfolioService'
+import { AI_PERFORMANCE_QUERY_KEY } from './useAIPerformance'
+import { PORTFOLIO_SUMMARY_QUERY_KEY } from './usePortfolioSummary'
+
+// SSE 연결 중에는 폴링을 끄지 않고 이 주기로 늘려 놓친 이벤트에 대한 안전망으로만 씁니다.
+export const LIVE_FALLBACK_REFETCH_MS = 60000
+
+interface AnalysisEvent {
+  id: number
+  symbol?: string
+}
+
+let liveConnected = false
+const connectionListeners = new Set<() => void>()
+
+function setLiveConnected(nextConnected: boolean): void {
+  if (liveConnected === nextConnected) {
+    return
+  }
+  liveConnected = nextConnected
+  connectionListeners.forEach((listener) => listener())
+}
+
+function subscribeConnection(listener: () => void): () => void {
+  connectionListeners.add(listener)
+  return () => {
+    connectionListeners.delete(listener)
+  }
+}
+
+export function useLiveConnected(): boolean {
+  return useSyncExternalStore(subscribeConnection, () => liveConnected)
+}
+
+export function resolveLiveRefetchInterval(isLiveConnected: boolean, pollingMs: number): number {
+  return isLiveConnected ? Math.max(pollingMs, LIVE_FALLBACK_REFETCH_MS) : pollingMs
+}
+
+function parseEventData<T>(event: Event): T | null {
+  try {
+    return JSON.parse((event as MessageEvent<string>).data) as T
+  } catch {
+    return null
+  }
+}
+
+function mergeTickers(previous: TickerItem[] | undefined, changed: TickerItem[]): TickerItem[] | undefined {
+  if (!previous) {
+    return previous
+  }
+  const changedBySymbol = new Map(changed.map((item) => [item.symbol, item]))
+  return previous.map((item) => changedBySymbol.get(item.symbol) ?? item)
+}
+
+export function useLiveUpdates(): void {
+  const queryClient = useQueryClient()
+
+  useEffect(() => {
+    if (typeof window === 'undefined' || typeof EventSource === 'undefined') {
+      return
+    }
+
+    const source = new EventSource(`${API_BASE_URL}/live/stream`)
+    source.addEventListener('ready', () => setLiveConnected(true))
+    source.onerror = () => setLiveConnected(false)
+
+    source.addEventListener('portfolio', (event) => {
+      const portfolio = parseEventData<PortfolioSummary>(event)
+      if (portfolio) {
+        queryClient.setQueryData(PORTFOLIO_SUMMARY_QUERY_KEY, portfolio)
+      }
+    })
+    source.addEventListener('tickers', (event) => {
+      const changed = parseEventData<TickerItem[]>(event)
+      if (changed && changed.length > 0) {
+        queryClient.setQueriesData<TickerItem[]>({ queryKey: ['watchlist-tickers'] }, (previous) =>
+          mergeTickers(previous, changed),
+        )
+      }
+    })
+    source.addEventListener('bot_status', (event) => {
+      const botStatus = parseEventData<BotStatus>(event)
+      if (botStatus) {
+        queryClient.setQueryData(['bot-status'], botStatus)
+      }
+    })
+    source.addEventListener('analysis', (event) => {
+      const analysis = parseEventData<AnalysisEvent>(event)
+      void queryClient.invalidateQueries({
+        queryKey: analysis?.symbol ? ['latest-ai-analysis', analysis.symbol] : ['latest-ai-analysis'],
+      })
+    })
+    source.addEventListener('order_fill', () => {
+      void Promise.all([
+        queryClient.invalidateQueries({ queryKey: ['dashboard-orders'] }),
+        queryClient.invalidateQueries({ queryKey: PORTFOLIO_SUMMARY_QUERY_KEY }),
+        queryClient.invalidateQueries({ queryKey: AI_PERFORMANCE_QUERY_KEY }),
+      ])
+    })
+    // 서버가 느린 연결의 밀린 이벤트를 버렸다는 뜻이므로 화면 전체를 다시 불러옵니다.
+    source.addEventListener('resync', () => {
+      void queryClient.invalidateQueries()
+    })
+
+    return () => {
+      source.close()
+      setLiveConnected(false)
+    }
+  }, [queryClient])
+}
@@ -1,10 +1,13 @@
 import { useQuery } from '@tanstack/react-query'
 
 import { getPortfolioSummary } from '../services/portfolioService'
+import { resolveLiveRefetchInterval, useLiveConnected } from './useLiveUpdates'
 
 export const PORTFOLIO_SUMMARY_QUERY_KEY = ['portfolio-summary'] as const
 
 export function usePortfolioSummary() {
+  const isLiveConnected = useLiveConnected()
+
   return useQuery({
     queryKey: PORTFOLIO_SUMMARY_QUERY_KEY,
     queryFn: getPortfolioSummary,
@@ -12,7 +15,7 @@ export function usePortfolioSummary() {
       if (query.state.status === 'error' || query.state.data?.is_stale) {
         return 30000
       }
-      return 15000
+      return resolveLiveRefetchInterval(isLiveConnected, 15000)
     },
     refetchIntervalInBackground: true,
     placeholderData: (previousData) => previousData,
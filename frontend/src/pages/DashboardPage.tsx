@@ -14,6 +14,7 @@ import MarketChart from '../components/trading/MarketChart'
 import PortfolioChart from '../components/trading/PortfolioChart'
 import RecentOrders from '../components/trading/RecentOrders'
 import WatchlistSidebar from '../components/trading/Watchlist'
+import { resolveLiveRefetchInterval, useLiveConnected, useLiveUpdates } from '../hooks/useLiveUpdates'
 import { usePortfolioSummary } from '../hooks/usePortfolioSummary'
 import { fetchOrders } from '../services/portfolioService'
 import type { AssetItem } from '../services/portfolioService'
@@ -26,11 +27,14 @@ function DashboardPage() {
   const [searchParams, setSearchParams] = useSearchParams()
   const [macroTab, setMacroTab] = useState<'sentiment' | 'news'>('sentiment')
   const [rightPanelTab, setRightPanelTab] = useState<'portfolio' | 'performance'>('portfolio')
+  useLiveUpdates()
+  const isLiveConnected = useLiveConnected()
   const portfolioSummaryQuery = usePortfolioSummary()
   const ordersQuery = useQuery({
     queryKey: ['dashboard-orders'],
     queryFn: fetchOrders,
-    refetchInterval: (query) => (query.state.status === 'error' ? 30000 : 15000),
+    refetchInterval: (query) =>
+      query.state.status === 'error' ? 30000 : resolveLiveRefetchInterval(isLiveConnected, 15000),
     refetchIntervalInBackground: true,
     placeholderData: (previousData) => previousData,
     retry: 1,
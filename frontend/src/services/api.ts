@@ -1,6 +1,6 @@
 import axios, { AxiosHeaders } from 'axios'
 
-const API_BASE_URL = import.meta.env.VITE_API_BASE_URL ?? 'http://localhost:8000/api'
+export const API_BASE_URL = import.meta.env.VITE_API_BASE_URL ?? 'http://localhost:8000/api'
 const ADMIN_TOKEN_STORAGE_KEY = 'ai-trade-manager-admin-token'
 
 export const ADMIN_TOKEN_REQUIRED_EVENT = 'ai-trade-manager:admin-token-required'
@@ -119,6 +119,28 @@ export interface BotConfig {
   trade_mode?: string
 }
 
+export interface LiquidationOrderItem {
+  market: string
+  currency: string
+  volume: number
+  price: number | null
+  estimated_krw: number | null
+  status: string
+  order_uuid: string | null
+  executed_volume: number
+  executed_krw: number | null
+  submitted_after_seconds: number | null
+  error: string | null
+}
+
+export interface LiquidationReport {
+  run_id: string
+  message: string
+  submit_seconds: number
+  total_seconds: number
+  results: LiquidationOrderItem[]
+}
+
 export interface BotStatus {
   running: boolean
   last_heartbeat: string | null
@@ -330,9 +352,10 @@ export async function updateBotConfig(config: BotConfig): Promise<BotConfig> {
   return data
 }
 
-export async function liquidateAll(): Promise<void> {
+export async function liquidateAll(): Promise<LiquidationReport> {
   await requestAdminToken('전량 롤백')
-  await apiClient.post('/bot/liquidate')
+  const { data } = await apiClient.post<LiquidationReport>('/bot/liquidate')
+  return data
 }
 
 export async function getMarketSentiment(): Promise<MarketSentimentSnapshot> {
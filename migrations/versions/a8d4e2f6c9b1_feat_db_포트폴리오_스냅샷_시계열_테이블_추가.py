@@ -0,0 +1,88 @@
+"""feat(db): 포트폴리오 스냅샷 시계열 테이블 추가
+
+Revision ID: a8d4e2f6c9b1
+Revises: f2c8a6b3d1e5
+Create Date: 2026-05-06 14:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a8d4e2f6c9b1"
+down_revision: Union[str, Sequence[str], None] = "f2c8a6b3d1e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        op.f("ix_portfolio_snapshots_created_at"),
+        "portfolio_snapshots",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_table(
+        "portfolio_snapshot_points",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("snapshot_id", sa.Integer(), nullable=False),
+        sa.Column("currency", sa.String(), nullable=False),
+        sa.Column("balance", sa.Float(), nullable=True),
+        sa.Column("current_price", sa.Float(), nullable=True),
+        sa.Column("total_value", sa.Float(), nullable=True),
+        sa.Column("pnl_percentage", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["snapshot_id"], ["portfolio_snapshots.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_portfolio_snapshot_points_snapshot_id"),
+        "portfolio_snapshot_points",
+        ["snapshot_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_portfolio_snapshot_points_created_at"),
+        "portfolio_snapshot_points",
+        ["created_at"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_portfolio_snapshot_points_currency_created_at",
+        "portfolio_snapshot_points",
+        ["currency", "created_at"],
+        unique=False,
+    )
+
+    # 기존 JSON 스냅샷을 자산별 행으로 펼쳐 채웁니다.
+    op.execute(
+        """
+        INSERT INTO portfolio_snapshot_points (
+            snapshot_id, currency, balance, current_price, total_value, pnl_percentage, created_at
+        )
+        SELECT
+            s.id,
+            UPPER(item->>'currency'),
+            NULLIF(item->>'balance', '')::double precision,
+            NULLIF(item->>'current_price', '')::double precision,
+            NULLIF(item->>'total_value', '')::double precision,
+            NULLIF(item->>'pnl_percentage', '')::double precision,
+            s.created_at
+        FROM portfolio_snapshots AS s
+        CROSS JOIN LATERAL json_array_elements(s.snapshot_data) AS item
+        WHERE COALESCE(item->>'currency', '') <> ''
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_portfolio_snapshot_points_currency_created_at", table_name="portfolio_snapshot_points")
+    op.drop_index(op.f("ix_portfolio_snapshot_points_created_at"), table_name="portfolio_snapshot_points")
+    op.drop_index(op.f("ix_portfolio_snapshot_points_snapshot_id"), table_name="portfolio_snapshot_points")
+    op.drop_table("portfolio_snapshot_points")
+    op.drop_index(op.f("ix_portfolio_snapshots_created_at"), table_name="portfolio_snapshots")
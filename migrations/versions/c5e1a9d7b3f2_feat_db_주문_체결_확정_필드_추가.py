@@ -0,0 +1,48 @@
+"""feat(db): 주문 체결 확정 필드 추가
+
+Revision ID: c5e1a9d7b3f2
+Revises: a8d4e2f6c9b1
+Create Date: 2026-05-12 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e1a9d7b3f2"
+down_revision: Union[str, Sequence[str], None] = "a8d4e2f6c9b1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("order_history", sa.Column("broker_order_uuid", sa.String(), nullable=True))
+    op.add_column(
+        "order_history",
+        sa.Column("fill_status", sa.String(length=16), server_default="filled", nullable=False),
+    )
+    op.create_index(
+        op.f("ix_order_history_broker_order_uuid"),
+        "order_history",
+        ["broker_order_uuid"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_order_history_pending_fill",
+        "order_history",
+        ["id"],
+        unique=False,
+        postgresql_where=sa.text("fill_status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_order_history_pending_fill", table_name="order_history")
+    op.drop_index(op.f("ix_order_history_broker_order_uuid"), table_name="order_history")
+    op.drop_column("order_history", "fill_status")
+    op.drop_column("order_history", "broker_order_uuid")
@@ -0,0 +1,43 @@
+"""feat(db): 채팅 이력 trigram 검색 인덱스 추가
+
+Revision ID: e7b1c4d9a2f3
+Revises: d3a9f7c1b2e4
+Create Date: 2026-05-02 10:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b1c4d9a2f3"
+down_revision: Union[str, Sequence[str], None] = "d3a9f7c1b2e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # 기존 행은 인덱스 생성 시 함께 채워집니다. 대량 이력에서도 쓰기를 막지 않도록 CONCURRENTLY 로 만듭니다.
+    with op.get_context().autocommit_block():
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ai_chat_messages_content_trgm
+            ON ai_chat_messages USING gin (content gin_trgm_ops)
+            """
+        )
+        op.execute(
+            """
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ai_chat_messages_session_id_created_at
+            ON ai_chat_messages (session_id, created_at)
+            """
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_ai_chat_messages_session_id_created_at")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_ai_chat_messages_content_trgm")
@@ -0,0 +1,39 @@
+"""feat(db): 채팅 working memory 요약 필드 추가
+
+Revision ID: f2c8a6b3d1e5
+Revises: e7b1c4d9a2f3
+Create Date: 2026-05-04 09:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f2c8a6b3d1e5"
+down_revision: Union[str, Sequence[str], None] = "e7b1c4d9a2f3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("ai_chat_messages", sa.Column("token_count", sa.Integer(), nullable=True))
+    op.add_column("chat_sessions", sa.Column("memory_summary", sa.Text(), nullable=True))
+    op.add_column("chat_sessions", sa.Column("memory_summary_until_id", sa.Integer(), nullable=True))
+    op.add_column("chat_sessions", sa.Column("memory_summary_token_count", sa.Integer(), nullable=True))
+    op.add_column(
+        "chat_sessions",
+        sa.Column("memory_summary_updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("chat_sessions", "memory_summary_updated_at")
+    op.drop_column("chat_sessions", "memory_summary_token_count")
+    op.drop_column("chat_sessions", "memory_summary_until_id")
+    op.drop_column("chat_sessions", "memory_summary")
+    op.drop_column("ai_chat_messages", "token_count")
@@ -0,0 +1,101 @@
+"""기술 지표 계산 경로 micro-benchmark.
+
+캔들 조회 API(200봉)와 백테스트(1만 봉) 크기에서 다음 세 경로를 비교합니다.
+
+- legacy: DataFrame 생성/복사 → ``replace({nan: None})`` → 행×열 ``.at`` 조회로 병합하던 이전 방식
+- records: 현재 ``IndicatorCalculator.calculate_from_candles`` (열 배열 계산 후 응답 경계에서 한 번 변환)
+- columns: ``calculate_columns`` 로 종가 배열 → 지표 배열만 계산(변환 없음)
+
+사용 예:
+    python scripts/benchmark_indicators.py
+    python scripts/benchmark_indicators.py --rows 200 10000 --repeat 20
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.services.indicators.calculator import IndicatorCalculator  # noqa: E402
+from app.services.indicators.calculator import load_indicator_stack  # noqa: E402
+
+DEFAULT_ROWS = (200, 10_000)
+
+
+def build_candles(count: int, seed: int = 42) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    close = 50_000_000.0
+    candles: list[dict[str, Any]] = []
+    for index in range(count):
+        close = max(1.0, close * (1 + rng.uniform(-0.01, 0.01)))
+        candles.append(
+            {
+                "timestamp": f"2026-01-01T00:00:00+00:00#{index}",
+                "open": close,
+                "high": close * 1.002,
+                "low": close * 0.998,
+                "close": close,
+                "volume": rng.uniform(0.1, 5.0),
+            }
+        )
+    return candles
+
+
+def legacy_calculate_from_candles(calculator: IndicatorCalculator, candles: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    np, pd, _ta = load_indicator_stack()
+    calculated = calculator.to_dataframe(candles).copy()
+    for column, values in calculator.calculate_columns(calculated["close"]).items():
+        calculated[column] = values
+    calculated = calculated.replace({np.nan: None})
+
+    merged_rows: list[dict[str, Any]] = []
+    for index, candle in enumerate(candles):
+        row = dict(candle)
+        for column in calculator.INDICATOR_COLUMNS:
+            value = calculated.at[index, column]
+            row[column] = None if pd.isna(value) else float(value)
+        merged_rows.append(row)
+    return merged_rows
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    func()
+    samples = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started_at)
+    return statistics.median(samples) * 1000.0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS))
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    calculator = IndicatorCalculator()
+    print(f"{'rows':>8}  {'legacy':>10}  {'records':>10}  {'columns':>10}  {'speedup':>8}")
+    for rows in args.rows:
+        candles = build_candles(rows)
+        close = calculator.candles_to_columns(candles)["close"]
+        legacy_ms = measure(lambda: legacy_calculate_from_candles(calculator, candles), args.repeat)
+        records_ms = measure(lambda: calculator.calculate_from_candles(candles), args.repeat)
+        columns_ms = measure(lambda: calculator.calculate_columns(close), args.repeat)
+        print(
+            f"{rows:>8}  {legacy_ms:>8.2f}ms  {records_ms:>8.2f}ms  {columns_ms:>8.2f}ms  "
+            f"{legacy_ms / records_ms:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
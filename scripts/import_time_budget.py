@@ -0,0 +1,106 @@
+"""`python -X importtime` 으로 앱 기동 import 비용을 측정하고 예산을 검사합니다.
+
+사용 예:
+    python scripts/import_time_budget.py                 # 기본 예산으로 app.main 검사
+    python scripts/import_time_budget.py --budget-ms 1500 --top 20
+
+예산을 넘거나 지연 로딩 대상 모듈이 기동 경로에 섞이면 종료 코드 1 을 반환합니다.
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_TARGET = "app.main"
+DEFAULT_BUDGET_MS = 2000.0
+# 첫 사용 또는 warm-up(app.core.warmup)에서만 불러와야 하는 무거운 선택 의존성입니다.
+LAZY_MODULES = (
+    "pandas",
+    "pandas_ta_classic",
+    "langgraph",
+    "langchain_core",
+    "langchain_openai",
+    "opensearchpy",
+    "feedparser",
+    "google.genai",
+    "openai",
+    "slack_sdk",
+    "slack_bolt",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    timings: list[ImportTiming] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        timings.append(
+            ImportTiming(
+                module=parts[2].strip(),
+                self_us=int(parts[0].strip()),
+                cumulative_us=int(parts[1].strip()),
+            )
+        )
+    return timings
+
+
+def measure_import_time(target: str = DEFAULT_TARGET) -> list[ImportTiming]:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {target} 실패:\n{completed.stderr[-2000:]}")
+    return parse_importtime(completed.stderr)
+
+
+def find_eager_lazy_modules(timings: list[ImportTiming]) -> list[str]:
+    imported = {timing.module for timing in timings}
+    return [module for module in LAZY_MODULES if module in imported]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", default=DEFAULT_TARGET)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    timings = measure_import_time(args.target)
+    target_timing = next((timing for timing in timings if timing.module == args.target), None)
+    total_ms = target_timing.cumulative_us / 1000.0 if target_timing is not None else 0.0
+
+    print(f"{args.target} 누적 import 시간: {total_ms:.1f} ms (예산 {args.budget_ms:.0f} ms)")
+    print(f"\n자체 import 시간 상위 {args.top}개 모듈:")
+    for timing in sorted(timings, key=lambda item: item.self_us, reverse=True)[: args.top]:
+        print(f"  self={timing.self_us / 1000.0:8.1f} ms  cumulative={timing.cumulative_us / 1000.0:8.1f} ms  {timing.module}")
+
+    failed = False
+    eager_modules = find_eager_lazy_modules(timings)
+    if eager_modules:
+        failed = True
+        print(f"\n[실패] 기동 경로에서 지연 로딩 대상 모듈이 import 되었습니다: {', '.join(eager_modules)}")
+    if total_ms > args.budget_ms:
+        failed = True
+        print(f"\n[실패] import 시간이 예산을 초과했습니다: {total_ms:.1f} ms > {args.budget_ms:.0f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
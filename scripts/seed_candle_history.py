@@ -0,0 +1,69 @@
+"""관심 종목 캔들 이력 일괄 시딩.
+
+관심 종목(또는 ``--markets`` 로 지정한 마켓)의 과거 캔들을 동시에 내려받아 백테스트 CSV 캐시
+(``data/backtesting/cache``)에 저장합니다. 이후 같은 구간 안의 백테스트는 업비트를 다시
+호출하지 않습니다. 모든 마켓이 하나의 캔들 rate limiter 를 공유합니다.
+
+사용 예:
+    python scripts/seed_candle_history.py --timeframe 1m --days 365
+    python scripts/seed_candle_history.py --markets KRW-BTC KRW-ETH --timeframe 60m --days 730 --fill-gaps
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+async def load_favorite_markets() -> list[str]:
+    from sqlalchemy import select
+
+    from app.db.session import AsyncSessionLocal
+    from app.models.domain import Favorite
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(Favorite.symbol).order_by(Favorite.id.asc()))
+        return [str(symbol) for symbol in result.scalars().all() if symbol]
+
+
+async def run(args: argparse.Namespace) -> int:
+    from app.services.backtesting.data_loader import seed_candle_history
+
+    markets = args.markets or await load_favorite_markets()
+    if not markets:
+        print("시딩할 마켓이 없습니다. --markets 를 지정하거나 관심 종목을 등록하세요.")
+        return 1
+
+    end_date = datetime.now(timezone.utc).replace(second=0, microsecond=0)
+    start_date = end_date - timedelta(days=args.days)
+    reports = await seed_candle_history(markets, args.timeframe, start_date, end_date, fill_gaps=args.fill_gaps)
+
+    print(f"{'market':<12}  {'rows':>9}  {'pages':>6}  {'gaps':>6}  {'filled':>6}  {'sec':>7}  {'rows/s':>8}")
+    for report in reports:
+        if report.cache_hit:
+            print(f"{report.market:<12}  {report.rows:>9}  {'cache':>6}")
+            continue
+        print(
+            f"{report.market:<12}  {report.rows:>9}  {report.pages + report.followup_pages:>6}  "
+            f"{report.empty_slots:>6}  {report.filled_slots:>6}  {report.elapsed_seconds:>7.1f}  "
+            f"{report.rows_per_second:>8.0f}"
+        )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--markets", nargs="*", default=None)
+    parser.add_argument("--timeframe", default="60m")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--fill-gaps", action="store_true", help="거래가 없어 빠진 봉을 직전 종가로 채웁니다.")
+    return asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+import asyncio
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import Any
+
+from app.core.config import settings
+from app.services.ai import provider_router
+from app.services.ai.providers.base import AIProviderRateLimitError
+from app.services.trading import ai_analyst
+from app.services.trading import bulk_analysis
+from app.services.trading.ai_analyst import AnalysisCycleContext
+
+CYCLE = AnalysisCycleContext(
+    technical_timeframe="60m",
+    portfolio=None,
+    sentiment={"score": 50, "classification": "Neutral", "updated_at": None, "error": None},
+    custom_persona_prompt="",
+)
+
+
+class _FakeSession:
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        return None
+
+
+def _analysis(symbol: str, analysis_id: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=analysis_id,
+        symbol=symbol,
+        decision="HOLD",
+        confidence=60,
+        recommended_weight=0,
+        reasoning="일괄 분석 테스트",
+        accuracy_label=None,
+        actual_price_diff_pct=None,
+        created_at=datetime(2026, 6, 5, tzinfo=UTC),
+    )
+
+
+def _patch_provider_config(monkeypatch) -> dict[str, str]:
+    """provider 상태를 system_configs 대신 메모리에 읽고 씁니다(라우터 로직은 실제 코드)."""
+    configs: dict[str, str] = {}
+
+    async def get_values(_db, config_keys):
+        return {key: configs[key] for key in config_keys if key in configs}
+
+    async def upsert(_db, config_key: str, config_value: str, _description: str | None = None):
+        configs[config_key] = config_value
+
+    monkeypatch.setattr(settings, "GEMINI_API_KEY", "test-gemini-key")
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "")
+    monkeypatch.setattr(provider_router, "get_system_config_values", get_values)
+    monkeypatch.setattr(provider_router, "upsert_system_config", upsert)
+    monkeypatch.setattr(bulk_analysis, "AsyncSessionLocal", _FakeSession)
+    return configs
+
+
+def _patch_analysis(monkeypatch, delays: dict[str, float]):
+    calls: list[str] = []
+    state = {"running": 0, "peak": 0}
+
+    async def fake_execute_ai_analysis(_db, symbol: str, *, cycle=None, fallback_on_unavailable=True):
+        assert cycle is CYCLE and fallback_on_unavailable is False
+        calls.append(symbol)
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        try:
+            await asyncio.sleep(delays.get(symbol, 0.01))
+            return _analysis(symbol, len(calls))
+        finally:
+            state["running"] -= 1
+
+    _patch_provider_config(monkeypatch)
+    monkeypatch.setattr(bulk_analysis, "execute_ai_analysis", fake_execute_ai_analysis)
+    return calls, state
+
+
+async def _collect(symbols: list[str], concurrency: int) -> list[dict[str, Any]]:
+    return [event async for event in bulk_analysis.stream_bulk_analysis(symbols, CYCLE, concurrency=concurrency)]
+
+
+def test_bulk_analysis_streams_in_completion_order_with_bounded_fan_out(monkeypatch) -> None:
+    symbols = [f"KRW-C{index}" for index in range(10)]
+    calls, state = _patch_analysis(monkeypatch, {"KRW-C0": 0.08})
+
+    events = asyncio.run(_collect(symbols, concurrency=3))
+
+    results = [event for event in events if event["type"] == "result"]
+    assert events[0]["type"] == "start" and events[-1]["type"] == "done"
+    assert sorted(event["symbol"] for event in results) == sorted(symbols)
+    assert results[-1]["symbol"] == "KRW-C0"
+    assert results[0]["analysis"]["decision"] == "HOLD"
+    assert state["peak"] == 3
+    assert events[-1]["completed"] == 10
+    assert bulk_analysis._in_flight == {}
+
+
+def test_concurrent_requests_share_in_flight_symbol_runs(monkeypatch) -> None:
+    calls, _state = _patch_analysis(monkeypatch, {"KRW-BTC": 0.05, "KRW-ETH": 0.05})
+
+    async def scenario():
+        first = asyncio.create_task(_collect(["KRW-BTC", "KRW-ETH"], concurrency=2))
+        await asyncio.sleep(0.01)
+        second = await _collect(["KRW-ETH", "KRW-XRP"], concurrency=2)
+        return await first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert sorted(calls) == ["KRW-BTC", "KRW-ETH", "KRW-XRP"]
+    assert second[0]["shared_symbols"] == ["KRW-ETH"]
+    shared_eth = next(event for event in second if event.get("symbol") == "KRW-ETH")
+    first_eth = next(event for event in first if event.get("symbol") == "KRW-ETH")
+    assert shared_eth["shared"] is True
+    assert shared_eth["analysis"] == first_eth["analysis"]
+
+
+def test_exhausted_providers_skip_queued_symbols_without_saving_fallbacks(monkeypatch) -> None:
+    symbols = ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-SOL"]
+    configs = _patch_provider_config(monkeypatch)
+    gathered: list[str] = []
+    persisted: list[str] = []
+    llm_calls: list[str] = []
+
+    class RateLimitedAnalyzer:
+        async def generate_structured_analysis(self, **_kwargs: Any):
+            llm_calls.append("gemini")
+            raise AIProviderRateLimitError("429 RESOURCE_EXHAUSTED", provider="gemini")
+
+    async def gather_context(_db, symbol: str, *, cycle=None):
+        gathered.append(symbol)
+        return {}
+
+    async def load_feedback(_db, _symbol: str) -> str:
+        return ""
+
+    async def persist(_db, symbol: str, _response):
+        persisted.append(symbol)
+        return _analysis(symbol, len(persisted))
+
+    monkeypatch.setattr(ai_analyst, "gather_market_context", gather_context)
+    monkeypatch.setattr(ai_analyst, "format_market_context_for_llm", lambda _context: "context")
+    monkeypatch.setattr(ai_analyst, "_load_recent_failure_feedback", load_feedback)
+    monkeypatch.setattr(ai_analyst, "_persist_ai_analysis_log", persist)
+    monkeypatch.setattr(
+        provider_router.AIAnalyzerFactory,
+        "get_analyzer",
+        lambda *_args, **_kwargs: RateLimitedAnalyzer(),
+    )
+
+    events = asyncio.run(_collect(symbols, concurrency=1))
+
+    assert llm_calls == ["gemini"] and gathered == ["KRW-BTC"] and persisted == []
+    assert "blocked_until" in configs[provider_router.AI_PROVIDER_STATUS_KEY]
+    assert [event["type"] for event in events[1:-1]] == ["error", "skipped", "skipped", "skipped"]
+    assert events[1]["reason"] == "provider_unavailable"
+    assert events[-1] == {**events[-1], "completed": 0, "failed": 1, "skipped": 3}
+
+
+def test_disconnect_keeps_symbol_running_for_other_waiting_request(monkeypatch) -> None:
+    calls, _state = _patch_analysis(monkeypatch, {"KRW-BTC": 0.05, "KRW-ETH": 0.05})
+
+    async def scenario():
+        first = bulk_analysis.stream_bulk_analysis(["KRW-BTC", "KRW-ETH"], CYCLE, concurrency=2)
+        await first.__anext__()
+        btc_task = bulk_analysis._in_flight["KRW-BTC"]
+        second = asyncio.create_task(_collect(["KRW-ETH"], concurrency=2))
+        await asyncio.sleep(0.01)
+        # A 클라이언트가 끊겨도 B 가 기다리는 KRW-ETH 분석은 계속 돌아야 합니다.
+        await first.aclose()
+        return btc_task, await second
+
+    btc_task, second = asyncio.run(scenario())
+
+    eth_event = next(event for event in second if event.get("symbol") == "KRW-ETH")
+    assert btc_task.cancelled()
+    assert eth_event["type"] == "result" and eth_event["shared"] is True
+    assert sorted(calls) == ["KRW-BTC", "KRW-ETH"]
+    assert bulk_analysis._waiters == {} and bulk_analysis._in_flight == {}
@@ -0,0 +1,155 @@
+import asyncio
+import random
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+
+import numpy as np
+import pytest
+
+from app.services.trading.calibration import CalibrationOutcome
+from app.services.trading.calibration import CalibrationStore
+from app.services.trading.entry_policy import load_buy_confidence_calibration
+
+
+def _outcomes(count: int, seed: int = 5) -> list[CalibrationOutcome]:
+    rng = random.Random(seed)
+    start = datetime(2026, 5, 1, tzinfo=UTC)
+    return [
+        CalibrationOutcome(
+            analysis_id=index + 1,
+            symbol=rng.choice(("KRW-BTC", "KRW-ETH")),
+            decision=rng.choice(("BUY", "SELL")),
+            confidence=rng.randint(40, 100),
+            success=rng.random() < 0.55,
+            created_at=start + timedelta(minutes=37 * index),
+        )
+        for index in range(count)
+    ]
+
+
+class _FakeResult:
+    def __init__(self, rows: list[Any]) -> None:
+        self.rows = rows
+
+    def all(self) -> list[Any]:
+        return self.rows
+
+
+class _FakeSession:
+    def __init__(self, outcomes: list[CalibrationOutcome], on_execute=None) -> None:
+        self.outcomes = outcomes
+        self.on_execute = on_execute
+        self.execute_count = 0
+
+    async def execute(self, _statement: Any) -> _FakeResult:
+        self.execute_count += 1
+        if self.on_execute is not None:
+            self.on_execute()
+        await asyncio.sleep(0)
+        return _FakeResult(
+            [
+                SimpleNamespace(
+                    id=outcome.analysis_id,
+                    symbol=outcome.symbol,
+                    decision=outcome.decision,
+                    confidence=outcome.confidence,
+                    accuracy_label="SUCCESS" if outcome.success else "FAIL",
+                    created_at=outcome.created_at,
+                )
+                for outcome in self.outcomes
+            ]
+        )
+
+
+def test_incremental_store_matches_full_recomputation() -> None:
+    outcomes = _outcomes(600)
+    store = CalibrationStore(recent_window=50)
+    store.load_outcomes(outcomes[:100])
+    for outcome in outcomes[100:]:
+        store.record(outcome)
+
+    report = store.report()
+
+    probabilities = np.array([outcome.confidence / 100 for outcome in outcomes])
+    hits = np.array([float(outcome.success) for outcome in outcomes])
+    assert report["checked_count"] == 600 and report["success_count"] == int(hits.sum())
+    assert report["brier_score"] == pytest.approx(np.mean((probabilities - hits) ** 2), abs=1e-6)
+    bucket = next(row for row in report["reliability"] if row["bucket_start"] == 70)
+    in_bucket = (probabilities >= 0.7) & (probabilities < 0.8)
+    assert bucket["checked_count"] == int(in_bucket.sum())
+    assert bucket["win_rate_pct"] == pytest.approx(hits[in_bucket].mean() * 100, abs=1e-4)
+    assert report["reliability"][-1]["bucket_end"] == 100
+    assert sum(row["checked_count"] for row in report["by_hour"]) == 600
+    assert {row["key"] for row in report["by_decision"]} == {"BUY", "SELL"}
+
+    eth_buys = [outcome.success for outcome in outcomes if (outcome.symbol, outcome.decision) == ("KRW-ETH", "BUY")]
+    recent = store.recent_win_rate("krw-eth", "BUY")
+    assert (recent.checked_count, recent.success_count) == (50, sum(eth_buys[-50:]))
+    assert store.overall_win_rate().checked_count == 600
+    assert store.report(symbol="KRW-BTC", decision="SELL")["by_symbol"][0]["key"] == "KRW-BTC"
+
+
+def test_bootstrap_keeps_labels_recorded_mid_load_and_gate_reads_without_queries() -> None:
+    outcomes = _outcomes(300)
+    late = CalibrationOutcome(
+        analysis_id=999,
+        symbol="KRW-BTC",
+        decision="BUY",
+        confidence=80,
+        success=True,
+        created_at=datetime(2026, 6, 1, tzinfo=UTC),
+    )
+    store = CalibrationStore()
+    store.record(outcomes[0])  # 부트스트랩 전 기록은 DB 에서 다시 읽으므로 버립니다.
+    # 조회 도중 워커가 이미 조회 결과에 포함된 라벨과 새 라벨을 기록합니다.
+    db = _FakeSession(outcomes, on_execute=lambda: (store.record(outcomes[-1]), store.record(late)))
+
+    async def scenario() -> None:
+        await asyncio.gather(store.ensure_loaded(db), store.ensure_loaded(db))
+
+    asyncio.run(scenario())
+
+    assert db.execute_count == 1
+    assert store.overall_win_rate().checked_count == 301
+
+
+def test_entry_gate_calibration_reads_store_in_constant_time(monkeypatch) -> None:
+    outcomes = [
+        CalibrationOutcome(
+            analysis_id=index,
+            symbol="KRW-BTC",
+            decision="BUY",
+            confidence=80,
+            success=index % 4 != 0,
+            created_at=datetime(2026, 5, 1, tzinfo=UTC),
+        )
+        for index in range(400)
+    ]
+    store = CalibrationStore()
+    monkeypatch.setattr("app.services.trading.entry_policy.calibration_store", store)
+    db = _FakeSession(outcomes)
+
+    async def scenario():
+        first = await load_buy_confidence_calibration(db, "KRW-BTC", 70)
+        second = await load_buy_confidence_calibration(db, "KRW-ETH", 70)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+
+    assert db.execute_count == 1
+    assert (first.checked_count, first.success_count) == (200, 150)
+    assert first.calibrated_confidence == 100
+    assert second.success_rate_pct is None and second.calibrated_confidence == 70
+
+
+def test_label_recorded_after_bootstrap_already_read_it_is_not_counted_twice() -> None:
+    outcomes = _outcomes(50)
+    store = CalibrationStore()
+
+    asyncio.run(store.ensure_loaded(_FakeSession(outcomes)))
+    # 워커가 커밋한 라벨을 부트스트랩이 이미 읽은 뒤에 record 가 도착한 경우입니다.
+    store.record(outcomes[-1])
+
+    assert store.overall_win_rate().checked_count == 50
+    assert store.report()["checked_count"] == 50
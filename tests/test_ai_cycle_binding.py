@@ -254,8 +254,8 @@ def test_execute_ai_analysis_propagates_real_persistence_failure(monkeypatch) ->
     commit_error = RuntimeError("analysis commit failed")
     db = _AnalysisPersistenceDb(commit_error=commit_error)
 
-    async def gather_context(_db: object, symbol: str) -> dict[str, str]:
-        assert symbol == "KRW-BTC"
+    async def gather_context(_db: object, symbol: str, *, cycle: object = None) -> dict[str, str]:
+        assert symbol == "KRW-BTC" and cycle is None
         return {"symbol": symbol}
 
     async def get_config(*_args: Any, **_kwargs: Any) -> str:
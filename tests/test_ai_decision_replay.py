@@ -0,0 +1,127 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.services.backtesting.analyzer import analyze_backtest_result
+from app.services.backtesting.replay import AIDecisionReplayEngine
+from app.services.backtesting.replay import ReplayDecision
+from app.services.backtesting.replay import coerce_replay_policy
+from app.services.trading.ai_executor import AIExecutorPolicy
+from app.services.trading.ai_executor import plan_ai_buy_order
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _candles(prices: list[float]) -> list[dict[str, float | str]]:
+    return [
+        {
+            "timestamp": (START + timedelta(hours=index)).isoformat(),
+            "open": price,
+            "high": price,
+            "low": price,
+            "close": price,
+            "volume": 1.0,
+        }
+        for index, price in enumerate(prices)
+    ]
+
+
+def _decision(decision_id: int, hours: float, decision: str, confidence: int = 90, weight: int = 30) -> ReplayDecision:
+    return ReplayDecision(
+        id=decision_id,
+        symbol="KRW-BTC",
+        decision=decision,
+        confidence=confidence,
+        recommended_weight=weight,
+        created_at=START + timedelta(hours=hours),
+    )
+
+
+async def _stream(decisions: list[ReplayDecision]):
+    for decision in decisions:
+        yield decision
+
+
+def _replay(prices: list[float], decisions: list[ReplayDecision], policy: AIExecutorPolicy) -> dict:
+    return asyncio.run(
+        AIDecisionReplayEngine(None).replay(  # type: ignore[arg-type]
+            market="KRW-BTC",
+            candles=_candles(prices),
+            decisions=_stream(decisions),
+            initial_balance=1_000_000,
+            policy=policy,
+        )
+    )
+
+
+def test_replay_fills_decisions_on_next_bar_and_feeds_analyzer() -> None:
+    prices = [100.0, 100.0, 110.0, 120.0, 120.0]
+    decisions = [
+        _decision(1, 0.5, "BUY"),
+        _decision(2, 1.0, "BUY", confidence=10),
+        _decision(3, 2.5, "SELL", weight=100),
+        _decision(4, 10.0, "BUY"),
+    ]
+
+    result = _replay(prices, decisions, AIExecutorPolicy(min_confidence=75))
+
+    buy, sell = result["trades"]
+    assert (buy["side"], buy["price"], buy["index"]) == ("buy", 100.0, 1)
+    assert buy["qty"] * buy["price"] == pytest.approx(300_000 * 0.995 * 0.9995)
+    assert (sell["side"], sell["price"], sell["coin_balance"]) == ("sell", 120.0, 0.0)
+    assert result["replay"]["outcomes"] == {"executed": 2, "low_confidence": 1, "after_last_candle": 1}
+    assert len(result["equity_curve"]) == len(prices)
+
+    analyzed = analyze_backtest_result(result)
+    assert analyzed["summary"]["number_of_trades"] == 2
+    assert analyzed["summary"]["win_rate"] == 100.0
+    assert analyzed["summary"]["total_return_pct"] > 0
+
+
+def test_replay_applies_hard_stop_loss_and_skips_stale_decisions() -> None:
+    prices = [100.0, 100.0, 90.0, 80.0, 80.0]
+    decisions = [
+        _decision(1, -5.0, "BUY"),
+        _decision(2, 0.0, "BUY"),
+    ]
+    policy = coerce_replay_policy(
+        AIExecutorPolicy(),
+        {"hard_stop_loss_pct": -5.0, "max_age_minutes": 90, "unknown": 1, "min_confidence": None},
+    )
+
+    result = _replay(prices, decisions, policy)
+
+    assert [(trade["side"], trade["reason"]) for trade in result["trades"]] == [
+        ("buy", "ai_buy"),
+        ("sell", "SL_SELL"),
+    ]
+    assert result["trades"][1]["price"] == 90.0
+    assert result["replay"]["outcomes"] == {"stale": 1, "executed": 1}
+    assert result["position_qty"] == 0.0
+
+
+def test_plan_ai_buy_order_caps_weight_and_allocation() -> None:
+    plan = plan_ai_buy_order(
+        total_krw=1_000_000,
+        available_krw=1_000_000,
+        current_position_value=250_000,
+        recommended_weight=80,
+        max_allocation_pct=30.0,
+        max_buy_weight_pct=20.0,
+    )
+
+    assert plan.effective_recommended_weight == 20.0
+    assert plan.target_budget == pytest.approx(50_000)
+    assert plan.order_amount_krw == pytest.approx(50_000 * 0.995)
+    assert plan.skip_reason is None
+
+    capped = plan_ai_buy_order(
+        total_krw=1_000_000,
+        available_krw=1_000_000,
+        current_position_value=300_000,
+        recommended_weight=20,
+        max_allocation_pct=30.0,
+        max_buy_weight_pct=30.0,
+    )
+    assert capped.skip_reason == "allocation_cap_reached"
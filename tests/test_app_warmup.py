@@ -0,0 +1,59 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+
+from fastapi import Response
+
+from app.api.routes import health as health_route
+from app.core.warmup import AppWarmup
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts" / "import_time_budget.py"
+
+
+def _load_budget_script():
+    spec = importlib.util.spec_from_file_location("import_time_budget", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_warmup_records_each_step_and_reports_degraded_on_failure() -> None:
+    loaded: list[str] = []
+
+    def broken() -> None:
+        raise ImportError("missing sdk")
+
+    warmup = AppWarmup([("first", lambda: loaded.append("first")), ("broken", broken)])
+    assert warmup.status() == "warming"
+
+    asyncio.run(warmup.run())
+
+    snapshot = warmup.snapshot()
+    assert loaded == ["first"]
+    assert snapshot["status"] == "degraded"
+    assert snapshot["serving"] is True and snapshot["warmed"] is False
+    assert snapshot["components"]["first"]["status"] == "ready"
+    assert snapshot["components"]["broken"]["error"] == "ImportError: missing sdk"
+
+
+def test_readiness_returns_503_only_when_warm_state_is_required(monkeypatch) -> None:
+    monkeypatch.setattr(health_route, "app_warmup", AppWarmup([("chat_graph", lambda: None)]))
+
+    serving_response = Response()
+    serving = asyncio.run(health_route.readiness(serving_response, require_warm=False))
+    strict_response = Response()
+    asyncio.run(health_route.readiness(strict_response, require_warm=True))
+
+    assert serving["status"] == "warming"
+    assert serving_response.status_code == 200
+    assert strict_response.status_code == 503
+
+
+def test_app_startup_does_not_import_lazy_subsystems() -> None:
+    budget = _load_budget_script()
+
+    timings = budget.measure_import_time("app.main")
+
+    assert any(timing.module == "app.main" for timing in timings)
+    assert budget.find_eager_lazy_modules(timings) == []
@@ -0,0 +1,121 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from app.services.backtesting.jobs import JOB_STATUS_CANCELLED
+from app.services.backtesting.jobs import JOB_STATUS_SUCCEEDED
+from app.services.backtesting.jobs import BacktestJobManager
+from app.services.backtesting.jobs import read_candles
+from app.services.backtesting.jobs import read_equity
+from app.services.backtesting.jobs import read_trades
+
+RUN_KWARGS = {
+    "market": "KRW-BTC",
+    "start_date": datetime(2026, 1, 1, tzinfo=UTC),
+    "end_date": datetime(2026, 3, 1, tzinfo=UTC),
+    "initial_balance": 1_000_000,
+    "timeframe": "60m",
+    "strategy": {"ema_fast": 5, "ema_slow": 12, "rsi_period": 5, "rsi_min": 50, "trailing_stop_pct": 0.02},
+    "policy": {
+        "min_confidence": 70,
+        "max_allocation_pct": 30,
+        "take_profit_pct": 1_000,
+        "stop_loss_pct": -100,
+        "cooldown_minutes": 0,
+    },
+}
+
+
+def _candles(count: int) -> list[dict[str, float | str]]:
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    rows: list[dict[str, float | str]] = []
+    previous = 100.0
+    for index in range(count):
+        # 상승과 하락을 반복해 매수/매도가 여러 번 일어나게 합니다.
+        price = 100.0 + (index % 60 if (index // 60) % 2 == 0 else 60 - index % 60)
+        rows.append(
+            {
+                "timestamp": (start + timedelta(hours=index)).isoformat(),
+                "open": previous,
+                "high": max(previous, price) * 1.01,
+                "low": min(previous, price) * 0.99,
+                "close": price,
+                "volume": 1.0,
+            }
+        )
+        previous = price
+    return rows
+
+
+def _patch_candles(monkeypatch, count: int) -> None:
+    async def fake_fetch_historical_data(**_kwargs):
+        return _candles(count)
+
+    monkeypatch.setattr("app.services.backtesting.engine.fetch_historical_data", fake_fetch_historical_data)
+
+
+def test_job_reports_progress_and_pages_downsampled_artifact(monkeypatch, tmp_path) -> None:
+    _patch_candles(monkeypatch, 2_500)
+
+    async def finalize(analyzed):
+        return {"ai_briefing": {"content": f"trades={len(analyzed['trades'])}", "fallback": True}}
+
+    async def scenario():
+        manager = BacktestJobManager(artifact_dir=tmp_path)
+        job = manager.submit(dict(RUN_KWARGS), finalize=finalize)
+        progress = []
+        while not job.is_finished:
+            changed = job.changed()
+            progress.append(job.bars_done)
+            await changed.wait()
+        return job, progress
+
+    job, progress = asyncio.run(scenario())
+
+    assert job.status == JOB_STATUS_SUCCEEDED
+    assert job.bars_done == job.bars_total == 2_500
+    assert {1_000, 2_000} <= set(progress)
+    assert job.trade_count > 2
+    assert job.result["meta"]["bars_processed"] == 2_500
+    assert job.result["ai_briefing"]["content"] == f"trades={job.trade_count}"
+
+    first_page = read_trades(job.artifact_path, 0, 2)
+    rest = read_trades(job.artifact_path, 2, 1_000)
+    assert len(first_page) == 2 and len(first_page) + len(rest) == job.trade_count
+    assert first_page[0]["side"] == "buy" and first_page[0]["confidence"] is not None
+    assert isinstance(first_page[0]["index"], int)
+
+    equity = read_equity(job.artifact_path, 100)
+    assert len(equity) == 100
+    assert [point["time"] for point in equity] == sorted(point["time"] for point in equity)
+    assert set(equity[0]) == {"time", "equity", "pnl_pct", "drawdown_pct"}
+
+    candles = read_candles(job.artifact_path, 100)
+    assert len(candles) == 100
+    # 25봉씩 묶이므로 첫 버킷 고가는 앞 25봉 고가의 최댓값, 거래량은 합계입니다.
+    assert candles[0]["volume"] == 25.0
+    assert candles[0]["high"] == max(row["high"] for row in _candles(25))
+    assert candles[0]["sma_60"] is None and candles[-1]["sma_60"] is not None
+
+
+def test_cancelled_job_keeps_no_artifact_and_old_jobs_are_evicted(monkeypatch, tmp_path) -> None:
+    _patch_candles(monkeypatch, 5_000)
+
+    async def scenario():
+        manager = BacktestJobManager(artifact_dir=tmp_path, max_retained=2)
+        first = manager.submit(dict(RUN_KWARGS))
+        while first.bars_done == 0:
+            await first.changed().wait()
+        await manager.cancel(first.id)
+        second = manager.submit(dict(RUN_KWARGS))
+        await second.task
+        third = manager.submit(dict(RUN_KWARGS))
+        await third.task
+        return manager, first, second, third
+
+    manager, first, second, third = asyncio.run(scenario())
+
+    assert first.status == JOB_STATUS_CANCELLED
+    assert first.artifact_path is None
+    assert manager.get(first.id) is None
+    assert manager.get(second.id) is second and manager.get(third.id) is third
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted([f"{second.id}.npz", f"{third.id}.npz"])
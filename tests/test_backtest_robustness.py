@@ -0,0 +1,160 @@
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.services.backtesting.engine import AIPolicyBacktestEngine
+from app.services.backtesting.robustness import PolicyBacktestSeries
+from app.services.backtesting.robustness import WalkForwardFold
+from app.services.backtesting.robustness import build_candidates
+from app.services.backtesting.robustness import build_walk_forward_folds
+from app.services.backtesting.robustness import run_robustness_analysis
+from app.services.backtesting.robustness import simulate_policy
+
+STRATEGY = {"ema_fast": 5, "ema_slow": 12, "rsi_period": 5, "rsi_min": 50, "trailing_stop_pct": 0.02}
+POLICY = {
+    "min_confidence": 70,
+    "max_allocation_pct": 30,
+    "take_profit_pct": 3,
+    "stop_loss_pct": -2,
+    "cooldown_minutes": 60,
+}
+
+
+def _random_walk(count: int, seed: int = 7) -> list[dict[str, float | str]]:
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=UTC)
+    price = 100.0
+    candles: list[dict[str, float | str]] = []
+    for index in range(count):
+        price = max(1.0, price * (1 + rng.gauss(0.0003, 0.01)))
+        candles.append(
+            {
+                "timestamp": (start + timedelta(hours=index)).isoformat(),
+                "open": price,
+                "high": price,
+                "low": price,
+                "close": price,
+                "volume": 1.0,
+            }
+        )
+    return candles
+
+
+def test_simulation_matches_async_engine(monkeypatch) -> None:
+    candles = _random_walk(1_500)
+
+    async def fake_fetch_historical_data(**_kwargs):
+        return candles
+
+    monkeypatch.setattr("app.services.backtesting.engine.fetch_historical_data", fake_fetch_historical_data)
+    engine_result = asyncio.run(
+        AIPolicyBacktestEngine().run(
+            market="KRW-BTC",
+            start_date=datetime(2026, 1, 1, tzinfo=UTC),
+            end_date=datetime(2026, 3, 10, tzinfo=UTC),
+            initial_balance=1_000_000,
+            strategy=STRATEGY,
+            policy=POLICY,
+        )
+    )
+    [(strategy, policy)] = build_candidates(STRATEGY, POLICY, None)
+
+    simulated = simulate_policy(PolicyBacktestSeries.from_candles(candles), strategy, policy)
+
+    assert len(engine_result["trades"]) == simulated.trade_count > 0
+    assert simulated.final_equity == pytest.approx(engine_result["final_balance"], rel=1e-12)
+    assert simulated.max_drawdown_pct == pytest.approx(
+        max(point["drawdown_pct"] for point in engine_result["drawdown_curve"]), rel=1e-12
+    )
+
+
+def test_walk_forward_folds_roll_or_anchor_training_window() -> None:
+    assert build_walk_forward_folds(100, 40, 20) == [
+        WalkForwardFold(0, 40, 40, 60),
+        WalkForwardFold(20, 60, 60, 80),
+        WalkForwardFold(40, 80, 80, 100),
+    ]
+    anchored = build_walk_forward_folds(100, 40, 30, 30, anchored=True)
+    assert [(fold.train_start, fold.train_stop, fold.test_stop) for fold in anchored] == [(0, 40, 70), (0, 70, 100)]
+
+
+def test_grid_rejects_unknown_keys_and_skips_invalid_ema_pairs() -> None:
+    with pytest.raises(ValueError):
+        build_candidates(STRATEGY, POLICY, {"leverage": [2]})
+
+    candidates = build_candidates(STRATEGY, POLICY, {"ema_fast": [5, 12, 20], "min_confidence": [70, 90]})
+
+    assert {(strategy.ema_fast, policy.min_confidence) for strategy, policy in candidates} == {(5, 70), (5, 90)}
+
+
+def test_robustness_reports_out_of_sample_distributions_reproducibly() -> None:
+    candles = _random_walk(3_000)
+    kwargs = {
+        "base_strategy": STRATEGY,
+        "base_policy": POLICY,
+        "grid": {"min_confidence": [60, 80], "take_profit_pct": [2, 5]},
+        "train_bars": 600,
+        "test_bars": 300,
+        "monte_carlo_iterations": 700,
+        "max_workers": 1,
+        "seed": 3,
+    }
+
+    report = run_robustness_analysis(candles, **kwargs)
+
+    assert report == {**run_robustness_analysis(candles, **kwargs), "elapsed_seconds": report["elapsed_seconds"]}
+    assert report["candidates"] == 4 and len(report["folds"]) == 8
+    assert report["simulations"] == 8 * 4 + 8
+    assert report["budget_exhausted"] is False
+    for fold in report["folds"]:
+        assert fold["train"][1] < fold["test"][0]
+    for name in ("trade_resampling", "bar_bootstrap"):
+        monte_carlo = report["monte_carlo"][name]
+        assert monte_carlo["iterations"] == 700
+        distribution = monte_carlo["final_return_pct"]
+        assert distribution["ci_low"] <= distribution["median"] <= distribution["ci_high"]
+        assert 0.0 <= monte_carlo["probability_of_loss"] <= 1.0
+
+
+def test_robustness_stops_at_wall_clock_budget() -> None:
+    report = run_robustness_analysis(
+        _random_walk(2_000),
+        base_strategy=STRATEGY,
+        base_policy=POLICY,
+        train_bars=500,
+        test_bars=250,
+        budget_seconds=0.0,
+        max_workers=1,
+    )
+
+    assert report["budget_exhausted"] is True
+    assert report["folds"] == []
+    assert report["monte_carlo"] == {"trade_resampling": None, "bar_bootstrap": None}
+
+
+def test_concurrent_inline_runs_do_not_share_state() -> None:
+    kwargs = {
+        "base_strategy": STRATEGY,
+        "base_policy": POLICY,
+        "grid": {"min_confidence": [60, 80]},
+        "train_bars": 500,
+        "test_bars": 250,
+        "monte_carlo_iterations": 50,
+        "max_workers": 1,
+        "seed": 1,
+    }
+    datasets = [_random_walk(2_000, seed=seed) for seed in (11, 12, 13, 14)]
+
+    def run(candles):
+        report = run_robustness_analysis(candles, **kwargs)
+        report.pop("elapsed_seconds")
+        return report
+
+    expected = [run(candles) for candles in datasets]
+    with ThreadPoolExecutor(max_workers=len(datasets)) as pool:
+        concurrent = list(pool.map(run, datasets))
+
+    assert concurrent == expected
@@ -0,0 +1,141 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import httpx
+
+from app.core.rate_limit import TokenBucketLimiter
+from app.services.backtesting import data_loader
+from app.services.backtesting.data_loader import download_candles
+from app.services.backtesting.data_loader import fetch_historical_data
+
+LISTED_AT = datetime(2026, 1, 1, tzinfo=UTC)
+TOTAL_MINUTES = 1_500
+
+
+def _has_trade(minute: int) -> bool:
+    # 40~49분과 700~719분에는 거래가 없어 업비트가 캔들을 만들지 않은 구간입니다.
+    return not (40 <= minute < 50 or 700 <= minute < 720)
+
+
+class _FakeUpbit:
+    def __init__(self, *, truncate_once_at: datetime | None = None, fail_once_at: datetime | None = None) -> None:
+        self.truncate_once_at = truncate_once_at
+        self.fail_once_at = fail_once_at
+        self.requests: list[datetime] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        to_cursor = datetime.strptime(request.url.params["to"], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=UTC)
+        self.requests.append(to_cursor)
+        if to_cursor == self.fail_once_at:
+            self.fail_once_at = None
+            return httpx.Response(429, json={"error": "too many requests"})
+        rows = []
+        minute = int((to_cursor - LISTED_AT).total_seconds() // 60) - 1
+        while minute >= 0 and len(rows) < int(request.url.params["count"]):
+            if minute < TOTAL_MINUTES and _has_trade(minute):
+                timestamp = LISTED_AT + timedelta(minutes=minute)
+                rows.append(
+                    {
+                        "candle_date_time_utc": timestamp.strftime("%Y-%m-%dT%H:%M:%S"),
+                        "opening_price": float(minute),
+                        "high_price": float(minute) + 1,
+                        "low_price": float(minute) - 1,
+                        "trade_price": float(minute) + 0.5,
+                        "candle_acc_trade_volume": 1.0,
+                    }
+                )
+            minute -= 1
+        if to_cursor == self.truncate_once_at:
+            self.truncate_once_at = None
+            rows = rows[:50]
+        return httpx.Response(200, json=rows)
+
+    def client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+
+
+def _expected(start_minute: int, end_minute: int) -> list[str]:
+    return [
+        (LISTED_AT + timedelta(minutes=minute)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        for minute in range(start_minute, end_minute + 1)
+        if _has_trade(minute)
+    ]
+
+
+def _download(upbit: _FakeUpbit, start_minute: int, end_minute: int, **kwargs):
+    async def scenario():
+        async with upbit.client() as client:
+            return await download_candles(
+                "krw-btc",
+                "1m",
+                LISTED_AT + timedelta(minutes=start_minute),
+                LISTED_AT + timedelta(minutes=end_minute),
+                client=client,
+                rate_limiter=TokenBucketLimiter(10_000, burst=100),
+                **kwargs,
+            )
+
+    return asyncio.run(scenario())
+
+
+def test_download_fetches_precomputed_windows_and_reports_empty_slots() -> None:
+    upbit = _FakeUpbit()
+
+    candles, report = _download(upbit, 10, 1_209)
+
+    assert [candle["timestamp"] for candle in candles] == _expected(10, 1_209)
+    assert report.pages == 6 and report.followup_pages == 0
+    assert report.rows == len(candles)
+    assert report.empty_slots == 30
+    # 커서는 응답을 기다리지 않고 끝 시각부터 200봉 간격으로 미리 계산됩니다.
+    assert sorted(upbit.requests, reverse=True) == [
+        LISTED_AT + timedelta(minutes=1_210 - 200 * index) for index in range(6)
+    ]
+
+
+def test_download_retries_rate_limit_and_repairs_truncated_page(monkeypatch) -> None:
+    monkeypatch.setattr(data_loader, "UPBIT_CANDLE_RETRY_BASE_SECONDS", 0.0)
+    upbit = _FakeUpbit(
+        truncate_once_at=LISTED_AT + timedelta(minutes=1_010),
+        fail_once_at=LISTED_AT + timedelta(minutes=610),
+    )
+
+    candles, report = _download(upbit, 10, 1_209, fill_gaps=True)
+
+    assert report.retries == 1
+    assert report.followup_pages >= 1
+    assert report.filled_slots == 30
+    timestamps = [candle["timestamp"] for candle in candles]
+    assert timestamps == [
+        (LISTED_AT + timedelta(minutes=minute)).strftime("%Y-%m-%dT%H:%M:%SZ") for minute in range(10, 1_210)
+    ]
+    filled = candles[timestamps.index("2026-01-01T00:40:00Z")]
+    assert filled["volume"] == 0.0 and filled["open"] == filled["close"] == 39.5
+
+
+def test_fetch_historical_data_reuses_covering_seeded_cache(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(data_loader, "_project_root", lambda: tmp_path)
+    seeded = [
+        {"timestamp": timestamp, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0}
+        for timestamp in _expected(0, 300)
+    ]
+    data_loader._write_cached_csv(
+        data_loader._cache_file_path("KRW-BTC", "1m", LISTED_AT, LISTED_AT + timedelta(minutes=300)),
+        seeded,
+    )
+
+    async def unexpected_download(*_args, **_kwargs):
+        raise AssertionError("covering cache should be used")
+
+    monkeypatch.setattr(data_loader, "download_candles", unexpected_download)
+
+    candles = asyncio.run(
+        fetch_historical_data(
+            "KRW-BTC",
+            "1m",
+            LISTED_AT + timedelta(minutes=100),
+            LISTED_AT + timedelta(minutes=120),
+        )
+    )
+
+    assert [candle["timestamp"] for candle in candles] == _expected(100, 120)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any
+
+from sqlalchemy.dialects import postgresql
+
+from app.db import repository
+from app.services.chat import tools as chat_tools
+
+
+class _CapturingSession:
+    def __init__(self) -> None:
+        self.statements: list[Any] = []
+
+    async def execute(self, statement: Any) -> Any:
+        self.statements.append(statement)
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: []))
+
+
+def test_search_chat_history_is_ranked_paginated_and_escaped() -> None:
+    db = _CapturingSession()
+
+    asyncio.run(repository.search_chat_history(db, "s1", "비트코인 100%_손절", limit=5, offset=10))  # type: ignore[arg-type]
+
+    compiled = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    params = db.statements[0].compile(dialect=postgresql.dialect()).params
+    assert "word_similarity" in compiled
+    assert "LIMIT" in compiled and "OFFSET" in compiled
+    assert "%100\\%\\_손절%" in params.values()
+
+
+def test_search_past_conversations_reports_next_page(monkeypatch) -> None:
+    calls: list[dict[str, Any]] = []
+    created_at = datetime(2026, 5, 1, tzinfo=timezone.utc)
+
+    class _FakeSessionFactory:
+        async def __aenter__(self) -> object:
+            return object()
+
+        async def __aexit__(self, *_exc: Any) -> None:
+            return None
+
+    async def fake_search(_db: Any, session_id: str, keyword: str, *, limit: int, offset: int) -> list[Any]:
+        calls.append({"session_id": session_id, "keyword": keyword, "limit": limit, "offset": offset})
+        return [
+            SimpleNamespace(created_at=created_at, role="user", agent_name=None, is_tool_call=False, content=f"비트코인 {index}")
+            for index in range(limit)
+        ]
+
+    monkeypatch.setattr(chat_tools, "AsyncSessionLocal", _FakeSessionFactory)
+    monkeypatch.setattr(chat_tools, "search_chat_history", fake_search)
+    tools_by_name = {item.name: item for item in chat_tools.build_chat_tools("session-1")}
+
+    output = asyncio.run(tools_by_name["search_past_conversations"].ainvoke({"keyword": "비트코인", "page": 2}))
+
+    page_size = repository.CHAT_HISTORY_SEARCH_PAGE_SIZE
+    assert calls == [{"session_id": "session-1", "keyword": "비트코인", "limit": page_size + 1, "offset": page_size}]
+    assert output.count("\n- ") == page_size
+    assert "page=3" in output
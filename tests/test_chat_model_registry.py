@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from langchain_core.tools import tool
+from pydantic import BaseModel
+
+from app.core.metrics import CHAT_MODEL_CACHE_TOTAL
+from app.services.ai import provider_router
+from app.services.ai.provider_router import AIProviderCandidate
+from app.services.ai.provider_router import AIProviderRouter
+from app.services.chat.model_registry import ChatModelRegistry
+
+
+class _FakeChatModel:
+    def __init__(self, model: str) -> None:
+        self.model = model
+        self.bind_calls = 0
+        self.structured_calls = 0
+
+    def bind_tools(self, tools: list[Any]) -> tuple[str, tuple[str, ...]]:
+        self.bind_calls += 1
+        return ("tools", tuple(item.name for item in tools))
+
+    def with_structured_output(self, schema: type[BaseModel], *, include_raw: bool = False) -> tuple[str, str]:
+        self.structured_calls += 1
+        return ("structured", schema.__name__)
+
+
+class _Decision(BaseModel):
+    answer: str
+
+
+def _session_tools(session_id: str) -> list[Any]:
+    @tool
+    async def get_realtime_ticker(symbol: str) -> str:
+        """실시간 시세를 조회합니다."""
+        return f"{session_id}:{symbol}"
+
+    return [get_realtime_ticker]
+
+
+def test_registry_reuses_bound_models_across_sessions() -> None:
+    built: list[_FakeChatModel] = []
+
+    def builder(candidate: AIProviderCandidate) -> _FakeChatModel:
+        model = _FakeChatModel(candidate.model)
+        built.append(model)
+        return model
+
+    registry = ChatModelRegistry(builder=builder)
+    candidate = AIProviderCandidate(provider="openai", model="gpt-test")
+    hits_before = CHAT_MODEL_CACHE_TOTAL.value(provider="openai", kind="tools", result="hit")
+
+    async def scenario() -> list[Any]:
+        return [
+            registry.get_tool_model(candidate, _session_tools("s1")),
+            registry.get_tool_model(candidate, _session_tools("s2")),
+            registry.get_structured_model(candidate, _Decision, include_raw=True),
+            registry.get_structured_model(candidate, _Decision, include_raw=True),
+        ]
+
+    first_tools, second_tools, first_structured, second_structured = asyncio.run(scenario())
+
+    assert len(built) == 1
+    assert first_tools is second_tools
+    assert first_structured is second_structured
+    assert built[0].bind_calls == 1
+    assert built[0].structured_calls == 1
+    assert CHAT_MODEL_CACHE_TOTAL.value(provider="openai", kind="tools", result="hit") == hits_before + 1
+
+
+def test_router_reads_provider_configs_once_per_instance(monkeypatch) -> None:
+    lookups: list[tuple[str, ...]] = []
+    saved: list[str] = []
+
+    async def fake_get_values(_db: Any, keys: tuple[str, ...]) -> dict[str, str]:
+        lookups.append(tuple(keys))
+        return {}
+
+    async def fake_upsert(_db: Any, _key: str, value: str, _description: str) -> None:
+        saved.append(value)
+
+    monkeypatch.setattr(provider_router, "get_system_config_values", fake_get_values)
+    monkeypatch.setattr(provider_router, "upsert_system_config", fake_upsert)
+    monkeypatch.setattr(provider_router, "_has_valid_api_key", lambda _provider: True)
+
+    router = AIProviderRouter(db=None)  # type: ignore[arg-type]
+
+    async def operation(candidate: AIProviderCandidate) -> str:
+        return candidate.provider
+
+    async def scenario() -> None:
+        for _ in range(3):
+            await router.execute(operation, purpose="chat")
+
+    asyncio.run(scenario())
+
+    assert len(lookups) == 1
+    assert len(saved) == 3
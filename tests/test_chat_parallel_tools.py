@@ -0,0 +1,91 @@
+# ruff: noqa: E402
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from typing import Any
+
+stub_orchestrator = sys.modules.get("app.services.chat.orchestrator")
+if stub_orchestrator is not None and not hasattr(stub_orchestrator, "_run_worker_agent"):
+    del sys.modules["app.services.chat.orchestrator"]
+
+from langchain_core.messages import AIMessage
+from langchain_core.tools import tool
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import app.services.chat.orchestrator as orchestrator
+
+
+def _build_tools(finished: list[str]) -> dict[str, Any]:
+    @tool
+    async def get_realtime_ticker(symbol: str) -> str:
+        """시세 조회"""
+        await asyncio.sleep(0.1)
+        finished.append("ticker")
+        return f"ticker:{symbol}"
+
+    @tool
+    async def get_technical_indicators(symbol: str) -> str:
+        """지표 조회"""
+        await asyncio.sleep(0.02)
+        finished.append("indicators")
+        return f"indicators:{symbol}"
+
+    @tool
+    async def get_market_sentiment() -> str:
+        """심리 조회"""
+        await asyncio.sleep(5)
+        return "never"
+
+    return {
+        item.name: item
+        for item in (get_realtime_ticker, get_technical_indicators, get_market_sentiment)
+    }
+
+
+def test_worker_agent_runs_tool_calls_concurrently_and_keeps_call_order(monkeypatch) -> None:
+    finished: list[str] = []
+    tools_by_name = _build_tools(finished)
+    captured: list[list[Any]] = []
+    responses = iter(
+        [
+            AIMessage(
+                content="",
+                tool_calls=[
+                    {"name": "get_realtime_ticker", "args": {"symbol": "KRW-BTC"}, "id": "call-1"},
+                    {"name": "get_technical_indicators", "args": {"symbol": "KRW-BTC"}, "id": "call-2"},
+                    {"name": "get_market_sentiment", "args": {}, "id": "call-3"},
+                    {"name": "unknown_tool", "args": {}, "id": "call-4"},
+                ],
+            ),
+            AIMessage(content="완료"),
+        ]
+    )
+
+    async def fake_tool_model(_state: Any, _tools: Any, conversation: list[Any]) -> AIMessage:
+        captured.append(list(conversation))
+        return next(responses)
+
+    monkeypatch.setattr(orchestrator, "_get_filtered_tools", lambda *_args: tools_by_name)
+    monkeypatch.setattr(orchestrator, "_ainvoke_tool_model", fake_tool_model)
+    monkeypatch.setattr(orchestrator, "TOOL_CALL_TIMEOUT_OVERRIDES", {"get_market_sentiment": 0.2})
+
+    started_at = time.perf_counter()
+    result = asyncio.run(
+        orchestrator._run_worker_agent(
+            {"session_id": "s1", "messages": [], "db": AsyncSession()},
+            agent_name="quant_agent",
+            system_prompt="system",
+            allowed_tool_names=orchestrator.QUANT_TOOL_NAMES,
+        )
+    )
+    elapsed = time.perf_counter() - started_at
+
+    tool_messages = captured[1][-4:]
+    assert [message.tool_call_id for message in tool_messages] == ["call-1", "call-2", "call-3", "call-4"]
+    assert [message.status for message in tool_messages] == ["success", "success", "error", "error"]
+    assert "초과" in tool_messages[2].content
+    assert finished == ["indicators", "ticker"]
+    assert elapsed < 0.5
+    assert result["messages"][0].content == "완료"
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from app.core.config import settings
+from app.services.chat import working_memory
+from app.services.chat.working_memory import SUMMARY_HEADER
+from app.services.chat.working_memory import TRUNCATED_SUFFIX
+from app.services.chat.working_memory import assemble_working_memory
+from app.services.chat.working_memory import estimate_tokens
+from app.services.chat.working_memory import split_rows_for_summary
+
+
+def _row(message_id: int, role: str, content: str, token_count: int | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=message_id,
+        role=role,
+        content=content,
+        agent_name="supervisor" if role == "assistant" else None,
+        token_count=token_count,
+    )
+
+
+def test_estimate_tokens_counts_hangul_per_character() -> None:
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("비트코인") == 4
+    assert estimate_tokens("abcdefgh") == 2
+
+
+def test_working_memory_keeps_recent_messages_within_budget_and_prepends_summary() -> None:
+    rows = [
+        _row(1, "user", "오래된 질문", token_count=60),
+        _row(2, "assistant", "오래된 긴 답변", token_count=60),
+        _row(3, "user", "최근 질문", token_count=30),
+        _row(4, "assistant", "최근 답변", token_count=30),
+    ]
+
+    memory = assemble_working_memory(
+        rows,
+        summary="- 사용자는 KRW-BTC 에 관심",
+        summary_token_count=20,
+        token_budget=100,
+        message_token_cap=500,
+    )
+
+    assert memory.dropped_message_count == 2
+    assert memory.needs_summary
+    assert memory.token_count == 80
+    assert isinstance(memory.messages[0], HumanMessage)
+    assert memory.messages[0].content.startswith(SUMMARY_HEADER)
+    assert [message.content for message in memory.messages[1:]] == ["최근 질문", "최근 답변"]
+    assert isinstance(memory.messages[-1], AIMessage)
+
+
+def test_working_memory_truncates_oversized_messages() -> None:
+    rows = [_row(1, "assistant", "가" * 1000)]
+
+    memory = assemble_working_memory(rows, token_budget=50, message_token_cap=40)
+
+    assert not memory.needs_summary
+    assert memory.messages[0].content.endswith(TRUNCATED_SUFFIX)
+    assert memory.token_count <= 45
+
+
+def test_split_rows_for_summary_keeps_newest_messages() -> None:
+    rows = [_row(index, "user", "질문", token_count=10) for index in range(1, 6)]
+
+    to_summarize, kept = split_rows_for_summary(rows, keep_token_budget=25)
+
+    assert [row.id for row in to_summarize] == [1, 2, 3]
+    assert [row.id for row in kept] == [4, 5]
+
+
+def test_refresh_summary_walks_forward_without_skipping_old_messages(monkeypatch) -> None:
+    rows = [_row(index, "user", "질문", token_count=10) for index in range(1, 451)]
+    session = SimpleNamespace(memory_summary="", memory_summary_until_id=None, memory_summary_token_count=0)
+    summarized_ranges: list[tuple[int, int]] = []
+
+    class FakeSessionFactory:
+        async def __aenter__(self) -> object:
+            return object()
+
+        async def __aexit__(self, *_exc: Any) -> None:
+            return None
+
+    class FakeRouter:
+        def __init__(self, _db: object) -> None:
+            pass
+
+        async def generate_report(self, prompt: str, **_kwargs: Any) -> SimpleNamespace:
+            return SimpleNamespace(value=f"요약 {len(summarized_ranges) + 1}")
+
+    async def get_session(_db, _session_id: str) -> SimpleNamespace:
+        return session
+
+    async def get_recent(_db, _session_id: str, limit: int, *, after_message_id: int | None = None):
+        return [row for row in rows if after_message_id is None or row.id > after_message_id][-limit:]
+
+    async def get_after(_db, _session_id: str, *, after_message_id, before_message_id=None, limit: int):
+        return [
+            row
+            for row in rows
+            if (after_message_id is None or row.id > after_message_id)
+            and (before_message_id is None or row.id < before_message_id)
+        ][:limit]
+
+    async def update_summary(_db, _session_id: str, *, summary: str, until_message_id: int, token_count: int):
+        start = (session.memory_summary_until_id or 0) + 1
+        summarized_ranges.append((start, until_message_id))
+        session.memory_summary = summary
+        session.memory_summary_until_id = until_message_id
+
+    monkeypatch.setattr(settings, "chat_working_memory_token_budget", 100)
+    monkeypatch.setattr(working_memory, "AsyncSessionLocal", FakeSessionFactory)
+    monkeypatch.setattr(working_memory, "AIProviderRouter", FakeRouter)
+    monkeypatch.setattr(working_memory, "get_chat_session_record", get_session)
+    monkeypatch.setattr(working_memory, "get_recent_chat_messages", get_recent)
+    monkeypatch.setattr(working_memory, "get_chat_messages_after", get_after)
+    monkeypatch.setattr(working_memory, "update_chat_session_memory_summary", update_summary)
+
+    assert asyncio.run(working_memory.refresh_session_summary("session-1")) is True
+
+    # 최근 5개(50토큰 = 예산 100 * 0.5)는 원문으로 남기고 1번부터 빠짐없이 요약합니다.
+    assert summarized_ranges == [(1, 200), (201, 400), (401, 445)]
+    assert session.memory_summary == "요약 3"
@@ -0,0 +1,174 @@
+import asyncio
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from app.services.brokers.upbit import UpbitAPIError
+from app.services.trading.liquidation import LiquidationExecutor
+from app.services.trading.liquidation import OrderRateLimiter
+
+
+class _FakeBroker:
+    def __init__(self, accounts: list[dict[str, Any]], prices: dict[str, float], *, order_delay: float = 0.05) -> None:
+        self.accounts = accounts
+        self.prices = prices
+        self.order_delay = order_delay
+        self.hang_markets: set[str] = set()
+        self.orders: dict[str, dict[str, Any]] = {}
+        self.ticker_calls: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_accounts(self) -> list[dict[str, Any]]:
+        return self.accounts
+
+    async def get_ticker(self, markets: list[str]) -> list[dict[str, Any]]:
+        self.ticker_calls.append(markets)
+        return [{"market": market, "trade_price": self.prices[market]} for market in markets if market in self.prices]
+
+    async def create_order(self, *, market: str, side: str, ord_type: str, volume: str, identifier: str) -> dict:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(1.0 if market in self.hang_markets else self.order_delay)
+        finally:
+            self.in_flight -= 1
+        order = {"uuid": f"uuid-{market}", "identifier": identifier, "state": "wait", "executed_volume": "0"}
+        self.orders[order["uuid"]] = {**order, "volume": volume}
+        return order
+
+    async def get_orders_by_uuids(self, uuids: list[str]) -> list[dict[str, Any]]:
+        rows = []
+        for order_uuid in uuids:
+            order = self.orders[order_uuid]
+            rows.append({**order, "state": "done", "executed_volume": order["volume"], "executed_funds": "12345"})
+        return rows
+
+    async def get_order(self, *, identifier: str) -> dict[str, Any]:
+        return {"uuid": f"late-{identifier}", "state": "done", "executed_volume": "1"}
+
+
+def _account(currency: str, balance: float, locked: float = 0.0) -> dict[str, Any]:
+    return {"currency": currency, "balance": str(balance), "locked": str(locked)}
+
+
+def test_liquidation_submits_sells_concurrently_and_reports_per_market() -> None:
+    coins = [f"C{index}" for index in range(12)]
+    broker = _FakeBroker(
+        [_account("KRW", 100_000), *[_account(coin, 1.0) for coin in coins], _account("DUST", 1.0), _account("AIR", 5.0)],
+        {**{f"KRW-{coin}": 10_000.0 for coin in coins}, "KRW-DUST": 10.0},
+    )
+    executor = LiquidationExecutor(
+        broker,
+        rate_limiter=OrderRateLimiter(rate_per_second=1000),
+        poll_interval=0.01,
+    )
+
+    report = asyncio.run(executor.liquidate_all())
+
+    assert broker.ticker_calls == [sorted(f"KRW-{coin}" for coin in [*coins, "DUST", "AIR"])]
+    assert broker.max_in_flight == len(coins)
+    assert report.submit_seconds < 0.05 * 3
+    statuses = {result.market: result.status for result in report.results}
+    assert statuses["KRW-DUST"] == "below_min_order"
+    assert statuses["KRW-AIR"] == "no_market"
+    assert [statuses[f"KRW-{coin}"] for coin in coins] == ["filled"] * len(coins)
+    payload = report.to_dict()
+    assert payload["results"][0]["executed_krw"] == 12345.0
+    assert "체결 12건" in payload["message"]
+
+
+def test_submit_timeout_is_resolved_by_identifier() -> None:
+    broker = _FakeBroker([_account("BTC", 1.0), _account("ETH", 1.0)], {"KRW-BTC": 100_000.0, "KRW-ETH": 10_000.0})
+    broker.hang_markets = {"KRW-BTC"}
+    executor = LiquidationExecutor(
+        broker,
+        rate_limiter=OrderRateLimiter(rate_per_second=1000),
+        submit_timeout=0.1,
+        poll_interval=0.01,
+    )
+
+    report = asyncio.run(executor.liquidate_all())
+
+    btc = next(result for result in report.results if result.market == "KRW-BTC")
+    assert btc.identifier is not None and btc.identifier.startswith(f"liq-{report.run_id}-")
+    assert btc.order_uuid == f"late-{btc.identifier}"
+    assert btc.status == "filled"
+    assert report.submit_seconds < 0.5
+
+
+class _RetryingFakeBroker(_FakeBroker):
+    """첫 주문 요청은 접수되지만 응답이 시간 초과되고, 같은 identifier 재시도가 ``final_error`` 로 끝나는 브로커."""
+
+    def __init__(self, *args: Any, final_error: Exception, rejected: dict[str, Exception], **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.final_error = final_error
+        self.rejected = rejected
+        self.accepted: set[str] = set()
+        self.lookups: list[str] = []
+
+    async def create_order(self, *, market: str, side: str, ord_type: str, volume: str, identifier: str) -> dict:
+        if market in self.rejected:
+            raise self.rejected[market]
+        # 첫 시도는 접수만 되고 응답이 사라지며, 브로커 재시도의 마지막 오류만 호출자에게 전달됩니다.
+        self.accepted.add(identifier)
+        raise self.final_error
+
+    async def get_order(self, *, identifier: str) -> dict[str, Any]:
+        self.lookups.append(identifier)
+        return await super().get_order(identifier=identifier)
+
+
+@pytest.mark.parametrize(
+    "final_error",
+    [
+        UpbitAPIError(400, {"error": {"name": "duplicate_identifier"}}, error_name="duplicate_identifier"),
+        httpx.ReadTimeout("read timed out"),
+    ],
+)
+def test_accepted_order_whose_retry_failed_is_resolved_by_identifier(final_error: Exception) -> None:
+    broker = _RetryingFakeBroker(
+        [_account("BTC", 1.0), _account("ETH", 1.0)],
+        {"KRW-BTC": 100_000.0, "KRW-ETH": 10_000.0},
+        final_error=final_error,
+        rejected={
+            "KRW-ETH": UpbitAPIError(
+                400,
+                {"error": {"name": "insufficient_funds_ask"}},
+                error_name="insufficient_funds_ask",
+            )
+        },
+    )
+    executor = LiquidationExecutor(broker, rate_limiter=OrderRateLimiter(rate_per_second=1000), poll_interval=0.01)
+
+    report = asyncio.run(executor.liquidate_all())
+
+    statuses = {result.market: result.status for result in report.results}
+    btc = next(result for result in report.results if result.market == "KRW-BTC")
+    assert broker.accepted == {btc.identifier}
+    assert broker.lookups == [btc.identifier]
+    assert statuses == {"KRW-BTC": "filled", "KRW-ETH": "submit_failed"}
+    assert btc.order_uuid == f"late-{btc.identifier}"
+    assert btc.error is None
+
+
+def test_order_rate_limiter_allows_burst_then_spaces_requests() -> None:
+    async def scenario() -> list[float]:
+        limiter = OrderRateLimiter(rate_per_second=20, burst=2)
+        started_at = time.perf_counter()
+        offsets: list[float] = []
+
+        async def acquire() -> None:
+            await limiter.acquire()
+            offsets.append(time.perf_counter() - started_at)
+
+        await asyncio.gather(*(acquire() for _ in range(4)))
+        return sorted(offsets)
+
+    offsets = asyncio.run(scenario())
+
+    assert offsets[1] < 0.03
+    assert 0.04 <= offsets[2] < 0.09
+    assert 0.09 <= offsets[3] < 0.15
@@ -0,0 +1,116 @@
+import math
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.services.indicators import IndicatorCache, IndicatorCalculator
+from app.services.indicators import cache as indicator_cache_module
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+def _candles(closes: list[float], *, offset: int = 0) -> list[dict[str, float | str]]:
+    return [
+        {
+            "timestamp": (START + timedelta(minutes=15 * (offset + index))).isoformat(),
+            "open": close,
+            "high": close,
+            "low": close,
+            "close": close,
+            "volume": 1.0,
+        }
+        for index, close in enumerate(closes)
+    ]
+
+
+def _random_closes(count: int, seed: int = 7) -> list[float]:
+    rng = random.Random(seed)
+    closes = [100.0]
+    for _ in range(count - 1):
+        closes.append(max(1.0, closes[-1] * (1 + rng.uniform(-0.03, 0.03))))
+    return closes
+
+
+def _assert_rows_close(actual: list[dict], expected: list[dict]) -> None:
+    assert len(actual) == len(expected)
+    for actual_row, expected_row in zip(actual, expected):
+        for column in IndicatorCalculator.INDICATOR_COLUMNS:
+            if expected_row[column] is None:
+                assert actual_row[column] is None, column
+            else:
+                assert actual_row[column] == pytest.approx(expected_row[column], rel=1e-9), column
+
+
+class _Clock:
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _counting_cache(monkeypatch: pytest.MonkeyPatch, clock: _Clock) -> tuple[IndicatorCache, list[float]]:
+    updates: list[float] = []
+    original_update = indicator_cache_module.IndicatorState.update
+
+    def counting_update(self, close: float):
+        updates.append(close)
+        return original_update(self, close)
+
+    monkeypatch.setattr(indicator_cache_module.IndicatorState, "update", counting_update)
+    return IndicatorCache(clock=clock), updates
+
+
+def test_cache_matches_full_calculator_output() -> None:
+    candles = _candles(_random_closes(230))
+
+    enriched = IndicatorCache().enrich("KRW-BTC", "15m", candles)
+
+    _assert_rows_close(enriched, IndicatorCalculator().calculate_from_candles(candles))
+    assert enriched[-1]["timestamp"] == candles[-1]["timestamp"]
+    assert math.isfinite(enriched[-1]["ema_200"])
+
+
+def test_cache_reuses_closed_bars_and_appends_only_new_ones(monkeypatch: pytest.MonkeyPatch) -> None:
+    closes = _random_closes(202)
+    clock = _Clock(START + timedelta(minutes=15 * 200))
+    cache, updates = _counting_cache(monkeypatch, clock)
+
+    cache.enrich("krw-btc", "15m", _candles(closes[:200]))
+    assert len(updates) == 200  # 마감 봉 199개 + 진행 중인 봉
+
+    updates.clear()
+    forming_changed = _candles([*closes[:199], closes[199] * 1.01])
+    cache.enrich("KRW-BTC", "15m", forming_changed)
+    assert len(updates) == 1
+
+    updates.clear()
+    slid = _candles(closes[2:202], offset=2)
+    enriched = cache.enrich("KRW-BTC", "15m", slid)
+    assert len(updates) == 3  # 새로 마감된 봉 2개 + 진행 중인 봉
+
+    # 이어 붙인 결과는 전체 이력(202봉)을 한 번에 계산한 값과 같습니다.
+    _assert_rows_close(enriched, IndicatorCalculator().calculate_from_candles(_candles(closes))[2:])
+
+
+def test_cache_expires_after_next_bar_close_and_rebuilds_on_gaps(monkeypatch: pytest.MonkeyPatch) -> None:
+    closes = _random_closes(120)
+    clock = _Clock(START)
+    cache, updates = _counting_cache(monkeypatch, clock)
+
+    cache.enrich("KRW-ETH", "15m", _candles(closes[:100]))
+    updates.clear()
+
+    clock.now = START + timedelta(minutes=15 * (98 + 3))
+    cache.enrich("KRW-ETH", "15m", _candles(closes[:100]))
+    assert len(updates) == 100
+
+    updates.clear()
+    clock.now = START
+    gapped = _candles(closes[10:110], offset=110)
+    cache.enrich("KRW-ETH", "15m", gapped)
+    assert len(updates) == 100
+
+    unsupported = cache.enrich("KRW-ETH", "unknown", _candles(closes[:30]))
+    assert unsupported[-1]["sma_20"] == pytest.approx(sum(closes[10:30]) / 20)
@@ -0,0 +1,42 @@
+import math
+
+import numpy as np
+import pytest
+
+from app.services.indicators import IndicatorCalculator, indicator_records, nan_to_none
+
+
+def test_calculate_columns_returns_float_arrays_with_nan_warmup() -> None:
+    calculator = IndicatorCalculator()
+    close = np.linspace(100.0, 130.0, 30)
+
+    columns = calculator.calculate_columns(close)
+
+    assert list(columns) == list(IndicatorCalculator.INDICATOR_COLUMNS)
+    assert all(values.dtype == np.float64 and values.shape == (30,) for values in columns.values())
+    assert np.isnan(columns["sma_20"][18]) and columns["sma_20"][19] == pytest.approx(close[:20].mean())
+    assert np.isnan(columns["sma_60"]).all()
+    assert np.isnan(columns["ema_200"]).all()
+
+
+def test_calculate_from_candles_converts_nan_once_at_record_boundary() -> None:
+    candles = [
+        {"timestamp": str(index), "open": 1, "high": 1, "low": 1, "close": str(100 + index), "volume": None}
+        for index in range(25)
+    ]
+    candles[3]["close"] = "n/a"
+
+    enriched = IndicatorCalculator().calculate_from_candles(candles)
+
+    assert enriched[0]["timestamp"] == "0" and enriched[0]["close"] == "100"
+    assert enriched[0]["sma_5"] is None
+    assert enriched[-1]["sma_5"] == pytest.approx(sum(range(120, 125)) / 5)
+    assert all(row["rsi_14"] is None or math.isfinite(row["rsi_14"]) for row in enriched)
+
+
+def test_indicator_records_and_nan_to_none() -> None:
+    values = np.array([1.5, np.nan, np.inf])
+
+    assert nan_to_none(values) == [1.5, None, None]
+    records = indicator_records([{"t": 1}, {"t": 2}, {"t": 3}], {"x": values})
+    assert records == [{"t": 1, "x": 1.5}, {"t": 2, "x": None}, {"t": 3, "x": None}]
@@ -0,0 +1,95 @@
+import asyncio
+from typing import Any
+
+from app.core.event_hub import RESYNC_EVENT
+from app.core.event_hub import LiveEventHub
+from app.services.live_updates import LiveUpdateProducer
+
+
+class _FakeResult:
+    def __init__(self, values: list[str]) -> None:
+        self.values = values
+
+    def scalars(self) -> "_FakeResult":
+        return self
+
+    def all(self) -> list[str]:
+        return self.values
+
+
+class _FakeSession:
+    def __init__(self, symbols: list[str]) -> None:
+        self.symbols = symbols
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        return None
+
+    async def execute(self, _statement: Any) -> _FakeResult:
+        return _FakeResult(self.symbols)
+
+
+class _FakeBroker:
+    def __init__(self) -> None:
+        self.prices = {"KRW-BTC": 100.0, "KRW-ETH": 10.0}
+        self.calls = 0
+
+    async def get_ticker(self, markets: list[str]) -> list[dict[str, Any]]:
+        self.calls += 1
+        return [{"market": market, "trade_price": self.prices[market]} for market in markets]
+
+
+def test_hub_fans_out_to_all_subscribers_and_resyncs_slow_ones() -> None:
+    async def scenario() -> tuple[list[str], list[str], int]:
+        hub = LiveEventHub(queue_size=2)
+        hub.publish("bot_status", {"running": True})  # 구독자가 없으면 버려집니다.
+        async with hub.subscribe() as fast, hub.subscribe() as slow:
+            hub.publish("bot_status", {"running": True})
+            fast_types = [(await fast.get(timeout=0.1)).type]
+            for index in range(3):
+                hub.publish("tickers", [{"symbol": f"KRW-{index}"}])
+                fast_types.append((await fast.get(timeout=0.1)).type)
+            slow_types = []
+            while (event := await slow.get(timeout=0.01)) is not None:
+                slow_types.append(event.type)
+            return fast_types, slow_types, hub.subscriber_count
+
+    fast_types, slow_types, subscriber_count = asyncio.run(scenario())
+
+    assert fast_types == ["bot_status", "tickers", "tickers", "tickers"]
+    assert slow_types == [RESYNC_EVENT, "tickers"]
+    assert subscriber_count == 2
+
+
+def test_producer_polls_once_for_all_clients_and_publishes_only_changed_tickers() -> None:
+    async def scenario() -> tuple[list[list[dict[str, Any]]], int]:
+        hub = LiveEventHub()
+        broker = _FakeBroker()
+        producer = LiveUpdateProducer(
+            hub,
+            lambda: _FakeSession(["krw-btc", "KRW-ETH", "KRW-BTC"]),
+            broker=broker,
+        )
+        published: list[list[dict[str, Any]]] = []
+        async with hub.subscribe() as first, hub.subscribe() as second:
+            assert await producer.publish_tickers() == 2
+            assert await producer.publish_tickers() == 0
+            broker.prices["KRW-ETH"] = 11.0
+            assert await producer.publish_tickers() == 1
+            for subscription in (first, second):
+                while (event := await subscription.get(timeout=0.01)) is not None:
+                    published.append(event.data)
+        return published, broker.calls
+
+    published, broker_calls = asyncio.run(scenario())
+
+    assert broker_calls == 3
+    assert [[item["symbol"] for item in payload] for payload in published] == [
+        ["KRW-BTC", "KRW-ETH"],
+        ["KRW-ETH"],
+        ["KRW-BTC", "KRW-ETH"],
+        ["KRW-ETH"],
+    ]
+    assert published[1][0]["current_price"] == 11.0
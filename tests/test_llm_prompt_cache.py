@@ -0,0 +1,170 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from app.core.config import settings
+from app.core.metrics import record_llm_usage
+from app.models.schemas import AIAnalysisResponse
+from app.services.ai import provider_router
+from app.services.ai.provider_router import AIProviderCandidate
+from app.services.ai.provider_router import AIProviderRouter
+from app.services.ai.providers import gemini
+from app.services.trading.ai_analyst import _build_analysis_user_prompt
+from app.services.trading.ai_analyst import build_analysis_system_prompt
+
+RESPONSE = AIAnalysisResponse(decision="HOLD", confidence=40, recommended_weight=0, reasoning="캐시 테스트")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeModels:
+    def __init__(self, missing_cache: bool = False) -> None:
+        self.missing_cache = missing_cache
+        self.configs: list[Any] = []
+
+    async def generate_content(self, *, model: str, contents: str, config: Any) -> Any:
+        self.configs.append(config)
+        if config.cached_content and self.missing_cache:
+            raise RuntimeError("404 NOT_FOUND: CachedContent not found (or permission denied)")
+        return SimpleNamespace(
+            parsed=RESPONSE,
+            usage_metadata=SimpleNamespace(
+                prompt_token_count=1_500,
+                candidates_token_count=80,
+                cached_content_token_count=1_200 if config.cached_content else None,
+            ),
+        )
+
+
+class _FakeCaches:
+    def __init__(self) -> None:
+        self.created: list[Any] = []
+
+    async def create(self, *, model: str, config: Any) -> Any:
+        self.created.append(config)
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(name=f"cachedContents/{len(self.created)}")
+
+
+def _gemini_analyzer(monkeypatch, models: _FakeModels, caches: _FakeCaches) -> gemini.GeminiAnalyzer:
+    monkeypatch.setattr(settings, "gemini_context_cache_enabled", True)
+    monkeypatch.setattr(gemini, "gemini_context_cache", gemini.GeminiContextCacheRegistry())
+    analyzer = gemini.GeminiAnalyzer.__new__(gemini.GeminiAnalyzer)
+    analyzer.model = "gemini-test"
+    analyzer.client = SimpleNamespace(aio=SimpleNamespace(models=models, caches=caches))
+    return analyzer
+
+
+def test_analysis_system_prompt_is_a_stable_prefix_across_symbols() -> None:
+    system_prompt = build_analysis_system_prompt("보수적으로 판단")
+    btc_prompt = _build_analysis_user_prompt("KRW-BTC", "# Symbol\n- KRW-BTC", "1. 시점=... | 판단=BUY")
+    eth_prompt = _build_analysis_user_prompt("KRW-ETH", "# Symbol\n- KRW-ETH")
+
+    assert "Self-Correction" not in system_prompt
+    assert "Self-Correction" in btc_prompt and "Self-Correction" not in eth_prompt
+    assert btc_prompt.split("대상 종목")[0] == eth_prompt.split("대상 종목")[0]
+
+
+def test_gemini_context_cache_is_created_once_per_prefix_and_reused(monkeypatch) -> None:
+    models, caches = _FakeModels(), _FakeCaches()
+    analyzer = _gemini_analyzer(monkeypatch, models, caches)
+
+    async def scenario() -> None:
+        await asyncio.gather(
+            *(
+                analyzer.generate_structured_analysis(
+                    system_prompt="고정 시스템 프롬프트",
+                    user_prompt=f"symbol-{index}",
+                    response_model=AIAnalysisResponse,
+                    cache_key="trade_analysis-abc",
+                )
+                for index in range(4)
+            )
+        )
+
+    asyncio.run(scenario())
+
+    assert len(caches.created) == 1
+    assert caches.created[0].system_instruction == "고정 시스템 프롬프트"
+    assert [config.cached_content for config in models.configs] == ["cachedContents/1"] * 4
+    assert all(config.system_instruction is None for config in models.configs)
+
+
+def test_gemini_falls_back_to_inline_prompt_when_cache_is_gone_or_unavailable(monkeypatch) -> None:
+    models, caches = _FakeModels(missing_cache=True), _FakeCaches()
+    analyzer = _gemini_analyzer(monkeypatch, models, caches)
+
+    result = asyncio.run(
+        analyzer.generate_structured_analysis(
+            system_prompt="고정 시스템 프롬프트",
+            user_prompt="symbol",
+            response_model=AIAnalysisResponse,
+        )
+    )
+
+    assert result == RESPONSE
+    assert [config.cached_content for config in models.configs] == ["cachedContents/1", None]
+    assert models.configs[-1].system_instruction == "고정 시스템 프롬프트"
+    assert gemini.gemini_context_cache.lookup(("gemini-test", gemini.prompt_digest("고정 시스템 프롬프트"))) is None
+
+
+def test_failed_cache_creation_is_not_retried_until_expiry() -> None:
+    clock = _Clock()
+    registry = gemini.GeminiContextCacheRegistry(clock=clock)
+    attempts: list[int] = []
+
+    async def failing_create() -> str:
+        attempts.append(1)
+        raise RuntimeError("400 INVALID_ARGUMENT: min_total_token_count")
+
+    async def scenario() -> list[tuple[str | None, str]]:
+        outcomes = [await registry.resolve(("m", "p"), failing_create, 300) for _ in range(3)]
+        clock.now += 300
+        outcomes.append(await registry.resolve(("m", "p"), failing_create, 300))
+        return outcomes
+
+    outcomes = asyncio.run(scenario())
+
+    assert len(attempts) == 2
+    assert outcomes == [(None, "unavailable")] * 4
+
+
+def test_router_reports_cached_tokens_per_call_and_derives_cache_key(monkeypatch) -> None:
+    received_keys: list[str | None] = []
+
+    class FakeAnalyzer:
+        async def generate_structured_analysis(self, *, cache_key: str | None = None, **_kwargs: Any):
+            received_keys.append(cache_key)
+            record_llm_usage("openai", "gpt-test", input_tokens=2_048, output_tokens=64, cached_tokens=1_792)
+            return RESPONSE
+
+    async def fake_get_candidates(self, **_kwargs: Any) -> list[AIProviderCandidate]:
+        return [AIProviderCandidate(provider="openai", model="gpt-test")]
+
+    async def fake_mark_success(self, _provider: str) -> None:
+        return None
+
+    monkeypatch.setattr(AIProviderRouter, "get_candidates", fake_get_candidates)
+    monkeypatch.setattr(AIProviderRouter, "mark_success", fake_mark_success)
+    monkeypatch.setattr(provider_router.AIAnalyzerFactory, "get_analyzer", lambda *_args, **_kwargs: FakeAnalyzer())
+
+    async def scenario():
+        router = AIProviderRouter(db=None)
+        kwargs = {"user_prompt": "x", "response_model": AIAnalysisResponse, "purpose": "trade_analysis"}
+        first = await router.generate_structured_analysis(system_prompt="고정", **kwargs)
+        second = await router.generate_structured_analysis(system_prompt="고정", **kwargs)
+        other = await router.generate_structured_analysis(system_prompt="다른 prefix", **kwargs)
+        return first, second, other
+
+    first, second, _other = asyncio.run(scenario())
+
+    assert received_keys[0] == received_keys[1] != received_keys[2]
+    assert received_keys[0].startswith("trade_analysis-")
+    assert (first.usage.input_tokens, first.usage.cached_tokens, first.usage.output_tokens) == (2_048, 1_792, 64)
+    assert second.usage.cached_ratio == 1_792 / 2_048
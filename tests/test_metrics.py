@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from app.api.routes.metrics import metrics
+from app.core.metrics import MetricsRegistry
+from app.core.metrics import UPBIT_REQUEST_SECONDS
+from app.core.metrics import observe_duration
+from app.services.brokers.upbit import UpbitAPIError
+from app.services.brokers.upbit import UpbitBroker
+
+
+def test_histogram_renders_cumulative_buckets_and_escaped_labels() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("job_seconds", "job duration", ("job",), buckets=(0.1, 1.0))
+    counter = registry.counter("tokens_total", "tokens", ("model",))
+
+    histogram.observe(0.05, job='a"b')
+    histogram.observe(0.5, job='a"b')
+    histogram.observe(3.0, job='a"b')
+    counter.inc(12, model="gpt")
+
+    rendered = registry.render()
+
+    assert "# TYPE job_seconds histogram" in rendered
+    assert 'job_seconds_bucket{job="a\\"b",le="0.1"} 1' in rendered
+    assert 'job_seconds_bucket{job="a\\"b",le="1"} 2' in rendered
+    assert 'job_seconds_bucket{job="a\\"b",le="+Inf"} 3' in rendered
+    assert 'job_seconds_count{job="a\\"b"} 3' in rendered
+    assert 'tokens_total{model="gpt"} 12' in rendered
+
+
+def test_observe_duration_marks_error_outcome() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("op_seconds", "op", ("op", "outcome"))
+
+    with pytest.raises(RuntimeError):
+        with observe_duration(histogram, op="sync", outcome="success"):
+            raise RuntimeError("boom")
+
+    assert histogram.summary(op="sync", outcome="error")["count"] == 1
+    assert histogram.summary(op="sync", outcome="success")["count"] == 0
+
+
+def test_upbit_request_records_endpoint_and_status(monkeypatch) -> None:
+    responses = iter([httpx.Response(200, json=[]), httpx.Response(429, json={"error": {"name": "too_many"}})])
+
+    async def fake_request(self: httpx.AsyncClient, method: str, url: str, **_kwargs: Any) -> httpx.Response:
+        response = next(responses)
+        response.request = httpx.Request(method, url)
+        return response
+
+    monkeypatch.setattr(httpx.AsyncClient, "request", fake_request)
+    path = "/v1/test-metrics"
+    broker = UpbitBroker(base_url="https://upbit.test")
+
+    async def scenario() -> None:
+        await broker._request("GET", path)
+        with pytest.raises(UpbitAPIError):
+            await broker._request("GET", path)
+
+    asyncio.run(scenario())
+
+    assert UPBIT_REQUEST_SECONDS.summary(method="GET", endpoint=path, status="200")["count"] == 1
+    assert UPBIT_REQUEST_SECONDS.summary(method="GET", endpoint=path, status="429")["count"] == 1
+
+
+def test_metrics_route_returns_prometheus_text() -> None:
+    response = asyncio.run(metrics(None))
+
+    assert response.media_type.startswith("text/plain; version=0.0.4")
+    assert b"# TYPE upbit_request_duration_seconds histogram" in response.body
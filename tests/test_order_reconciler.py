@@ -0,0 +1,183 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.models.domain import OrderHistory, Position
+from app.services.trading.order_reconciler import FILL_STATUS_CANCELLED
+from app.services.trading.order_reconciler import FILL_STATUS_FILLED
+from app.services.trading.order_reconciler import FILL_STATUS_PENDING
+from app.services.trading.order_reconciler import OrderFill
+from app.services.trading.order_reconciler import OrderFillReconciler
+from app.services.trading.order_reconciler import TrackedOrder
+from app.services.trading.order_reconciler import reconcile_live_position
+from app.services.trading.order_reconciler import resolve_order_fill
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeBroker:
+    def __init__(self) -> None:
+        self.states: dict[str, str] = {}
+        self.batches: list[list[str]] = []
+        self.detail_calls: list[str] = []
+
+    async def get_orders_by_uuids(self, uuids: list[str]) -> list[dict[str, Any]]:
+        self.batches.append(list(uuids))
+        rows = []
+        for order_uuid in uuids:
+            state = self.states.get(order_uuid, "wait")
+            row: dict[str, Any] = {"uuid": order_uuid, "state": state, "executed_volume": "0"}
+            if state == "done":
+                row.update({"executed_volume": "2", "executed_funds": "210"})
+            elif state == "trades_only":
+                row.update({"state": "done", "executed_volume": "1"})
+            rows.append(row)
+        return rows
+
+    async def get_order(self, *, uuid_: str) -> dict[str, Any]:
+        self.detail_calls.append(uuid_)
+        return {"uuid": uuid_, "state": "done", "trades": [{"volume": "1", "price": "99"}]}
+
+
+def test_resolve_order_fill_prefers_trades_then_executed_funds() -> None:
+    assert resolve_order_fill({"state": "wait", "executed_volume": "1"}) is None
+
+    from_trades = resolve_order_fill(
+        {
+            "state": "done",
+            "trades": [{"volume": "1", "funds": "100"}, {"volume": "3", "price": "120"}],
+        }
+    )
+    assert from_trades is not None
+    assert from_trades.qty == pytest.approx(4.0)
+    assert from_trades.price == pytest.approx(115.0)
+
+    from_funds = resolve_order_fill({"state": "done", "executed_volume": "2", "executed_funds": "210"})
+    assert from_funds == OrderFill(state="done", price=105.0, qty=2.0, fully_filled=True)
+
+    cancelled = resolve_order_fill({"state": "cancel", "executed_volume": "0"})
+    assert cancelled is not None and cancelled.qty == 0.0
+    assert resolve_order_fill({"state": "done", "executed_volume": "1"}) is None
+
+
+def test_cancelled_market_buy_is_judged_by_executed_amount() -> None:
+    # 시장가 매수 10,000원이 단위 미만 잔액만 남기고 cancel 로 끝난 경우는 전량 체결입니다.
+    dust_cancel = resolve_order_fill(
+        {"state": "cancel", "ord_type": "price", "price": "10000", "executed_volume": "0.1", "executed_funds": "9999.7"}
+    )
+    assert dust_cancel is not None and dust_cancel.fully_filled
+
+    half_cancel = resolve_order_fill(
+        {"state": "cancel", "ord_type": "price", "price": "10000", "executed_volume": "0.05", "executed_funds": "5000"}
+    )
+    assert half_cancel is not None and not half_cancel.fully_filled
+
+    limit_cancel = resolve_order_fill(
+        {"state": "cancel", "ord_type": "limit", "volume": "2", "executed_volume": "1", "executed_funds": "100"}
+    )
+    assert limit_cancel is not None and not limit_cancel.fully_filled
+
+
+def test_reconcile_live_position_replaces_provisional_fill() -> None:
+    position = Position(asset_id=1, avg_entry_price=0.0, quantity=0.0, status="open", is_paper=False)
+    # 기존 1개 @100 에 추정치 1개 @110 을 더해 둔 상태에서 실제 체결 0.9개 @120 으로 보정합니다.
+    position.quantity = 2.0
+    position.avg_entry_price = 105.0
+    reconcile_live_position(position, side="buy", provisional_price=110.0, provisional_qty=1.0, price=120.0, qty=0.9)
+    assert position.quantity == pytest.approx(1.9)
+    assert position.avg_entry_price == pytest.approx((100.0 + 0.9 * 120.0) / 1.9)
+
+    reconcile_live_position(position, side="sell", provisional_price=0.0, provisional_qty=1.9, price=120.0, qty=0.0)
+    assert position.quantity == pytest.approx(3.8)
+    assert position.status == "open"
+
+
+def test_run_once_polls_in_batches_and_backs_off_pending_orders() -> None:
+    clock = _Clock()
+    broker = _FakeBroker()
+    reconciler = OrderFillReconciler(broker=broker, batch_size=2, min_backoff=1.0, max_backoff=4.0, clock=clock)
+    applied: list[tuple[str, OrderFill]] = []
+
+    async def fake_apply_fills(fills: list[tuple[TrackedOrder, OrderFill]]) -> int:
+        applied.extend((order.order_uuid, fill) for order, fill in fills)
+        return len(fills)
+
+    reconciler._apply_fills = fake_apply_fills  # type: ignore[method-assign]
+    for index in range(5):
+        reconciler.track(f"uuid-{index}", index)
+    broker.states = {"uuid-0": "done", "uuid-3": "trades_only"}
+
+    assert asyncio.run(reconciler.run_once()) == 0
+    assert broker.batches == []
+
+    clock.now = 1.0
+    assert asyncio.run(reconciler.run_once()) == 2
+    assert [len(batch) for batch in broker.batches] == [2, 2, 1]
+    assert broker.detail_calls == ["uuid-3"]
+    assert dict(applied)["uuid-0"].price == pytest.approx(105.0)
+    assert dict(applied)["uuid-3"].price == pytest.approx(99.0)
+    assert reconciler.pending_count == 3
+
+    broker.batches.clear()
+    clock.now = 2.0
+    assert asyncio.run(reconciler.run_once()) == 0
+    assert broker.batches == []
+
+    clock.now = 3.0
+    broker.states["uuid-1"] = "done"
+    assert asyncio.run(reconciler.run_once()) == 1
+    assert sorted(uuid for batch in broker.batches for uuid in batch) == ["uuid-1", "uuid-2", "uuid-4"]
+    assert max(order.next_poll_at for order in reconciler._tracked.values()) == pytest.approx(3.0 + 4.0)
+
+
+def test_apply_fills_keeps_unfilled_orders_for_audit() -> None:
+    unfilled = OrderHistory(
+        id=1, position_id=10, side="buy", price=100.0, qty=1.0, is_paper=False, fill_status=FILL_STATUS_PENDING
+    )
+    dust_cancel = OrderHistory(
+        id=2, position_id=10, side="buy", price=100.0, qty=1.0, is_paper=False, fill_status=FILL_STATUS_PENDING
+    )
+    position = Position(id=10, asset_id=1, avg_entry_price=100.0, quantity=2.0, status="open", is_paper=False)
+
+    class FakeSession:
+        def __init__(self) -> None:
+            self.deleted: list[Any] = []
+            self.commits = 0
+
+        async def __aenter__(self) -> "FakeSession":
+            return self
+
+        async def __aexit__(self, *_exc: Any) -> None:
+            return None
+
+        async def execute(self, statement: Any) -> Any:
+            entity = statement.column_descriptions[0]["entity"]
+            rows = [unfilled, dust_cancel] if entity is OrderHistory else [position]
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: rows))
+
+        async def delete(self, instance: Any) -> None:
+            self.deleted.append(instance)
+
+        async def commit(self) -> None:
+            self.commits += 1
+
+    db = FakeSession()
+    reconciler = OrderFillReconciler(lambda: db)  # type: ignore[arg-type]
+    fills = [
+        (TrackedOrder("uuid-1", 1, 0.0, 0.0), OrderFill(state="cancel", price=0.0, qty=0.0)),
+        (TrackedOrder("uuid-2", 2, 0.0, 0.0), OrderFill(state="cancel", price=101.0, qty=0.99, fully_filled=True)),
+    ]
+
+    assert asyncio.run(reconciler._apply_fills(fills)) == 2
+    assert db.deleted == [] and db.commits == 1
+    assert (unfilled.fill_status, unfilled.qty) == (FILL_STATUS_CANCELLED, 0.0)
+    assert (dust_cancel.fill_status, dust_cancel.qty) == (FILL_STATUS_FILLED, 0.99)
+    assert position.quantity == pytest.approx(0.99)
@@ -0,0 +1,142 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.models.domain import Asset, OrderHistory, Position, SystemConfig
+from app.services.trading import ai_executor
+from app.services.trading import paper
+from app.services.trading.paper import PaperFill
+from app.services.trading.paper import PaperLedger
+
+
+class _FakeLedgerSession:
+    def __init__(self, *, cash: str, positions: list[Position], assets: dict[str, int]) -> None:
+        self.cash_config = SystemConfig(config_key=paper.PAPER_TRADING_KRW_BALANCE_KEY, config_value=cash)
+        self.positions = positions
+        self.assets = assets
+        self.added: list[Any] = []
+        self.locked: list[str] = []
+        self.queries = 0
+        self.flushes = 0
+        self._next_id = 100
+
+    async def execute(self, statement: Any) -> Any:
+        self.queries += 1
+        entity = statement.column_descriptions[0]["entity"]
+        if statement._for_update_arg is not None:
+            self.locked.append(entity.__name__)
+        if entity is SystemConfig:
+            return SimpleNamespace(scalar_one_or_none=lambda: self.cash_config)
+        if entity is Asset:
+            return SimpleNamespace(all=lambda: list(self.assets.items()))
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: list(self.positions)))
+
+    def add(self, instance: Any) -> None:
+        self.added.append(instance)
+
+    async def flush(self) -> None:
+        self.flushes += 1
+        for instance in self.added:
+            if getattr(instance, "id", None) is None:
+                instance.id = self._next_id
+                self._next_id += 1
+
+
+@pytest.fixture(autouse=True)
+def _clear_asset_cache():
+    paper.clear_paper_asset_cache()
+    yield
+    paper.clear_paper_asset_cache()
+
+
+def test_apply_many_locks_accounts_and_applies_fills_in_one_flush() -> None:
+    btc_position = Position(id=1, asset_id=11, avg_entry_price=100.0, quantity=2.0, status="open", is_paper=True)
+    db = _FakeLedgerSession(cash="1000", positions=[btc_position], assets={"KRW-BTC": 11, "KRW-ETH": 12})
+
+    results = asyncio.run(
+        PaperLedger(db).apply_many(  # type: ignore[arg-type]
+            [
+                PaperFill(symbol="krw-btc", side="sell", executed_price=150.0, executed_qty=2.0, order_reason="TP_SELL"),
+                PaperFill(symbol="KRW-ETH", side="buy", executed_price=50.0, executed_qty=4.0, cash_amount=210.0),
+            ]
+        )
+    )
+
+    assert db.locked == ["SystemConfig", "Position"]
+    assert db.queries == 3
+    assert db.cash_config.config_value == "1090"
+    assert [result.cash_after for result in results] == [1300.0, 1090.0]
+    assert btc_position.quantity == 0.0 and btc_position.status == "closed"
+
+    eth_position = next(item for item in db.added if isinstance(item, Position))
+    assert eth_position.asset_id == 12
+    assert eth_position.avg_entry_price == pytest.approx(52.5)
+    histories = [item for item in db.added if isinstance(item, OrderHistory)]
+    assert [(item.side, item.position_id, item.order_reason) for item in histories] == [
+        ("sell", 1, "TP_SELL"),
+        ("buy", eth_position.id, None),
+    ]
+
+
+def test_buy_over_cash_balance_is_rejected() -> None:
+    db = _FakeLedgerSession(cash="100", positions=[], assets={"KRW-BTC": 11})
+
+    with pytest.raises(ValueError, match="paper_krw_balance_insufficient"):
+        asyncio.run(
+            PaperLedger(db).apply(  # type: ignore[arg-type]
+                PaperFill(symbol="KRW-BTC", side="buy", executed_price=100.0, executed_qty=2.0)
+            )
+        )
+
+
+def test_asset_ids_are_cached_across_ledgers() -> None:
+    first = _FakeLedgerSession(cash="0", positions=[], assets={"KRW-BTC": 11})
+    second = _FakeLedgerSession(cash="0", positions=[], assets={})
+
+    asyncio.run(PaperLedger(first).position_quantities(["KRW-BTC"]))  # type: ignore[arg-type]
+    quantities = asyncio.run(PaperLedger(second).position_quantities(["KRW-BTC"]))  # type: ignore[arg-type]
+
+    assert quantities == {"KRW-BTC": 0.0}
+    assert second.queries == 1
+
+
+def test_hard_tp_sl_paper_sells_commit_each_fill_independently(monkeypatch) -> None:
+    applied: list[str] = []
+
+    class FakeLedger:
+        def __init__(self, _db: Any) -> None:
+            pass
+
+        async def position_quantities(self, symbols: list[str]) -> dict[str, float]:
+            return {symbol: 1.0 for symbol in symbols}
+
+        async def apply(self, fill: PaperFill) -> None:
+            if fill.symbol == "KRW-ETH":
+                raise ValueError("ledger error")
+            applied.append(fill.symbol)
+
+    class FakeSession:
+        def __init__(self) -> None:
+            self.events: list[str] = []
+
+        async def commit(self) -> None:
+            self.events.append("commit")
+
+        async def rollback(self) -> None:
+            self.events.append("rollback")
+
+    monkeypatch.setattr(ai_executor, "PaperLedger", FakeLedger)
+    db = FakeSession()
+    candidates = [
+        ("KRW-BTC", "SL_SELL", -5.0, 100.0),
+        ("KRW-ETH", "SL_SELL", -6.0, 50.0),
+        ("KRW-XRP", "TP_SELL", 8.0, 10.0),
+    ]
+
+    liquidated = asyncio.run(ai_executor._apply_paper_hard_tp_sl_sells(db, candidates))  # type: ignore[arg-type]
+
+    assert liquidated == {"KRW-BTC", "KRW-XRP"}
+    assert applied == ["KRW-BTC", "KRW-XRP"]
+    assert db.events == ["commit", "rollback", "commit"]
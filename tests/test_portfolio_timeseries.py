@@ -0,0 +1,74 @@
+import asyncio
+import math
+from datetime import datetime, timedelta, timezone
+
+from app.services.portfolio import timeseries
+from app.services.portfolio.timeseries import SeriesSample
+from app.services.portfolio.timeseries import downsample_lttb
+from app.services.portfolio.timeseries import downsample_ohlc
+
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _hourly_samples(count: int) -> list[SeriesSample]:
+    return [
+        SeriesSample(
+            timestamp=BASE_TIME + timedelta(hours=index),
+            value=1_000_000 + 50_000 * math.sin(index / 24),
+            secondary=float(index),
+        )
+        for index in range(count)
+    ]
+
+
+def test_lttb_keeps_endpoints_and_target_size() -> None:
+    samples = _hourly_samples(24 * 365)
+    samples[4000] = SeriesSample(timestamp=samples[4000].timestamp, value=5_000_000)
+
+    points = downsample_lttb(samples, 200)
+
+    assert len(points) == 200
+    assert points[0].timestamp == samples[0].timestamp
+    assert points[-1].timestamp == samples[-1].timestamp
+    assert any(point.value == 5_000_000 for point in points)
+    assert [point.timestamp for point in points] == sorted(point.timestamp for point in points)
+
+
+def test_lttb_returns_input_when_already_small() -> None:
+    samples = _hourly_samples(10)
+
+    assert [point.value for point in downsample_lttb(samples, 200)] == [sample.value for sample in samples]
+
+
+def test_ohlc_buckets_summarize_each_window() -> None:
+    samples = [
+        SeriesSample(timestamp=BASE_TIME + timedelta(hours=index), value=value, secondary=float(index))
+        for index, value in enumerate([10, 30, 5, 20, 40, 35, 25, 50])
+    ]
+
+    points = downsample_ohlc(samples, 2)
+
+    assert [(point.open, point.high, point.low, point.value) for point in points] == [
+        (10, 30, 5, 20),
+        (40, 50, 25, 50),
+    ]
+    assert points[1].secondary == 7.0
+
+
+def test_load_portfolio_series_reads_asset_points_and_bounds_target(monkeypatch) -> None:
+    calls: list[tuple[str, datetime | None]] = []
+
+    async def fake_asset_series(_db, currency, since):
+        calls.append((currency, since))
+        return [(BASE_TIME + timedelta(hours=index), float(index), 1.0) for index in range(5000)]
+
+    monkeypatch.setattr(timeseries, "get_portfolio_asset_series", fake_asset_series)
+
+    source_points, points = asyncio.run(
+        timeseries.load_portfolio_series(None, series_range="7d", target_points=50_000, currency="btc")
+    )
+
+    assert source_points == 5000
+    assert len(points) == timeseries.MAX_TARGET_POINTS
+    assert calls[0][0] == "BTC"
+    assert calls[0][1] is not None
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import marshal
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.routes import profiling as profiling_routes
+from app.core.profiling import StructuredProfiler
+from app.core.profiling import annotate_span
+
+
+def _profiler(monkeypatch, **kwargs) -> StructuredProfiler:
+    instance = StructuredProfiler(**kwargs)
+    monkeypatch.setattr("app.core.profiling.profiler", instance)
+    monkeypatch.setattr(profiling_routes, "profiler", instance)
+    return instance
+
+
+def test_disabled_profiler_records_nothing(monkeypatch) -> None:
+    profiler = _profiler(monkeypatch)
+
+    with profiler.trace("autonomous_ai_analyst_job") as span:
+        with profiler.span("analysis") as child:
+            annotate_span(symbol="KRW-BTC")
+
+    assert span is None
+    assert child is None
+    assert profiler.list_runs() == []
+
+
+def test_trace_builds_span_tree_across_tasks_and_keeps_ring_buffer(monkeypatch) -> None:
+    profiler = _profiler(monkeypatch, buffer_size=2, cprofile_sample_rate=0)
+    profiler.configure(enabled=True)
+
+    async def stage(name: str) -> None:
+        with profiler.span(name):
+            annotate_span(payload_bytes=10)
+            await asyncio.sleep(0.01)
+
+    async def scenario() -> None:
+        for _ in range(3):
+            with profiler.trace("execute_ai_trade", symbol="KRW-BTC"):
+                await asyncio.gather(stage("entry_gate"), stage("order_execution"))
+
+    asyncio.run(scenario())
+
+    runs = profiler.list_runs()
+    assert len(runs) == 2
+    assert runs[0]["span_count"] == 3
+
+    run = profiler.get_run(runs[0]["run_id"])
+    payload = run.to_dict()
+    assert payload["root"]["attributes"] == {"symbol": "KRW-BTC"}
+    assert {child["name"] for child in payload["root"]["children"]} == {"entry_gate", "order_execution"}
+    assert all(child["attributes"] == {"payload_bytes": 10} for child in payload["root"]["children"])
+    assert "execute_ai_trade;entry_gate " in run.to_collapsed_stacks()
+
+
+def test_trace_records_error_and_sampled_cprofile(monkeypatch) -> None:
+    profiler = _profiler(monkeypatch, cprofile_sample_rate=1.0)
+    profiler.configure(enabled=True)
+
+    with pytest.raises(RuntimeError):
+        with profiler.trace("run_market_news_ingestion_job"):
+            sum(range(1000))
+            raise RuntimeError("boom")
+
+    run = profiler.get_run(profiler.list_runs()[0]["run_id"])
+    assert run.root.error == "RuntimeError: boom"
+    assert isinstance(marshal.loads(run.cprofile_stats), dict)
+    assert run.cprofile_summary
+
+
+def test_download_route_returns_json_and_rejects_missing_pstats(monkeypatch) -> None:
+    profiler = _profiler(monkeypatch, cprofile_sample_rate=0)
+    profiler.configure(enabled=True)
+    with profiler.trace("execute_ai_trade"):
+        pass
+    run_id = profiler.list_runs()[0]["run_id"]
+
+    response = asyncio.run(profiling_routes.download_profiling_run(run_id, format="json"))
+    assert json.loads(response.body)["run_id"] == run_id
+    assert "attachment" in response.headers["content-disposition"]
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(profiling_routes.download_profiling_run(run_id, format="pstats"))
+    assert exc_info.value.status_code == 404
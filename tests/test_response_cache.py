@@ -0,0 +1,149 @@
+import asyncio
+import json
+from typing import Any
+
+from app.core.response_cache import CachedRoute
+from app.core.response_cache import DataVersions
+from app.core.response_cache import ResponseCache
+from app.core.response_cache import ResponseCacheMiddleware
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingApp:
+    def __init__(self, *, delay: float = 0.0, status: int = 200) -> None:
+        self.calls = 0
+        self.delay = delay
+        self.status = status
+
+    async def __call__(self, scope: dict[str, Any], receive, send) -> None:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        body = json.dumps({"path": scope["path"], "call": self.calls}).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+async def _request(app: Any, path: str, *, if_none_match: bytes | None = None) -> dict[str, Any]:
+    headers = [(b"if-none-match", if_none_match)] if if_none_match else []
+    scope = {"type": "http", "method": "GET", "path": path, "query_string": b"", "headers": headers}
+    messages: list[dict[str, Any]] = []
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        messages.append(message)
+
+    await app(scope, receive, send)
+    start = messages[0]
+    return {
+        "status": start["status"],
+        "headers": dict(start["headers"]),
+        "body": b"".join(message.get("body", b"") for message in messages[1:]),
+    }
+
+
+def _middleware(app: _CountingApp, clock: _Clock, versions: DataVersions) -> ResponseCacheMiddleware:
+    cache = ResponseCache(
+        [CachedRoute("/api/dashboard", 5.0, ("order_history",))],
+        versions=versions,
+        clock=clock,
+    )
+    return ResponseCacheMiddleware(app, cache)
+
+
+def test_cached_route_serves_etag_and_not_modified_until_ttl_or_version_changes() -> None:
+    clock = _Clock()
+    versions = DataVersions()
+    app = _CountingApp()
+    middleware = _middleware(app, clock, versions)
+
+    async def scenario() -> list[dict[str, Any]]:
+        first = await _request(middleware, "/api/dashboard")
+        etag = first["headers"][b"etag"]
+        revalidated = await _request(middleware, "/api/dashboard", if_none_match=etag)
+        clock.now = 6.0
+        expired = await _request(middleware, "/api/dashboard", if_none_match=etag)
+        versions.bump(["order_history"])
+        invalidated = await _request(middleware, "/api/dashboard")
+        versions.bump(["favorites"])
+        unrelated = await _request(middleware, "/api/dashboard")
+        return [first, revalidated, expired, invalidated, unrelated]
+
+    first, revalidated, expired, invalidated, unrelated = asyncio.run(scenario())
+
+    assert first["status"] == 200
+    assert first["headers"][b"x-cache"] == b"MISS"
+    assert first["headers"][b"cache-control"] == b"private, no-cache"
+    assert revalidated["status"] == 304 and revalidated["body"] == b""
+    assert expired["status"] == 200 and expired["headers"][b"etag"] != first["headers"][b"etag"]
+    assert json.loads(invalidated["body"])["call"] == 3
+    assert unrelated["headers"][b"x-cache"] == b"HIT"
+    assert app.calls == 3
+
+
+def test_concurrent_misses_are_coalesced_into_one_generation() -> None:
+    app = _CountingApp(delay=0.05)
+    middleware = _middleware(app, _Clock(), DataVersions())
+
+    async def scenario() -> list[dict[str, Any]]:
+        return list(await asyncio.gather(*(_request(middleware, "/api/dashboard") for _ in range(5))))
+
+    responses = asyncio.run(scenario())
+
+    assert app.calls == 1
+    assert {response["body"] for response in responses} == {responses[0]["body"]}
+    assert sorted(response["headers"][b"x-cache"] for response in responses) == [b"HIT"] * 4 + [b"MISS"]
+
+
+def test_errors_and_unregistered_paths_are_not_cached() -> None:
+    clock = _Clock()
+    failing = _CountingApp(status=503)
+    middleware = _middleware(failing, clock, DataVersions())
+
+    async def scenario() -> list[dict[str, Any]]:
+        return [
+            await _request(middleware, "/api/dashboard"),
+            await _request(middleware, "/api/dashboard"),
+            await _request(middleware, "/api/orders"),
+        ]
+
+    first, second, other = asyncio.run(scenario())
+
+    assert first["status"] == second["status"] == 503
+    assert b"etag" not in first["headers"] and b"etag" not in other["headers"]
+    assert failing.calls == 3
+
+
+def test_successful_briefing_is_not_invalidated_by_its_own_provider_status_write() -> None:
+    versions = DataVersions()
+    app = _CountingApp()
+
+    async def briefing_app(scope: dict[str, Any], receive, send) -> None:
+        await app(scope, receive, send)
+        # 성공한 브리핑은 AIProviderRouter.mark_success 로 provider 상태를 커밋합니다.
+        versions.bump(["system_configs"])
+
+    middleware = ResponseCacheMiddleware(briefing_app, ResponseCache(versions=versions, clock=_Clock()))
+
+    async def scenario() -> list[dict[str, Any]]:
+        return [await _request(middleware, "/api/portfolio/briefing") for _ in range(2)]
+
+    first, second = asyncio.run(scenario())
+
+    assert first["headers"][b"x-cache"] == b"MISS"
+    assert second["headers"][b"x-cache"] == b"HIT"
+    assert app.calls == 1
@@ -1,7 +1,9 @@
 # ruff: noqa: E402
 
+import asyncio
 from datetime import UTC, datetime
 import sys
+import time
 from types import SimpleNamespace
 
 stub_scheduler = sys.modules.get("app.core.scheduler")
@@ -13,6 +15,7 @@ from app.core.scheduler import _build_slack_portfolio_alert_job_specs
 from app.core.scheduler import _build_market_impact_news_alert_section
 from app.core.scheduler import _normalize_slack_portfolio_alert_settings
 from app.core.scheduler import _rank_market_impact_news_candidates
+from app.core import scheduler as scheduler_module
 
 
 def test_slack_alert_preset_daily_twice_registers_two_jobs() -> None:
@@ -246,3 +249,103 @@ def test_market_impact_news_empty_block_is_stable() -> None:
 
     assert "가격 영향 뉴스 Top3" in text
     assert "후보 뉴스가 없습니다" in text
+
+
+def _patch_slow_alert_loaders(monkeypatch, delay: float) -> dict[str, int]:
+    calls = {"portfolio": 0, "sentiment": 0, "favorites": 0, "news": 0}
+    portfolio = SimpleNamespace(total_net_worth=1_000_000, total_pnl=0, items=[], error=None)
+
+    async def fake_portfolio():
+        calls["portfolio"] += 1
+        await asyncio.sleep(delay)
+        return portfolio
+
+    async def fake_sentiment():
+        calls["sentiment"] += 1
+        await asyncio.sleep(delay)
+        return SimpleNamespace(score=50, updated_at=datetime(2026, 6, 10, tzinfo=UTC))
+
+    async def fake_favorites():
+        calls["favorites"] += 1
+        await asyncio.sleep(delay)
+        return [
+            {
+                "symbol": "KRW-BTC",
+                "decision": "BUY",
+                "confidence": 90,
+                "recommended_weight": 10,
+                "created_at": datetime(2026, 6, 10, tzinfo=UTC),
+            },
+            {
+                "symbol": "KRW-ETH",
+                "decision": "HOLD",
+                "confidence": 95,
+                "recommended_weight": 0,
+                "created_at": datetime(2026, 6, 10, tzinfo=UTC),
+            },
+        ]
+
+    async def fake_news(portfolio_future):
+        await portfolio_future
+
+        async def _load():
+            calls["news"] += 1
+            await asyncio.sleep(delay)
+            return []
+
+        return await scheduler_module._cached_alert_section("market_impact_news:test", _load)
+
+    monkeypatch.setattr(scheduler_module, "_load_alert_portfolio", fake_portfolio)
+    monkeypatch.setattr(scheduler_module, "_load_alert_sentiment", fake_sentiment)
+    monkeypatch.setattr(scheduler_module, "_load_alert_favorite_latest_analyses", fake_favorites)
+    monkeypatch.setattr(scheduler_module, "_load_alert_market_impact_news", fake_news)
+    scheduler_module._clear_alert_section_cache()
+    return calls
+
+
+def _alert_rule(rule_id: str, decisions: list[str]) -> dict:
+    return scheduler_module._normalize_slack_portfolio_alert_rule(
+        {
+            "id": rule_id,
+            "weekdays": ["mon"],
+            "times": ["08:30"],
+            "sections": list(scheduler_module.SLACK_ALERT_DEFAULT_SECTIONS),
+            "signal_decisions": decisions,
+            "min_confidence": 70,
+        },
+        fallback_id=rule_id,
+    )
+
+
+def test_slack_alert_sections_load_concurrently(monkeypatch) -> None:
+    _patch_slow_alert_loaders(monkeypatch, delay=0.1)
+
+    started_at = time.perf_counter()
+    loaded = asyncio.run(
+        scheduler_module._load_slack_portfolio_alert_sections(_alert_rule("all", ["BUY"]))
+    )
+    elapsed = time.perf_counter() - started_at
+    scheduler_module._clear_alert_section_cache()
+
+    assert elapsed < 0.3
+    assert loaded["portfolio"].total_net_worth == 1_000_000
+    assert loaded["sentiment"].score == 50
+    assert [item["symbol"] for item in loaded["signal_items"]] == ["KRW-BTC"]
+    assert loaded["market_impact_news_items"] == []
+
+
+def test_slack_alert_rules_in_same_window_share_section_loads(monkeypatch) -> None:
+    calls = _patch_slow_alert_loaders(monkeypatch, delay=0.05)
+
+    async def scenario():
+        return await asyncio.gather(
+            scheduler_module._load_slack_portfolio_alert_sections(_alert_rule("buy", ["BUY"])),
+            scheduler_module._load_slack_portfolio_alert_sections(_alert_rule("hold", ["HOLD"])),
+        )
+
+    buy_loaded, hold_loaded = asyncio.run(scenario())
+    scheduler_module._clear_alert_section_cache()
+
+    assert calls == {"portfolio": 1, "sentiment": 1, "favorites": 1, "news": 1}
+    assert [item["symbol"] for item in buy_loaded["signal_items"]] == ["KRW-BTC"]
+    assert [item["symbol"] for item in hold_loaded["signal_items"]] == ["KRW-ETH"]
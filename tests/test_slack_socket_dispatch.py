@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from app.core.config import settings
+from app.services import slack_socket
+from app.services.command_dispatcher import KeyedCommandDispatcher
+from app.services.slack_socket import SlackSocketService
+
+
+class _FakeWebClient:
+    def __init__(self) -> None:
+        self.posted: list[dict[str, Any]] = []
+        self.updated: list[dict[str, Any]] = []
+        self.deleted: list[dict[str, Any]] = []
+
+    async def chat_postMessage(self, **payload: Any) -> dict[str, Any]:
+        self.posted.append(payload)
+        return {"ok": True, "channel": payload["channel"], "ts": f"ts-{len(self.posted)}"}
+
+    async def chat_update(self, **payload: Any) -> dict[str, Any]:
+        self.updated.append(payload)
+        return {"ok": True}
+
+    async def chat_delete(self, **payload: Any) -> dict[str, Any]:
+        self.deleted.append(payload)
+        return {"ok": True}
+
+
+def _service(monkeypatch) -> tuple[SlackSocketService, _FakeWebClient]:
+    monkeypatch.setattr(settings, "slack_allowed_user_ids", "U1")
+    service = SlackSocketService()
+    web_client = _FakeWebClient()
+    service._web_client = web_client
+    service._dispatcher = KeyedCommandDispatcher(name="slack", max_concurrency=2)
+    return service, web_client
+
+
+def _dm_event(text: str) -> dict[str, Any]:
+    return {"event": {"type": "message", "user": "U1", "channel": "D1", "channel_type": "im", "text": text}}
+
+
+def test_heavy_command_placeholder_is_replaced_by_result(monkeypatch) -> None:
+    service, web_client = _service(monkeypatch)
+
+    async def fake_send_balance(channel: str) -> None:
+        await service._post_message(channel, "잔고 알림")
+
+    monkeypatch.setattr(service, "_send_balance", fake_send_balance)
+
+    async def scenario() -> None:
+        service._enqueue_request("events_api", _dm_event("잔고"))
+        await service._dispatcher.close()
+
+    asyncio.run(scenario())
+
+    assert [item["text"] for item in web_client.posted] == [slack_socket.WORKING_PLACEHOLDER_TEXT]
+    assert web_client.updated == [{"channel": "D1", "text": "잔고 알림", "ts": "ts-1"}]
+    assert web_client.deleted == []
+
+
+def test_stop_command_is_not_blocked_by_pending_order_flow(monkeypatch) -> None:
+    service, _ = _service(monkeypatch)
+    handled: list[str] = []
+    release = asyncio.Event()
+
+    async def slow_prepare_buy(*_args: Any) -> None:
+        await release.wait()
+        handled.append("buy")
+
+    async def fake_stop(_channel: str) -> None:
+        handled.append("stop")
+
+    monkeypatch.setattr(service, "_prepare_buy", slow_prepare_buy)
+    monkeypatch.setattr(service, "_send_stop", fake_stop)
+
+    async def scenario() -> list[str]:
+        service._enqueue_request("events_api", _dm_event("매수 KRW-BTC 10000"))
+        service._enqueue_request("events_api", _dm_event("stop"))
+        await asyncio.sleep(0.01)
+        before_release = list(handled)
+        release.set()
+        await service._dispatcher.close()
+        return before_release
+
+    before_release = asyncio.run(scenario())
+
+    assert before_release == ["stop"]
+    assert handled == ["stop", "buy"]
+
+
+def test_enrich_order_values_fetches_details_concurrently_and_keeps_order(monkeypatch) -> None:
+    service = SlackSocketService()
+    active = 0
+    peak = 0
+
+    async def fake_get_order(uuid_: str) -> dict[str, Any]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return {"trades": [{"price": "100", "volume": uuid_[-1]}]}
+
+    monkeypatch.setattr(slack_socket.broker, "get_order", fake_get_order)
+    orders = [{"state": "done", "uuid": f"order-{index}"} for index in range(1, 6)]
+
+    enriched = asyncio.run(service._enrich_order_values(orders))
+
+    assert [item["computed_value"] for item in enriched] == [100.0, 200.0, 300.0, 400.0, 500.0]
+    assert 1 < peak <= slack_socket.ORDER_DETAIL_CONCURRENCY
+
+
+def test_order_confirm_and_emergency_actions_are_not_cancelled_by_timeout(monkeypatch) -> None:
+    service, _ = _service(monkeypatch)
+    service._dispatcher = KeyedCommandDispatcher(name="slack", max_concurrency=2, default_timeout=0.01)
+    handled: list[str] = []
+
+    async def slow_confirm(*_args: Any) -> None:
+        await asyncio.sleep(0.05)
+        handled.append("confirm")
+
+    async def slow_interactive(payload: dict[str, Any]) -> None:
+        await asyncio.sleep(0.05)
+        handled.append(payload["actions"][0]["action_id"])
+
+    monkeypatch.setattr(service, "_confirm_order", slow_confirm)
+    monkeypatch.setattr(service, "_handle_interactive", slow_interactive)
+
+    async def scenario() -> dict[str, Any]:
+        service._enqueue_request("events_api", _dm_event("확인 abc123"))
+        service._enqueue_request(
+            "interactive",
+            {"user": {"id": "U1"}, "actions": [{"action_id": "emergency_liquidate"}]},
+        )
+        await service._dispatcher.close()
+        return service._dispatcher.snapshot()
+
+    snapshot = asyncio.run(scenario())
+
+    assert sorted(handled) == ["confirm", "emergency_liquidate"]
+    assert all(stats["timeouts"] == 0 for stats in snapshot["commands"].values())
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from app.services.command_dispatcher import KeyedCommandDispatcher
+from app.services.telegram_bot import TelegramBotService
+
+
+class _FakeTelegramClient:
+    enabled = True
+    chat_id = None
+
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, Any]] = []
+
+    async def send_message(self, text: str, chat_id: Any = None) -> None:
+        self.sent.append((text, chat_id))
+
+
+def _update(update_id: int, chat_id: int, text: str) -> dict[str, Any]:
+    return {"update_id": update_id, "message": {"chat": {"id": chat_id}, "text": text}}
+
+
+def test_dispatcher_keeps_order_per_key_and_runs_keys_concurrently() -> None:
+    async def scenario() -> list[str]:
+        dispatcher = KeyedCommandDispatcher(name="test", max_concurrency=4)
+        events: list[str] = []
+
+        def handler(label: str, delay: float):
+            async def _run() -> None:
+                events.append(f"start:{label}")
+                await asyncio.sleep(delay)
+                events.append(f"end:{label}")
+
+            return _run
+
+        dispatcher.submit("chat-a", "slow", handler("a1", 0.05))
+        dispatcher.submit("chat-a", "fast", handler("a2", 0))
+        dispatcher.submit("chat-b", "fast", handler("b1", 0))
+        await dispatcher.close()
+        return events
+
+    events = asyncio.run(scenario())
+
+    assert events.index("end:a1") < events.index("start:a2")
+    assert events.index("end:b1") < events.index("end:a1")
+
+
+def test_dispatcher_timeout_is_reported_and_lane_continues() -> None:
+    async def scenario() -> tuple[list[tuple[str, str]], list[str], dict[str, Any]]:
+        timeouts: list[tuple[str, str]] = []
+        done: list[str] = []
+
+        async def on_timeout(key: str, name: str) -> None:
+            timeouts.append((key, name))
+
+        dispatcher = KeyedCommandDispatcher(
+            name="test",
+            max_concurrency=1,
+            default_timeout=0.01,
+            on_timeout=on_timeout,
+        )
+
+        async def hang() -> None:
+            await asyncio.sleep(1)
+
+        async def quick() -> None:
+            done.append("quick")
+
+        dispatcher.submit("chat", "/balance", hang)
+        dispatcher.submit("chat", "/status", quick)
+        await dispatcher.close()
+        return timeouts, done, dispatcher.snapshot()
+
+    timeouts, done, snapshot = asyncio.run(scenario())
+
+    assert timeouts == [("chat", "/balance")]
+    assert done == ["quick"]
+    assert snapshot["commands"]["/balance"]["timeouts"] == 1
+    assert snapshot["commands"]["/status"]["count"] == 1
+    assert snapshot["max_queue_depth"] == 2
+
+
+def test_telegram_stop_command_bypasses_slow_balance_in_same_chat(monkeypatch) -> None:
+    async def scenario() -> list[str]:
+        service = TelegramBotService(_FakeTelegramClient(), max_concurrent_handlers=1)
+        handled: list[str] = []
+        balance_release = asyncio.Event()
+
+        async def fake_handle_update(update: dict[str, Any]) -> None:
+            text = update["message"]["text"]
+            if text == "/balance":
+                await balance_release.wait()
+            handled.append(text)
+
+        monkeypatch.setattr(service, "_handle_update", fake_handle_update)
+
+        service._dispatch_update(_update(1, 10, "/balance"))
+        service._dispatch_update(_update(2, 10, "/status"))
+        service._dispatch_update(_update(3, 10, "/stop"))
+        await asyncio.sleep(0.01)
+        handled_before_release = list(handled)
+        balance_release.set()
+        await service._dispatcher.close()
+        return handled_before_release + ["|"] + handled
+
+    events = asyncio.run(scenario())
+
+    assert events[: events.index("|")] == ["/stop"]
+    assert events[events.index("|") + 1 :] == ["/stop", "/balance", "/status"]
+
+
+def test_telegram_liquidate_is_not_cancelled_by_command_timeout(monkeypatch) -> None:
+    async def scenario() -> tuple[list[str], list[tuple[str, Any]]]:
+        client = _FakeTelegramClient()
+        service = TelegramBotService(client, command_timeout=0.01)
+        handled: list[str] = []
+
+        async def fake_handle_update(update: dict[str, Any]) -> None:
+            await asyncio.sleep(0.05)
+            handled.append(update["message"]["text"])
+
+        monkeypatch.setattr(service, "_handle_update", fake_handle_update)
+
+        service._dispatch_update(_update(1, 10, "/liquidate confirm"))
+        service._dispatch_update(_update(2, 10, "/balance"))
+        await service._dispatcher.close()
+        return handled, client.sent
+
+    handled, sent = asyncio.run(scenario())
+
+    assert handled == ["/liquidate confirm"]
+    assert [chat_id for _text, chat_id in sent] == ["10"]